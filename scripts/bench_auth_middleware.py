@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the per-request overhead of AuthMiddleware.
+
+Compares, on an authenticated GET to a trivial endpoint, driven directly
+through ASGI (no server, no network):
+
+    - no middleware (baseline)
+    - the previous BaseHTTPMiddleware implementation (signature check on
+      every request, session data logged at INFO)
+    - the pure ASGI middleware with its verified-session cache
+
+Usage:
+    python scripts/bench_auth_middleware.py
+    python scripts/bench_auth_middleware.py --requests 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+os.environ.setdefault("SESSION_SECRET_KEY", "benchmark-secret")
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import PlainTextResponse, RedirectResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from backoffice.features.auth.infrastructure.middleware import PUBLIC_PATHS, AuthMiddleware  # noqa: E402
+from backoffice.features.auth.infrastructure.session import SESSION_COOKIE_NAME, create_session_token, verify_session_token  # noqa: E402
+
+logger = logging.getLogger("bench.legacy_auth")
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, kept here as the "before" reference."""
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        for public_path in PUBLIC_PATHS:
+            if path.startswith(public_path):
+                return await call_next(request)
+        session_token = request.cookies.get(SESSION_COOKIE_NAME)
+        logger.info(f"[AuthMiddleware] Path: {path}, Cookie present: {bool(session_token)}")
+        if not session_token:
+            return RedirectResponse(url="/login", status_code=302)
+        session_data = verify_session_token(session_token)
+        logger.info(f"[AuthMiddleware] Session data: {session_data}")
+        if session_data is None:
+            response = RedirectResponse(url="/login?error=session_expired", status_code=302)
+            response.delete_cookie(key=SESSION_COOKIE_NAME)
+            return response
+        return await call_next(request)
+
+
+async def endpoint(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+def build_app(middleware: list[Middleware]) -> Starlette:
+    return Starlette(routes=[Route("/api/ebooks", endpoint)], middleware=middleware)
+
+
+async def run(app: Starlette, token: str, nb_requests: int) -> float:
+    """Mean microseconds per request."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/ebooks",
+        "raw_path": b"/api/ebooks",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost"), (b"cookie", f"{SESSION_COOKIE_NAME}={token}".encode())],
+        "server": ("localhost", 8001),
+        "client": ("127.0.0.1", 50000),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    statuses: list[int] = []
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    for _ in range(min(1000, nb_requests)):  # Warm-up (and cache fill)
+        await app(dict(scope), receive, send)
+    statuses.clear()
+
+    start = time.perf_counter()
+    for _ in range(nb_requests):
+        await app(dict(scope), receive, send)
+    elapsed = time.perf_counter() - start
+
+    if set(statuses) != {200}:
+        raise RuntimeError(f"Unexpected statuses {set(statuses)} (is the session accepted?)")
+    return elapsed / nb_requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AuthMiddleware per-request overhead")
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per variant (default: 20000)")
+    args = parser.parse_args()
+
+    # Production logs at INFO; the f-strings are formatted either way
+    logging.basicConfig(level=logging.WARNING)
+    token = create_session_token("editor@example.com")
+    variants = {
+        "no middleware": build_app([]),
+        "BaseHTTPMiddleware (before)": build_app([Middleware(LegacyAuthMiddleware)]),
+        "pure ASGI + session cache": build_app([Middleware(AuthMiddleware)]),
+    }
+
+    results = {name: asyncio.run(run(app, token, args.requests)) for name, app in variants.items()}
+    baseline = results["no middleware"]
+    print(f"{'variant':<30} {'us/request':>11} {'overhead':>10}")
+    for name, micros in results.items():
+        print(f"{name:<30} {micros:>11.1f} {micros - baseline:>9.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Configuration loader for externalized YAML configs."""
 
-from backoffice.config.loader import ConfigLoader
+from backoffice.config.app_config import AppConfig, get_app_config, reload_app_config
+from backoffice.config.loader import ConfigLoader, get_config_loader
 
-__all__ = ["ConfigLoader"]
+__all__ = ["AppConfig", "ConfigLoader", "get_app_config", "get_config_loader", "reload_app_config"]
@@ -0,0 +1,216 @@
+"""Process-wide, immutable application configuration snapshot.
+
+All YAML configs (KDP, business limits, branding, audiences, models) are read
+and validated ONCE into an AppConfig. Consumers get the current snapshot via
+get_app_config() (routes: the AppConfigDep dependency in
+features/shared/presentation/routes/dependencies.py) and never touch the
+filesystem afterwards.
+
+Reloading is explicit (SIGHUP or POST /api/admin/config/reload): a new
+snapshot is fully built and validated, then swapped in with a single
+assignment. Readers holding the previous snapshot keep a consistent view; a
+broken config never replaces a working one.
+"""
+
+import logging
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from backoffice.config.loader import ConfigLoader
+
+if TYPE_CHECKING:
+    # pydantic schema is imported on first load, not when this module is imported
+    from backoffice.config.models_schema import ModelMapping
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KdpSection:
+    """KDP specifications (config/kdp/specifications.yaml)."""
+
+    specifications: Mapping[str, Any]
+    default_format: str
+    default_paper_type: str
+    default_cover_finish: str
+    default_include_barcode: bool
+
+
+@dataclass(frozen=True)
+class BusinessLimitsSection:
+    """Business constraints (config/business/limits.yaml)."""
+
+    min_pages: int
+    max_pages: int
+    default_format: str
+    default_engine: str
+    cover_min_pixels: int
+    content_min_pixels: int
+
+
+@dataclass(frozen=True)
+class BrandingSection:
+    """Brand identity (config/branding/identity.yaml) and assets."""
+
+    identity: Mapping[str, Any]
+    fonts_directory: Path
+
+    @property
+    def brand(self) -> Mapping[str, Any]:
+        """Brand information (name, tagline, copyright, website)."""
+        return self.identity["brand"]
+
+    @property
+    def style_guidelines(self) -> Mapping[str, Any]:
+        """Style guidelines for illustrations."""
+        return self.identity["style_guidelines"]
+
+
+@dataclass(frozen=True)
+class AudiencesSection:
+    """Target audiences (config/branding/audiences.yaml)."""
+
+    audiences: Mapping[str, Mapping[str, Any]]
+
+    def get(self, audience_id: str) -> Mapping[str, Any]:
+        """Configuration of an audience, falling back to children."""
+        return self.audiences.get(audience_id, self.audiences["children"])
+
+
+@dataclass(frozen=True)
+class ModelsSection:
+    """Validated model mappings (config/generation/models.yaml)."""
+
+    models: Mapping[str, "ModelMapping"]
+
+    def for_type(self, image_type: str) -> "ModelMapping":
+        """Model mapping for an image type ("cover", "coloring_page", ...)."""
+        return self.models[image_type]
+
+    def template_key_for_type(self, image_type: str) -> str:
+        """Theme template key for an image type ("comfy", "diffusers" or "default")."""
+        provider = self.models[image_type].provider
+        # Providers with custom templates in theme YAML
+        if provider in ("comfy", "diffusers"):
+            return provider
+        return "default"
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Immutable snapshot of the application configuration.
+
+    Attributes:
+        config_dir: Config directory the snapshot was loaded from
+        kdp: KDP specifications
+        limits: Business limits
+        branding: Brand identity and fonts
+        audiences: Target audiences
+        models: Model mappings per image type
+        loader: Preloaded ConfigLoader for the detailed getters (no file I/O)
+        loaded_at: When the snapshot was built
+    """
+
+    config_dir: Path
+    kdp: KdpSection
+    limits: BusinessLimitsSection
+    branding: BrandingSection
+    audiences: AudiencesSection
+    models: ModelsSection
+    loader: ConfigLoader
+    loaded_at: datetime
+
+    @classmethod
+    def load(cls, config_dir: Path | None = None) -> "AppConfig":
+        """Read and validate every config file into a new snapshot.
+
+        Args:
+            config_dir: Config directory (project config/ if None)
+
+        Raises:
+            FileNotFoundError: If a config file is missing
+            ValueError: If a config file is invalid (pydantic ValidationError included)
+        """
+        loader = ConfigLoader(config_dir)
+        try:
+            loader.preload()
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {loader.config_dir}: {e}") from e
+
+        try:
+            page_limits = loader.get_page_limits()
+            limits = BusinessLimitsSection(
+                min_pages=int(page_limits["min"]),
+                max_pages=int(page_limits["max"]),
+                default_format=loader.get_default_format(),
+                default_engine=loader.get_default_engine(),
+                cover_min_pixels=loader.get_cover_min_pixels(),
+                content_min_pixels=loader.get_content_min_pixels(),
+            )
+            kdp = KdpSection(
+                specifications=MappingProxyType(loader.load_kdp_specifications()),
+                default_format=loader.get_default_kdp_format(),
+                default_paper_type=loader.get_default_paper_type(),
+                default_cover_finish=loader.get_default_cover_finish(),
+                default_include_barcode=loader.get_default_include_barcode(),
+            )
+            branding = BrandingSection(
+                identity=MappingProxyType(loader.load_brand_identity()),
+                fonts_directory=loader.config_dir / "branding" / "fonts",
+            )
+            audiences = AudiencesSection(audiences=MappingProxyType(loader.load_audiences()["audiences"]))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid configuration in {loader.config_dir}: missing or malformed {e}") from e
+
+        from backoffice.config.models_schema import ModelsConfig
+
+        models = ModelsSection(models=MappingProxyType(ModelsConfig(**loader.load_model_config()).models))
+
+        return cls(
+            config_dir=loader.config_dir,
+            kdp=kdp,
+            limits=limits,
+            branding=branding,
+            audiences=audiences,
+            models=models,
+            loader=loader,
+            loaded_at=datetime.now(UTC),
+        )
+
+
+_app_config: AppConfig | None = None
+_app_config_lock = threading.Lock()
+
+
+def get_app_config() -> AppConfig:
+    """Get the current configuration snapshot (loaded on first use)."""
+    config = _app_config
+    if config is None:
+        with _app_config_lock:
+            config = _app_config or _swap(AppConfig.load())
+    return config
+
+
+def reload_app_config() -> AppConfig:
+    """Build a new snapshot and atomically swap it in.
+
+    Raises:
+        FileNotFoundError, ValueError: If the new config is invalid (current snapshot is kept)
+    """
+    with _app_config_lock:
+        config = _swap(AppConfig.load())
+    logger.info(f"🔄 Configuration reloaded from {config.config_dir}")
+    return config
+
+
+def _swap(config: AppConfig) -> AppConfig:
+    global _app_config
+    _app_config = config
+    return config
@@ -62,6 +62,11 @@ class ConfigLoader:
             self._cache[relative_path] = result
             return result
 
+    def preload(self) -> None:
+        """Load every config file into the cache (no file I/O afterwards)."""
+        for relative_path in _CONFIG_FILES:
+            self._load_yaml(relative_path)
+
     # KDP configurations
     def load_kdp_specifications(self) -> dict[str, Any]:
         """Load KDP specifications (trim sizes, bleed, paper types, etc.)."""
@@ -222,6 +227,21 @@ class ConfigLoader:
         specs = self.load_kdp_specifications()
         return cast(dict[str, Any], specs["export"])
 
+    def get_encoding_profiles(self) -> dict[str, dict[str, Any]]:
+        """Get image encoding profiles for KDP PDFs (by profile name)."""
+        specs = self.load_kdp_specifications()
+        return cast(dict[str, dict[str, Any]], specs["export"]["encoding"]["profiles"])
+
+    def get_default_encoding_profile(self) -> str:
+        """Get default image encoding profile name."""
+        specs = self.load_kdp_specifications()
+        return cast(str, specs["export"]["encoding"]["default_profile"])
+
+    def get_linearize_pdf(self) -> bool:
+        """Get whether generated PDFs are linearized (fast web view)."""
+        specs = self.load_kdp_specifications()
+        return bool(specs["export"].get("linearize", False))
+
     def get_validation_rules(self) -> dict[str, Any]:
         """Get validation rules for cover/interior.
 
@@ -420,13 +440,19 @@ class ConfigLoader:
         return "default"
 
 
-# Singleton instance for easy import
-_config_loader: ConfigLoader | None = None
+# Files read into every AppConfig snapshot
+_CONFIG_FILES = (
+    "kdp/specifications.yaml",
+    "publishing/legal.yaml",
+    "business/limits.yaml",
+    "branding/identity.yaml",
+    "branding/audiences.yaml",
+    "generation/models.yaml",
+)
 
 
 def get_config_loader() -> ConfigLoader:
-    """Get or create singleton ConfigLoader instance."""
-    global _config_loader
-    if _config_loader is None:
-        _config_loader = ConfigLoader()
-    return _config_loader
+    """Get the preloaded ConfigLoader of the current AppConfig snapshot."""
+    from backoffice.config.app_config import get_app_config
+
+    return get_app_config().loader
@@ -0,0 +1,13 @@
+"""Admin allow-list: who may use the /api/admin routes and profile requests."""
+
+import os
+
+
+def get_admin_emails() -> frozenset[str]:
+    """Lowercased emails listed in ADMIN_EMAILS (comma-separated), empty if unset."""
+    return frozenset(email.strip().lower() for email in os.getenv("ADMIN_EMAILS", "").split(",") if email.strip())
+
+
+def is_admin(email: str | None) -> bool:
+    """Whether a logged-in email is on the admin allow-list."""
+    return bool(email) and email.lower() in get_admin_emails()
@@ -2,14 +2,12 @@
 
 import logging
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.requests import HTTPConnection
 from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from backoffice.features.auth.infrastructure.session import (
-    SESSION_COOKIE_NAME,
-    verify_session_token,
-)
+from backoffice.features.auth.infrastructure.session import SESSION_COOKIE_NAME
+from backoffice.features.auth.infrastructure.session_cache import VerifiedSessionCache, get_session_cache
 
 logger = logging.getLogger(__name__)
 
@@ -21,39 +19,48 @@ PUBLIC_PATHS = [
     "/logout",
     "/static",
     "/healthz",
+    "/readyz",
+    "/metrics",  # Authenticates itself (METRICS_TOKEN bearer or session), see metrics_routes
     "/__test__",
 ]
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware that redirects unauthenticated users to login page."""
+class AuthMiddleware:
+    """Middleware that redirects unauthenticated users to login page.
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
+    Pure ASGI: authenticated requests call the application with the original
+    receive/send, so request and response bodies (PDF downloads, SSE) stream
+    through untouched. Verified sessions come from a TTL'd LRU and are made
+    available as request.state.session.
+    """
 
-        # Allow public paths
-        for public_path in PUBLIC_PATHS:
-            if path.startswith(public_path):
-                return await call_next(request)
+    def __init__(self, app: ASGIApp, session_cache: VerifiedSessionCache | None = None):
+        self.app = app
+        self.session_cache = session_cache
+        self.public_paths = tuple(PUBLIC_PATHS)
 
-        # Check for session cookie
-        session_token = request.cookies.get(SESSION_COOKIE_NAME)
-        logger.info(f"[AuthMiddleware] Path: {path}, Cookie present: {bool(session_token)}")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.public_paths):
+            await self.app(scope, receive, send)
+            return
 
+        path = scope["path"]
+        session_token = HTTPConnection(scope).cookies.get(SESSION_COOKIE_NAME)
         if not session_token:
-            logger.info("[AuthMiddleware] No session cookie, redirecting to login")
-            return RedirectResponse(url="/login", status_code=302)
-
-        # Verify session token
-        session_data = verify_session_token(session_token)
-        logger.info(f"[AuthMiddleware] Session data: {session_data}")
+            logger.debug(f"[AuthMiddleware] No session cookie for {path}, redirecting to login")
+            await RedirectResponse(url="/login", status_code=302)(scope, receive, send)
+            return
 
+        cache = self.session_cache if self.session_cache is not None else get_session_cache()
+        session_data = cache.verify(session_token)
         if session_data is None:
             # Session expired or invalid
-            logger.info("[AuthMiddleware] Session invalid/expired, redirecting to login")
+            logger.info(f"[AuthMiddleware] Session invalid/expired for {path}, redirecting to login")
             response = RedirectResponse(url="/login?error=session_expired", status_code=302)
             response.delete_cookie(key=SESSION_COOKIE_NAME)
-            return response
+            await response(scope, receive, send)
+            return
 
         # Session valid, continue
-        return await call_next(request)
+        scope.setdefault("state", {})["session"] = session_data
+        await self.app(scope, receive, send)
@@ -2,11 +2,13 @@
 
 import os
 from datetime import datetime, timedelta
+from typing import Literal, overload
 
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 
 SESSION_COOKIE_NAME = "session"
 SESSION_MAX_AGE_DAYS = 30
+SESSION_MAX_AGE_SECONDS = SESSION_MAX_AGE_DAYS * 24 * 60 * 60
 
 
 def get_serializer() -> URLSafeTimedSerializer:
@@ -28,17 +30,28 @@ def create_session_token(email: str) -> str:
     return token
 
 
-def verify_session_token(token: str) -> dict | None:
+@overload
+def verify_session_token(token: str, return_timestamp: Literal[False] = False) -> dict | None: ...
+
+
+@overload
+def verify_session_token(token: str, return_timestamp: Literal[True]) -> tuple[dict, datetime] | None: ...
+
+
+def verify_session_token(token: str, return_timestamp: bool = False) -> dict | tuple[dict, datetime] | None:
     """
     Verify a session token and return the session data.
+    With return_timestamp=True, return (data, signed_at) instead.
     Returns None if token is invalid or expired.
     """
     serializer = get_serializer()
-    max_age_seconds = SESSION_MAX_AGE_DAYS * 24 * 60 * 60
 
     try:
-        data: dict = serializer.loads(token, max_age=max_age_seconds)
-        return data
+        if return_timestamp:
+            data, signed_at = serializer.loads(token, max_age=SESSION_MAX_AGE_SECONDS, return_timestamp=True)
+            return data, signed_at
+        loaded: dict = serializer.loads(token, max_age=SESSION_MAX_AGE_SECONDS)
+        return loaded
     except SignatureExpired:
         return None
     except BadSignature:
@@ -0,0 +1,86 @@
+"""Cache of recently verified session tokens.
+
+verify_session_token() checks an HMAC signature and decodes JSON; pages,
+HTMX polls and assets of the same browser send the same cookie over and
+over. Verified tokens are kept in a small LRU for a bounded time, so a
+token is re-verified at most once per TTL, and never served past its own
+expiry. Invalid tokens are not cached, and every caller gets its own copy
+of the session data.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from backoffice.features.auth.infrastructure.session import SESSION_MAX_AGE_SECONDS, verify_session_token
+from backoffice.features.shared.infrastructure.metrics import record_cache
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL_SECONDS = 60.0
+
+
+class VerifiedSessionCache:
+    """LRU of verified session tokens with a TTL.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that verified the signature
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, token: str) -> dict | None:
+        """Session data of a token (cached), or None if invalid or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(token)
+                    self.hits += 1
+                    record_cache("session", hit=True)
+                    return dict(entry[1])
+                del self._entries[token]
+            self.misses += 1
+        record_cache("session", hit=False)
+
+        verified = verify_session_token(token, return_timestamp=True)
+        if verified is None:
+            return None
+        data, signed_at = verified
+
+        expires_at = min(now + self.ttl_seconds, signed_at.timestamp() + SESSION_MAX_AGE_SECONDS)
+        with self._lock:
+            self._entries[token] = (expires_at, data)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return dict(data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache: VerifiedSessionCache | None = None
+
+
+def get_session_cache() -> VerifiedSessionCache:
+    """Process-wide cache, sized by SESSION_CACHE_SIZE / SESSION_CACHE_TTL_SECONDS."""
+    global _cache
+    if _cache is None:
+        _cache = VerifiedSessionCache(
+            max_size=int(os.getenv("SESSION_CACHE_SIZE", str(DEFAULT_MAX_SIZE))),
+            ttl_seconds=float(os.getenv("SESSION_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+        )
+    return _cache
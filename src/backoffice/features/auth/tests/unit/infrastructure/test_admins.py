@@ -0,0 +1,19 @@
+"""Tests for the ADMIN_EMAILS allow-list."""
+
+from backoffice.features.auth.infrastructure.admins import get_admin_emails, is_admin
+
+
+def test_admin_emails_are_read_from_env(monkeypatch):
+    monkeypatch.setenv("ADMIN_EMAILS", " Admin@Example.com, ,ops@example.com")
+
+    assert get_admin_emails() == {"admin@example.com", "ops@example.com"}
+    assert is_admin("ADMIN@example.com")
+    assert not is_admin("editor@example.com")
+    assert not is_admin(None)
+
+
+def test_no_admins_when_unset(monkeypatch):
+    monkeypatch.delenv("ADMIN_EMAILS", raising=False)
+
+    assert get_admin_emails() == frozenset()
+    assert not is_admin("admin@example.com")
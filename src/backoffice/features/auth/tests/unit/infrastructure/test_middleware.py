@@ -0,0 +1,136 @@
+"""Tests for the pure ASGI auth middleware and the verified-session cache."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from backoffice.features.auth.infrastructure import session_cache as session_cache_module
+from backoffice.features.auth.infrastructure.middleware import AuthMiddleware
+from backoffice.features.auth.infrastructure.session import SESSION_COOKIE_NAME, create_session_token, verify_session_token
+from backoffice.features.auth.infrastructure.session_cache import VerifiedSessionCache
+
+
+@pytest.fixture(autouse=True)
+def session_secret(monkeypatch):
+    monkeypatch.setenv("SESSION_SECRET_KEY", "test-secret")
+
+
+def _app(cache: VerifiedSessionCache) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware, session_cache=cache)
+
+    @app.get("/me")
+    async def me(request: Request) -> dict:
+        return {"email": request.state.session["email"]}
+
+    @app.get("/healthz")
+    async def healthz() -> dict:
+        return {"status": "ok"}
+
+    return app
+
+
+def test_requests_without_valid_session_are_redirected():
+    client = TestClient(_app(VerifiedSessionCache()), follow_redirects=False)
+
+    assert client.get("/healthz").status_code == 200
+    missing = client.get("/me")
+    assert (missing.status_code, missing.headers["location"]) == (302, "/login")
+
+    client.cookies.set(SESSION_COOKIE_NAME, "forged.token")
+    invalid = client.get("/me")
+    assert (invalid.status_code, invalid.headers["location"]) == (302, "/login?error=session_expired")
+    assert f"{SESSION_COOKIE_NAME}=" in invalid.headers["set-cookie"]
+
+
+def test_verified_session_is_cached_and_exposed_on_request_state():
+    cache = VerifiedSessionCache()
+    client = TestClient(_app(cache))
+    client.cookies.set(SESSION_COOKIE_NAME, create_session_token("editor@example.com"))
+
+    for _ in range(5):
+        assert client.get("/me").json() == {"email": "editor@example.com"}
+    assert (cache.misses, cache.hits) == (1, 4)
+
+
+def test_cache_entries_expire_and_are_bounded(monkeypatch):
+    cache = VerifiedSessionCache(max_size=2, ttl_seconds=60)
+    tokens = [create_session_token(f"user{i}@example.com") for i in range(3)]
+    for token in tokens:
+        assert cache.verify(token) is not None
+    assert len(cache) == 2  # Least recently used token evicted
+
+    assert cache.verify("not-a-token") is None
+    assert len(cache) == 2  # Invalid tokens are not cached
+
+    now = time.time()
+    monkeypatch.setattr(session_cache_module.time, "time", lambda: now + 61)
+    cache.verify(tokens[2])
+    assert cache.misses == 5  # Expired entry verified again
+
+
+def test_cached_session_data_is_not_shared_between_callers():
+    cache = VerifiedSessionCache()
+    token = create_session_token("editor@example.com")
+
+    first = cache.verify(token)
+    first["email"] = "admin@example.com"
+
+    assert cache.verify(token)["email"] == "editor@example.com"
+    data, signed_at = verify_session_token(token, return_timestamp=True)
+    assert data["email"] == "editor@example.com"
+    assert abs(signed_at.timestamp() - time.time()) < 5
+
+
+async def test_streaming_response_passes_through_unbuffered():
+    second_chunk_allowed = asyncio.Event()
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware, session_cache=VerifiedSessionCache())
+
+    @app.get("/download")
+    async def download() -> StreamingResponse:
+        async def chunks():
+            yield b"first"
+            await second_chunk_allowed.wait()  # Only released once "first" reached the client
+            yield b"second"
+
+        return StreamingResponse(chunks(), media_type="application/pdf")
+
+    token = create_session_token("editor@example.com")
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/download",
+        "raw_path": b"/download",
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [(b"cookie", f"{SESSION_COOKIE_NAME}={token}".encode())],
+        "server": ("test", 80),
+        "client": ("test", 1234),
+        "http_version": "1.1",
+    }
+    bodies: list[bytes] = []
+    request_sent = False
+    request_done = asyncio.Event()
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await request_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            bodies.append(message["body"])
+            second_chunk_allowed.set()
+
+    await asyncio.wait_for(app(scope, receive, send), timeout=2)
+    request_done.set()
+    assert bodies == [b"first", b"second"]
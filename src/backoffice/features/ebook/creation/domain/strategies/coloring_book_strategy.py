@@ -3,8 +3,7 @@
 import logging
 from pathlib import Path
 
-import yaml
-
+from backoffice.config import get_app_config
 from backoffice.features.ebook.shared.domain.entities.generation_request import (
     ColorMode,
     GenerationRequest,
@@ -28,6 +27,8 @@ from backoffice.features.ebook.shared.domain.services.prompt_template_engine imp
 from backoffice.features.ebook.shared.infrastructure.adapters.theme_repository import (
     ThemeRepository,
 )
+from backoffice.features.shared.infrastructure.metrics import BYTES_PRODUCED, STAGE_DURATION
+from backoffice.features.shared.infrastructure.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -80,32 +81,17 @@ class ColoringBookStrategy(EbookGenerationStrategyPort):
         Returns:
             Dictionary of workflow parameters
         """
-        from backoffice.config import ConfigLoader
-
         # Get template key based on provider configuration
-        config = ConfigLoader()
-        template_key = config.get_template_key_for_type(image_type)
+        template_key = get_app_config().models.template_key_for_type(image_type)
 
         logger.info(f"Loading workflow_params for {image_type} using template: {template_key}")
 
-        theme_file = self.theme_repository.themes_directory / f"{theme_id}.yml"
-        if not theme_file.exists():
-            logger.warning(f"Theme file not found: {theme_file}, returning empty workflow_params")
+        theme = self.theme_repository.get_compiled_theme(theme_id)
+        if theme is None:
+            logger.warning(f"Theme file not found for '{theme_id}', returning empty workflow_params")
             return {}
 
-        with theme_file.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        # Extract workflow_params from appropriate template
-        params: dict[str, str]
-        is_cover = image_type == "cover"
-        if is_cover:
-            params = data.get("cover_templates", {}).get(template_key, {}).get("workflow_params", {})
-        else:
-            params = data.get("coloring_page_templates", {}).get(template_key, {}).get("workflow_params", {})
-
-        # Ensure we return dict[str, str] not Any
-        return params if isinstance(params, dict) else {}
+        return theme.workflow_params(image_type, template_key)
 
     async def generate(self, request: GenerationRequest) -> GenerationResult:
         """Generate a coloring book.
@@ -146,16 +132,19 @@ class ColoringBookStrategy(EbookGenerationStrategyPort):
             color_mode=ColorMode.COLOR,
         )
 
-        cover_data = await self.cover_service.generate_cover(
-            prompt=cover_prompt,
-            spec=cover_spec,
-            seed=request.seed,
-            workflow_params=workflow_params,
-        )
+        with STAGE_DURATION.time(stage="cover"), get_tracer().span("strategy.cover"):
+            cover_data = await self.cover_service.generate_cover(
+                prompt=cover_prompt,
+                spec=cover_spec,
+                seed=request.seed,
+                workflow_params=workflow_params,
+            )
+        BYTES_PRODUCED.inc(len(cover_data), artifact="cover")
 
         # Step 1b: Overlay title and footer on cover
         theme_profile = self.theme_repository.get_theme_by_id(request.theme)
-        cover_data = self.cover_compositor.apply_cover_overlays(cover_data, theme_profile)
+        with STAGE_DURATION.time(stage="overlays"), get_tracer().span("strategy.overlays"):
+            cover_data = self.cover_compositor.apply_cover_overlays(cover_data, theme_profile)
 
         # Step 2: Generate content pages (B&W) SECOND
         logger.info(f"\n📋 Step 2/4: Generating {request.page_count} content pages...")
@@ -173,12 +162,14 @@ class ColoringBookStrategy(EbookGenerationStrategyPort):
         page_workflow_params = self._load_workflow_params(request.theme, image_type="coloring_page")
         logger.info(f"📝 Loaded page workflow_params: {page_workflow_params}")
 
-        pages_data = await self.pages_service.generate_pages(
-            prompts=page_prompts,
-            spec=page_spec,
-            seed=request.seed,
-            workflow_params=page_workflow_params,
-        )
+        with STAGE_DURATION.time(stage="pages"), get_tracer().span("strategy.pages"):
+            pages_data = await self.pages_service.generate_pages(
+                prompts=page_prompts,
+                spec=page_spec,
+                seed=request.seed,
+                workflow_params=page_workflow_params,
+            )
+        BYTES_PRODUCED.inc(sum(len(page_data) for page_data in pages_data), artifact="page")
 
         # Step 3: Remove text from cover to create back cover with Gemini Vision
         logger.info("\n📋 Step 3/4: Creating back cover (same image without text)...")
@@ -188,20 +179,23 @@ class ColoringBookStrategy(EbookGenerationStrategyPort):
 
         kdp_config = KDPExportConfig()
 
-        back_cover_data = await self.cover_service.cover_port.remove_text_from_cover(
-            image_bytes=cover_data,
-            spec=cover_spec,
-            barcode_width_inches=kdp_config.barcode_width,
-            barcode_height_inches=kdp_config.barcode_height,
-            barcode_margin_inches=kdp_config.barcode_margin,
-        )
+        with STAGE_DURATION.time(stage="text_removal"), get_tracer().span("strategy.text_removal"):
+            back_cover_data = await self.cover_service.cover_port.remove_text_from_cover(
+                image_bytes=cover_data,
+                spec=cover_spec,
+                barcode_width_inches=kdp_config.barcode_width,
+                barcode_height_inches=kdp_config.barcode_height,
+                barcode_margin_inches=kdp_config.barcode_margin,
+            )
 
         # Step 3b: Apply back cover overlays (preview images + text)
-        back_cover_data = self.cover_compositor.apply_back_cover_overlays(
-            back_cover_data=back_cover_data,
-            theme_profile=theme_profile,
-            content_pages=pages_data,
-        )
+        with STAGE_DURATION.time(stage="overlays"), get_tracer().span("strategy.overlays"):
+            back_cover_data = self.cover_compositor.apply_back_cover_overlays(
+                back_cover_data=back_cover_data,
+                theme_profile=theme_profile,
+                content_pages=pages_data,
+            )
+        BYTES_PRODUCED.inc(len(back_cover_data), artifact="back_cover")
 
         # Step 4: Assemble PDF
         logger.info("\n📋 Step 4/4: Assembling PDF...")
@@ -232,11 +226,12 @@ class ColoringBookStrategy(EbookGenerationStrategyPort):
             image_format="PNG",
         )
 
-        pdf_uri = await self.assembly_service.assemble_ebook(
-            cover=cover_page,
-            pages=content_pages + [back_cover_page],  # Include back cover
-            output_path=output_path,
-        )
+        with STAGE_DURATION.time(stage="assembly"), get_tracer().span("strategy.assembly"):
+            pdf_uri = await self.assembly_service.assemble_ebook(
+                cover=cover_page,
+                pages=content_pages + [back_cover_page],  # Include back cover
+                output_path=output_path,
+            )
 
         # Build result with image data for regeneration
         pages_meta = (
@@ -319,32 +314,29 @@ class ColoringBookStrategy(EbookGenerationStrategyPort):
         Returns:
             Cover prompt from template (comfy or default) based on configured provider
         """
-        from backoffice.config import ConfigLoader
-
-        config = ConfigLoader()
+        config = get_app_config()
 
         # Get the template key based on provider (comfy or default)
-        template_key = config.get_template_key_for_type("cover")
+        template_key = config.models.template_key_for_type("cover")
 
         logger.info(f"Building cover prompt using template: {template_key}")
 
-        # Load theme YAML to get the prompt template
-        theme_file = self.theme_repository.themes_directory / f"{request.theme}.yml"
-        with theme_file.open("r", encoding="utf-8") as f:
-            theme_data = yaml.safe_load(f)
+        # Compiled theme holds the prompt template
+        theme = self.theme_repository.get_compiled_theme(request.theme)
+        if theme is None:
+            raise FileNotFoundError(f"Theme file not found for '{request.theme}'")
 
-        cover_template = theme_data.get("cover_templates", {}).get(template_key, {})
+        cover_template = theme.cover_template(template_key)
 
         # Check if we have a direct prompt (comfy style) or prompt_blocks (default style)
         base_prompt: str
-        if "prompt" in cover_template:
+        if cover_template is not None and cover_template.prompt is not None:
             # ComfyUI style: direct prompt
-            base_prompt = str(cover_template["prompt"])
-        elif "prompt_blocks" in cover_template:
+            base_prompt = cover_template.prompt
+        elif cover_template is not None and cover_template.prompt_blocks:
             # Default style: build from blocks
-            blocks = cover_template["prompt_blocks"]
-            identity = config.load_brand_identity()
-            style_guide = identity["style_guidelines"]
+            blocks = cover_template.prompt_blocks
+            style_guide = config.branding.style_guidelines
 
             # Load theme profile for palette
             theme_profile = self.theme_repository.get_theme_by_id(request.theme)
@@ -455,16 +447,13 @@ Text: Only "{request.title}" - NO age numbers"""
             Back cover prompt for line art generation based on theme
             configuration and brand identity
         """
-        from backoffice.config import ConfigLoader
         from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils.color_utils import (
             extract_dominant_color_exact,
         )
 
         # Load theme and style guide
         theme_profile = self.theme_repository.get_theme_by_id(request.theme)
-        config = ConfigLoader()
-        identity = config.load_brand_identity()
-        style_guide = identity["style_guidelines"]
+        style_guide = get_app_config().branding.style_guidelines
 
         # Extract background color from front cover
         bg_color = extract_dominant_color_exact(front_cover_bytes)
@@ -506,15 +495,11 @@ Text: Only "{request.title}" - NO age numbers"""
         Returns:
             List of page prompts with varied compositions
         """
-        from backoffice.config import ConfigLoader
-
         # Initialize template engine with request seed for reproducibility
         engine = PromptTemplateEngine(seed=request.seed)
 
         # Get provider from config to use the correct template
-        config = ConfigLoader()
-        model_config = config.get_model_config_for_type("coloring_page")
-        provider = model_config["provider"]
+        provider = get_app_config().models.for_type("coloring_page").provider
 
         # Convert provider to template key ("comfy" stays "comfy", others use provider name)
         template_key = provider  # For ComfyUI it's "comfy", for others it's their name
@@ -13,7 +13,10 @@ from backoffice.features.ebook.shared.domain.ports.ebook_generation_strategy_por
 )
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.ebook.shared.domain.ports.file_storage_port import FileStoragePort
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import PageThumbnailPort
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.metrics import STAGE_DURATION
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,7 @@ class CreateEbookUseCase:
         generation_strategy: EbookGenerationStrategyPort,
         event_bus: EventBus,
         file_storage: FileStoragePort | None = None,
+        thumbnail_store: PageThumbnailPort | None = None,
     ):
         """Initialize use case with dependencies.
 
@@ -39,12 +43,15 @@ class CreateEbookUseCase:
             generation_strategy: Strategy for ebook generation (injected based on type)
             event_bus: Event bus for publishing domain events
             file_storage: Optional file storage service (e.g., Google Drive)
+            thumbnail_store: Optional store for WebP page thumbnails
         """
         self.ebook_repository = ebook_repository
         self.generation_strategy = generation_strategy
         self.event_bus = event_bus
         self.file_storage = file_storage
+        self.thumbnail_store = thumbnail_store
 
+    @traced_use_case("create_ebook")
     async def execute(self, request: GenerationRequest, is_preview: bool = False) -> Ebook:
         """Execute ebook creation workflow.
 
@@ -66,6 +73,7 @@ class CreateEbookUseCase:
         start_time = time.time()
         generation_result = await self.generation_strategy.generate(request)
         generation_duration = time.time() - start_time
+        STAGE_DURATION.observe(generation_duration, stage="total")
 
         logger.info(f"✅ Ebook generated: {generation_result.pdf_uri}")
         logger.info(f"   Total pages: {len(generation_result.pages_meta)}")
@@ -151,9 +159,17 @@ class CreateEbookUseCase:
                 logger.warning(f"⚠️ Failed to upload to storage: {e}")
                 # Continue anyway - ebook is already in DB with local file path
 
+        # 7. Render page thumbnails (detail page and edit modals load these, not the PNGs)
+        if self.thumbnail_store:
+            for page in generation_result.pages_meta:
+                try:
+                    await self.thumbnail_store.render(page.image_data)
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to render thumbnails for page {page.page_number}: {e}")
+
         logger.info(f"✅ Ebook creation complete: {ebook.id}")
 
-        # 7. Emit domain event
+        # 8. Emit domain event
         # ebook.id is guaranteed to be non-None after creation (checked above)
         await self.event_bus.publish(
             EbookCreatedEvent(
@@ -24,6 +24,7 @@ from backoffice.features.ebook.shared.infrastructure.factories.repository_factor
     get_repository_factory,
 )
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.presentation.routes.dependencies import AppConfigDep
 from backoffice.features.shared.presentation.routes.templates import templates
 
 # Type alias for dependency injection
@@ -34,7 +35,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/form-config")
-async def get_form_config() -> dict:
+async def get_form_config(config: AppConfigDep) -> dict:
     """Get form configuration (themes and audiences) from YAML files.
 
     Returns:
@@ -50,39 +51,19 @@ async def get_form_config() -> dict:
             ]
         }
     """
-    from pathlib import Path
+    from backoffice.features.ebook.shared.domain.theme.theme_registry import get_theme_registry
 
-    import yaml
-
-    from backoffice.config import ConfigLoader
-
-    config = ConfigLoader()
-
-    # Load themes from config/branding/themes/ directory
-    themes_dir = Path(__file__).parent.parent.parent.parent.parent.parent.parent / "config" / "branding" / "themes"
-    themes = []
-
-    for theme_file in sorted(themes_dir.glob("*.yml")):
-        # Skip neutral-default (internal fallback)
-        if theme_file.stem == "neutral-default":
-            continue
-
-        with open(theme_file, encoding="utf-8") as f:
-            theme_data = yaml.safe_load(f)
-
-        themes.append(
-            {
-                "id": theme_file.stem,
-                "label": theme_data.get("label", theme_file.stem.capitalize()),
-                "description": theme_data.get("description", ""),
-            }
-        )
+    # Themes from config/branding/themes/ (compiled once per file version)
+    themes = [
+        {"id": theme.id, "label": theme.label, "description": theme.description}
+        for theme in get_theme_registry().list_themes()
+        if theme.id != "neutral-default"  # Internal fallback
+    ]
 
-    # Load audiences from config
-    audiences_config = config.load_audiences()
+    # Audiences from the configuration snapshot
     audiences = []
 
-    for audience_id, audience_data in audiences_config["audiences"].items():
+    for audience_id, audience_data in config.audiences.audiences.items():
         audiences.append(
             {
                 "id": audience_id,
@@ -197,6 +178,7 @@ async def create_ebook(
         generation_strategy=strategy,
         event_bus=event_bus,
         file_storage=file_storage,
+        thumbnail_store=factory.get_thumbnail_store(),
     )
 
     # Step 7: Execute use case (emits EbookCreatedEvent)
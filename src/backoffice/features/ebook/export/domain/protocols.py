@@ -4,7 +4,7 @@ This module defines Protocol types to avoid circular imports and provide
 loose coupling between the export use case and infrastructure providers.
 """
 
-from typing import Protocol
+from typing import Any, Protocol
 
 from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, KDPExportConfig
 from backoffice.features.ebook.shared.domain.entities.generation_request import ImageSpec
@@ -82,9 +82,24 @@ class KDPAssemblyProviderProtocol(Protocol):
             front_cover_bytes: Front cover image bytes
             kdp_config: KDP export configuration
             isbn: Optional ISBN-13 for EAN barcode rendering on back cover
-            spine_colors: spine colors for background and text  
+            spine_colors: spine colors for background and text
 
         Returns:
             PDF bytes ready for KDP upload
         """
         ...
+
+    def compose_kdp_cover(
+        self,
+        ebook: Ebook,
+        back_cover_bytes: bytes,
+        front_cover_bytes: bytes,
+        kdp_config: KDPExportConfig,
+        spine_colors: list | None = None,
+    ) -> Any:
+        """Compose the full cover (back + spine + front) in memory.
+
+        Returns:
+            Composed cover exposing the RGB canvas as `.image`
+        """
+        ...
@@ -0,0 +1,125 @@
+"""Content-hash cache keys for KDP export artifacts.
+
+A key covers every input of a KDP assembly: page images, KDP config, theme
+version and file content, legal page config, ISBN and spine colors. Editing
+any page changes its image hash and therefore the key, as does editing the
+theme YAML or publishing/legal.yaml, so cached artifacts never need explicit
+invalidation.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Mapping
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, KDPExportConfig
+from backoffice.features.ebook.shared.domain.theme.theme_registry import find_themes_directory
+
+logger = logging.getLogger(__name__)
+
+# Bump when assembly output changes for identical inputs (layout, encoding, etc.)
+ASSEMBLY_VERSION = 1
+
+
+class KdpExportCacheKey:
+    """Builds cache keys for KDP export artifacts (cover, interior, cover preview)."""
+
+    @staticmethod
+    def page_hashes(ebook: Ebook) -> list[str]:
+        """Hash each page image of the ebook (in page order).
+
+        Args:
+            ebook: Ebook with structure_json containing pages_meta
+
+        Returns:
+            SHA-256 hex digest per page (empty list if no structure)
+        """
+        pages = (ebook.structure_json or {}).get("pages_meta", [])
+        return [hashlib.sha256(page.get("image_data_base64", "").encode()).hexdigest() for page in pages]
+
+    @staticmethod
+    def theme_file_hash(theme_id: str | None, themes_directory: Path | None = None) -> str | None:
+        """Hash the YAML file of a theme (colors, ISBN, back cover and legal page texts).
+
+        Args:
+            theme_id: Theme identifier (file stem), or None if the ebook has no theme
+            themes_directory: Themes directory (project config/branding/themes if None)
+
+        Returns:
+            SHA-256 hex digest of the file, or None if there is no theme file
+        """
+        if not theme_id:
+            return None
+        try:
+            theme_file = (themes_directory or find_themes_directory()) / f"{theme_id}.yml"
+            return hashlib.sha256(theme_file.read_bytes()).hexdigest()
+        except OSError as e:
+            logger.warning(f"Could not hash theme file of '{theme_id}': {e}")
+            return None
+
+    @staticmethod
+    def legal_config_hash(legal_config: Mapping[str, Any] | None = None) -> str | None:
+        """Hash the legal page configuration (publishing/legal.yaml).
+
+        Args:
+            legal_config: Loaded legal config (loaded from the current config snapshot if None)
+
+        Returns:
+            SHA-256 hex digest of the config, or None if it cannot be loaded
+        """
+        if legal_config is None:
+            try:
+                from backoffice.config.loader import get_config_loader
+
+                legal_config = get_config_loader().load_legal_config()
+            except Exception as e:
+                logger.warning(f"Could not load legal config for the cache key: {e}")
+                return None
+        return hashlib.sha256(json.dumps(legal_config, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def compute(
+        artifact: str,
+        ebook: Ebook,
+        kdp_config: KDPExportConfig | None = None,
+        isbn: str | None = None,
+        spine_colors: list | None = None,
+        extra: dict | None = None,
+        themes_directory: Path | None = None,
+        legal_config: Mapping[str, Any] | None = None,
+    ) -> str:
+        """Compute the cache key of an export artifact.
+
+        Args:
+            artifact: Artifact type (e.g. "cover", "interior", "cover_preview")
+            ebook: Ebook being exported
+            kdp_config: KDP export configuration used for assembly
+            isbn: ISBN rendered on the back cover / legal page
+            spine_colors: Spine background and text colors
+            extra: Other artifact-specific inputs (must be JSON serializable)
+            themes_directory: Themes directory (project config/branding/themes if None)
+            legal_config: Legal page config (loaded from the current config snapshot if None)
+
+        Returns:
+            SHA-256 hex digest identifying the artifact content
+        """
+        payload = {
+            "assembly_version": ASSEMBLY_VERSION,
+            "artifact": artifact,
+            "pages": KdpExportCacheKey.page_hashes(ebook),
+            "kdp_config": asdict(kdp_config) if kdp_config else None,
+            "theme_id": ebook.theme_id,
+            "theme_version": ebook.theme_version,
+            "theme_file": KdpExportCacheKey.theme_file_hash(ebook.theme_id, themes_directory),
+            "legal_config": KdpExportCacheKey.legal_config_hash(legal_config),
+            "title": ebook.title,
+            "author": ebook.author,
+            "page_count": ebook.page_count,
+            "isbn": isbn,
+            "spine_colors": spine_colors,
+            "extra": extra,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
@@ -5,6 +5,7 @@ This service extracts common validation patterns used across KDP export use case
 """
 
 import logging
+from dataclasses import replace
 
 from backoffice.features.ebook.shared.domain.entities.ebook import (
     Ebook,
@@ -115,14 +116,7 @@ class KdpExportValidator:
 
         if ebook.page_count and ebook.page_count < 24 and kdp_config.paper_type == "premium_color":
             logger.warning(f"Ebook has {ebook.page_count} pages (< 24), switching from premium_color to standard_color")
-            return KDPExportConfig(
-                trim_size=kdp_config.trim_size,
-                bleed_size=kdp_config.bleed_size,
-                paper_type="standard_color",
-                include_barcode=kdp_config.include_barcode,
-                cover_finish=kdp_config.cover_finish,
-                icc_rgb_profile=kdp_config.icc_rgb_profile,
-            )
+            return replace(kdp_config, paper_type="standard_color")
 
         return kdp_config
 
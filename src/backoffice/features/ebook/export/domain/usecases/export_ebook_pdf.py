@@ -1,11 +1,18 @@
 """Use case for exporting ebook PDFs from database."""
 
 import logging
+import os
+import time
 
 from backoffice.features.ebook.export.domain.events.ebook_exported_event import EbookExportedEvent
+from backoffice.features.ebook.shared.domain.entities.ebook import EbookPdfInfo
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.export_artifact_cache_port import ExportArtifactCachePort
+from backoffice.features.ebook.shared.domain.services.pdf_rebuild_scheduler import PdfRebuildScheduler
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.metrics import EXPORT_DURATION
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -17,60 +24,144 @@ class ExportEbookPdfUseCase:
     - Retrieving PDF bytes from database
     - Validating ebook exists
     - Emitting export event for tracking
+
+    With a file store, the PDF is materialized once per content hash and
+    served from disk, so downloads never hold the whole PDF in memory.
+
+    With a rebuild scheduler, a PDF still waiting for its debounced rebuild
+    after page edits is rebuilt before being served.
     """
 
-    def __init__(self, ebook_repository: EbookPort, event_bus: EventBus):
+    def __init__(
+        self,
+        ebook_repository: EbookPort,
+        event_bus: EventBus,
+        file_store: ExportArtifactCachePort | None = None,
+        pdf_rebuild_scheduler: PdfRebuildScheduler | None = None,
+    ):
         """Initialize use case with dependencies.
 
         Args:
             ebook_repository: Repository for ebook access
             event_bus: Event bus for publishing domain events
+            file_store: Optional content-addressed file store for zero-copy delivery
+            pdf_rebuild_scheduler: Optional scheduler holding deferred PDF rebuilds
         """
         self.ebook_repository = ebook_repository
         self.event_bus = event_bus
+        self.file_store = file_store
+        self.pdf_rebuild_scheduler = pdf_rebuild_scheduler
 
-    async def execute(self, ebook_id: int) -> bytes:
-        """Export ebook PDF from database.
+    async def get_pdf_info(self, ebook_id: int) -> EbookPdfInfo:
+        """Get title and content hash of the stored PDF (light query).
 
         Args:
             ebook_id: ID of the ebook to export
 
         Returns:
-            PDF bytes
+            PDF metadata (content_hash doubles as ETag), after any pending rebuild
 
         Raises:
             DomainError: If ebook not found or PDF not available
         """
-        logger.info(f"📥 Exporting PDF for ebook {ebook_id}")
-
-        # Step 1: Validate ebook exists
-        ebook = await self.ebook_repository.get_by_id(ebook_id)
-        if not ebook:
+        info = await self.ebook_repository.get_ebook_pdf_info(ebook_id)
+        if info and info.pdf_dirty_at is not None and self.pdf_rebuild_scheduler is not None:
+            # Pages changed since the last build: rebuild now (or wait for the running rebuild)
+            logger.info(f"⏳ PDF of ebook {ebook_id} is outdated, rebuilding before serving")
+            await self.pdf_rebuild_scheduler.flush(ebook_id)
+            info = await self.ebook_repository.get_ebook_pdf_info(ebook_id)
+
+        if not info:
             raise DomainError(
                 code=ErrorCode.EBOOK_NOT_FOUND,
                 message=f"Ebook with id {ebook_id} not found",
                 actionable_hint="Verify the ebook ID is correct",
             )
 
+        if not info.content_hash:
+            raise self._pdf_not_found()
+
+        return info
+
+    @traced_use_case("export_ebook_pdf")
+    async def execute(self, ebook_id: int) -> bytes:
+        """Export ebook PDF from database.
+
+        Args:
+            ebook_id: ID of the ebook to export
+
+        Returns:
+            PDF bytes
+
+        Raises:
+            DomainError: If ebook not found or PDF not available
+        """
+        start = time.perf_counter()
+        logger.info(f"📥 Exporting PDF for ebook {ebook_id}")
+
+        # Step 1: Validate ebook exists and has a PDF (light query)
+        info = await self.get_pdf_info(ebook_id)
+
         # Step 2: Get PDF bytes from repository
         pdf_bytes = await self.ebook_repository.get_ebook_bytes(ebook_id)
         if not pdf_bytes:
-            raise DomainError(
-                code=ErrorCode.VALIDATION_ERROR,
-                message="PDF not found - may have been deleted after approval",
-                actionable_hint=("Try regenerating the ebook or check if it was approved and removed"),
-            )
+            raise self._pdf_not_found()
 
         logger.info(f"✅ PDF retrieved: {len(pdf_bytes)} bytes")
 
         # Step 3: Emit domain event
+        await self._publish_exported(info, len(pdf_bytes))
+        EXPORT_DURATION.observe(time.perf_counter() - start, format="pdf")
+        return pdf_bytes
+
+    async def execute_file(self, info: EbookPdfInfo) -> str | None:
+        """Export ebook PDF as a local file from the file store.
+
+        The PDF blob is only read from the database when the file store
+        does not hold this content hash yet.
+
+        Args:
+            info: PDF metadata from get_pdf_info
+
+        Returns:
+            Local file path, or None if no file store is configured or the
+            PDF cannot be stored (callers fall back to execute)
+
+        Raises:
+            DomainError: If PDF not available
+        """
+        if not self.file_store or not info.content_hash:
+            return None
+
+        path = await self.file_store.get_path(info.content_hash)
+        if path is None:
+            pdf_bytes = await self.ebook_repository.get_ebook_bytes(info.ebook_id)
+            if not pdf_bytes:
+                raise self._pdf_not_found()
+
+            await self.file_store.put(info.content_hash, pdf_bytes)
+            path = await self.file_store.get_path(info.content_hash)
+            if path is None:
+                return None
+            logger.info(f"✅ PDF materialized in file store for ebook {info.ebook_id}: {len(pdf_bytes)} bytes")
+
+        await self._publish_exported(info, os.path.getsize(path))
+        return path
+
+    async def _publish_exported(self, info: EbookPdfInfo, file_size_bytes: int) -> None:
         await self.event_bus.publish(
             EbookExportedEvent(
-                ebook_id=ebook_id,
-                title=ebook.title or "Untitled",
-                file_size_bytes=len(pdf_bytes),
+                ebook_id=info.ebook_id,
+                title=info.title or "Untitled",
+                file_size_bytes=file_size_bytes,
                 export_format="pdf",
             )
         )
 
-        return pdf_bytes
+    @staticmethod
+    def _pdf_not_found() -> DomainError:
+        return DomainError(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="PDF not found - may have been deleted after approval",
+            actionable_hint=("Try regenerating the ebook or check if it was approved and removed"),
+        )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from backoffice.features.ebook.export.domain.events.kdp_export_generated_event import (
@@ -12,6 +14,9 @@ from backoffice.features.ebook.export.domain.protocols import (
     ImageProviderProtocol,
     KDPAssemblyProviderProtocol,
 )
+from backoffice.features.ebook.export.domain.services.kdp_export_cache_key import (
+    KdpExportCacheKey,
+)
 from backoffice.features.ebook.export.domain.services.kdp_export_validator import (
     KdpExportValidator,
 )
@@ -22,7 +27,10 @@ from backoffice.features.ebook.shared.domain.entities.ebook import (
 from backoffice.features.ebook.shared.domain.entities.theme_profile import ThemeProfile
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.export_artifact_cache_port import ExportArtifactCachePort
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.metrics import BYTES_PRODUCED, EXPORT_DURATION
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 if TYPE_CHECKING:
     from backoffice.features.ebook.shared.infrastructure.adapters.theme_repository import ThemeRepository
@@ -40,6 +48,7 @@ class ExportToKDPUseCase:
         image_provider: ImageProviderProtocol | None = None,
         kdp_assembly_provider: KDPAssemblyProviderProtocol | None = None,
         theme_repository: ThemeRepository | None = None,
+        export_cache: ExportArtifactCachePort | None = None,
     ):
         """Initialize export to KDP use case.
 
@@ -49,14 +58,17 @@ class ExportToKDPUseCase:
             image_provider: Optional image provider (uses OpenRouter if None)
             kdp_assembly_provider: Optional KDP assembly provider (uses default if None)
             theme_repository: Optional theme repository for ISBN lookup (uses default if None)
+            export_cache: Optional artifact cache (assembles on every call if None)
         """
         self.ebook_repository = ebook_repository
         self.event_bus = event_bus
         self.image_provider = image_provider
         self.kdp_assembly_provider = kdp_assembly_provider
         self.theme_repository = theme_repository
+        self.export_cache = export_cache
         logger.info("ExportToKDPUseCase initialized")
 
+    @traced_use_case("export_to_kdp")
     async def execute(
         self,
         ebook_id: int,
@@ -76,6 +88,8 @@ class ExportToKDPUseCase:
         Raises:
             DomainError: If ebook not found, not approved, or export fails
         """
+        start = time.perf_counter()
+
         # 1. Load and validate ebook
         ebook = await self.ebook_repository.get_by_id(ebook_id)
         ebook = KdpExportValidator.validate_for_export(ebook, ebook_id, preview_mode, export_type="KDP")
@@ -85,7 +99,39 @@ class ExportToKDPUseCase:
         # 2. Adjust KDP config for short books if needed
         kdp_config = KdpExportValidator.adjust_config_for_short_books(ebook, kdp_config)
 
-        # 3. Initialize providers if not injected
+        # 3. Extract ISBN and spine colors from theme config (if available)
+        isbn = self._get_isbn_from_theme(ebook.theme_id)
+        spine_colors = self._get_spine_colors_from_theme(ebook.theme_id)
+
+        if not spine_colors:
+            spine_colors = ["#FFFFFF", "#000000"]
+
+        # 4. Serve from cache when no assembly input changed
+        cache_key = KdpExportCacheKey.compute("cover", ebook, kdp_config, isbn=isbn, spine_colors=spine_colors)
+        kdp_pdf_bytes = await self.export_cache.get(cache_key) if self.export_cache else None
+
+        if kdp_pdf_bytes is None:
+            kdp_pdf_bytes = await self._assemble(ebook, kdp_config, isbn, spine_colors)
+            if self.export_cache:
+                await self.export_cache.put(cache_key, kdp_pdf_bytes)
+
+        # 5. Emit domain event
+        await self.event_bus.publish(
+            KDPExportGeneratedEvent(
+                ebook_id=ebook_id,
+                title=ebook.title or "Untitled",
+                file_size_bytes=len(kdp_pdf_bytes),
+                preview_mode=preview_mode,
+                status=ebook.status.value,
+            )
+        )
+
+        EXPORT_DURATION.observe(time.perf_counter() - start, format="kdp_cover")
+        return kdp_pdf_bytes
+
+    async def _assemble(self, ebook: Ebook, kdp_config: KDPExportConfig, isbn: str | None, spine_colors: list) -> bytes:
+        """Assemble and validate the KDP cover PDF (cache miss path)."""
+        # 1. Initialize providers if not injected
         if not self.image_provider:
             from backoffice.features.ebook.shared.infrastructure.providers.images.openrouter import (
                 openrouter_image_provider as or_provider,
@@ -93,63 +139,92 @@ class ExportToKDPUseCase:
 
             self.image_provider = or_provider.OpenRouterImageProvider()
 
-        if not self.kdp_assembly_provider:
-            from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.assembly import (
-                cover_assembly_provider as kdp_provider,
-            )
-
-            self.kdp_assembly_provider = kdp_provider.KDPAssemblyProvider()
+        kdp_assembly_provider = self._get_assembly_provider()
 
-        # 4. Get front cover bytes (WITH text - for assembly)
+        # 2. Get front cover bytes (WITH text - for assembly)
         front_cover_bytes = await self._get_front_cover_bytes(ebook)
 
-        # 5. Get back cover bytes (already generated in coloring_book_strategy)
+        # 3. Get back cover bytes (already generated in coloring_book_strategy)
         logger.info("Extracting existing back cover from ebook structure...")
         back_cover_bytes = await self._get_back_cover_bytes(ebook)
 
-        # 5b. Extract ISBN from theme config (if available)
-        isbn = self._get_isbn_from_theme(ebook.theme_id)
-
-        # 5c retrieve spine colors from theme config
-        spine_colors = self._get_spine_colors_from_theme(ebook.theme_id)
-
-        if not spine_colors:
-            spine_colors = ["#FFFFFF", "#000000"]
-
-        # 6. Assemble KDP PDF (back + spine + front)
+        # 4. Assemble KDP PDF (back + spine + front, validated against the KDP template)
         logger.info("Assembling KDP paperback PDF...")
-        kdp_pdf_bytes = await self.kdp_assembly_provider.assemble_kdp_paperback(
+        kdp_pdf_bytes = await kdp_assembly_provider.assemble_kdp_paperback(
             ebook=ebook,
             back_cover_bytes=back_cover_bytes,
             front_cover_bytes=front_cover_bytes,
             kdp_config=kdp_config,
             isbn=isbn,
-            spine_colors=spine_colors
+            spine_colors=spine_colors,
         )
 
         logger.info(f"✅ KDP export completed: {len(kdp_pdf_bytes)} bytes")
+        BYTES_PRODUCED.inc(len(kdp_pdf_bytes), artifact="kdp_cover")
 
-        # 7. Visual validation against KDP template
-        if ebook.page_count is None:  # pragma: no cover — guaranteed by validator
-            raise DomainError(code=ErrorCode.VALIDATION_ERROR, message="Ebook has no page count", actionable_hint="Regenerate the ebook first")
-        await self._validate_cover_against_template(
-            back_cover_bytes=back_cover_bytes,
-            front_cover_bytes=front_cover_bytes,
-            page_count=ebook.page_count,
+        return kdp_pdf_bytes
+
+    @traced_use_case("export_to_kdp.cover_preview")
+    async def execute_cover_preview(self, ebook_id: int, kdp_config: KDPExportConfig | None = None) -> bytes:
+        """Render the full KDP cover with the official template overlaid.
+
+        Composes the cover with the same engine (and spine) as the PDF export,
+        then overlays the template on the in-memory canvas.
+
+        Args:
+            ebook_id: ID of the ebook to preview (any status)
+            kdp_config: Optional KDP export configuration
+
+        Returns:
+            PNG bytes of the full cover with template overlay
+
+        Raises:
+            DomainError: If ebook not found or has no cover/back cover
+        """
+        start = time.perf_counter()
+        ebook = await self.ebook_repository.get_by_id(ebook_id)
+        ebook = KdpExportValidator.validate_exists(ebook, ebook_id)
+        KdpExportValidator.validate_page_count(ebook)
+        kdp_config = KdpExportValidator.adjust_config_for_short_books(ebook, kdp_config)
+
+        spine_colors = self._get_spine_colors_from_theme(ebook.theme_id) or ["#FFFFFF", "#000000"]
+
+        cache_key = KdpExportCacheKey.compute("cover_preview", ebook, kdp_config, spine_colors=spine_colors)
+        if self.export_cache:
+            cached_preview = await self.export_cache.get(cache_key)
+            if cached_preview is not None:
+                EXPORT_DURATION.observe(time.perf_counter() - start, format="kdp_cover_preview")
+                return cached_preview
+
+        from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import (
+            visual_validator,
         )
 
-        # 8. Emit domain event
-        await self.event_bus.publish(
-            KDPExportGeneratedEvent(
-                ebook_id=ebook_id,
-                title=ebook.title or "Untitled",
-                file_size_bytes=len(kdp_pdf_bytes),
-                preview_mode=preview_mode,
-                status=ebook.status.value,
+        front_cover_bytes = await self._get_front_cover_bytes(ebook)
+        back_cover_bytes = await self._get_back_cover_bytes(ebook)
+
+        # Composition and template overlay are CPU-bound: keep the event loop free
+        kdp_assembly_provider = self._get_assembly_provider()
+        full_cover = await asyncio.to_thread(kdp_assembly_provider.compose_kdp_cover, ebook, back_cover_bytes, front_cover_bytes, kdp_config, spine_colors)
+        preview_bytes = await asyncio.to_thread(visual_validator.overlay_kdp_template, full_cover.image, 0.3, True)
+
+        logger.info(f"✅ KDP cover preview generated for ebook {ebook_id}: {len(preview_bytes)} bytes")
+        BYTES_PRODUCED.inc(len(preview_bytes), artifact="kdp_cover_preview")
+        if self.export_cache:
+            await self.export_cache.put(cache_key, preview_bytes)
+        EXPORT_DURATION.observe(time.perf_counter() - start, format="kdp_cover_preview")
+        return preview_bytes
+
+    def _get_assembly_provider(self) -> KDPAssemblyProviderProtocol:
+        """Get the injected KDP assembly provider (default provider if None)."""
+        if not self.kdp_assembly_provider:
+            from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.assembly import (
+                cover_assembly_provider as kdp_provider,
             )
-        )
 
-        return kdp_pdf_bytes
+            self.kdp_assembly_provider = kdp_provider.KDPAssemblyProvider()
+
+        return self.kdp_assembly_provider
 
     def _get_isbn_from_theme(self, theme_id: str | None) -> str | None:
         """Extract ISBN from the theme configuration.
@@ -269,46 +344,3 @@ class ExportToKDPUseCase:
         back_cover_bytes = base64.b64decode(back_cover_page["image_data_base64"])
         logger.info(f"✅ Extracted back cover from ebook structure: {len(back_cover_bytes)} bytes")
         return back_cover_bytes
-
-    async def _validate_cover_against_template(
-        self,
-        back_cover_bytes: bytes,
-        front_cover_bytes: bytes,
-        page_count: int,
-    ) -> None:
-        """Validate assembled full cover against official KDP template.
-
-        This validation is informational only (logs warnings, doesn't fail export).
-
-        Args:
-            back_cover_bytes: Back cover image bytes
-            front_cover_bytes: Front cover image bytes
-            page_count: Number of pages for spine calculation
-        """
-        try:
-            from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils.visual_validator import (
-                assemble_full_kdp_cover,
-                validate_full_cover_against_template,
-            )
-
-            logger.info("🔍 Validating KDP cover against official template...")
-
-            # Assemble full cover (same logic as KDPAssemblyProvider but in PNG)
-            full_cover_bytes = assemble_full_kdp_cover(
-                back_cover_bytes=back_cover_bytes,
-                front_cover_bytes=front_cover_bytes,
-                page_count=page_count,
-            )
-
-            # Validate against template
-            validation_result = validate_full_cover_against_template(full_cover_bytes)
-
-            if validation_result.get("valid"):
-                logger.info(f"✅ {validation_result['message']}")
-            else:
-                logger.warning(f"⚠️ {validation_result['message']}")
-                logger.warning(f"   Cover size: {validation_result.get('cover_size')} vs expected: {validation_result.get('expected_size')}")
-
-        except Exception as e:
-            # Don't fail export if validation fails - just log warning
-            logger.warning(f"⚠️ KDP template validation failed (non-critical): {str(e)}")
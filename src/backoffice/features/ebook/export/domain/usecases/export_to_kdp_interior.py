@@ -1,11 +1,15 @@
 """Use case for exporting ebook interior to Amazon KDP manuscript format."""
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from backoffice.features.ebook.export.domain.events.kdp_export_generated_event import (
     KDPExportGeneratedEvent,
 )
+from backoffice.features.ebook.export.domain.services.kdp_export_cache_key import (
+    KdpExportCacheKey,
+)
 from backoffice.features.ebook.export.domain.services.kdp_export_validator import (
     KdpExportValidator,
 )
@@ -13,7 +17,10 @@ from backoffice.features.ebook.shared.domain.entities.ebook import (
     KDPExportConfig,
 )
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.export_artifact_cache_port import ExportArtifactCachePort
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.metrics import BYTES_PRODUCED, EXPORT_DURATION
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 if TYPE_CHECKING:
     from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.assembly import (
@@ -31,12 +38,15 @@ class ExportToKDPInteriorUseCase:
         ebook_repository: EbookPort,
         event_bus: EventBus,
         kdp_interior_assembly_provider: ("interior_assembly_provider.KDPInteriorAssemblyProvider | None") = None,
+        export_cache: ExportArtifactCachePort | None = None,
     ):
         self.ebook_repository = ebook_repository
         self.event_bus = event_bus
         self.kdp_interior_assembly_provider = kdp_interior_assembly_provider
+        self.export_cache = export_cache
         logger.info("ExportToKDPInteriorUseCase initialized")
 
+    @traced_use_case("export_to_kdp_interior")
     async def execute(
         self,
         ebook_id: int,
@@ -56,6 +66,8 @@ class ExportToKDPInteriorUseCase:
         Raises:
             DomainError: If ebook not found, not approved, or export fails
         """
+        start = time.perf_counter()
+
         # 1. Load and validate ebook
         ebook = await self.ebook_repository.get_by_id(ebook_id)
         ebook = KdpExportValidator.validate_for_export(ebook, ebook_id, preview_mode, export_type="KDP interior")
@@ -65,22 +77,31 @@ class ExportToKDPInteriorUseCase:
         # 2. Adjust KDP config for short books if needed
         kdp_config = KdpExportValidator.adjust_config_for_short_books(ebook, kdp_config)
 
-        # 3. Initialize provider if not injected
-        if not self.kdp_interior_assembly_provider:
-            from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.assembly import (
-                interior_assembly_provider as kdp_provider,
-            )
+        # 3. Serve from cache when no assembly input changed
+        cache_key = KdpExportCacheKey.compute("interior", ebook, kdp_config, isbn=self._get_isbn_from_theme(ebook.theme_id))
+        kdp_interior_pdf_bytes = await self.export_cache.get(cache_key) if self.export_cache else None
 
-            self.kdp_interior_assembly_provider = kdp_provider.KDPInteriorAssemblyProvider()
+        if kdp_interior_pdf_bytes is None:
+            # 4. Initialize provider if not injected
+            if not self.kdp_interior_assembly_provider:
+                from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.assembly import (
+                    interior_assembly_provider as kdp_provider,
+                )
 
-        # 4. Assemble KDP interior PDF (content pages only, no cover/back)
-        logger.info("Assembling KDP interior/manuscript PDF...")
-        kdp_interior_pdf_bytes = await self.kdp_interior_assembly_provider.assemble_kdp_interior(
-            ebook=ebook,
-            kdp_config=kdp_config,
-        )
+                self.kdp_interior_assembly_provider = kdp_provider.KDPInteriorAssemblyProvider()
+
+            # Assemble KDP interior PDF (content pages only, no cover/back)
+            logger.info("Assembling KDP interior/manuscript PDF...")
+            kdp_interior_pdf_bytes = await self.kdp_interior_assembly_provider.assemble_kdp_interior(
+                ebook=ebook,
+                kdp_config=kdp_config,
+            )
 
-        logger.info(f"✅ KDP interior export completed: {len(kdp_interior_pdf_bytes)} bytes")
+            logger.info(f"✅ KDP interior export completed: {len(kdp_interior_pdf_bytes)} bytes")
+            BYTES_PRODUCED.inc(len(kdp_interior_pdf_bytes), artifact="kdp_interior")
+
+            if self.export_cache:
+                await self.export_cache.put(cache_key, kdp_interior_pdf_bytes)
 
         # 5. Emit domain event
         await self.event_bus.publish(
@@ -93,4 +114,22 @@ class ExportToKDPInteriorUseCase:
             )
         )
 
+        EXPORT_DURATION.observe(time.perf_counter() - start, format="kdp_interior")
         return kdp_interior_pdf_bytes
+
+    @staticmethod
+    def _get_isbn_from_theme(theme_id: str | None) -> str | None:
+        """Get the theme ISBN printed on the legal page (part of the cache key)."""
+        if not theme_id:
+            return None
+
+        try:
+            from backoffice.features.ebook.shared.infrastructure.adapters.theme_repository import (
+                ThemeRepository,
+            )
+
+            theme = ThemeRepository().get_theme_by_id(theme_id)
+            return theme.back_cover.isbn if theme and theme.back_cover else None
+        except Exception as e:
+            logger.warning(f"Could not load theme for ISBN: {e}")
+            return None
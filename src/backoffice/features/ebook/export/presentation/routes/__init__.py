@@ -1,26 +1,24 @@
 """API routes for ebook export feature."""
 
-import base64
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response as FastAPIResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, Response as FastAPIResponse
 
 from backoffice.features.ebook.export.domain.usecases.export_ebook_pdf import ExportEbookPdfUseCase
 from backoffice.features.ebook.export.domain.usecases.export_to_kdp import ExportToKDPUseCase
 from backoffice.features.ebook.export.domain.usecases.export_to_kdp_interior import (
     ExportToKDPInteriorUseCase,
 )
+from backoffice.features.ebook.regeneration.presentation.routes.dependencies import get_pdf_rebuild_scheduler
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError
 from backoffice.features.ebook.shared.infrastructure.factories.repository_factory import (
     RepositoryFactory,
     get_repository_factory,
 )
-from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import (
-    visual_validator,
-)
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.presentation.routes.http_caching import cached_binary_response, etag_matches
 
 # Type alias for dependency injection
 RepositoryFactoryDep = Annotated[RepositoryFactory, Depends(get_repository_factory)]
@@ -30,17 +28,19 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/{ebook_id}/pdf")
-async def export_ebook_pdf(ebook_id: int, factory: RepositoryFactoryDep) -> FastAPIResponse:
+async def export_ebook_pdf(ebook_id: int, request: Request, factory: RepositoryFactoryDep) -> FastAPIResponse:
     """Export raw ebook PDF from database.
 
     This endpoint:
-    1. Validates ebook exists
-    2. Retrieves PDF bytes from database
-    3. Emits EbookExportedEvent
-    4. Returns PDF with proper headers for download
+    1. Validates ebook exists (light query: title + content hash only),
+       rebuilding first if page edits are still pending
+    2. Answers 304 if the client copy is current (content-hash ETag)
+    3. Streams the PDF from the file store (Range supported)
+    4. Emits EbookExportedEvent
 
     Args:
         ebook_id: ID of the ebook to export
+        request: FastAPI request (If-None-Match / Range)
         factory: Repository factory for dependency injection
 
     Returns:
@@ -55,27 +55,33 @@ async def export_ebook_pdf(ebook_id: int, factory: RepositoryFactoryDep) -> Fast
         # Create use case with dependencies
         ebook_repo = factory.get_ebook_repository()
         event_bus = EventBus()
-        use_case = ExportEbookPdfUseCase(ebook_repository=ebook_repo, event_bus=event_bus)
+        use_case = ExportEbookPdfUseCase(
+            ebook_repository=ebook_repo,
+            event_bus=event_bus,
+            file_store=factory.get_export_cache(),
+            pdf_rebuild_scheduler=get_pdf_rebuild_scheduler(),
+        )
 
-        # Execute export
-        pdf_bytes = await use_case.execute(ebook_id)
+        # Title and content hash only (no page images, no PDF bytes)
+        info = await use_case.get_pdf_info(ebook_id)
+        filename = f"{info.title}.pdf" if info.title else f"ebook_{ebook_id}.pdf"
+        etag = f'"{info.content_hash}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",  # Always revalidate: the PDF changes after regeneration
+            "Content-Disposition": f'inline; filename="{filename}"',
+        }
 
-        # Get ebook for filename
-        ebook = await ebook_repo.get_by_id(ebook_id)
-        filename = f"{ebook.title}.pdf" if ebook and ebook.title else f"ebook_{ebook_id}.pdf"
-
-        # Return PDF with proper headers
-        # Note: Cache disabled to ensure fresh PDF after regeneration (especially with LocalFileStorage)
-        return FastAPIResponse(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'inline; filename="{filename}"',
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
-            },
-        )
+        if etag_matches(request, etag):
+            return FastAPIResponse(status_code=304, headers=headers)
+
+        # Stream from disk (constant memory, Range handled by FileResponse)
+        pdf_path = await use_case.execute_file(info)
+        if pdf_path:
+            return FileResponse(pdf_path, media_type="application/pdf", headers=headers)
+
+        pdf_bytes = await use_case.execute(ebook_id)
+        return cached_binary_response(request, pdf_bytes, "application/pdf", headers["Content-Disposition"], etag=etag)
 
     except DomainError as e:
         logger.warning(f"Domain error exporting PDF for ebook {ebook_id}: {e}")
@@ -87,7 +93,7 @@ async def export_ebook_pdf(ebook_id: int, factory: RepositoryFactoryDep) -> Fast
 
 
 @router.get("/{ebook_id}/export-kdp")
-async def export_ebook_to_kdp(ebook_id: int, factory: RepositoryFactoryDep, preview: bool = False) -> FastAPIResponse:
+async def export_ebook_to_kdp(ebook_id: int, request: Request, factory: RepositoryFactoryDep, preview: bool = False) -> FastAPIResponse:
     """Export ebook to Amazon KDP paperback format.
 
     This endpoint:
@@ -98,6 +104,7 @@ async def export_ebook_to_kdp(ebook_id: int, factory: RepositoryFactoryDep, prev
 
     Args:
         ebook_id: ID of the ebook to export
+        request: FastAPI request (If-None-Match revalidation)
         factory: Repository factory for dependency injection
         preview: If True, display inline (allows DRAFT); if False, download (requires APPROVED)
 
@@ -113,7 +120,7 @@ async def export_ebook_to_kdp(ebook_id: int, factory: RepositoryFactoryDep, prev
         # Create use case with dependencies
         ebook_repo = factory.get_ebook_repository()
         event_bus = EventBus()
-        use_case = ExportToKDPUseCase(ebook_repository=ebook_repo, event_bus=event_bus)
+        use_case = ExportToKDPUseCase(ebook_repository=ebook_repo, event_bus=event_bus, export_cache=factory.get_export_cache())
 
         # Execute export (preview_mode=True allows DRAFT, False requires APPROVED)
         kdp_pdf_bytes = await use_case.execute(ebook_id, preview_mode=preview)
@@ -124,14 +131,7 @@ async def export_ebook_to_kdp(ebook_id: int, factory: RepositoryFactoryDep, prev
 
         # Return PDF (inline for preview, attachment for download)
         disposition = "inline" if preview else "attachment"
-        return FastAPIResponse(
-            content=kdp_pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'{disposition}; filename="{filename}"',
-                "Cache-Control": "no-cache",
-            },
-        )
+        return cached_binary_response(request, kdp_pdf_bytes, "application/pdf", f'{disposition}; filename="{filename}"')
 
     except DomainError as e:
         logger.warning(f"Domain error exporting ebook {ebook_id} to KDP: {e}")
@@ -145,7 +145,7 @@ async def export_ebook_to_kdp(ebook_id: int, factory: RepositoryFactoryDep, prev
 
 
 @router.get("/{ebook_id}/export-kdp/interior")
-async def export_ebook_to_kdp_interior(ebook_id: int, factory: RepositoryFactoryDep, preview: bool = False) -> FastAPIResponse:
+async def export_ebook_to_kdp_interior(ebook_id: int, request: Request, factory: RepositoryFactoryDep, preview: bool = False) -> FastAPIResponse:
     """Export ebook interior/manuscript to Amazon KDP format.
 
     This endpoint:
@@ -157,6 +157,7 @@ async def export_ebook_to_kdp_interior(ebook_id: int, factory: RepositoryFactory
 
     Args:
         ebook_id: ID of the ebook to export
+        request: FastAPI request (If-None-Match revalidation)
         factory: Repository factory for dependency injection
         preview: If True, display inline (allows DRAFT); if False, download (requires APPROVED)
 
@@ -172,7 +173,7 @@ async def export_ebook_to_kdp_interior(ebook_id: int, factory: RepositoryFactory
         # Create use case with dependencies
         ebook_repo = factory.get_ebook_repository()
         event_bus = EventBus()
-        use_case = ExportToKDPInteriorUseCase(ebook_repository=ebook_repo, event_bus=event_bus)
+        use_case = ExportToKDPInteriorUseCase(ebook_repository=ebook_repo, event_bus=event_bus, export_cache=factory.get_export_cache())
 
         # Execute export (preview_mode=True allows DRAFT, False requires APPROVED)
         kdp_interior_pdf_bytes = await use_case.execute(ebook_id, preview_mode=preview)
@@ -183,14 +184,7 @@ async def export_ebook_to_kdp_interior(ebook_id: int, factory: RepositoryFactory
 
         # Return PDF (inline for preview, attachment for download)
         disposition = "inline" if preview else "attachment"
-        return FastAPIResponse(
-            content=kdp_interior_pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'{disposition}; filename="{filename}"',
-                "Cache-Control": "no-cache",
-            },
-        )
+        return cached_binary_response(request, kdp_interior_pdf_bytes, "application/pdf", f'{disposition}; filename="{filename}"')
 
     except DomainError as e:
         logger.warning(f"Domain error exporting ebook {ebook_id} interior to KDP: {e}")
@@ -204,18 +198,18 @@ async def export_ebook_to_kdp_interior(ebook_id: int, factory: RepositoryFactory
 
 
 @router.get("/{ebook_id}/kdp-cover-preview")
-async def get_kdp_cover_preview(ebook_id: int, factory: RepositoryFactoryDep) -> FastAPIResponse:
+async def get_kdp_cover_preview(ebook_id: int, request: Request, factory: RepositoryFactoryDep) -> FastAPIResponse:
     """Get full KDP cover (back + spine + front) with KDP template overlay for visual validation.
 
     This endpoint:
     1. Retrieves ebook and validates it exists
-    2. Extracts cover and back cover images
-    3. Assembles full KDP cover (back + spine + front)
-    4. Overlays official KDP template for visual validation
-    5. Returns PNG image with overlay
+    2. Composes the full KDP cover exactly as the KDP PDF export does
+    3. Overlays official KDP template for visual validation
+    4. Returns PNG image with overlay
 
     Args:
         ebook_id: ID of the ebook
+        request: FastAPI request (If-None-Match revalidation)
         factory: Repository factory for dependency injection
 
     Returns:
@@ -227,98 +221,17 @@ async def get_kdp_cover_preview(ebook_id: int, factory: RepositoryFactoryDep) ->
     try:
         logger.info(f"KDP cover preview requested for ebook {ebook_id}")
 
-        # Get ebook
         ebook_repo = factory.get_ebook_repository()
-        ebook = await ebook_repo.get_by_id(ebook_id)
+        use_case = ExportToKDPUseCase(ebook_repository=ebook_repo, event_bus=EventBus(), export_cache=factory.get_export_cache())
 
-        if not ebook:
-            raise HTTPException(status_code=404, detail=f"Ebook {ebook_id} not found")
-
-        # Validate structure exists
-        if not ebook.structure_json or "pages_meta" not in ebook.structure_json:
-            raise HTTPException(status_code=400, detail="Ebook structure not available - no pages found")
-
-        # Extract cover and back cover from structure
-        pages_meta = ebook.structure_json["pages_meta"]
-        if not isinstance(pages_meta, list):
-            raise HTTPException(status_code=400, detail="Invalid structure format")
-
-        # Get cover (first page) and back cover (last page) by index, not by page_number
-        # Note: page_number can be inconsistent after regeneration
-        if len(pages_meta) < 2:
-            raise HTTPException(status_code=400, detail="Ebook must have at least cover and back cover")
-
-        cover_page = pages_meta[0]  # First page
-        back_cover_page = pages_meta[-1]  # Last page
-
-        if not cover_page or not cover_page.get("image_data_base64"):
-            raise HTTPException(status_code=400, detail="Cover image not available")
-
-        if not back_cover_page or not back_cover_page.get("image_data_base64"):
-            raise HTTPException(status_code=400, detail="Back cover image not available")
-
-        # Decode base64 image data
-        cover_bytes = base64.b64decode(cover_page["image_data_base64"])
-        back_cover_bytes = base64.b64decode(back_cover_page["image_data_base64"])
-
-        # Resize images to KDP required dimensions (8.5" × 8.5" @ 300 DPI = 2550×2550px)
-        from io import BytesIO
-
-        from PIL import Image
-
-        # Resize cover
-        cover_img = Image.open(BytesIO(cover_bytes))
-        if cover_img.size != (2550, 2550):
-            logger.info(f"Resizing cover from {cover_img.size} to (2550, 2550)")
-            cover_img = cover_img.resize((2550, 2550), Image.Resampling.LANCZOS)
-            buffer = BytesIO()
-            cover_img.save(buffer, format="PNG")
-            cover_bytes = buffer.getvalue()
-
-        # Resize back cover (barcode space is already present and will be resized proportionally)
-        back_cover_img = Image.open(BytesIO(back_cover_bytes))
-        if back_cover_img.size != (2550, 2550):
-            logger.info(f"Resizing back cover from {back_cover_img.size} to (2550, 2550)")
-            back_cover_img = back_cover_img.resize((2550, 2550), Image.Resampling.LANCZOS)
-            buffer = BytesIO()
-            back_cover_img.save(buffer, format="PNG")
-            back_cover_bytes = buffer.getvalue()
-
-        # Assemble full KDP cover (back + spine + front)
-        page_count = ebook.config.number_of_pages if ebook.config and ebook.config.number_of_pages else 24
-        logger.warning(f"🔍 DEBUG: About to call assemble_full_kdp_cover() with page_count={page_count}")
-        logger.warning(f"   Back cover size: {len(back_cover_bytes)} bytes")
-        logger.warning(f"   Front cover size: {len(cover_bytes)} bytes")
-
-        try:
-            full_cover_bytes = visual_validator.assemble_full_kdp_cover(
-                back_cover_bytes=back_cover_bytes,
-                front_cover_bytes=cover_bytes,
-                page_count=page_count,
-            )
-            logger.warning(f"✅ DEBUG: assemble_full_kdp_cover() returned {len(full_cover_bytes)} bytes")
-        except Exception as e:
-            logger.error(f"❌ EXCEPTION in assemble_full_kdp_cover(): {e}", exc_info=True)
-            # Re-raise to see full traceback
-            raise
-
-        # Overlay KDP template for visual validation
-        preview_bytes = visual_validator.overlay_kdp_template(full_cover_bytes, template_opacity=0.3, show_measurements=True)
-
-        logger.info(f"✅ KDP cover preview generated for ebook {ebook_id}")
-
-        # Return PNG image
-        return FastAPIResponse(
-            content=preview_bytes,
-            media_type="image/png",
-            headers={
-                "Content-Disposition": f'inline; filename="ebook_{ebook_id}_kdp_cover_preview.png"',
-                "Cache-Control": "no-cache",
-            },
-        )
+        preview_bytes = await use_case.execute_cover_preview(ebook_id)
 
-    except HTTPException:
-        raise
+        return cached_binary_response(request, preview_bytes, "image/png", f'inline; filename="ebook_{ebook_id}_kdp_cover_preview.png"')
+
+    except DomainError as e:
+        logger.warning(f"Domain error generating KDP cover preview for ebook {ebook_id}: {e}")
+        status_code = 404 if e.code.value == "EBOOK_NOT_FOUND" else 400
+        raise HTTPException(status_code=status_code, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Error generating KDP cover preview for ebook {ebook_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error generating KDP cover preview: {str(e)}") from e
@@ -0,0 +1 @@
+"""Unit tests for export domain layer."""
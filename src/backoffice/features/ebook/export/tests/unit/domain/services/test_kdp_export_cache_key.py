@@ -0,0 +1,57 @@
+"""Unit tests for KdpExportCacheKey."""
+
+from datetime import datetime
+
+from backoffice.features.ebook.export.domain.services.kdp_export_cache_key import KdpExportCacheKey
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
+
+LEGAL_CONFIG = {"copyright": {"publisher": "Nash Editions", "year": 2026}}
+
+
+def _ebook() -> Ebook:
+    return Ebook(
+        id=1,
+        title="Dinosaurs",
+        author="Test",
+        created_at=datetime(2026, 1, 1),
+        status=EbookStatus.APPROVED,
+        theme_id="dinosaurs",
+        page_count=24,
+        structure_json={"pages_meta": [{"image_data_base64": "aGVsbG8="}]},
+    )
+
+
+def test_key_is_stable_for_identical_inputs(tmp_path):
+    (tmp_path / "dinosaurs.yml").write_text("label: Dinosaurs\n")
+
+    first = KdpExportCacheKey.compute("interior", _ebook(), themes_directory=tmp_path, legal_config=LEGAL_CONFIG)
+    second = KdpExportCacheKey.compute("interior", _ebook(), themes_directory=tmp_path, legal_config=dict(LEGAL_CONFIG))
+
+    assert first == second
+
+
+def test_editing_the_theme_file_changes_the_key(tmp_path):
+    theme_file = tmp_path / "dinosaurs.yml"
+    theme_file.write_text("label: Dinosaurs\nback_cover:\n  isbn: null\n")
+    before = KdpExportCacheKey.compute("cover", _ebook(), themes_directory=tmp_path, legal_config=LEGAL_CONFIG)
+
+    theme_file.write_text("label: Dinosaurs\nback_cover:\n  isbn: null\n  tagline: New tagline\n")  # Same theme_version
+    after = KdpExportCacheKey.compute("cover", _ebook(), themes_directory=tmp_path, legal_config=LEGAL_CONFIG)
+
+    assert before != after
+
+
+def test_editing_the_legal_config_changes_the_key(tmp_path):
+    (tmp_path / "dinosaurs.yml").write_text("label: Dinosaurs\n")
+    edited = {"copyright": {"publisher": "Nash Editions", "year": 2027}}
+
+    before = KdpExportCacheKey.compute("interior", _ebook(), themes_directory=tmp_path, legal_config=LEGAL_CONFIG)
+    after = KdpExportCacheKey.compute("interior", _ebook(), themes_directory=tmp_path, legal_config=edited)
+
+    assert before != after
+
+
+def test_hashes_of_missing_or_default_inputs(tmp_path):
+    assert KdpExportCacheKey.theme_file_hash("unknown", tmp_path) is None
+    assert KdpExportCacheKey.theme_file_hash(None) is None
+    assert KdpExportCacheKey.legal_config_hash() is not None  # Loaded from config/publishing/legal.yaml
@@ -0,0 +1,102 @@
+"""Unit tests for ExportEbookPdfUseCase (light metadata + file store delivery)."""
+
+import hashlib
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from backoffice.features.ebook.export.domain.usecases.export_ebook_pdf import ExportEbookPdfUseCase
+from backoffice.features.ebook.shared.domain.entities.ebook import EbookPdfInfo
+from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
+from backoffice.features.ebook.shared.domain.services.pdf_rebuild_scheduler import PdfRebuildScheduler
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_export_artifact_cache import (
+    DiskExportArtifactCache,
+)
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+
+PDF_BYTES = b"%PDF-1.7 fake ebook content"
+
+
+class FakeEbookRepository:
+    """Fake repository exposing only the PDF surface, counting blob loads."""
+
+    def __init__(self, pdfs: dict[int, bytes | None]):
+        self.pdfs = pdfs
+        self.bytes_loads = 0
+        self.dirty_at: dict[int, datetime] = {}
+
+    async def get_ebook_pdf_info(self, ebook_id: int) -> EbookPdfInfo | None:
+        if ebook_id not in self.pdfs:
+            return None
+        pdf = self.pdfs[ebook_id]
+        content_hash = hashlib.sha256(pdf).hexdigest() if pdf else None
+        return EbookPdfInfo(ebook_id=ebook_id, title="Test Book", content_hash=content_hash, pdf_dirty_at=self.dirty_at.get(ebook_id))
+
+    async def get_ebook_bytes(self, ebook_id: int) -> bytes | None:
+        self.bytes_loads += 1
+        return self.pdfs.get(ebook_id)
+
+
+@pytest.fixture
+def repository():
+    return FakeEbookRepository({1: PDF_BYTES, 2: None})
+
+
+@pytest.fixture
+def use_case(repository, tmp_path):
+    return ExportEbookPdfUseCase(ebook_repository=repository, event_bus=EventBus(), file_store=DiskExportArtifactCache(cache_path=str(tmp_path)))
+
+
+async def test_pdf_materialized_once_then_served_from_file(use_case, repository):
+    """The PDF blob is read once; later downloads stream the stored file."""
+    info = await use_case.get_pdf_info(1)
+
+    first = await use_case.execute_file(info)
+    second = await use_case.execute_file(info)
+
+    assert first == second
+    assert Path(first).read_bytes() == PDF_BYTES
+    assert repository.bytes_loads == 1
+
+
+async def test_missing_ebook_and_missing_pdf(use_case):
+    with pytest.raises(DomainError) as not_found:
+        await use_case.get_pdf_info(99)
+    with pytest.raises(DomainError) as no_pdf:
+        await use_case.get_pdf_info(2)
+
+    assert not_found.value.code == ErrorCode.EBOOK_NOT_FOUND
+    assert no_pdf.value.code == ErrorCode.VALIDATION_ERROR
+
+
+async def test_without_file_store_falls_back_to_bytes(repository):
+    use_case = ExportEbookPdfUseCase(ebook_repository=repository, event_bus=EventBus())
+    info = await use_case.get_pdf_info(1)
+
+    assert await use_case.execute_file(info) is None
+    assert await use_case.execute(1) == PDF_BYTES
+
+
+async def test_dirty_pdf_is_rebuilt_before_serving(repository, tmp_path):
+    """A PDF waiting for its debounced rebuild is rebuilt on read."""
+    repository.dirty_at[1] = datetime(2026, 1, 1)
+
+    async def rebuild(ebook_id: int) -> None:
+        repository.pdfs[ebook_id] = b"%PDF-1.7 rebuilt"
+        repository.dirty_at.pop(ebook_id)
+
+    scheduler = PdfRebuildScheduler(rebuild, debounce_seconds=60)
+    scheduler.schedule(1)
+    use_case = ExportEbookPdfUseCase(
+        ebook_repository=repository,
+        event_bus=EventBus(),
+        file_store=DiskExportArtifactCache(cache_path=str(tmp_path)),
+        pdf_rebuild_scheduler=scheduler,
+    )
+
+    info = await use_case.get_pdf_info(1)
+
+    assert info.pdf_dirty_at is None
+    assert not scheduler.is_pending(1)
+    assert Path(await use_case.execute_file(info)).read_bytes() == b"%PDF-1.7 rebuilt"
@@ -58,6 +58,19 @@ class FakeKDPInteriorAssemblyProvider:
         return b"%PDF-1.7 fake kdp interior content"
 
 
+class FakeExportArtifactCache:
+    """Fake in-memory export artifact cache."""
+
+    def __init__(self):
+        self.entries: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.entries.get(key)
+
+    async def put(self, key: str, data: bytes) -> None:
+        self.entries[key] = data
+
+
 class TestExportToKDPInteriorUseCase:
     """Test cases for KDP interior export use case."""
 
@@ -222,3 +235,38 @@ class TestExportToKDPInteriorUseCase:
         # Assert
         assert fake_assembly_provider.last_config.trim_size == (6.0, 9.0)
         assert fake_assembly_provider.last_config.paper_type == "standard_color"
+
+    async def test_export_served_from_cache_until_page_changes(
+        self,
+        ebook_repository,
+        event_bus,
+        sample_ebook_with_structure,
+        fake_assembly_provider,
+    ):
+        """Unchanged ebooks are served from cache, editing a page reassembles."""
+        # Arrange
+        cache = FakeExportArtifactCache()
+        use_case = ExportToKDPInteriorUseCase(
+            ebook_repository=ebook_repository,
+            event_bus=event_bus,
+            kdp_interior_assembly_provider=fake_assembly_provider,
+            export_cache=cache,
+        )
+        ebook_repository.add_ebook(sample_ebook_with_structure)
+
+        # Act
+        first = await use_case.execute(ebook_id=1)
+        second = await use_case.execute(ebook_id=1)
+
+        # Assert
+        assert first == second
+        assert fake_assembly_provider.call_count == 1
+        assert len(cache.entries) == 1
+
+        # Act - edit one page
+        sample_ebook_with_structure.structure_json["pages_meta"][3]["image_data_base64"] = base64.b64encode(b"edited").decode()
+        await use_case.execute(ebook_id=1)
+
+        # Assert
+        assert fake_assembly_provider.call_count == 2
+        assert len(cache.entries) == 2
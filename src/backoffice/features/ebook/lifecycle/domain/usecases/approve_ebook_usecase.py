@@ -12,9 +12,11 @@ from backoffice.features.ebook.lifecycle.domain.events.ebook_approved_event impo
 from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.export_artifact_cache_port import ExportArtifactCachePort
 from backoffice.features.ebook.shared.domain.ports.file_storage_port import FileStoragePort
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,7 @@ class ApproveEbookUseCase:
         ebook_repository: EbookPort,
         file_storage: FileStoragePort,
         event_bus: EventBus,
+        export_cache: ExportArtifactCachePort | None = None,
     ):
         """Initialize use case with dependencies.
 
@@ -43,12 +46,15 @@ class ApproveEbookUseCase:
             ebook_repository: Repository for ebook persistence
             file_storage: File storage service (e.g., Google Drive)
             event_bus: Event bus for publishing domain events
+            export_cache: Optional artifact cache shared with the KDP export routes
         """
         self.ebook_repository = ebook_repository
         self.file_storage = file_storage
         self.event_bus = event_bus
+        self.export_cache = export_cache
         logger.info("ApproveEbookUseCase initialized")
 
+    @traced_use_case("approve_ebook")
     async def execute(self, ebook_id: int) -> Ebook:
         """Approve an ebook and upload KDP files to storage.
 
@@ -78,7 +84,7 @@ class ApproveEbookUseCase:
         # 4. Generate KDP Cover PDF (back + spine + front)
         try:
             logger.info("Generating KDP Cover PDF...")
-            export_kdp_use_case = ExportToKDPUseCase(ebook_repository=self.ebook_repository, event_bus=self.event_bus)
+            export_kdp_use_case = ExportToKDPUseCase(ebook_repository=self.ebook_repository, event_bus=self.event_bus, export_cache=self.export_cache)
             cover_pdf_bytes = await export_kdp_use_case.execute(
                 ebook_id=ebook_id,
                 preview_mode=True,  # Allow DRAFT during approval
@@ -95,7 +101,7 @@ class ApproveEbookUseCase:
         # 5. Generate KDP Interior PDF (content pages only)
         try:
             logger.info("Generating KDP Interior PDF...")
-            export_interior_use_case = ExportToKDPInteriorUseCase(ebook_repository=self.ebook_repository, event_bus=self.event_bus)
+            export_interior_use_case = ExportToKDPInteriorUseCase(ebook_repository=self.ebook_repository, event_bus=self.event_bus, export_cache=self.export_cache)
             interior_pdf_bytes = await export_interior_use_case.execute(
                 ebook_id=ebook_id,
                 preview_mode=True,  # Allow DRAFT during approval
@@ -9,6 +9,7 @@ from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookS
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class RejectEbookUseCase:
         self.event_bus = event_bus
         logger.info("RejectEbookUseCase initialized")
 
+    @traced_use_case("reject_ebook")
     async def execute(self, ebook_id: int, reason: str | None = None) -> Ebook:
         """Reject an ebook (manual review decision).
 
@@ -59,7 +59,7 @@ async def approve_ebook(ebook_id: int, request: Request, factory: RepositoryFact
         ebook_repo = factory.get_ebook_repository()
         file_storage = factory.get_file_storage()
         event_bus = EventBus()
-        approve_usecase = ApproveEbookUseCase(ebook_repo, file_storage, event_bus)
+        approve_usecase = ApproveEbookUseCase(ebook_repo, file_storage, event_bus, export_cache=factory.get_export_cache())
         updated_ebook = await approve_usecase.execute(ebook_id)
 
         ebook_data = {
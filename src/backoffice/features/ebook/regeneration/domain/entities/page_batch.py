@@ -0,0 +1,33 @@
+"""Value objects for batch content page regeneration."""
+
+from dataclasses import dataclass, field
+
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook
+
+
+@dataclass(frozen=True)
+class PageRegenerationItem:
+    """A content page to regenerate in a batch.
+
+    Attributes:
+        page_index: Index of the page (1-based, excluding cover)
+        custom_prompt: Optional prompt to use instead of the theme template
+    """
+
+    page_index: int
+    custom_prompt: str | None = None
+
+
+@dataclass
+class PageBatchResult:
+    """Outcome of a batch regeneration.
+
+    Attributes:
+        ebook: Updated ebook (one save for the whole batch)
+        regenerated_pages: Indexes of the pages replaced
+        failed_pages: Error message per page index that kept its previous image
+    """
+
+    ebook: Ebook
+    regenerated_pages: list[int] = field(default_factory=list)
+    failed_pages: dict[int, str] = field(default_factory=dict)
@@ -0,0 +1,73 @@
+"""Preview candidate resolution shared by the preview, edit and apply use cases."""
+
+import base64
+
+from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import (
+    PreviewCandidate,
+    PreviewCandidatePort,
+)
+
+
+class PreviewCandidateService:
+    """Load and store preview candidates for the modal regenerate/edit loop.
+
+    Use cases without a candidate store keep the legacy base64 contract, so
+    both helpers accept an optional store.
+    """
+
+    @staticmethod
+    async def load(
+        candidate_store: PreviewCandidatePort | None,
+        ebook_id: int,
+        page_index: int,
+        candidate_id: str,
+    ) -> PreviewCandidate:
+        """Load a candidate for a page.
+
+        Args:
+            candidate_store: Candidate store (None if not configured)
+            ebook_id: ID of the ebook
+            page_index: Page the candidate must belong to
+            candidate_id: Candidate id sent by the client
+
+        Returns:
+            The candidate
+
+        Raises:
+            DomainError: If the candidate is unknown, expired or belongs to another page
+        """
+        candidate = await candidate_store.get(ebook_id, candidate_id) if candidate_store else None
+        if candidate is None or candidate.page_index != page_index:
+            raise DomainError(
+                code=ErrorCode.PREVIEW_CANDIDATE_EXPIRED,
+                message=f"Preview {candidate_id[:8]} not found for page {page_index} of ebook {ebook_id}",
+                actionable_hint="The preview has expired, generate a new one",
+            )
+        return candidate
+
+    @staticmethod
+    async def store_result(
+        candidate_store: PreviewCandidatePort | None,
+        ebook_id: int,
+        page_index: int,
+        image_data: bytes,
+        prompt: str | None = None,
+    ) -> dict[str, str]:
+        """Keep a preview image server-side.
+
+        Args:
+            candidate_store: Candidate store (None for the legacy base64 contract)
+            ebook_id: ID of the ebook
+            page_index: Page the image was generated for
+            image_data: Preview image bytes
+            prompt: Generation prompt (None for edits)
+
+        Returns:
+            {"candidate_id": ...}, or {"image_base64": ...} without a store
+        """
+        if candidate_store is None:
+            return {"image_base64": base64.b64encode(image_data).decode("utf-8")}
+
+        candidate = await candidate_store.put(ebook_id, page_index, image_data, prompt)
+        return {"candidate_id": candidate.candidate_id}
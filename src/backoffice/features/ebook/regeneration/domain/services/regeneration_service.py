@@ -8,6 +8,7 @@ from pathlib import Path
 from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
 from backoffice.features.ebook.shared.domain.ports.assembly_port import AssembledPage
 from backoffice.features.ebook.shared.domain.ports.file_storage_port import FileStoragePort
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import PageThumbnailPort
 from backoffice.features.ebook.shared.domain.services.pdf_assembly import PDFAssemblyService
 
 logger = logging.getLogger(__name__)
@@ -24,15 +25,18 @@ class RegenerationService:
         self,
         assembly_service: PDFAssemblyService,
         file_storage: FileStoragePort,
+        thumbnail_store: PageThumbnailPort | None = None,
     ):
         """Initialize regeneration service.
 
         Args:
             assembly_service: Service for PDF assembly
             file_storage: Service for file storage (Google Drive)
+            thumbnail_store: Optional store for WebP page thumbnails
         """
         self.assembly_service = assembly_service
         self.file_storage = file_storage
+        self.thumbnail_store = thumbnail_store
 
     def validate_ebook_for_regeneration(self, ebook: Ebook) -> None:
         """Validate that ebook can be regenerated.
@@ -68,7 +72,8 @@ class RegenerationService:
         1. Assembles pages into PDF
         2. Saves PDF bytes to database (for preview endpoint)
         3. Uploads to file storage if available (Google Drive or local)
-        4. Returns PDF path and preview URL
+        4. Renders thumbnails for new page images (if a thumbnail store is set)
+        5. Returns PDF path and preview URL
 
         Args:
             ebook: Ebook being regenerated
@@ -113,8 +118,28 @@ class RegenerationService:
             filename_suffix=filename_suffix,
         )
 
+        await self.render_page_thumbnails([page.image_data for page in assembled_pages])
+
         return pdf_path, preview_url
 
+    async def render_page_thumbnails(self, page_images: list[bytes]) -> None:
+        """Render WebP thumbnails for page images.
+
+        Unchanged pages already have their renditions and are skipped by the
+        store. Failures are logged: thumbnails are also rendered on first read.
+
+        Args:
+            page_images: Original page image bytes
+        """
+        if self.thumbnail_store is None:
+            return
+
+        for image_data in page_images:
+            try:
+                await self.thumbnail_store.render(image_data)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to render page thumbnails: {e}")
+
     async def _upload_pdf_to_storage(
         self,
         ebook: Ebook,
@@ -2,13 +2,13 @@
 import asyncio
 import base64
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import Literal
 
 from backoffice.features.ebook.regeneration.domain.services.regeneration_service import (
     RegenerationService,
 )
-from backoffice.features.ebook.shared.domain.constants import MAX_PAGES
+from backoffice.features.ebook.shared.domain import constants
 from backoffice.features.ebook.shared.domain.entities.ebook import Ebook
 from backoffice.features.ebook.shared.domain.entities.generation_request import ColorMode, ImageSpec
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
@@ -18,6 +18,7 @@ from backoffice.features.ebook.shared.domain.services.ebook_validator import Ebo
 from backoffice.features.ebook.shared.domain.services.page_generation import (
     ContentPageGenerationService,
 )
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -31,13 +32,27 @@ class AddNewPagesResult:
     total_pages: int
     limit_reached: bool
     message: str
+    failures: list[str] = field(default_factory=list)  # One error per page that could not be generated
+
+
+@dataclass(frozen=True)
+class _PageSlot:
+    """A new page to generate: its prompt and the 0-based content index it was built for.
+
+    The page lands at pages_meta index page_index + 1 (after the cover), the
+    index ImageSpec.page_index and generation progress refer to.
+    """
+
+    page_index: int
+    prompt: str
 
 
 class AddNewPagesUseCase:
     """Add AI-generated coloring pages to an existing ebook.
 
     Pages are generated using the same theme/style/seed as the original ebook
-    and inserted before the back cover.
+    and inserted before the back cover. Generation runs concurrently; pages
+    that fail are skipped and reported while the others are kept.
     """
 
     def __init__(
@@ -57,6 +72,7 @@ class AddNewPagesUseCase:
         self.page_service = page_service
         self.regeneration_service = regeneration_service
 
+    @traced_use_case("add_new_pages")
     async def execute(self, ebook_id: int, count: int) -> AddNewPagesResult:
         """Add new AI-generated pages to an ebook.
 
@@ -65,10 +81,11 @@ class AddNewPagesUseCase:
             count: Number of pages to add (will be adjusted if limit reached)
 
         Returns:
-            AddNewPagesResult with pages added count and limit info
+            AddNewPagesResult with pages added count, limit info and generation failures
 
         Raises:
             DomainError: If ebook not found, not DRAFT, or no structure
+            Exception: The first generation error if no page could be generated
         """
         # Validate ebook (exists + DRAFT status + has structure)
         ebook = await self.ebook_repository.get_by_id(ebook_id)
@@ -80,7 +97,7 @@ class AddNewPagesUseCase:
         current_interior = current_total - 2  # Exclude cover and back cover
 
         # 4. Calculate remaining capacity
-        max_interior = MAX_PAGES
+        max_interior = constants.MAX_PAGES
         remaining_capacity = max_interior - current_interior
 
         if remaining_capacity <= 0:
@@ -89,7 +106,7 @@ class AddNewPagesUseCase:
                 pages_added=0,
                 total_pages=current_total,
                 limit_reached=True,
-                message=f"Maximum {MAX_PAGES} pages atteint",
+                message=f"Maximum {max_interior} pages atteint",
             )
 
         # 5. Adjust count if exceeds capacity (partial addition)
@@ -132,50 +149,66 @@ class AddNewPagesUseCase:
         # 7. Extract back cover to re-add after new pages
         back_cover = pages_meta.pop()
 
-        # 8. Generate and add new pages
-        last_page_number = pages_meta[-1]["page_number"] if pages_meta else 0
+        # 8. Build all prompts up front, then generate pages concurrently
+        # (bounded by the page service semaphore)
         new_total_content = current_interior + count
-
-        for i in range(count):
-            page_index = current_interior + i  # 0-based index for new pages
-            page_number = last_page_number + i + 1
-
-            # Build prompt for this page
-            prompt = build_page_prompt_from_yaml(
-                theme_id=theme_id,
+        slots = [
+            _PageSlot(
                 page_index=page_index,
-                total_pages=new_total_content,
-                themes_directory=theme_repo.themes_directory,
-                seed=42,
-                audience=audience,
+                prompt=build_page_prompt_from_yaml(
+                    theme_id=theme_id,
+                    page_index=page_index,
+                    total_pages=new_total_content,
+                    themes_directory=theme_repo.themes_directory,
+                    seed=42,
+                    audience=audience,
+                ),
             )
+            for page_index in range(current_interior, new_total_content)  # 0-based content indexes
+        ]
+
+        logger.info(f"Generating {count} pages (max concurrent: {self.page_service.max_concurrent})...")
+        results = await asyncio.gather(
+            *(
+                self.page_service.generate_single_page(
+                    prompt=slot.prompt,
+                    spec=replace(page_spec, ebook_id=ebook_id, page_index=slot.page_index + 1),  # pages_meta index
+                    seed=None,  # Random seed for variety
+                    workflow_params=workflow_params,
+                )
+                for slot in slots
+            ),
+            return_exceptions=True,
+        )
 
-            logger.info(f"Generating page {page_number} with prompt: {prompt[:80]}...")
-
-            await asyncio.sleep(0.1)
-
-            # Generate page
-            page_data = await self.page_service.generate_single_page(
-                prompt=prompt,
-                spec=page_spec,
-                seed=None,  # Random seed for variety
-                workflow_params=workflow_params,
-            )
-
-            await asyncio.sleep(0.1)
-
+        # Each result belongs to its slot: a failed slot is dropped with its
+        # prompt, and the pages after it keep their own prompt. Page numbers
+        # stay contiguous (page_number is the pages_meta index).
+        failures: list[str] = []
+        for slot, page_result in zip(slots, results, strict=True):
+            if isinstance(page_result, BaseException):
+                logger.error(f"  Failed to generate page {slot.page_index} ({slot.prompt[:80]}...): {page_result}")
+                failures.append(str(page_result))
+                continue
+
+            page_number = pages_meta[-1]["page_number"] + 1 if pages_meta else 1
             # Add to pages_meta (include prompt for edit modal)
             pages_meta.append(
                 {
                     "page_number": page_number,
                     "title": f"Page {page_number}",
-                    "image_data_base64": base64.b64encode(page_data).decode("utf-8"),
+                    "image_data_base64": base64.b64encode(page_result).decode("utf-8"),
                     "image_format": "PNG",
                     "color_mode": "BLACK_WHITE",
-                    "prompt": prompt,  # Store prompt for regeneration/editing
+                    "prompt": slot.prompt,  # Store prompt for regeneration/editing
                 }
             )
-            logger.info(f"  Added page {page_number} ({len(page_data)} bytes)")
+            logger.info(f"  Added page {page_number} ({len(page_result)} bytes)")
+
+        pages_added = count - len(failures)
+        if pages_added == 0:
+            # Nothing to save: surface the first error as before
+            raise next(error for error in results if isinstance(error, BaseException))
 
         # 9. Re-add back cover as last page
         back_cover["page_number"] = pages_meta[-1]["page_number"] + 1
@@ -202,18 +235,21 @@ class AddNewPagesUseCase:
         )
 
         # 13. Build result
-        message = f"{count} page(s) ajoutée(s)"
+        message = f"{pages_added} page(s) ajoutée(s)"
+        if failures:
+            message += f" - {len(failures)} échec(s) de génération"
         if limit_reached:
-            message += f" - Maximum {MAX_PAGES} pages atteint"
+            message += f" - Maximum {max_interior} pages atteint"
 
         logger.info(f"Ebook {ebook_id}: {message} (total: {updated_ebook.page_count})")
 
         return AddNewPagesResult(
             ebook=updated_ebook,
-            pages_added=count,
+            pages_added=pages_added,
             total_pages=updated_ebook.page_count or len(pages_meta),
             limit_reached=limit_reached,
             message=message,
+            failures=failures,
         )
 
     def _convert_pages_meta_to_assembled_pages(self, pages_meta: list[dict]) -> list[AssembledPage]:
@@ -6,6 +6,9 @@ import logging
 from backoffice.features.ebook.regeneration.domain.events.content_page_regenerated_event import (
     ContentPageRegeneratedEvent,
 )
+from backoffice.features.ebook.regeneration.domain.services.preview_candidates import (
+    PreviewCandidateService,
+)
 from backoffice.features.ebook.regeneration.domain.services.regeneration_service import (
     RegenerationService,
 )
@@ -13,8 +16,11 @@ from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookS
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.assembly_port import AssembledPage
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import PreviewCandidatePort
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
+from backoffice.features.ebook.shared.domain.services.pdf_rebuild_scheduler import PdfRebuildScheduler
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +29,9 @@ class ApplyPageEditUseCase:
     """Apply a page edit by saving the preview image to DB and rebuilding PDF.
 
     This use case:
-    1. Receives a base64-encoded image (from preview modal)
+    1. Receives a preview candidate id or a base64-encoded image (from preview modal)
     2. Updates the ebook's structure_json with the new image
-    3. Rebuilds the PDF with the new page
+    3. Rebuilds the PDF with the new page (or marks it dirty for a debounced rebuild)
     4. Resets APPROVED ebook to DRAFT if necessary
     5. Saves to DB and storage
     """
@@ -35,6 +41,8 @@ class ApplyPageEditUseCase:
         ebook_repository: EbookPort,
         regeneration_service: RegenerationService,
         event_bus: EventBus,
+        candidate_store: PreviewCandidatePort | None = None,
+        pdf_rebuild_scheduler: PdfRebuildScheduler | None = None,
     ):
         """Initialize apply page edit use case.
 
@@ -42,25 +50,32 @@ class ApplyPageEditUseCase:
             ebook_repository: Repository for ebook persistence
             regeneration_service: Service for PDF reassembly and upload
             event_bus: Event bus for domain events
+            candidate_store: Optional store for preview candidates
+            pdf_rebuild_scheduler: Optional scheduler deferring the PDF rebuild
         """
         self.ebook_repository = ebook_repository
         self.regeneration_service = regeneration_service
         self.event_bus = event_bus
+        self.candidate_store = candidate_store
+        self.pdf_rebuild_scheduler = pdf_rebuild_scheduler
 
+    @traced_use_case("apply_page_edit")
     async def execute(
         self,
         ebook_id: int,
         page_index: int,
-        image_base64: str,
+        image_base64: str | None = None,
         prompt: str | None = None,
+        candidate_id: str | None = None,
     ) -> Ebook:
         """Apply the page edit by saving the image and rebuilding PDF.
 
         Args:
             ebook_id: ID of the ebook
             page_index: Index of the page to update (0 for cover, 1+ for content pages)
-            image_base64: Base64-encoded image data from preview
+            image_base64: Base64-encoded image data from preview (legacy, see candidate_id)
             prompt: Optional prompt to save with the page (for prompt-based regeneration)
+            candidate_id: Preview candidate to apply (takes precedence over image_base64)
 
         Returns:
             Updated ebook with new page and PDF
@@ -90,49 +105,65 @@ class ApplyPageEditUseCase:
         page_type = "COVER" if is_cover else f"page {page_index}"
         logger.info(f"💾 Applying edit for {page_type} of ebook {ebook_id}: {ebook.title}")
 
-        # Step 1: Decode image from base64
-        try:
-            new_page_data = base64.b64decode(image_base64)
-        except Exception as e:
+        # Step 1: Load the new image (preview candidate, else base64 payload)
+        if candidate_id:
+            candidate = await PreviewCandidateService.load(self.candidate_store, ebook_id, page_index, candidate_id)
+            new_page_data = candidate.image_data
+            if prompt is None:
+                prompt = candidate.prompt
+        elif image_base64:
+            try:
+                new_page_data = base64.b64decode(image_base64)
+            except Exception as e:
+                raise DomainError(
+                    code=ErrorCode.VALIDATION_ERROR,
+                    message="Invalid base64 image data",
+                    actionable_hint="Ensure the image data is properly encoded",
+                ) from e
+        else:
             raise DomainError(
                 code=ErrorCode.VALIDATION_ERROR,
-                message="Invalid base64 image data",
-                actionable_hint="Ensure the image data is properly encoded",
-            ) from e
+                message="No image to apply",
+                actionable_hint="Provide a preview candidate_id (or image_base64)",
+            )
 
-        logger.info(f"✅ Decoded new page image: {len(new_page_data)} bytes")
+        logger.info(f"✅ Loaded new page image: {len(new_page_data)} bytes")
 
         # Step 2: Rebuild PDF with new page using RegenerationService
-        # Build list of all pages with the new page replacing the old one
-        assembled_pages = []
-        for i, page_meta in enumerate(pages_meta):
-            if i == page_index:
-                # Use new edited page
-                page_data = new_page_data
-                logger.info(f"📝 Replacing page {page_index} with edited version")
-            else:
-                # Keep existing page
-                page_data = base64.b64decode(page_meta["image_data_base64"])
-
-            assembled_pages.append(
-                AssembledPage(
-                    page_number=page_meta["page_number"],
-                    title=page_meta.get("title", f"Page {page_meta['page_number']}"),
-                    image_data=page_data,
-                    image_format=page_meta.get("image_format", "PNG"),
+        # With a scheduler, only the new image is processed now and the PDF is rebuilt once edits settle
+        if self.pdf_rebuild_scheduler is not None:
+            await self.regeneration_service.render_page_thumbnails([new_page_data])
+        else:
+            # Build list of all pages with the new page replacing the old one
+            assembled_pages = []
+            for i, page_meta in enumerate(pages_meta):
+                if i == page_index:
+                    # Use new edited page
+                    page_data = new_page_data
+                    logger.info(f"📝 Replacing page {page_index} with edited version")
+                else:
+                    # Keep existing page
+                    page_data = base64.b64decode(page_meta["image_data_base64"])
+
+                assembled_pages.append(
+                    AssembledPage(
+                        page_number=page_meta["page_number"],
+                        title=page_meta.get("title", f"Page {page_meta['page_number']}"),
+                        image_data=page_data,
+                        image_format=page_meta.get("image_format", "PNG"),
+                    )
                 )
-            )
 
-        # Use RegenerationService to assemble PDF, save to DB, and upload to storage
-        pdf_path, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
-            ebook=ebook,
-            assembled_pages=assembled_pages,
-            ebook_repository=self.ebook_repository,
-            filename_suffix=f"page{page_index}_edited",
-        )
+            # Use RegenerationService to assemble PDF, save to DB, and upload to storage
+            pdf_path, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
+                ebook=ebook,
+                assembled_pages=assembled_pages,
+                ebook_repository=self.ebook_repository,
+                filename_suffix=f"page{page_index}_edited",
+            )
 
-        # Update ebook with new preview URL
-        ebook.preview_url = preview_url
+            # Update ebook with new preview URL
+            ebook.preview_url = preview_url
 
         # Step 3: Update structure_json with new page
         # Preserve existing fields and update image + prompt
@@ -166,6 +197,15 @@ class ApplyPageEditUseCase:
         updated_ebook = await self.ebook_repository.save(ebook)
         logger.info(f"✅ Ebook {ebook_id} saved with edited {page_type}")
 
+        # Marked after the save, so the rebuild reads the new image
+        if self.pdf_rebuild_scheduler is not None:
+            await self.ebook_repository.mark_pdf_dirty(ebook_id)
+            self.pdf_rebuild_scheduler.schedule(ebook_id)
+
+        # Previews of this page are obsolete once one is applied
+        if self.candidate_store:
+            await self.candidate_store.discard(ebook_id, page_index)
+
         # Step 6: Emit domain event
         prompt_info = prompt[:50] + "..." if prompt and len(prompt) > 50 else prompt or "[Edited via modal]"
         await self.event_bus.publish(
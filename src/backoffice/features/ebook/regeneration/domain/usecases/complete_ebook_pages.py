@@ -14,6 +14,7 @@ from backoffice.features.ebook.shared.domain.errors.error_taxonomy import Domain
 from backoffice.features.ebook.shared.domain.ports.assembly_port import AssembledPage
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,7 @@ class CompleteEbookPagesUseCase:
         self.ebook_repository = ebook_repository
         self.regeneration_service = regeneration_service
 
+    @traced_use_case("complete_ebook_pages")
     async def execute(self, ebook_id: int, target_pages: int = KDP_MIN_PAGES) -> Ebook:
         """Complete ebook with blank pages to reach target INTERIOR page count.
 
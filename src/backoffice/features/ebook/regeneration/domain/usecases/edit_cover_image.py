@@ -3,11 +3,16 @@
 import base64
 import logging
 
+from backoffice.features.ebook.regeneration.domain.services.preview_candidates import (
+    PreviewCandidateService,
+)
 from backoffice.features.ebook.shared.domain.entities.generation_request import ColorMode, ImageSpec
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.ebook.shared.domain.ports.image_edit_port import ImageEditPort
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import PreviewCandidatePort
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +21,8 @@ class EditCoverImageUseCase:
     """Edit a cover image with targeted corrections without saving to DB.
 
     This applies specific corrections to an existing cover image (e.g., "replace 5 toes with 3").
-    The edited image is returned as base64 but NOT saved to DB/storage.
+    The edited image is kept as a preview candidate (or returned as base64
+    without a candidate store) but NOT saved to DB/storage.
     No PDF rebuild occurs - this is preview only.
     """
 
@@ -24,21 +30,26 @@ class EditCoverImageUseCase:
         self,
         ebook_repository: EbookPort,
         image_edit_port: ImageEditPort,
+        candidate_store: PreviewCandidatePort | None = None,
     ):
         """Initialize edit cover image use case.
 
         Args:
             ebook_repository: Repository for ebook retrieval
             image_edit_port: Port for image editing operations
+            candidate_store: Optional store for preview candidates
         """
         self.ebook_repository = ebook_repository
         self.image_edit_port = image_edit_port
+        self.candidate_store = candidate_store
 
+    @traced_use_case("edit_cover_image")
     async def execute(
         self,
         ebook_id: int,
         edit_prompt: str,
         current_image_base64: str | None = None,
+        current_candidate_id: str | None = None,
     ) -> dict[str, str | int]:
         """Edit the cover image with targeted corrections.
 
@@ -46,10 +57,12 @@ class EditCoverImageUseCase:
             ebook_id: ID of the ebook
             edit_prompt: Text instructions for editing (e.g., "replace 5 toes with 3")
             current_image_base64: Optional base64 image from the modal (latest preview)
+            current_candidate_id: Optional preview candidate to edit (takes precedence)
 
         Returns:
             Dictionary with:
-                - image_base64: Base64-encoded edited image data
+                - candidate_id: Preview candidate id (with a candidate store)
+                - image_base64: Base64-encoded edited image data (without a candidate store)
                 - page_index: 0 (cover index)
                 - edit_prompt_used: The edit prompt used
 
@@ -75,7 +88,10 @@ class EditCoverImageUseCase:
         logger.info(f"Edit prompt: {edit_prompt[:100]}...")
 
         # Load current cover image, preferring the modal-provided preview when available
-        if current_image_base64:
+        if current_candidate_id:
+            candidate = await PreviewCandidateService.load(self.candidate_store, ebook_id, 0, current_candidate_id)
+            current_image_bytes = candidate.image_data
+        elif current_image_base64:
             try:
                 current_image_bytes = base64.b64decode(current_image_base64)
             except Exception as exc:
@@ -116,9 +132,9 @@ class EditCoverImageUseCase:
 
         logger.info(f"✅ Cover edited: {len(edited_image_bytes)} bytes (not saved)")
 
-        # Return base64-encoded image (NO DB/storage save)
+        # Keep the edited preview server-side (NO DB/storage save)
         return {
-            "image_base64": base64.b64encode(edited_image_bytes).decode("utf-8"),
+            **await PreviewCandidateService.store_result(self.candidate_store, ebook_id, 0, edited_image_bytes),
             "page_index": 0,
             "edit_prompt_used": edit_prompt,
         }
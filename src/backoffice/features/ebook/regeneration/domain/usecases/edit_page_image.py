@@ -3,11 +3,16 @@
 import base64
 import logging
 
+from backoffice.features.ebook.regeneration.domain.services.preview_candidates import (
+    PreviewCandidateService,
+)
 from backoffice.features.ebook.shared.domain.entities.generation_request import ColorMode, ImageSpec
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.ebook.shared.domain.ports.image_edit_port import ImageEditPort
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import PreviewCandidatePort
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +21,8 @@ class EditPageImageUseCase:
     """Edit a content page image with targeted corrections without saving to DB.
 
     This applies specific corrections to an existing page image (e.g., "replace 5 toes with 3").
-    The edited image is returned as base64 but NOT saved to DB/storage.
+    The edited image is kept as a preview candidate (or returned as base64
+    without a candidate store) but NOT saved to DB/storage.
     No PDF rebuild occurs - this is preview only.
     """
 
@@ -24,22 +30,27 @@ class EditPageImageUseCase:
         self,
         ebook_repository: EbookPort,
         image_edit_port: ImageEditPort,
+        candidate_store: PreviewCandidatePort | None = None,
     ):
         """Initialize edit page image use case.
 
         Args:
             ebook_repository: Repository for ebook retrieval
             image_edit_port: Port for image editing operations
+            candidate_store: Optional store for preview candidates
         """
         self.ebook_repository = ebook_repository
         self.image_edit_port = image_edit_port
+        self.candidate_store = candidate_store
 
+    @traced_use_case("edit_page_image")
     async def execute(
         self,
         ebook_id: int,
         page_index: int,
         edit_prompt: str,
         current_image_base64: str | None = None,
+        current_candidate_id: str | None = None,
     ) -> dict[str, str | int]:
         """Edit a specific content page image with targeted corrections.
 
@@ -48,10 +59,12 @@ class EditPageImageUseCase:
             page_index: Index of the page to edit (1-based, excluding cover)
             edit_prompt: Text instructions for editing (e.g., "replace 5 toes with 3")
             current_image_base64: Optional base64 image from the modal (latest preview)
+            current_candidate_id: Optional preview candidate to edit (takes precedence)
 
         Returns:
             Dictionary with:
-                - image_base64: Base64-encoded edited image data
+                - candidate_id: Preview candidate id (with a candidate store)
+                - image_base64: Base64-encoded edited image data (without a candidate store)
                 - page_index: The page index edited
                 - edit_prompt_used: The edit prompt used
 
@@ -85,7 +98,10 @@ class EditPageImageUseCase:
         logger.info(f"Edit prompt: {edit_prompt[:100]}...")
 
         # Step 1: Load current page image, preferring the modal-provided preview when available
-        if current_image_base64:
+        if current_candidate_id:
+            candidate = await PreviewCandidateService.load(self.candidate_store, ebook_id, page_index, current_candidate_id)
+            current_image_bytes = candidate.image_data
+        elif current_image_base64:
             try:
                 current_image_bytes = base64.b64decode(current_image_base64)
             except Exception as exc:  # pragma: no cover - defensive guard
@@ -125,9 +141,9 @@ class EditPageImageUseCase:
 
         logger.info(f"✅ Page edited: {len(edited_image_bytes)} bytes (not saved)")
 
-        # Return base64-encoded image (NO DB/storage save)
+        # Keep the edited preview server-side (NO DB/storage save)
         return {
-            "image_base64": base64.b64encode(edited_image_bytes).decode("utf-8"),
+            **await PreviewCandidateService.store_result(self.candidate_store, ebook_id, page_index, edited_image_bytes),
             "page_index": page_index,
             "edit_prompt_used": edit_prompt,
         }
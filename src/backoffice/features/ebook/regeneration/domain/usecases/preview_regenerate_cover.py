@@ -3,12 +3,14 @@
 import base64
 import logging
 
-import yaml
-
-from backoffice.config import ConfigLoader
+from backoffice.config import get_app_config
+from backoffice.features.ebook.regeneration.domain.services.preview_candidates import (
+    PreviewCandidateService,
+)
 from backoffice.features.ebook.shared.domain.entities.generation_request import ColorMode, ImageSpec
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import PreviewCandidatePort
 from backoffice.features.ebook.shared.domain.services.cover_compositor import CoverCompositor
 from backoffice.features.ebook.shared.domain.services.cover_generation import CoverGenerationService
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
@@ -18,6 +20,7 @@ from backoffice.features.ebook.shared.domain.services.workflow_helper import (
 from backoffice.features.ebook.shared.infrastructure.adapters.theme_repository import (
     ThemeRepository,
 )
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,8 @@ class PreviewRegenerateCoverUseCase:
     """Preview regenerate a cover without saving to DB or storage.
 
     This generates a new version of the cover for preview purposes only.
-    The generated image is returned as base64 but NOT saved to DB/storage.
+    The generated image is kept as a preview candidate (or returned as base64
+    without a candidate store) but NOT saved to DB/storage.
     No PDF rebuild occurs.
     """
 
@@ -34,21 +38,27 @@ class PreviewRegenerateCoverUseCase:
         self,
         ebook_repository: EbookPort,
         cover_service: CoverGenerationService,
+        candidate_store: PreviewCandidatePort | None = None,
     ):
         """Initialize preview regenerate cover use case.
 
         Args:
             ebook_repository: Repository for ebook retrieval
             cover_service: Service for cover generation
+            candidate_store: Optional store for preview candidates
         """
         self.ebook_repository = ebook_repository
         self.cover_service = cover_service
+        self.candidate_store = candidate_store
 
+    @traced_use_case("preview_regenerate_cover")
     async def execute(
         self,
         ebook_id: int,
         current_image_base64: str | None = None,
         custom_prompt: str | None = None,
+        current_candidate_id: str | None = None,
+        chain_from_stored_image: bool = False,
     ) -> dict[str, str | int]:
         """Preview regenerate the cover.
 
@@ -56,10 +66,13 @@ class PreviewRegenerateCoverUseCase:
             ebook_id: ID of the ebook
             current_image_base64: Optional latest modal image to chain from
             custom_prompt: Optional custom prompt to use instead of stored/template
+            current_candidate_id: Optional preview candidate to chain from
+            chain_from_stored_image: Chain from the saved cover when no modal image is given
 
         Returns:
             Dictionary with:
-                - image_base64: Base64-encoded image data
+                - candidate_id: Preview candidate id (with a candidate store)
+                - image_base64: Base64-encoded image data (without a candidate store)
                 - page_index: 0 (cover index)
                 - prompt_used: The prompt used for generation
 
@@ -79,6 +92,13 @@ class PreviewRegenerateCoverUseCase:
             )
         pages_meta = structure_json["pages_meta"]
 
+        # Resolve the image to chain from: preview candidate > modal base64 > saved cover
+        if current_candidate_id:
+            candidate = await PreviewCandidateService.load(self.candidate_store, ebook_id, 0, current_candidate_id)
+            current_image_base64 = base64.b64encode(candidate.image_data).decode("utf-8")
+        elif chain_from_stored_image and not current_image_base64:
+            current_image_base64 = pages_meta[0].get("image_data_base64")
+
         logger.info(f"🔄 Preview regenerating COVER for ebook {ebook_id}: {ebook.title}")
 
         # Determine prompt to use
@@ -125,9 +145,9 @@ class PreviewRegenerateCoverUseCase:
 
         logger.info(f"✅ Preview cover generated: {len(new_cover_data)} bytes (not saved)")
 
-        # Return base64-encoded image (NO DB/storage save)
+        # Keep the preview server-side (NO DB/storage save)
         return {
-            "image_base64": base64.b64encode(new_cover_data).decode("utf-8"),
+            **await PreviewCandidateService.store_result(self.candidate_store, ebook_id, 0, new_cover_data, prompt),
             "page_index": 0,
             "prompt_used": prompt,
         }
@@ -142,24 +162,19 @@ class PreviewRegenerateCoverUseCase:
             Cover prompt string
         """
         theme_repo = ThemeRepository()
-        config = ConfigLoader()
 
         # Get the template key based on provider
-        template_key = config.get_template_key_for_type("cover")
+        template_key = get_app_config().models.template_key_for_type("cover")
 
-        # Load theme YAML
-        theme_file = theme_repo.themes_directory / f"{ebook.theme_id}.yml"
-        if not theme_file.exists():
+        theme = theme_repo.get_compiled_theme(ebook.theme_id) if ebook.theme_id else None
+        if theme is None:
             return f"Coloring book cover for {ebook.title}"
 
-        with theme_file.open("r", encoding="utf-8") as f:
-            theme_data = yaml.safe_load(f)
-
-        cover_template = theme_data.get("cover_templates", {}).get(template_key, {})
+        cover_template = theme.cover_template(template_key)
 
         # Check if we have a direct prompt
-        if "prompt" in cover_template:
-            return str(cover_template["prompt"])
+        if cover_template is not None and cover_template.prompt is not None:
+            return cover_template.prompt
 
         # Fallback
         return f"Coloring book cover for {ebook.title}"
@@ -3,13 +3,18 @@
 import base64
 import logging
 
+from backoffice.features.ebook.regeneration.domain.services.preview_candidates import (
+    PreviewCandidateService,
+)
 from backoffice.features.ebook.shared.domain.entities.generation_request import ColorMode, ImageSpec
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import PreviewCandidatePort
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
 from backoffice.features.ebook.shared.domain.services.page_generation import (
     ContentPageGenerationService,
 )
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +23,8 @@ class PreviewRegeneratePageUseCase:
     """Preview regenerate a content page without saving to DB or storage.
 
     This generates a new version of a page for preview purposes only.
-    The generated image is returned as base64 but NOT saved to DB/storage.
+    The generated image is kept as a preview candidate (or returned as base64
+    without a candidate store) but NOT saved to DB/storage.
     No PDF rebuild occurs.
     """
 
@@ -26,22 +32,28 @@ class PreviewRegeneratePageUseCase:
         self,
         ebook_repository: EbookPort,
         page_service: ContentPageGenerationService,
+        candidate_store: PreviewCandidatePort | None = None,
     ):
         """Initialize preview regenerate page use case.
 
         Args:
             ebook_repository: Repository for ebook retrieval
             page_service: Service for page generation
+            candidate_store: Optional store for preview candidates
         """
         self.ebook_repository = ebook_repository
         self.page_service = page_service
+        self.candidate_store = candidate_store
 
+    @traced_use_case("preview_regenerate_page")
     async def execute(
         self,
         ebook_id: int,
         page_index: int,
         current_image_base64: str | None = None,
         custom_prompt: str | None = None,
+        current_candidate_id: str | None = None,
+        chain_from_stored_image: bool = False,
     ) -> dict[str, str | int]:
         """Preview regenerate a specific content page.
 
@@ -50,10 +62,13 @@ class PreviewRegeneratePageUseCase:
             page_index: Index of the page to regenerate (1-based, excluding cover)
             current_image_base64: Optional latest modal image to chain from
             custom_prompt: Optional custom prompt to use instead of template
+            current_candidate_id: Optional preview candidate to chain from
+            chain_from_stored_image: Chain from the saved page image when no modal image is given
 
         Returns:
             Dictionary with:
-                - image_base64: Base64-encoded image data
+                - candidate_id: Preview candidate id (with a candidate store)
+                - image_base64: Base64-encoded image data (without a candidate store)
                 - page_index: The page index regenerated
                 - prompt_used: The prompt used for generation
 
@@ -75,6 +90,13 @@ class PreviewRegeneratePageUseCase:
                 actionable_hint=f"Must be between 1 and {len(pages_meta) - 2} (content pages only)",
             )
 
+        # Resolve the image to chain from: preview candidate > modal base64 > saved page
+        if current_candidate_id:
+            candidate = await PreviewCandidateService.load(self.candidate_store, ebook_id, page_index, current_candidate_id)
+            current_image_base64 = base64.b64encode(candidate.image_data).decode("utf-8")
+        elif chain_from_stored_image and not current_image_base64:
+            current_image_base64 = pages_meta[page_index].get("image_data_base64")
+
         logger.info(f"🔄 Preview regenerating CONTENT PAGE {page_index} for ebook {ebook_id}: {ebook.title}")
 
         # Step 1: Determine prompt to use
@@ -133,9 +155,9 @@ class PreviewRegeneratePageUseCase:
 
         logger.info(f"✅ Preview page generated: {len(new_page_data)} bytes (not saved)")
 
-        # Return base64-encoded image (NO DB/storage save)
+        # Keep the preview server-side (NO DB/storage save)
         return {
-            "image_base64": base64.b64encode(new_page_data).decode("utf-8"),
+            **await PreviewCandidateService.store_result(self.candidate_store, ebook_id, page_index, new_page_data, prompt),
             "page_index": page_index,
             "prompt_used": prompt,
         }
@@ -0,0 +1,64 @@
+"""Use case for rebuilding an ebook PDF after deferred page edits."""
+
+import logging
+
+from backoffice.features.ebook.regeneration.domain.services.regeneration_service import (
+    RegenerationService,
+)
+from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
+
+logger = logging.getLogger(__name__)
+
+
+class RebuildEbookPdfUseCase:
+    """Rebuild the PDF of an ebook whose pages changed since its last build.
+
+    Run by the PDF rebuild scheduler once edits settle, or on demand when the
+    PDF is read while still dirty. Clean ebooks are skipped, so concurrent or
+    repeated calls are cheap.
+    """
+
+    def __init__(self, ebook_repository: EbookPort, regeneration_service: RegenerationService):
+        """Initialize rebuild use case.
+
+        Args:
+            ebook_repository: Repository for ebook persistence
+            regeneration_service: Service for PDF reassembly and upload
+        """
+        self.ebook_repository = ebook_repository
+        self.regeneration_service = regeneration_service
+
+    @traced_use_case("rebuild_ebook_pdf")
+    async def execute(self, ebook_id: int) -> bool:
+        """Rebuild the ebook PDF from its current structure if it is dirty.
+
+        Args:
+            ebook_id: ID of the ebook
+
+        Returns:
+            True if the PDF was rebuilt, False if it was already current
+        """
+        # Read the dirty marker BEFORE the pages: an edit saved after this
+        # point moves the marker, so it is not cleared below
+        info = await self.ebook_repository.get_ebook_pdf_info(ebook_id)
+        if info is None or info.pdf_dirty_at is None:
+            return False
+
+        ebook = await self.ebook_repository.get_by_id(ebook_id)
+        if ebook is None or not ebook.structure_json:
+            return False
+
+        logger.info(f"📄 Rebuilding PDF of ebook {ebook_id} (pages changed at {info.pdf_dirty_at})")
+
+        assembled_pages = self.regeneration_service.assemble_pages_from_structure(ebook.structure_json["pages_meta"])
+        _, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
+            ebook=ebook,
+            assembled_pages=assembled_pages,
+            ebook_repository=self.ebook_repository,
+            filename_suffix="edited",
+        )
+
+        await self.ebook_repository.mark_pdf_rebuilt(ebook_id, info.pdf_dirty_at, preview_url, ebook.drive_id)
+        logger.info(f"✅ PDF of ebook {ebook_id} rebuilt")
+        return True
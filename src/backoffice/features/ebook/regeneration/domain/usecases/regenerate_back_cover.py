@@ -17,8 +17,10 @@ from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.ebook.shared.domain.services.cover_compositor import CoverCompositor
 from backoffice.features.ebook.shared.domain.services.cover_generation import CoverGenerationService
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
+from backoffice.features.ebook.shared.domain.services.pdf_rebuild_scheduler import PdfRebuildScheduler
 from backoffice.features.ebook.shared.infrastructure.adapters.theme_repository import ThemeRepository
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,7 @@ class RegenerateBackCoverUseCase:
         cover_service: CoverGenerationService,
         regeneration_service: RegenerationService,
         event_bus: EventBus,
+        pdf_rebuild_scheduler: PdfRebuildScheduler | None = None,
     ):
         """Initialize regenerate back cover use case.
 
@@ -46,12 +49,15 @@ class RegenerateBackCoverUseCase:
             cover_service: Service for cover generation
             regeneration_service: Service for regeneration operations
             event_bus: Event bus for domain events
+            pdf_rebuild_scheduler: Optional scheduler deferring the PDF rebuild
         """
         self.ebook_repository = ebook_repository
         self.cover_service = cover_service
         self.regeneration_service = regeneration_service
         self.event_bus = event_bus
+        self.pdf_rebuild_scheduler = pdf_rebuild_scheduler
 
+    @traced_use_case("regenerate_back_cover")
     async def execute(
         self,
         ebook_id: int,
@@ -121,40 +127,44 @@ class RegenerateBackCoverUseCase:
         logger.info(f"✅ Back cover regenerated: {len(back_cover_data)} bytes")
 
         # Step 4: Rebuild PDF with new back cover using RegenerationService
-        assembled_pages = []
+        # With a scheduler, only the new image is processed now and the PDF is rebuilt once edits settle
+        if self.pdf_rebuild_scheduler is not None:
+            await self.regeneration_service.render_page_thumbnails([back_cover_data])
+        else:
+            assembled_pages = []
+
+            # Add all pages EXCEPT the last one (old back cover)
+            for _i, page_meta in enumerate(pages_meta[:-1]):
+                page_data = base64.b64decode(page_meta["image_data_base64"])
+                assembled_pages.append(
+                    AssembledPage(
+                        page_number=page_meta["page_number"],
+                        title=page_meta.get("title", f"Page {page_meta['page_number']}"),
+                        image_data=page_data,
+                        image_format=page_meta.get("image_format", "PNG"),
+                    )
+                )
 
-        # Add all pages EXCEPT the last one (old back cover)
-        for _i, page_meta in enumerate(pages_meta[:-1]):
-            page_data = base64.b64decode(page_meta["image_data_base64"])
+            # Add new back cover as last page
             assembled_pages.append(
                 AssembledPage(
-                    page_number=page_meta["page_number"],
-                    title=page_meta.get("title", f"Page {page_meta['page_number']}"),
-                    image_data=page_data,
-                    image_format=page_meta.get("image_format", "PNG"),
+                    page_number=len(pages_meta),
+                    title="Back Cover",
+                    image_data=back_cover_data,
+                    image_format="PNG",
                 )
             )
 
-        # Add new back cover as last page
-        assembled_pages.append(
-            AssembledPage(
-                page_number=len(pages_meta),
-                title="Back Cover",
-                image_data=back_cover_data,
-                image_format="PNG",
+            # Use RegenerationService to assemble PDF, save to DB, and upload to storage
+            pdf_path, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
+                ebook=ebook,
+                assembled_pages=assembled_pages,
+                ebook_repository=self.ebook_repository,
+                filename_suffix="back_cover_regenerated",
             )
-        )
 
-        # Use RegenerationService to assemble PDF, save to DB, and upload to storage
-        pdf_path, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
-            ebook=ebook,
-            assembled_pages=assembled_pages,
-            ebook_repository=self.ebook_repository,
-            filename_suffix="back_cover_regenerated",
-        )
-
-        # Update ebook with new preview URL
-        ebook.preview_url = preview_url
+            # Update ebook with new preview URL
+            ebook.preview_url = preview_url
 
         # Step 5: Update structure_json with new back cover
         # Replace last page (old back cover) with new back cover
@@ -174,6 +184,11 @@ class RegenerateBackCoverUseCase:
         updated_ebook = await self.ebook_repository.save(ebook)
         logger.info(f"✅ Ebook {ebook_id} updated with new back cover")
 
+        # Marked after the save, so the rebuild reads the new image
+        if self.pdf_rebuild_scheduler is not None:
+            await self.ebook_repository.mark_pdf_dirty(ebook_id)
+            self.pdf_rebuild_scheduler.schedule(ebook_id)
+
         # Step 7: Emit domain event
         await self.event_bus.publish(
             BackCoverRegeneratedEvent(
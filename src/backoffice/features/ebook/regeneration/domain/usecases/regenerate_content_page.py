@@ -19,6 +19,7 @@ from backoffice.features.ebook.shared.domain.services.page_generation import (
     ContentPageGenerationService,
 )
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,7 @@ class RegenerateContentPageUseCase:
         self.regeneration_service = regeneration_service
         self.event_bus = event_bus
 
+    @traced_use_case("regenerate_content_page")
     async def execute(
         self,
         ebook_id: int,
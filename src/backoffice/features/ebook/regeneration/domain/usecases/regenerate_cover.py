@@ -17,6 +17,7 @@ from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.ebook.shared.domain.services.cover_compositor import CoverCompositor
 from backoffice.features.ebook.shared.domain.services.cover_generation import CoverGenerationService
 from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
+from backoffice.features.ebook.shared.domain.services.pdf_rebuild_scheduler import PdfRebuildScheduler
 from backoffice.features.ebook.shared.domain.services.workflow_helper import (
     build_cover_prompt_from_yaml,
     load_workflow_params,
@@ -25,6 +26,7 @@ from backoffice.features.ebook.shared.infrastructure.adapters.theme_repository i
     ThemeRepository,
 )
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,7 @@ class RegenerateCoverUseCase:
         cover_service: CoverGenerationService,
         regeneration_service: RegenerationService,
         event_bus: EventBus,
+        pdf_rebuild_scheduler: PdfRebuildScheduler | None = None,
     ):
         """Initialize regenerate cover use case.
 
@@ -53,12 +56,15 @@ class RegenerateCoverUseCase:
             cover_service: Service for cover generation
             regeneration_service: Service for regeneration operations
             event_bus: Event bus for domain events
+            pdf_rebuild_scheduler: Optional scheduler deferring the PDF rebuild
         """
         self.ebook_repository = ebook_repository
         self.cover_service = cover_service
         self.regeneration_service = regeneration_service
         self.event_bus = event_bus
+        self.pdf_rebuild_scheduler = pdf_rebuild_scheduler
 
+    @traced_use_case("regenerate_cover")
     async def execute(
         self,
         ebook_id: int,
@@ -125,41 +131,45 @@ class RegenerateCoverUseCase:
         # Extract pages metadata from structure_json
         pages_meta = ebook.structure_json["pages_meta"]
 
-        # Build assembled pages list with new cover
-        assembled_pages = [
-            AssembledPage(
-                page_number=0,
-                title=ebook.title or "Cover",
-                image_data=cover_data,
-                image_format="PNG",
-            )
-        ]
-
-        # Add content pages (skip old cover at page_number=0)
-        for page_meta in pages_meta:
-            if page_meta["page_number"] == 0:
-                continue  # Skip the old cover
-
-            page_data = base64.b64decode(page_meta["image_data_base64"])
-            assembled_pages.append(
+        # With a scheduler, only the new image is processed now and the PDF is rebuilt once edits settle
+        if self.pdf_rebuild_scheduler is not None:
+            await self.regeneration_service.render_page_thumbnails([cover_data])
+        else:
+            # Build assembled pages list with new cover
+            assembled_pages = [
                 AssembledPage(
-                    page_number=page_meta["page_number"],
-                    title=page_meta.get("title", f"Page {page_meta['page_number']}"),
-                    image_data=page_data,
-                    image_format=page_meta.get("image_format", "PNG"),
+                    page_number=0,
+                    title=ebook.title or "Cover",
+                    image_data=cover_data,
+                    image_format="PNG",
+                )
+            ]
+
+            # Add content pages (skip old cover at page_number=0)
+            for page_meta in pages_meta:
+                if page_meta["page_number"] == 0:
+                    continue  # Skip the old cover
+
+                page_data = base64.b64decode(page_meta["image_data_base64"])
+                assembled_pages.append(
+                    AssembledPage(
+                        page_number=page_meta["page_number"],
+                        title=page_meta.get("title", f"Page {page_meta['page_number']}"),
+                        image_data=page_data,
+                        image_format=page_meta.get("image_format", "PNG"),
+                    )
                 )
-            )
 
-        # Use RegenerationService to assemble PDF, save to DB, and upload to storage
-        pdf_path, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
-            ebook=ebook,
-            assembled_pages=assembled_pages,
-            ebook_repository=self.ebook_repository,
-            filename_suffix="cover_regenerated",
-        )
+            # Use RegenerationService to assemble PDF, save to DB, and upload to storage
+            pdf_path, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
+                ebook=ebook,
+                assembled_pages=assembled_pages,
+                ebook_repository=self.ebook_repository,
+                filename_suffix="cover_regenerated",
+            )
 
-        # Update ebook with new preview URL
-        ebook.preview_url = preview_url
+            # Update ebook with new preview URL
+            ebook.preview_url = preview_url
 
         # Step 4: Update structure_json with new cover
 
@@ -184,6 +194,11 @@ class RegenerateCoverUseCase:
         updated_ebook = await self.ebook_repository.save(ebook)
         logger.info(f"✅ Ebook {ebook_id} updated with new cover")
 
+        # Marked after the save, so the rebuild reads the new image
+        if self.pdf_rebuild_scheduler is not None:
+            await self.ebook_repository.mark_pdf_dirty(ebook_id)
+            self.pdf_rebuild_scheduler.schedule(ebook_id)
+
         # Step 6: Emit domain event
         await self.event_bus.publish(
             CoverRegeneratedEvent(
@@ -0,0 +1,215 @@
+"""Use case for regenerating several content pages in one pass."""
+
+import asyncio
+import base64
+import logging
+
+from backoffice.features.ebook.regeneration.domain.entities.page_batch import (
+    PageBatchResult,
+    PageRegenerationItem,
+)
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerated_event import (
+    ContentPageRegeneratedEvent,
+)
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import (
+    ContentPageRegeneratingStatusEvent,
+)
+from backoffice.features.ebook.regeneration.domain.services.regeneration_service import (
+    RegenerationService,
+)
+from backoffice.features.ebook.shared.domain.entities.generation_request import ColorMode, ImageSpec
+from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
+from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.services.ebook_validator import EbookValidator
+from backoffice.features.ebook.shared.domain.services.page_generation import (
+    ContentPageGenerationService,
+)
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.tracing import traced_use_case
+
+logger = logging.getLogger(__name__)
+
+
+class RegeneratePagesBatchUseCase:
+    """Regenerate several content pages of an ebook at once.
+
+    Pages are generated concurrently (bounded by the page service semaphore),
+    then the structure is updated, the PDF rebuilt and uploaded ONCE for the
+    whole batch. A page that fails keeps its previous image; the batch only
+    fails if no page could be generated.
+    """
+
+    def __init__(
+        self,
+        ebook_repository: EbookPort,
+        page_service: ContentPageGenerationService,
+        regeneration_service: RegenerationService,
+        event_bus: EventBus,
+    ):
+        """Initialize batch page regeneration use case.
+
+        Args:
+            ebook_repository: Repository for ebook persistence
+            page_service: Service for page generation
+            regeneration_service: Service for regeneration operations
+            event_bus: Event bus for domain and progress events
+        """
+        self.ebook_repository = ebook_repository
+        self.page_service = page_service
+        self.regeneration_service = regeneration_service
+        self.event_bus = event_bus
+
+    @traced_use_case("regenerate_pages_batch")
+    async def execute(
+        self,
+        ebook_id: int,
+        pages: list[PageRegenerationItem],
+    ) -> PageBatchResult:
+        """Regenerate the given content pages.
+
+        Args:
+            ebook_id: ID of the ebook
+            pages: Pages to regenerate (duplicate indexes keep the last item)
+
+        Returns:
+            Updated ebook with the regenerated and failed page indexes
+
+        Raises:
+            DomainError: If ebook not found, not DRAFT or missing structure
+            ValueError: If a page index is invalid or no page is given
+            Exception: The first generation error if every page failed
+        """
+        ebook = await self.ebook_repository.get_by_id(ebook_id)
+        ebook = EbookValidator.validate_for_approval(ebook, ebook_id)
+        if ebook.structure_json is None:  # pragma: no cover — guaranteed by validator
+            raise DomainError(code=ErrorCode.VALIDATION_ERROR, message="Ebook has no structure data", actionable_hint="Regenerate the ebook first")
+
+        pages_meta = ebook.structure_json["pages_meta"]
+        items = {item.page_index: item for item in pages}
+        if not items:
+            raise ValueError("At least one page must be provided")
+
+        for page_index in items:
+            if page_index < 1 or page_index >= len(pages_meta) - 1:
+                raise ValueError(f"Invalid page index {page_index}. Must be between 1 and {len(pages_meta) - 2} (content pages only).")
+
+        page_indexes = sorted(items)
+        logger.info(f"🔄 Regenerating {len(page_indexes)} CONTENT PAGES for ebook {ebook_id}: {page_indexes}")
+
+        # Step 1: Build all prompts up front (theme files read once)
+        from backoffice.features.ebook.shared.domain.services.workflow_helper import (
+            build_page_prompt_from_yaml,
+            load_workflow_params,
+        )
+        from backoffice.features.ebook.shared.infrastructure.adapters.theme_repository import (
+            ThemeRepository,
+        )
+
+        theme_repo = ThemeRepository()
+        total_content_pages = len(pages_meta) - 2
+
+        prompts: dict[int, str] = {}
+        for page_index in page_indexes:
+            custom_prompt = items[page_index].custom_prompt
+            prompts[page_index] = custom_prompt or build_page_prompt_from_yaml(
+                theme_id=ebook.theme_id or "dinosaurs",
+                page_index=page_index - 1,  # Convert to 0-based index
+                total_pages=total_content_pages,
+                themes_directory=theme_repo.themes_directory,
+                seed=42,  # Default seed for reproducibility
+                audience="adults" if ebook.audience == "adults" else "children",
+            )
+
+        workflow_params = load_workflow_params(
+            theme_id=ebook.theme_id or "dinosaurs",
+            image_type="coloring_page",
+            themes_directory=theme_repo.themes_directory,
+        )
+
+        # Step 2: Generate pages concurrently, each reporting its own progress
+        for page_index in page_indexes:
+            await self._publish_status(ebook_id, page_index, state="queued")
+
+        results = await asyncio.gather(
+            *(self._generate_page(ebook_id, page_index, prompts[page_index], workflow_params) for page_index in page_indexes),
+            return_exceptions=True,
+        )
+
+        new_pages: dict[int, bytes] = {}
+        result = PageBatchResult(ebook=ebook)
+        for page_index, page_result in zip(page_indexes, results, strict=True):
+            if isinstance(page_result, BaseException):
+                logger.error(f"❌ Page {page_index} failed: {page_result}")
+                result.failed_pages[page_index] = str(page_result)
+                await self._publish_status(ebook_id, page_index, state="failed")
+            else:
+                new_pages[page_index] = page_result
+                result.regenerated_pages.append(page_index)
+
+        if not new_pages:
+            # Nothing to save: surface the first error as a single regeneration would
+            raise next(error for error in results if isinstance(error, BaseException))
+
+        # Step 3: Update structure once with every new page
+        updated_pages_meta = pages_meta.copy()
+        for page_index, page_data in new_pages.items():
+            updated_pages_meta[page_index] = {
+                "page_number": page_index,
+                "title": f"Page {page_index}",
+                "image_format": "PNG",
+                "image_data_base64": base64.b64encode(page_data).decode(),
+                "prompt": prompts[page_index],  # Store prompt for regeneration/editing
+            }
+
+        # Step 4: Rebuild and upload the PDF once
+        assembled_pages = self.regeneration_service.assemble_pages_from_structure(updated_pages_meta)
+        _, preview_url = await self.regeneration_service.rebuild_and_upload_pdf(
+            ebook=ebook,
+            assembled_pages=assembled_pages,
+            ebook_repository=self.ebook_repository,
+            filename_suffix=f"{len(new_pages)}pages_regenerated",
+        )
+
+        ebook.preview_url = preview_url
+        ebook.structure_json = {"pages_meta": updated_pages_meta}
+
+        # Step 5: Save updated ebook
+        result.ebook = await self.ebook_repository.save(ebook)
+        logger.info(f"✅ Ebook {ebook_id} updated with {len(new_pages)} regenerated pages ({len(result.failed_pages)} failed)")
+
+        # Step 6: Emit domain events
+        for page_index in result.regenerated_pages:
+            await self.event_bus.publish(
+                ContentPageRegeneratedEvent(
+                    ebook_id=ebook_id,
+                    title=result.ebook.title or "Untitled",
+                    page_index=page_index,
+                    prompt_used=prompts[page_index],
+                )
+            )
+
+        return result
+
+    async def _generate_page(self, ebook_id: int, page_index: int, prompt: str, workflow_params: dict[str, str]) -> bytes:
+        # ebook_id/page_index in the spec let the provider stream per-page progress
+        page_spec = ImageSpec(width_px=2626, height_px=2626, format="PNG", dpi=300, color_mode=ColorMode.BLACK_WHITE, ebook_id=ebook_id, page_index=page_index)
+
+        page_data = await self.page_service.generate_single_page(
+            prompt=prompt,
+            spec=page_spec,
+            seed=None,  # Random seed for variety
+            workflow_params=workflow_params,
+        )
+        logger.info(f"✅ Page {page_index} regenerated: {len(page_data)} bytes")
+        return page_data
+
+    async def _publish_status(self, ebook_id: int, page_index: int, state: str) -> None:
+        await self.event_bus.publish(
+            ContentPageRegeneratingStatusEvent(
+                ebook_id=ebook_id,
+                page_index=page_index,
+                status=0,
+                state=state,
+                nb_total_steps=0,
+            )
+        )
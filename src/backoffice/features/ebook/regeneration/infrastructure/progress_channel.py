@@ -0,0 +1,148 @@
+"""Coalescing channel for generation progress (page regeneration status).
+
+Providers may publish hundreds of progress frames per image. The channel
+keeps only the LATEST status per (ebook_id, page_index) and flushes it to its
+subscribers at a bounded rate (5 Hz by default), so progress traffic depends
+on the number of pages in flight, not on how chatty the backend is.
+
+Terminal states ("finished", "failed") are delivered immediately and replace
+any pending update of the same page.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import (
+    ContentPageRegeneratingStatusEvent,
+)
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATES = frozenset({"finished", "failed"})
+DEFAULT_FLUSH_INTERVAL = 0.2  # 5 Hz
+
+ProgressCallback = Callable[[ContentPageRegeneratingStatusEvent], Awaitable[None]]
+
+
+class _ProgressBusHandler(EventHandler[ContentPageRegeneratingStatusEvent]):
+    def __init__(self, channel: "ProgressChannel"):
+        self.channel = channel
+
+    async def handle(self, event: ContentPageRegeneratingStatusEvent) -> None:
+        self.channel.offer(event)
+
+
+class ProgressChannel:
+    """Latest progress per page, flushed to subscribers at a bounded rate."""
+
+    def __init__(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._pending: dict[tuple[int, int], ContentPageRegeneratingStatusEvent] = {}
+        self._subscribers: dict[int, ProgressCallback] = {}
+        self._ids = itertools.count()
+        self._flusher: asyncio.Task | None = None
+        self._delivery_lock = asyncio.Lock()  # Keeps flushes and terminal deliveries in order
+        self._terminal_tasks: set[asyncio.Task] = set()
+        self._bus_subscription: tuple[EventBus, int] | None = None
+        self.received = 0  # Progress events offered (diagnostics)
+        self.delivered = 0  # Progress events sent to subscribers (diagnostics)
+
+    def attach(self, event_bus: EventBus) -> None:
+        """Receive the ContentPageRegeneratingStatusEvent published on a bus (by any worker)."""
+        if self._bus_subscription is not None:
+            return
+        event_bus.distribute(ContentPageRegeneratingStatusEvent)
+        handler_id = event_bus.subscribe(ContentPageRegeneratingStatusEvent, _ProgressBusHandler(self))
+        self._bus_subscription = (event_bus, handler_id)
+
+    def detach(self) -> None:
+        """Stop receiving events from the bus (pending updates are dropped)."""
+        if self._bus_subscription is not None:
+            event_bus, handler_id = self._bus_subscription
+            event_bus.unsubscribe(ContentPageRegeneratingStatusEvent, handler_id)
+            self._bus_subscription = None
+        self._pending.clear()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+
+    def subscribe(self, callback: ProgressCallback) -> int:
+        """Register a coroutine called with each coalesced progress update.
+
+        Returns:
+            Subscription id (for unsubscribe)
+        """
+        subscription_id = next(self._ids)
+        self._subscribers[subscription_id] = callback
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: int) -> bool:
+        """Remove a subscriber (safe from inside its own callback, or twice)."""
+        return self._subscribers.pop(subscription_id, None) is not None
+
+    def offer(self, event: ContentPageRegeneratingStatusEvent) -> None:
+        """Record a progress event (never blocks the publisher)."""
+        self.received += 1
+        key = (event.ebook_id, event.page_index)
+
+        if event.state in TERMINAL_STATES:
+            self._pending.pop(key, None)
+            task = asyncio.create_task(self._deliver([event]))
+            self._terminal_tasks.add(task)
+            task.add_done_callback(self._terminal_tasks.discard)
+            return
+
+        self._pending[key] = event
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def flush(self) -> None:
+        """Deliver every pending update now."""
+        events = list(self._pending.values())
+        self._pending.clear()
+        if events:
+            await self._deliver(events)
+
+    async def _flush_periodically(self) -> None:
+        # Runs while updates keep coming, exits once a tick finds nothing pending
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._pending:
+                return
+            await self.flush()
+
+    async def _deliver(self, events: list[ContentPageRegeneratingStatusEvent]) -> None:
+        async with self._delivery_lock:
+            for event in events:
+                callbacks = list(self._subscribers.values())
+                results = await asyncio.gather(*(callback(event) for callback in callbacks), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"❌ Progress subscriber failed for ebook {event.ebook_id} page {event.page_index}: {result}")
+                self.delivered += 1
+
+
+_progress_channel: ProgressChannel | None = None
+
+
+def get_progress_channel() -> ProgressChannel:
+    """Get the process-wide progress channel, attached to the global EventBus."""
+    global _progress_channel
+    if _progress_channel is None:
+        from backoffice.features.shared.infrastructure.events.event_bus_singleton import get_event_bus
+
+        _progress_channel = ProgressChannel()
+        _progress_channel.attach(get_event_bus())
+    return _progress_channel
+
+
+def reset_progress_channel() -> None:
+    """Reset the progress channel singleton (useful for testing)."""
+    global _progress_channel
+    if _progress_channel is not None:
+        _progress_channel.detach()
+    _progress_channel = None
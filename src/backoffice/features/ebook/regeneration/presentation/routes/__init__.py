@@ -11,6 +11,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request
 
+from backoffice.features.ebook.regeneration.domain.entities.page_batch import PageRegenerationItem
 from backoffice.features.ebook.regeneration.domain.entities.page_type import PageType
 from backoffice.features.ebook.regeneration.domain.usecases.add_new_pages import (
     AddNewPagesUseCase,
@@ -27,6 +28,9 @@ from backoffice.features.ebook.regeneration.domain.usecases.regenerate_content_p
 from backoffice.features.ebook.regeneration.domain.usecases.regenerate_cover import (
     RegenerateCoverUseCase,
 )
+from backoffice.features.ebook.regeneration.domain.usecases.regenerate_pages_batch import (
+    RegeneratePagesBatchUseCase,
+)
 from backoffice.features.ebook.regeneration.presentation.routes.cover_routes import (
     router as cover_router,
 )
@@ -34,10 +38,13 @@ from backoffice.features.ebook.regeneration.presentation.routes.dependencies imp
     create_cover_service,
     create_page_service,
     create_regeneration_service,
+    get_pdf_rebuild_scheduler,
+    http_error_from_domain_error,
 )
 from backoffice.features.ebook.regeneration.presentation.routes.page_routes import (
     router as page_router,
 )
+from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError
 from backoffice.features.ebook.shared.infrastructure.factories.repository_factory import (
     RepositoryFactory,
     get_repository_factory,
@@ -110,6 +117,7 @@ async def regenerate_ebook_page(
                 cover_service=cover_service,
                 regeneration_service=regeneration_service,
                 event_bus=event_bus,
+                pdf_rebuild_scheduler=get_pdf_rebuild_scheduler(),
             )
             updated_ebook = await regenerate_usecase.execute(ebook_id=ebook_id)
 
@@ -122,33 +130,33 @@ async def regenerate_ebook_page(
                 cover_service=cover_service,
                 regeneration_service=regeneration_service,
                 event_bus=event_bus,
+                pdf_rebuild_scheduler=get_pdf_rebuild_scheduler(),
             )
             updated_ebook = await regenerate_usecase.execute(ebook_id=ebook_id)
 
         else:  # PageType.CONTENT_PAGE
             page_service = create_page_service()
 
-            regenerate_usecase = RegenerateContentPageUseCase(
-                ebook_repository=ebook_repo,
-                page_service=page_service,
-                regeneration_service=regeneration_service,
-                event_bus=event_bus,
-            )
-
             # Handle multiple pages or single page
             if page_indices and isinstance(page_indices, list) and len(page_indices) > 0:
-                # Multiple pages regeneration
+                # Multiple pages: generated concurrently, one PDF rebuild
                 logger.info(f"Regenerating {len(page_indices)} pages for ebook {ebook_id}: {page_indices}")
 
-                # Regenerate each page sequentially
-                for idx in page_indices:
-                    logger.info(f"Regenerating page {idx}...")
-                    updated_ebook = await regenerate_usecase.execute(
-                        ebook_id=ebook_id,
-                        page_index=idx,
-                    )
+                batch_usecase = RegeneratePagesBatchUseCase(
+                    ebook_repository=ebook_repo,
+                    page_service=page_service,
+                    regeneration_service=regeneration_service,
+                    event_bus=factory.get_event_bus(),
+                )
+                batch_result = await batch_usecase.execute(
+                    ebook_id=ebook_id,
+                    pages=[PageRegenerationItem(page_index=int(idx)) for idx in page_indices],
+                )
+                updated_ebook = batch_result.ebook
 
-                message = f"{len(page_indices)} pages regenerated successfully"
+                message = f"{len(batch_result.regenerated_pages)} pages regenerated successfully"
+                if batch_result.failed_pages:
+                    message += f" ({len(batch_result.failed_pages)} failed: {sorted(batch_result.failed_pages)})"
             else:
                 # Single page regeneration (backward compatibility)
                 if page_index is None:
@@ -157,6 +165,13 @@ async def regenerate_ebook_page(
                         detail="Either page_index or page_indices must be provided for content_page",
                     )
 
+                regenerate_usecase = RegenerateContentPageUseCase(
+                    ebook_repository=ebook_repo,
+                    page_service=page_service,
+                    regeneration_service=regeneration_service,
+                    event_bus=event_bus,
+                )
+
                 logger.info(f"Regenerating page {page_index} for ebook {ebook_id}")
                 updated_ebook = await regenerate_usecase.execute(
                     ebook_id=ebook_id,
@@ -192,6 +207,75 @@ async def regenerate_ebook_page(
         ) from e
 
 
+@router.post("/{ebook_id}/pages/regenerate-batch")
+async def regenerate_ebook_pages_batch(
+    ebook_id: int,
+    factory: RepositoryFactoryDep,
+    batch_request: Annotated[dict, Body(...)],
+) -> dict:
+    """Regenerate several content pages with a single PDF rebuild.
+
+    Pages are generated concurrently; progress for each page is published
+    on the application event bus and streamed over the status websocket.
+
+    Request body:
+    {
+        "pages": [
+            {"page_index": 1},
+            {"page_index": 4, "custom_prompt": "<prompt to use instead of template>"}
+        ]
+    }
+
+    Returns:
+        JSON response with the regenerated and failed pages
+    """
+    try:
+        raw_pages = batch_request.get("pages")
+        if not isinstance(raw_pages, list) or not raw_pages:
+            raise HTTPException(status_code=400, detail="pages must be a non-empty list")
+
+        try:
+            pages = [PageRegenerationItem(page_index=int(page["page_index"]), custom_prompt=page.get("custom_prompt") or None) for page in raw_pages]
+        except (KeyError, TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail="Each page needs an integer page_index") from e
+
+        use_case = RegeneratePagesBatchUseCase(
+            ebook_repository=factory.get_ebook_repository(),
+            page_service=create_page_service(),
+            regeneration_service=create_regeneration_service(factory),
+            event_bus=factory.get_event_bus(),
+        )
+        result = await use_case.execute(ebook_id=ebook_id, pages=pages)
+
+        logger.info(f"Batch regenerated {len(result.regenerated_pages)} pages for ebook {ebook_id} ({len(result.failed_pages)} failed)")
+
+        return {
+            "success": not result.failed_pages,
+            "ebook_id": result.ebook.id,
+            "preview_url": result.ebook.preview_url,
+            "regenerated_pages": result.regenerated_pages,
+            "failed_pages": [{"page_index": page_index, "error": error} for page_index, error in sorted(result.failed_pages.items())],
+        }
+
+    except DomainError as e:
+        logger.warning(f"Domain error batch regenerating pages for ebook {ebook_id}: {e.message}")
+        raise http_error_from_domain_error(e) from e
+    except ValueError as e:
+        logger.warning(f"Validation error batch regenerating pages for ebook {ebook_id}: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            f"Unexpected error batch regenerating pages for ebook {ebook_id}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Error regenerating pages. Please try again.",
+        ) from e
+
+
 @router.post("/{ebook_id}/complete-pages")
 async def complete_ebook_pages(
     ebook_id: int,
@@ -261,8 +345,9 @@ async def add_new_pages(
 ) -> dict:
     """Add new AI-generated coloring pages to an existing ebook.
 
-    Pages are generated using the same theme/style as the original ebook
-    and inserted before the back cover.
+    Pages are generated concurrently using the same theme/style as the
+    original ebook and inserted before the back cover. Pages that fail to
+    generate are skipped and listed in "failures".
 
     Request body:
     {
@@ -302,6 +387,8 @@ async def add_new_pages(
             "success": True,
             "message": result.message,
             "pages_added": result.pages_added,
+            "pages_failed": len(result.failures),
+            "failures": result.failures,
             "total_pages": result.total_pages,
             "limit_reached": result.limit_reached,
         }
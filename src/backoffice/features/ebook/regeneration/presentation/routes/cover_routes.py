@@ -15,9 +15,13 @@ from backoffice.features.ebook.regeneration.domain.usecases.preview_regenerate_c
     PreviewRegenerateCoverUseCase,
 )
 from backoffice.features.ebook.regeneration.presentation.routes.dependencies import (
+    candidate_response,
     create_cover_service,
     create_regeneration_service,
+    get_pdf_rebuild_scheduler,
+    http_error_from_domain_error,
 )
+from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError
 from backoffice.features.ebook.shared.infrastructure.factories.repository_factory import (
     RepositoryFactory,
     get_repository_factory,
@@ -43,22 +47,23 @@ async def preview_regenerate_cover(
     """Preview regenerate the cover without saving to DB or storage.
 
     This endpoint generates a new version of the cover for preview purposes only.
-    The image is returned as base64 but NOT saved to DB/storage.
+    The image is kept server-side as a preview candidate but NOT saved to DB/storage.
     No PDF rebuild occurs.
 
     Request body (optional):
     {
-        "current_image_base64": "<latest modal image for chaining>",
+        "current_candidate_id": "<latest modal preview for chaining>",
+        "chain_from_stored_image": true,
         "custom_prompt": "<custom prompt to use instead of stored/template>"
     }
 
     Args:
         ebook_id: ID of the ebook
         factory: Repository factory for dependency injection
-        body: Optional request body with current_image_base64 and/or custom_prompt
+        body: Optional request body with current_candidate_id and/or custom_prompt
 
     Returns:
-        JSON response with base64 image data and metadata
+        JSON response with the candidate id, its thumbnail URL and metadata
 
     Raises:
         HTTPException: If ebook not found or invalid status
@@ -67,11 +72,11 @@ async def preview_regenerate_cover(
         logger.info(f"Preview regenerating cover for ebook {ebook_id}")
 
         # Extract optional parameters from body
-        current_image_base64 = None
-        custom_prompt = None
-        if body:
-            current_image_base64 = body.get("current_image_base64")
-            custom_prompt = body.get("custom_prompt")
+        body = body or {}
+        current_image_base64 = body.get("current_image_base64")
+        current_candidate_id = body.get("current_candidate_id")
+        chain_from_stored_image = bool(body.get("chain_from_stored_image", False))
+        custom_prompt = body.get("custom_prompt")
 
         # Get dependencies
         ebook_repo = factory.get_ebook_repository()
@@ -81,6 +86,7 @@ async def preview_regenerate_cover(
         use_case = PreviewRegenerateCoverUseCase(
             ebook_repository=ebook_repo,
             cover_service=cover_service,
+            candidate_store=factory.get_preview_candidate_store(),
         )
 
         # Execute preview regeneration
@@ -88,17 +94,22 @@ async def preview_regenerate_cover(
             ebook_id=ebook_id,
             current_image_base64=current_image_base64,
             custom_prompt=custom_prompt,
+            current_candidate_id=current_candidate_id,
+            chain_from_stored_image=chain_from_stored_image,
         )
 
         logger.info(f"Preview regenerated cover for ebook {ebook_id}")
 
         return {
             "success": True,
-            "image_base64": result["image_base64"],
+            **candidate_response(ebook_id, result),
             "page_index": result["page_index"],
             "prompt_used": result["prompt_used"],
         }
 
+    except DomainError as e:
+        logger.warning(f"Domain error preview regenerating cover for ebook {ebook_id}: {e.message}")
+        raise http_error_from_domain_error(e) from e
     except ValueError as e:
         logger.warning(f"Validation error preview regenerating cover for ebook {ebook_id}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -124,13 +135,13 @@ async def edit_cover_image(
     """Edit the cover image with targeted corrections without saving to DB.
 
     This endpoint applies specific corrections to an existing cover image.
-    The edited image is returned as base64 but NOT saved to DB/storage.
+    The edited image is kept server-side as a preview candidate but NOT saved to DB/storage.
     No PDF rebuild occurs - this is preview only.
 
     Request body:
     {
         "edit_prompt": "replace 5 toes with 3 toes",
-        "current_image_base64": "<latest modal image, optional>"
+        "current_candidate_id": "<latest modal preview, optional (saved cover otherwise)>"
     }
 
     Args:
@@ -139,7 +150,7 @@ async def edit_cover_image(
         edit_request: Request body with edit_prompt
 
     Returns:
-        JSON response with base64 edited image data and metadata
+        JSON response with the candidate id, its thumbnail URL and metadata
 
     Raises:
         HTTPException: If ebook not found, invalid status, or edit fails
@@ -150,6 +161,7 @@ async def edit_cover_image(
         if not edit_prompt:
             raise HTTPException(status_code=400, detail="edit_prompt is required in request body")
         current_image_base64 = edit_request.get("current_image_base64")
+        current_candidate_id = edit_request.get("current_candidate_id")
 
         logger.info(f"Editing cover for ebook {ebook_id} with prompt: {edit_prompt[:100]}...")
 
@@ -161,6 +173,7 @@ async def edit_cover_image(
         use_case = EditCoverImageUseCase(
             ebook_repository=ebook_repo,
             image_edit_port=image_edit_port,
+            candidate_store=factory.get_preview_candidate_store(),
         )
 
         # Execute edit
@@ -168,17 +181,21 @@ async def edit_cover_image(
             ebook_id=ebook_id,
             edit_prompt=edit_prompt,
             current_image_base64=current_image_base64,
+            current_candidate_id=current_candidate_id,
         )
 
         logger.info(f"Edited cover for ebook {ebook_id}")
 
         return {
             "success": True,
-            "image_base64": result["image_base64"],
+            **candidate_response(ebook_id, result),
             "page_index": result["page_index"],
             "edit_prompt_used": result["edit_prompt_used"],
         }
 
+    except DomainError as e:
+        logger.warning(f"Domain error editing cover for ebook {ebook_id}: {e.message}")
+        raise http_error_from_domain_error(e) from e
     except ValueError as e:
         logger.warning(f"Validation error editing cover for ebook {ebook_id}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -204,7 +221,7 @@ async def apply_cover_edit(
     """Apply a cover edit by saving the preview image and rebuilding PDF.
 
     This endpoint:
-    1. Receives base64 image from modal preview
+    1. Loads the preview candidate chosen in the modal
     2. Updates ebook structure_json with new cover image and optional prompt
     3. Rebuilds PDF with new cover
     4. Resets APPROVED ebook to DRAFT if necessary
@@ -212,14 +229,16 @@ async def apply_cover_edit(
 
     Request body:
     {
-        "image_base64": "base64-encoded-image-data",
+        "candidate_id": "preview-candidate-id",
         "prompt": "optional custom prompt used for regeneration"
     }
 
+    "image_base64" is still accepted in place of "candidate_id".
+
     Args:
         ebook_id: ID of the ebook
         factory: Repository factory for dependency injection
-        edit_data: Request body with image_base64 and optional prompt
+        edit_data: Request body with candidate_id and optional prompt
 
     Returns:
         JSON response with success status and updated ebook preview URL
@@ -230,10 +249,11 @@ async def apply_cover_edit(
     try:
         logger.info(f"Applying edit for cover of ebook {ebook_id}")
 
-        # Extract image data and optional prompt from request
+        # Extract image reference and optional prompt from request
+        candidate_id = edit_data.get("candidate_id")
         image_base64 = edit_data.get("image_base64")
-        if not image_base64:
-            raise HTTPException(status_code=400, detail="image_base64 is required in request body")
+        if not candidate_id and not image_base64:
+            raise HTTPException(status_code=400, detail="candidate_id is required in request body")
         prompt = edit_data.get("prompt")
 
         # Get dependencies
@@ -246,6 +266,8 @@ async def apply_cover_edit(
             ebook_repository=ebook_repo,
             regeneration_service=regeneration_service,
             event_bus=event_bus,
+            candidate_store=factory.get_preview_candidate_store(),
+            pdf_rebuild_scheduler=get_pdf_rebuild_scheduler(),
         )
 
         # Execute apply edit with page_index=0 for cover
@@ -254,6 +276,7 @@ async def apply_cover_edit(
             page_index=0,  # Cover is always at index 0
             image_base64=image_base64,
             prompt=prompt,
+            candidate_id=candidate_id,
         )
 
         logger.info(f"Successfully applied edit for cover of ebook {ebook_id}")
@@ -265,6 +288,9 @@ async def apply_cover_edit(
             "preview_url": updated_ebook.preview_url,
         }
 
+    except DomainError as e:
+        logger.warning(f"Domain error applying edit for cover of ebook {ebook_id}: {e.message}")
+        raise http_error_from_domain_error(e) from e
     except ValueError as e:
         logger.warning(f"Validation error applying edit for cover of ebook {ebook_id}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e)) from e
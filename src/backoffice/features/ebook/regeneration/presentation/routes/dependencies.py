@@ -1,15 +1,24 @@
 """Shared dependencies for regeneration routes."""
 
 import logging
+import os
+
+from fastapi import HTTPException
 
 from backoffice.features.ebook.regeneration.domain.services.regeneration_service import (
     RegenerationService,
 )
+from backoffice.features.ebook.regeneration.domain.usecases.rebuild_ebook_pdf import (
+    RebuildEbookPdfUseCase,
+)
+from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
+from backoffice.features.ebook.shared.domain.policies.model_registry import ModelRegistry
 from backoffice.features.ebook.shared.domain.services.cover_generation import CoverGenerationService
 from backoffice.features.ebook.shared.domain.services.page_generation import (
     ContentPageGenerationService,
 )
 from backoffice.features.ebook.shared.domain.services.pdf_assembly import PDFAssemblyService
+from backoffice.features.ebook.shared.domain.services.pdf_rebuild_scheduler import PdfRebuildScheduler
 from backoffice.features.ebook.shared.infrastructure.factories.repository_factory import (
     RepositoryFactory,
 )
@@ -19,6 +28,8 @@ from backoffice.features.ebook.shared.infrastructure.providers.provider_factory
 from backoffice.features.ebook.shared.infrastructure.providers.weasyprint_assembly_provider import (
     WeasyPrintAssemblyProvider,
 )
+from backoffice.features.shared.infrastructure.database import get_db
+from backoffice.features.shared.infrastructure.profiling import profiled_job
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +51,42 @@ def create_regeneration_service(factory: RepositoryFactory) -> RegenerationServi
     return RegenerationService(
         assembly_service=assembly_service,
         file_storage=factory.get_file_storage(),
+        thumbnail_store=factory.get_thumbnail_store(),
     )
 
 
+async def _rebuild_ebook_pdf(ebook_id: int) -> None:
+    """Rebuild a dirty ebook PDF with its own database session (runs after the request)."""
+    db_session = get_db()
+    db = next(db_session)
+    try:
+        factory = RepositoryFactory(db)
+        use_case = RebuildEbookPdfUseCase(
+            ebook_repository=factory.get_ebook_repository(),
+            regeneration_service=create_regeneration_service(factory),
+        )
+        await use_case.execute(ebook_id)
+    finally:
+        db_session.close()
+
+
+_pdf_rebuild_scheduler: PdfRebuildScheduler | None = None
+
+
+def get_pdf_rebuild_scheduler() -> PdfRebuildScheduler:
+    """Get the process-wide PDF rebuild scheduler.
+
+    Edits mark the PDF dirty and schedule a rebuild once they settle for
+    PDF_REBUILD_DEBOUNCE_SECONDS (default 5).
+    """
+    global _pdf_rebuild_scheduler
+    if _pdf_rebuild_scheduler is None:
+        debounce_seconds = float(os.getenv("PDF_REBUILD_DEBOUNCE_SECONDS", "5"))
+        _pdf_rebuild_scheduler = PdfRebuildScheduler(rebuild=profiled_job("pdf_rebuild", _rebuild_ebook_pdf), debounce_seconds=debounce_seconds)
+        logger.info(f"✅ PDF rebuild scheduler ready (debounce {debounce_seconds:g}s)")
+    return _pdf_rebuild_scheduler
+
+
 def create_cover_service() -> CoverGenerationService:
     """Create CoverGenerationService with provider.
 
@@ -56,8 +100,44 @@ def create_cover_service() -> CoverGenerationService:
 def create_page_service() -> ContentPageGenerationService:
     """Create ContentPageGenerationService with provider.
 
+    Concurrency follows the provider, as for ebook creation: ComfyUI runs
+    one page at a time, cloud APIs three.
+
     Returns:
         Configured ContentPageGenerationService instance
     """
     page_provider = ProviderFactory.create_content_page_provider()
-    return ContentPageGenerationService(page_port=page_provider)
+    page_model = ModelRegistry.get_instance().get_page_model()
+    max_concurrent = 1 if page_model.provider == "comfy" else 3
+    return ContentPageGenerationService(page_port=page_provider, max_concurrent=max_concurrent)
+
+
+def candidate_image_url(ebook_id: int, candidate_id: str, width: int = 1600) -> str:
+    """Build the URL of a preview candidate thumbnail."""
+    return f"/api/ebooks/{ebook_id}/candidates/{candidate_id}/image?w={width}"
+
+
+def candidate_response(ebook_id: int, result: dict) -> dict:
+    """Build the preview/edit response fields for a use case result.
+
+    Args:
+        ebook_id: ID of the ebook
+        result: Use case result (candidate_id, or image_base64 without a store)
+
+    Returns:
+        candidate_id + image_url, or image_base64 for the legacy contract
+    """
+    if "candidate_id" in result:
+        return {"candidate_id": result["candidate_id"], "image_url": candidate_image_url(ebook_id, result["candidate_id"])}
+    return {"image_base64": result["image_base64"]}
+
+
+def http_error_from_domain_error(error: DomainError) -> HTTPException:
+    """Map a domain error to an HTTP error (410 for expired previews, 400 for validation)."""
+    if error.code == ErrorCode.PREVIEW_CANDIDATE_EXPIRED:
+        return HTTPException(status_code=410, detail=error.message)
+    if error.code == ErrorCode.EBOOK_NOT_FOUND:
+        return HTTPException(status_code=404, detail=error.message)
+    if error.code == ErrorCode.VALIDATION_ERROR:
+        return HTTPException(status_code=400, detail=error.message)
+    return HTTPException(status_code=500, detail=error.message)
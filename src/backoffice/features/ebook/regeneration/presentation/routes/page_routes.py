@@ -1,9 +1,12 @@
 """API routes for page regeneration and editing."""
 
+import asyncio
+import base64
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 
 from backoffice.features.ebook.regeneration.domain.usecases.apply_page_edit import (
     ApplyPageEditUseCase,
@@ -15,8 +18,20 @@ from backoffice.features.ebook.regeneration.domain.usecases.preview_regenerate_p
     PreviewRegeneratePageUseCase,
 )
 from backoffice.features.ebook.regeneration.presentation.routes.dependencies import (
+    candidate_response,
     create_page_service,
     create_regeneration_service,
+    get_pdf_rebuild_scheduler,
+    http_error_from_domain_error,
+)
+from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError
+from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import (
+    THUMBNAIL_WIDTHS,
+    select_thumbnail_width,
+)
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_page_thumbnail_store import (
+    render_webp_thumbnails,
 )
 from backoffice.features.ebook.shared.infrastructure.factories.repository_factory import (
     RepositoryFactory,
@@ -26,6 +41,7 @@ from backoffice.features.ebook.shared.infrastructure.providers.provider_factory
     ProviderFactory,
 )
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.presentation.routes.http_caching import cached_binary_response, etag_matches
 
 # Type alias for dependency injection
 RepositoryFactoryDep = Annotated[RepositoryFactory, Depends(get_repository_factory)]
@@ -33,6 +49,26 @@ RepositoryFactoryDep = Annotated[RepositoryFactory, Depends(get_repository_facto
 router = APIRouter(tags=["Page Regeneration"])
 logger = logging.getLogger(__name__)
 
+# Versioned thumbnail URLs (?v=<page key>) never change content
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+PAGE_KEY_VERSION_LENGTH = 16
+
+
+def page_image_url(ebook_id: int, page_index: int, page_key: str, width: int) -> str:
+    """Build the versioned (long-cacheable) URL of a page thumbnail."""
+    return f"/api/ebooks/{ebook_id}/pages/{page_index}/image?w={width}&v={page_key[:PAGE_KEY_VERSION_LENGTH]}"
+
+
+async def _page_not_found_error(ebook_repo: EbookPort, ebook_id: int, page_index: int, include_back_cover: bool) -> HTTPException:
+    """Build the 404/400 error of a page that get_page_info did not find (loads the ebook)."""
+    ebook = await ebook_repo.get_by_id(ebook_id)
+    if not ebook:
+        return HTTPException(status_code=404, detail=f"Ebook {ebook_id} not found")
+    if not ebook.structure_json or "pages_meta" not in ebook.structure_json:
+        return HTTPException(status_code=400, detail="Ebook has no structure data")
+    last_index = len(ebook.structure_json["pages_meta"]) - (1 if include_back_cover else 2)
+    return HTTPException(status_code=400, detail=f"Invalid page index {page_index}. Must be between 0 and {last_index}")
+
 
 @router.post("/{ebook_id}/pages/{page_index}/preview-regenerate")
 async def preview_regenerate_page(
@@ -44,17 +80,24 @@ async def preview_regenerate_page(
     """Preview regenerate a content page without saving to DB or storage.
 
     This endpoint generates a new version of the page for preview purposes only.
-    The image is returned as base64 but NOT saved to DB/storage.
+    The image is kept server-side as a preview candidate but NOT saved to DB/storage.
     No PDF rebuild occurs.
 
+    Request body (optional):
+    {
+        "current_candidate_id": "<latest modal preview to chain from>",
+        "chain_from_stored_image": true,
+        "custom_prompt": "<custom prompt to use instead of stored/template>"
+    }
+
     Args:
         ebook_id: ID of the ebook
         page_index: Index of the page to regenerate (1-based, content pages only)
         factory: Repository factory for dependency injection
-        body: Optional request body that may include the current modal image
+        body: Optional request body that may include the current modal preview
 
     Returns:
-        JSON response with base64 image data and metadata
+        JSON response with the candidate id, its thumbnail URL and metadata
 
     Raises:
         HTTPException: If ebook not found, invalid status, or invalid page index
@@ -63,11 +106,11 @@ async def preview_regenerate_page(
         logger.info(f"Preview regenerating page {page_index} for ebook {ebook_id}")
 
         # Extract optional parameters from body
-        current_image_base64 = None
-        custom_prompt = None
-        if body:
-            current_image_base64 = body.get("current_image_base64")
-            custom_prompt = body.get("custom_prompt")
+        body = body or {}
+        current_image_base64 = body.get("current_image_base64")
+        current_candidate_id = body.get("current_candidate_id")
+        chain_from_stored_image = bool(body.get("chain_from_stored_image", False))
+        custom_prompt = body.get("custom_prompt")
 
         # Get dependencies
         ebook_repo = factory.get_ebook_repository()
@@ -77,6 +120,7 @@ async def preview_regenerate_page(
         use_case = PreviewRegeneratePageUseCase(
             ebook_repository=ebook_repo,
             page_service=page_service,
+            candidate_store=factory.get_preview_candidate_store(),
         )
 
         # Execute preview regeneration
@@ -85,17 +129,22 @@ async def preview_regenerate_page(
             page_index=page_index,
             current_image_base64=current_image_base64,
             custom_prompt=custom_prompt,
+            current_candidate_id=current_candidate_id,
+            chain_from_stored_image=chain_from_stored_image,
         )
 
         logger.info(f"Preview regenerated page {page_index} for ebook {ebook_id}")
 
         return {
             "success": True,
-            "image_base64": result["image_base64"],
+            **candidate_response(ebook_id, result),
             "page_index": result["page_index"],
             "prompt_used": result["prompt_used"],
         }
 
+    except DomainError as e:
+        logger.warning(f"Domain error preview regenerating page {page_index} for ebook {ebook_id}: {e.message}")
+        raise http_error_from_domain_error(e) from e
     except ValueError as e:
         logger.warning(f"Validation error preview regenerating page {page_index} for ebook {ebook_id}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -122,13 +171,13 @@ async def edit_page_image(
     """Edit a content page image with targeted corrections without saving to DB.
 
     This endpoint applies specific corrections to an existing page image.
-    The edited image is returned as base64 but NOT saved to DB/storage.
+    The edited image is kept server-side as a preview candidate but NOT saved to DB/storage.
     No PDF rebuild occurs - this is preview only.
 
     Request body:
     {
         "edit_prompt": "replace 5 toes with 3 toes",
-        "current_image_base64": "<latest modal image, optional>"
+        "current_candidate_id": "<latest modal preview, optional (saved page otherwise)>"
     }
 
     Args:
@@ -138,7 +187,7 @@ async def edit_page_image(
         edit_request: Request body with edit_prompt
 
     Returns:
-        JSON response with base64 edited image data and metadata
+        JSON response with the candidate id, its thumbnail URL and metadata
 
     Raises:
         HTTPException: If ebook not found, invalid status, invalid page index, or edit fails
@@ -149,6 +198,7 @@ async def edit_page_image(
         if not edit_prompt:
             raise HTTPException(status_code=400, detail="edit_prompt is required in request body")
         current_image_base64 = edit_request.get("current_image_base64")
+        current_candidate_id = edit_request.get("current_candidate_id")
 
         logger.info(f"Editing page {page_index} for ebook {ebook_id} with prompt: {edit_prompt[:100]}...")
 
@@ -160,6 +210,7 @@ async def edit_page_image(
         use_case = EditPageImageUseCase(
             ebook_repository=ebook_repo,
             image_edit_port=image_edit_port,
+            candidate_store=factory.get_preview_candidate_store(),
         )
 
         # Execute edit
@@ -168,17 +219,21 @@ async def edit_page_image(
             page_index=page_index,
             edit_prompt=edit_prompt,
             current_image_base64=current_image_base64,
+            current_candidate_id=current_candidate_id,
         )
 
         logger.info(f"Edited page {page_index} for ebook {ebook_id}")
 
         return {
             "success": True,
-            "image_base64": result["image_base64"],
+            **candidate_response(ebook_id, result),
             "page_index": result["page_index"],
             "edit_prompt_used": result["edit_prompt_used"],
         }
 
+    except DomainError as e:
+        logger.warning(f"Domain error editing page {page_index} for ebook {ebook_id}: {e.message}")
+        raise http_error_from_domain_error(e) from e
     except ValueError as e:
         logger.warning(f"Validation error editing page {page_index} for ebook {ebook_id}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -205,7 +260,7 @@ async def apply_page_edit(
     """Apply a page edit by saving the preview image and rebuilding PDF.
 
     This endpoint:
-    1. Receives base64 image from modal preview
+    1. Loads the preview candidate chosen in the modal
     2. Updates ebook structure_json with new image and optional prompt
     3. Rebuilds PDF with new page
     4. Resets APPROVED ebook to DRAFT if necessary
@@ -213,16 +268,18 @@ async def apply_page_edit(
 
     Request body:
     {
-        "image_base64": "base64-encoded-image-data",
+        "candidate_id": "preview-candidate-id",
         "page_index": 1,
         "prompt": "optional custom prompt used for regeneration"
     }
 
+    "image_base64" is still accepted in place of "candidate_id".
+
     Args:
         ebook_id: ID of the ebook
         page_index: Index of the page to update (0 for cover, 1+ for content pages)
         factory: Repository factory for dependency injection
-        edit_data: Request body with image_base64, page_index, and optional prompt
+        edit_data: Request body with candidate_id, page_index, and optional prompt
 
     Returns:
         JSON response with success status and updated ebook preview URL
@@ -233,10 +290,11 @@ async def apply_page_edit(
     try:
         logger.info(f"Applying edit for page {page_index} of ebook {ebook_id}")
 
-        # Extract image data and optional prompt from request
+        # Extract image reference and optional prompt from request
+        candidate_id = edit_data.get("candidate_id")
         image_base64 = edit_data.get("image_base64")
-        if not image_base64:
-            raise HTTPException(status_code=400, detail="image_base64 is required in request body")
+        if not candidate_id and not image_base64:
+            raise HTTPException(status_code=400, detail="candidate_id is required in request body")
         prompt = edit_data.get("prompt")
 
         # Get dependencies
@@ -249,6 +307,8 @@ async def apply_page_edit(
             ebook_repository=ebook_repo,
             regeneration_service=regeneration_service,
             event_bus=event_bus,
+            candidate_store=factory.get_preview_candidate_store(),
+            pdf_rebuild_scheduler=get_pdf_rebuild_scheduler(),
         )
 
         # Execute apply edit
@@ -257,6 +317,7 @@ async def apply_page_edit(
             page_index=page_index,
             image_base64=image_base64,
             prompt=prompt,
+            candidate_id=candidate_id,
         )
 
         page_type = "Couverture" if page_index == 0 else f"Page {page_index}"
@@ -269,6 +330,9 @@ async def apply_page_edit(
             "preview_url": updated_ebook.preview_url,
         }
 
+    except DomainError as e:
+        logger.warning(f"Domain error applying edit for page {page_index} of ebook {ebook_id}: {e.message}")
+        raise http_error_from_domain_error(e) from e
     except ValueError as e:
         logger.warning(f"Validation error applying edit for page {page_index} of ebook {ebook_id}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -290,10 +354,11 @@ async def get_page_data(
     ebook_id: int,
     page_index: int,
     factory: RepositoryFactoryDep,
+    include_image: bool = False,
 ) -> dict:
-    """Get page data (image base64 + prompt) for editing.
+    """Get page data (thumbnail URLs + prompt) for editing.
 
-    This endpoint returns the current image and prompt for a specific page,
+    This endpoint returns the current image URLs and prompt for a specific page,
     allowing the frontend to fetch data on-demand rather than embedding
     all images in the HTML.
 
@@ -301,44 +366,150 @@ async def get_page_data(
         ebook_id: ID of the ebook
         page_index: Index of the page (0 for cover, 1+ for content pages)
         factory: Repository factory for dependency injection
+        include_image: Also return the full image as base64
 
     Returns:
-        JSON with image_base64 and prompt
+        JSON with image_urls and prompt (and image_base64 if requested)
 
     Raises:
         HTTPException: If ebook not found or invalid page index
     """
     try:
         ebook_repo = factory.get_ebook_repository()
-        ebook = await ebook_repo.get_by_id(ebook_id)
-
-        if not ebook:
-            raise HTTPException(status_code=404, detail=f"Ebook {ebook_id} not found")
+        page = await ebook_repo.get_page_info(ebook_id, page_index)
 
-        if not ebook.structure_json or "pages_meta" not in ebook.structure_json:
-            raise HTTPException(status_code=400, detail="Ebook has no structure data")
+        # Allow cover and content pages, not back cover
+        if page is None or page.is_back_cover:
+            raise await _page_not_found_error(ebook_repo, ebook_id, page_index, include_back_cover=False)
 
-        pages_meta = ebook.structure_json["pages_meta"]
-
-        # Validate page index (allow cover and content pages, not back cover)
-        if page_index < 0 or page_index >= len(pages_meta) - 1:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid page index {page_index}. Must be between 0 and {len(pages_meta) - 2}",
-            )
-
-        page = pages_meta[page_index]
-        return {
+        page_data = {
             "success": True,
             "ebook_id": ebook_id,
             "page_index": page_index,
-            "image_base64": page.get("image_data_base64", ""),
-            "prompt": page.get("prompt", ""),
-            "title": page.get("title", f"Page {page_index}"),
+            "image_urls": {str(width): page_image_url(ebook_id, page_index, page.image_key, width) for width in THUMBNAIL_WIDTHS},
+            "prompt": page.prompt or "",
+            "title": page.title or f"Page {page_index}",
         }
+        if include_image:
+            ebook = await ebook_repo.get_by_id(ebook_id)
+            page_data["image_base64"] = ebook.structure_json["pages_meta"][page_index].get("image_data_base64", "") if ebook else ""
+        return page_data
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error getting page data for ebook {ebook_id}, page {page_index}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Error retrieving page data") from e
+
+
+@router.get("/{ebook_id}/pages/{page_index}/image")
+async def get_page_image(
+    ebook_id: int,
+    page_index: int,
+    request: Request,
+    factory: RepositoryFactoryDep,
+    w: Annotated[int | None, Query(ge=1)] = None,
+    v: str | None = None,
+) -> Response:
+    """Get a WebP thumbnail of a page (cover, content or back cover).
+
+    Thumbnails are rendered at generation/edit time in 256/768/1600px; the
+    requested width is snapped to the smallest rendition that covers it.
+    Renditions missing from the store (older ebooks) are rendered on first read.
+
+    Responses carry an ETag. When `v` matches the current page image key
+    (URLs from the page data endpoint), the response is cacheable for a year.
+
+    Args:
+        ebook_id: ID of the ebook
+        page_index: Index of the page (0 for cover, last for back cover)
+        request: Incoming request (If-None-Match)
+        factory: Repository factory for dependency injection
+        w: Requested width in px (default 768)
+        v: Page image version from a versioned URL
+
+    Returns:
+        WebP image response (or 304 if the client copy is current)
+
+    Raises:
+        HTTPException: If ebook not found or invalid page index
+    """
+    try:
+        ebook_repo = factory.get_ebook_repository()
+        page = await ebook_repo.get_page_info(ebook_id, page_index)
+        if page is None:
+            raise await _page_not_found_error(ebook_repo, ebook_id, page_index, include_back_cover=True)
+
+        # Revalidation only needs the stored page key: no image is read or decoded
+        width = select_thumbnail_width(w)
+        etag = f'"{page.image_key[:32]}-{width}"'
+        is_versioned = v is not None and v == page.image_key[:PAGE_KEY_VERSION_LENGTH]
+        cache_control = IMMUTABLE_CACHE_CONTROL if is_versioned else "private, no-cache"
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+        thumbnail_store = factory.get_thumbnail_store()
+        thumbnail = await thumbnail_store.get(page.image_key, width)
+        if thumbnail is None:
+            logger.info(f"Rendering missing thumbnails for page {page_index} of ebook {ebook_id}")
+            ebook = await ebook_repo.get_by_id(ebook_id)
+            if not ebook or not ebook.structure_json:
+                raise HTTPException(status_code=404, detail=f"Ebook {ebook_id} not found")
+            image_data = base64.b64decode(ebook.structure_json["pages_meta"][page_index]["image_data_base64"])
+            thumbnail = await thumbnail_store.get(await thumbnail_store.render(image_data), width)
+        if thumbnail is None:  # pragma: no cover — render stores every width
+            raise HTTPException(status_code=500, detail="Error rendering page thumbnail")
+
+        return cached_binary_response(request, content=thumbnail, media_type="image/webp", etag=etag, cache_control=cache_control)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting page image for ebook {ebook_id}, page {page_index}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error retrieving page image") from e
+
+
+@router.get("/{ebook_id}/candidates/{candidate_id}/image")
+async def get_candidate_image(
+    ebook_id: int,
+    candidate_id: str,
+    request: Request,
+    factory: RepositoryFactoryDep,
+    w: Annotated[int | None, Query(ge=1)] = None,
+) -> Response:
+    """Get a WebP thumbnail of a preview candidate (regenerate/edit modal).
+
+    Candidates are immutable, so responses are cacheable until the candidate
+    expires.
+
+    Args:
+        ebook_id: ID of the ebook
+        candidate_id: Preview candidate id
+        request: Incoming request (If-None-Match)
+        factory: Repository factory for dependency injection
+        w: Requested width in px (default 768)
+
+    Returns:
+        WebP image response (or 304 if the client copy is current)
+
+    Raises:
+        HTTPException: If the candidate is unknown or expired (410)
+    """
+    width = select_thumbnail_width(w)
+    etag = f'"{candidate_id}-{width}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    try:
+        candidate = await factory.get_preview_candidate_store().get(ebook_id, candidate_id)
+        if candidate is None:
+            raise HTTPException(status_code=410, detail="Preview expired, generate a new one")
+
+        renditions = await asyncio.to_thread(render_webp_thumbnails, candidate.image_data, (width,))
+        return cached_binary_response(request, renditions[width], "image/webp", etag=etag, cache_control="private, max-age=3600, immutable")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting candidate image {candidate_id[:8]} for ebook {ebook_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error retrieving preview image") from e
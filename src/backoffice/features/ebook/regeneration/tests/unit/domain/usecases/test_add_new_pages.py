@@ -0,0 +1,123 @@
+"""Tests for AddNewPagesUseCase."""
+
+import asyncio
+import base64
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backoffice.features.ebook.regeneration.domain.usecases.add_new_pages import (
+    AddNewPagesUseCase,
+)
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
+from backoffice.features.ebook.shared.domain.services.page_generation import (
+    ContentPageGenerationService,
+)
+from backoffice.features.ebook.shared.tests.unit.fakes.fake_page_port import FakePagePort
+
+
+class SlowPagePort(FakePagePort):
+    """Fake port tracking how many generations overlap, failing on given pages."""
+
+    def __init__(self, fail_pages: tuple[int, ...] = ()):
+        super().__init__()
+        self.fail_pages = fail_pages
+        self.active = 0
+        self.max_active = 0
+        self.prompts: dict[int, str] = {}  # By spec.page_index
+
+    async def generate_page(self, prompt, spec, seed=None, workflow_params=None) -> bytes:
+        self.prompts[spec.page_index] = prompt
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            page_data = await super().generate_page(prompt, spec, seed, workflow_params)
+        finally:
+            self.active -= 1
+        if spec.page_index in self.fail_pages:
+            raise RuntimeError("provider timeout")
+        return page_data
+
+
+def _ebook_with_pages(content_pages: int) -> Ebook:
+    ebook = Ebook(
+        id=1,
+        title="Test Coloring Book",
+        author="Test Author",
+        created_at=datetime.now(),
+        status=EbookStatus.DRAFT,
+        theme_id="dinosaurs",
+        audience="6-8",
+    )
+    titles = ["Cover"] + [f"Page {i}" for i in range(1, content_pages + 1)] + ["Back Cover"]
+    ebook.structure_json = {
+        "pages_meta": [{"page_number": i, "title": title, "image_format": "PNG", "image_data_base64": base64.b64encode(f"old_{i}".encode()).decode()} for i, title in enumerate(titles)]
+    }
+    return ebook
+
+
+def _use_case(ebook: Ebook, page_port: SlowPagePort):
+    ContentPageGenerationService.clear_cache()
+    mock_repo = AsyncMock()
+    mock_repo.get_by_id.return_value = ebook
+    mock_repo.save.side_effect = lambda saved: saved
+    regeneration_service = AsyncMock()
+
+    use_case = AddNewPagesUseCase(
+        ebook_repository=mock_repo,
+        page_service=ContentPageGenerationService(page_port=page_port, max_concurrent=3),
+        regeneration_service=regeneration_service,
+    )
+    use_case._convert_pages_meta_to_assembled_pages = MagicMock(return_value=[])
+    return use_case, regeneration_service
+
+
+async def test_add_pages_generates_concurrently_and_keeps_order():
+    """Pages are generated in parallel (bounded) and numbered before the back cover."""
+    ebook = _ebook_with_pages(2)
+    page_port = SlowPagePort()
+    use_case, regeneration_service = _use_case(ebook, page_port)
+
+    result = await use_case.execute(ebook_id=1, count=5)
+
+    assert result.pages_added == 5
+    assert result.failures == []
+    assert page_port.max_active == 3
+    pages_meta = result.ebook.structure_json["pages_meta"]
+    assert [page["page_number"] for page in pages_meta] == list(range(9))
+    assert pages_meta[-1]["title"] == "Back Cover"
+    assert sorted(page_port.prompts) == [3, 4, 5, 6, 7]  # pages_meta indexes of the new pages
+    assert [page["prompt"] for page in pages_meta[3:8]] == [page_port.prompts[i] for i in range(3, 8)]
+    regeneration_service.rebuild_and_upload_pdf.assert_awaited_once()
+
+
+async def test_add_pages_keeps_successes_when_some_fail():
+    ebook = _ebook_with_pages(2)
+    page_port = SlowPagePort(fail_pages=(4,))
+    use_case, regeneration_service = _use_case(ebook, page_port)
+
+    result = await use_case.execute(ebook_id=1, count=3)
+
+    assert result.pages_added == 2
+    assert result.failures == ["provider timeout"]
+    assert "1 échec(s)" in result.message
+    pages_meta = result.ebook.structure_json["pages_meta"]
+    assert [page["page_number"] for page in pages_meta] == list(range(6))
+    # The failed slot is skipped: the next page keeps its own prompt
+    assert [page["prompt"] for page in pages_meta[3:5]] == [page_port.prompts[3], page_port.prompts[5]]
+    assert page_port.prompts[4] not in [page.get("prompt") for page in pages_meta]
+    assert result.total_pages == 6
+    regeneration_service.rebuild_and_upload_pdf.assert_awaited_once()
+
+
+async def test_add_pages_raises_when_every_page_fails():
+    ebook = _ebook_with_pages(2)
+    page_port = SlowPagePort(fail_pages=(3,))
+    use_case, regeneration_service = _use_case(ebook, page_port)
+
+    with pytest.raises(RuntimeError, match="provider timeout"):
+        await use_case.execute(ebook_id=1, count=1)
+
+    regeneration_service.rebuild_and_upload_pdf.assert_not_called()
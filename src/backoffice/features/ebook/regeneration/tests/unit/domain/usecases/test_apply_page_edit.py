@@ -14,6 +14,7 @@ from backoffice.features.ebook.regeneration.domain.usecases.apply_page_edit impo
 )
 from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
+from backoffice.features.ebook.shared.tests.unit.fakes.fake_preview_candidate_store import FakePreviewCandidateStore
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
 from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
 
@@ -350,3 +351,81 @@ async def test_apply_page_edit_emits_domain_event():
     assert len(published_events) == 1
     assert published_events[0].ebook_id == ebook_id
     assert published_events[0].page_index == page_index
+
+
+@pytest.mark.asyncio
+async def test_apply_page_edit_from_preview_candidate():
+    """Applying a candidate id saves the stored image and prompt, then drops the page's candidates."""
+    fake_ebook = Ebook(id=1, title="Test", author="Author", created_at=datetime.now(), status=EbookStatus.DRAFT)
+    fake_ebook.structure_json = {"pages_meta": [{"page_number": i, "title": f"Page {i}", "image_data_base64": base64.b64encode(b"old").decode(), "prompt": "old prompt"} for i in range(3)]}
+    mock_repo = AsyncMock()
+    mock_repo.get_by_id.return_value = fake_ebook
+    mock_repo.save.return_value = fake_ebook
+    mock_regeneration_service = AsyncMock()
+    mock_regeneration_service.rebuild_and_upload_pdf.return_value = (MagicMock(), None)
+
+    candidate_store = FakePreviewCandidateStore()
+    candidate = await candidate_store.put(1, 1, b"candidate_image", prompt="new prompt")
+
+    use_case = ApplyPageEditUseCase(
+        ebook_repository=mock_repo,
+        regeneration_service=mock_regeneration_service,
+        event_bus=EventBus(),
+        candidate_store=candidate_store,
+    )
+    result = await use_case.execute(ebook_id=1, page_index=1, candidate_id=candidate.candidate_id)
+
+    updated_page = result.structure_json["pages_meta"][1]
+    assert base64.b64decode(updated_page["image_data_base64"]) == b"candidate_image"
+    assert updated_page["prompt"] == "new prompt"
+    assert candidate_store.discarded == [(1, 1)]
+
+
+@pytest.mark.asyncio
+async def test_apply_page_edit_rejects_candidate_of_another_page():
+    """A candidate generated for another page is reported as expired."""
+    fake_ebook = Ebook(id=1, title="Test", author="Author", created_at=datetime.now(), status=EbookStatus.DRAFT)
+    fake_ebook.structure_json = {"pages_meta": [{"page_number": i, "image_data_base64": base64.b64encode(b"old").decode()} for i in range(4)]}
+    mock_repo = AsyncMock()
+    mock_repo.get_by_id.return_value = fake_ebook
+
+    candidate_store = FakePreviewCandidateStore()
+    candidate = await candidate_store.put(1, 2, b"page_2_candidate")
+
+    use_case = ApplyPageEditUseCase(
+        ebook_repository=mock_repo,
+        regeneration_service=AsyncMock(),
+        event_bus=EventBus(),
+        candidate_store=candidate_store,
+    )
+    with pytest.raises(DomainError) as exc_info:
+        await use_case.execute(ebook_id=1, page_index=1, candidate_id=candidate.candidate_id)
+
+    assert exc_info.value.code == ErrorCode.PREVIEW_CANDIDATE_EXPIRED
+    mock_repo.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_apply_page_edit_defers_pdf_rebuild_to_scheduler():
+    """With a scheduler, the edit only stores the image and marks the PDF dirty."""
+    fake_ebook = Ebook(id=1, title="Test", author="Author", created_at=datetime.now(), status=EbookStatus.DRAFT)
+    fake_ebook.structure_json = {"pages_meta": [{"page_number": i, "image_data_base64": base64.b64encode(b"old").decode()} for i in range(4)]}
+    mock_repo = AsyncMock()
+    mock_repo.get_by_id.return_value = fake_ebook
+    mock_repo.save.return_value = fake_ebook
+    mock_regeneration_service = AsyncMock()
+    scheduler = MagicMock()
+
+    use_case = ApplyPageEditUseCase(
+        ebook_repository=mock_repo,
+        regeneration_service=mock_regeneration_service,
+        event_bus=EventBus(),
+        pdf_rebuild_scheduler=scheduler,
+    )
+    await use_case.execute(ebook_id=1, page_index=2, image_base64=base64.b64encode(b"edited").decode())
+
+    mock_regeneration_service.rebuild_and_upload_pdf.assert_not_called()
+    mock_regeneration_service.render_page_thumbnails.assert_awaited_once_with([b"edited"])
+    mock_repo.save.assert_awaited_once()
+    mock_repo.mark_pdf_dirty.assert_awaited_once_with(1)
+    scheduler.schedule.assert_called_once_with(1)
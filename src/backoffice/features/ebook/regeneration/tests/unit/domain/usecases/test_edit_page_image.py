@@ -9,6 +9,7 @@ from backoffice.features.ebook.regeneration.domain.usecases.edit_page_image impo
 from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
 from backoffice.features.ebook.shared.domain.entities.pagination import PaginatedResult, PaginationParams
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError
+from backoffice.features.ebook.shared.tests.unit.fakes.fake_preview_candidate_store import FakePreviewCandidateStore
 from backoffice.features.shared.tests.unit.fakes.fake_image_edit_port import FakeImageEditPort
 
 
@@ -136,3 +137,29 @@ async def test_edit_raises_on_invalid_modal_base64():
             edit_prompt="invalid input",
             current_image_base64="@@not-base64@@",
         )
+
+
+@pytest.mark.asyncio
+async def test_edit_chains_from_candidate_and_stores_result():
+    """Edits load the source from the candidate store and return a new candidate id."""
+    ebook = _make_ebook(base64.b64encode(b"PDF_IMAGE").decode())
+    repo = FakeEbookRepository(ebook)
+    edit_port = FakeImageEditPort(mode="succeed", edited_image_size=20)
+    candidate_store = FakePreviewCandidateStore()
+    source = await candidate_store.put(1, 1, b"PREVIOUS_PREVIEW")
+
+    use_case = EditPageImageUseCase(ebook_repository=repo, image_edit_port=edit_port, candidate_store=candidate_store)
+
+    result = await use_case.execute(
+        ebook_id=1,
+        page_index=1,
+        edit_prompt="add a hat",
+        current_candidate_id=source.candidate_id,
+    )
+
+    assert edit_port.last_image == b"PREVIOUS_PREVIEW"
+    assert "image_base64" not in result
+    edited = await candidate_store.get(1, str(result["candidate_id"]))
+    assert edited is not None
+    assert edited.page_index == 1
+    assert edited.image_data.startswith(b"EDITED[add a hat]")
@@ -0,0 +1,44 @@
+"""Tests for RebuildEbookPdfUseCase."""
+
+import base64
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from backoffice.features.ebook.regeneration.domain.usecases.rebuild_ebook_pdf import (
+    RebuildEbookPdfUseCase,
+)
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookPdfInfo, EbookStatus
+
+
+async def test_rebuild_skips_current_pdf():
+    """Nothing is assembled when no edit is pending."""
+    mock_repo = AsyncMock()
+    mock_repo.get_ebook_pdf_info.return_value = EbookPdfInfo(ebook_id=1, title="Test", content_hash="abc")
+    mock_regeneration_service = AsyncMock()
+
+    rebuilt = await RebuildEbookPdfUseCase(mock_repo, mock_regeneration_service).execute(1)
+
+    assert rebuilt is False
+    mock_regeneration_service.rebuild_and_upload_pdf.assert_not_called()
+
+
+async def test_rebuild_assembles_structure_and_clears_marker_read_before():
+    """The PDF is rebuilt from the saved pages; only the marker read first is cleared."""
+    dirty_at = datetime(2026, 1, 1, 12, 0, 0)
+    fake_ebook = Ebook(id=1, title="Test", author="Author", created_at=datetime.now(), status=EbookStatus.DRAFT, drive_id="drive-1")
+    fake_ebook.structure_json = {"pages_meta": [{"page_number": i, "image_data_base64": base64.b64encode(b"page").decode()} for i in range(3)]}
+
+    mock_repo = AsyncMock()
+    mock_repo.get_ebook_pdf_info.return_value = EbookPdfInfo(ebook_id=1, title="Test", content_hash="abc", pdf_dirty_at=dirty_at)
+    mock_repo.get_by_id.return_value = fake_ebook
+    mock_regeneration_service = AsyncMock()
+    mock_regeneration_service.assemble_pages_from_structure = MagicMock(return_value=["assembled"])
+    mock_regeneration_service.rebuild_and_upload_pdf.return_value = (MagicMock(), "http://preview.url")
+
+    rebuilt = await RebuildEbookPdfUseCase(mock_repo, mock_regeneration_service).execute(1)
+
+    assert rebuilt is True
+    mock_regeneration_service.rebuild_and_upload_pdf.assert_awaited_once()
+    assert mock_regeneration_service.rebuild_and_upload_pdf.await_args.kwargs["assembled_pages"] == ["assembled"]
+    mock_repo.mark_pdf_rebuilt.assert_awaited_once_with(1, dirty_at, "http://preview.url", "drive-1")
+    mock_repo.save.assert_not_called()
@@ -0,0 +1,161 @@
+"""Tests for RegeneratePagesBatchUseCase."""
+
+import base64
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backoffice.features.ebook.regeneration.domain.entities.page_batch import PageRegenerationItem
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerated_event import (
+    ContentPageRegeneratedEvent,
+)
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import (
+    ContentPageRegeneratingStatusEvent,
+)
+from backoffice.features.ebook.regeneration.domain.usecases.regenerate_pages_batch import (
+    RegeneratePagesBatchUseCase,
+)
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+
+
+class RecordingHandler(EventHandler):
+    def __init__(self):
+        self.events = []
+
+    async def handle(self, event) -> None:
+        self.events.append(event)
+
+
+def _ebook_with_pages(content_pages: int) -> Ebook:
+    ebook = Ebook(
+        id=1,
+        title="Test Coloring Book",
+        author="Test Author",
+        created_at=datetime.now(),
+        status=EbookStatus.DRAFT,
+        theme_id="dinosaurs",
+        audience="6-8",
+    )
+    titles = ["Cover"] + [f"Page {i}" for i in range(1, content_pages + 1)] + ["Back Cover"]
+    ebook.structure_json = {
+        "pages_meta": [
+            {
+                "page_number": i,
+                "title": title,
+                "image_format": "PNG",
+                "image_data_base64": base64.b64encode(f"old_{i}".encode()).decode(),
+            }
+            for i, title in enumerate(titles)
+        ]
+    }
+    return ebook
+
+
+def _use_case(ebook: Ebook, page_service, event_bus: EventBus):
+    mock_repo = AsyncMock()
+    mock_repo.get_by_id.return_value = ebook
+    mock_repo.save.side_effect = lambda saved: saved
+
+    regeneration_service = AsyncMock()
+    regeneration_service.assemble_pages_from_structure = MagicMock(return_value=[])
+    regeneration_service.rebuild_and_upload_pdf.return_value = (MagicMock(), "http://preview.url")
+
+    use_case = RegeneratePagesBatchUseCase(
+        ebook_repository=mock_repo,
+        page_service=page_service,
+        regeneration_service=regeneration_service,
+        event_bus=event_bus,
+    )
+    return use_case, mock_repo, regeneration_service
+
+
+async def test_batch_rebuilds_pdf_once_for_all_pages():
+    """All pages are generated, then one structure update, one rebuild and one save."""
+    ebook = _ebook_with_pages(4)
+    page_service = AsyncMock()
+    page_service.generate_single_page.side_effect = lambda prompt, spec, seed, workflow_params: f"new_{spec.page_index}".encode()
+
+    event_bus = EventBus()
+    regenerated = RecordingHandler()
+    event_bus.subscribe(ContentPageRegeneratedEvent, regenerated)
+
+    use_case, mock_repo, regeneration_service = _use_case(ebook, page_service, event_bus)
+
+    result = await use_case.execute(
+        ebook_id=1,
+        pages=[PageRegenerationItem(page_index=3), PageRegenerationItem(page_index=1, custom_prompt="a dragon")],
+    )
+
+    assert result.regenerated_pages == [1, 3]
+    assert result.failed_pages == {}
+    assert page_service.generate_single_page.await_count == 2
+    assert {call.kwargs["spec"].page_index for call in page_service.generate_single_page.await_args_list} == {1, 3}
+    regeneration_service.rebuild_and_upload_pdf.assert_awaited_once()
+    mock_repo.save.assert_awaited_once()
+
+    pages_meta = result.ebook.structure_json["pages_meta"]
+    assert base64.b64decode(pages_meta[1]["image_data_base64"]) == b"new_1"
+    assert base64.b64decode(pages_meta[3]["image_data_base64"]) == b"new_3"
+    assert base64.b64decode(pages_meta[2]["image_data_base64"]) == b"old_2"
+    assert pages_meta[1]["prompt"] == "a dragon"
+    assert result.ebook.preview_url == "http://preview.url"
+    assert [event.page_index for event in regenerated.events] == [1, 3]
+
+
+async def test_batch_keeps_successful_pages_when_one_fails():
+    """A failed page keeps its previous image and is reported."""
+    ebook = _ebook_with_pages(3)
+
+    async def generate(prompt, spec, seed, workflow_params):
+        if spec.page_index == 2:
+            raise RuntimeError("provider down")
+        return f"new_{spec.page_index}".encode()
+
+    page_service = AsyncMock()
+    page_service.generate_single_page.side_effect = generate
+
+    event_bus = EventBus()
+    statuses = RecordingHandler()
+    event_bus.subscribe(ContentPageRegeneratingStatusEvent, statuses)
+
+    use_case, mock_repo, regeneration_service = _use_case(ebook, page_service, event_bus)
+
+    result = await use_case.execute(ebook_id=1, pages=[PageRegenerationItem(page_index=i) for i in (1, 2, 3)])
+
+    assert result.regenerated_pages == [1, 3]
+    assert result.failed_pages == {2: "provider down"}
+    pages_meta = result.ebook.structure_json["pages_meta"]
+    assert base64.b64decode(pages_meta[2]["image_data_base64"]) == b"old_2"
+    regeneration_service.rebuild_and_upload_pdf.assert_awaited_once()
+    assert [(event.page_index, event.state) for event in statuses.events if event.state == "failed"] == [(2, "failed")]
+
+
+async def test_batch_fails_when_every_page_fails():
+    """Nothing is saved when no page could be generated."""
+    ebook = _ebook_with_pages(2)
+    page_service = AsyncMock()
+    page_service.generate_single_page.side_effect = RuntimeError("provider down")
+
+    use_case, mock_repo, regeneration_service = _use_case(ebook, page_service, EventBus())
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        await use_case.execute(ebook_id=1, pages=[PageRegenerationItem(page_index=1), PageRegenerationItem(page_index=2)])
+
+    regeneration_service.rebuild_and_upload_pdf.assert_not_called()
+    mock_repo.save.assert_not_called()
+
+
+async def test_batch_rejects_invalid_page_index_before_generating():
+    """Covers and out-of-range indexes are rejected up front."""
+    ebook = _ebook_with_pages(2)
+    page_service = AsyncMock()
+
+    use_case, _, _ = _use_case(ebook, page_service, EventBus())
+
+    with pytest.raises(ValueError, match="Invalid page index 3"):
+        await use_case.execute(ebook_id=1, pages=[PageRegenerationItem(page_index=1), PageRegenerationItem(page_index=3)])
+
+    page_service.generate_single_page.assert_not_called()
@@ -0,0 +1,84 @@
+"""Unit tests for the coalescing progress channel."""
+
+import asyncio
+
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import (
+    ContentPageRegeneratingStatusEvent,
+)
+from backoffice.features.ebook.regeneration.infrastructure.progress_channel import ProgressChannel
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+
+
+def _status(page_index: int, status: int, state: str | None = "running") -> ContentPageRegeneratingStatusEvent:
+    return ContentPageRegeneratingStatusEvent(ebook_id=1, page_index=page_index, status=status, state=state, nb_total_steps=100)
+
+
+class Recorder:
+    def __init__(self):
+        self.events: list[tuple[int, int, str | None]] = []
+
+    async def __call__(self, event: ContentPageRegeneratingStatusEvent) -> None:
+        self.events.append((event.page_index, event.status, event.state))
+
+
+async def test_chatty_progress_is_coalesced_per_page():
+    bus = EventBus()
+    channel = ProgressChannel(flush_interval=0.05)
+    channel.attach(bus)
+    recorder = Recorder()
+    channel.subscribe(recorder)
+
+    for status in range(200):
+        await bus.publish(_status(page_index=1, status=status))
+        await bus.publish(_status(page_index=2, status=status))
+    await asyncio.sleep(0.12)
+
+    assert channel.received == 400
+    assert sorted(recorder.events) == [(1, 199, "running"), (2, 199, "running")]
+
+
+async def test_flush_rate_is_bounded():
+    channel = ProgressChannel(flush_interval=0.05)
+    recorder = Recorder()
+    channel.subscribe(recorder)
+
+    for status in range(20):
+        channel.offer(_status(page_index=1, status=status))
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.06)
+
+    # ~0.2s of updates at 100 Hz -> about 4 flushes at 20 Hz
+    assert 2 <= len(recorder.events) <= 6
+    assert recorder.events[-1] == (1, 19, "running")
+
+
+async def test_terminal_state_is_delivered_immediately_and_replaces_pending():
+    channel = ProgressChannel(flush_interval=10)
+    recorder = Recorder()
+    channel.subscribe(recorder)
+
+    channel.offer(_status(page_index=3, status=40))
+    channel.offer(_status(page_index=3, status=100, state="finished"))
+    await asyncio.sleep(0.01)  # Far below the 10s flush interval
+
+    assert recorder.events == [(3, 100, "finished")]
+    await channel.flush()
+    assert recorder.events == [(3, 100, "finished")]  # Stale progress never follows
+    channel.detach()
+
+
+async def test_failing_subscriber_does_not_block_others():
+    channel = ProgressChannel(flush_interval=0.01)
+    recorder = Recorder()
+
+    async def broken(event: ContentPageRegeneratingStatusEvent) -> None:
+        raise ConnectionError("socket closed")
+
+    channel.subscribe(broken)
+    subscription_id = channel.subscribe(recorder)
+    channel.offer(_status(page_index=1, status=50))
+    await asyncio.sleep(0.03)
+
+    assert recorder.events == [(1, 50, "running")]
+    assert channel.unsubscribe(subscription_id) is True
+    assert channel.unsubscribe(subscription_id) is False
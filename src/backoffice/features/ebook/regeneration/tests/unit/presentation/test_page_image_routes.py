@@ -0,0 +1,100 @@
+"""Tests for the page image and page data routes (revalidation without image reads)."""
+
+import base64
+from io import BytesIO
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from PIL import Image
+
+from backoffice.features.ebook.regeneration.presentation.routes import page_routes
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookPageInfo
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import page_image_key
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_page_thumbnail_store import DiskPageThumbnailStore
+from backoffice.features.ebook.shared.infrastructure.factories.repository_factory import get_repository_factory
+
+
+def _png() -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (400, 500), (255, 255, 255)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+IMAGE = _png()
+
+
+class FakeEbookRepository:
+    """Serves page metadata; counts full ebook loads."""
+
+    def __init__(self):
+        self.full_loads = 0
+        pages = [{"title": title, "prompt": f"{title} prompt", "image_data_base64": base64.b64encode(IMAGE).decode()} for title in ("Cover", "Page 1", "Back")]
+        self.ebook = Ebook(id=1, title="Dinosaurs", author="Test", created_at=None, structure_json={"pages_meta": pages})
+
+    async def get_by_id(self, ebook_id: int) -> Ebook | None:
+        self.full_loads += 1
+        return self.ebook if ebook_id == 1 else None
+
+    async def get_page_info(self, ebook_id: int, page_index: int) -> EbookPageInfo | None:
+        if ebook_id != 1 or not 0 <= page_index < 3:
+            return None
+        page = self.ebook.structure_json["pages_meta"][page_index]
+        return EbookPageInfo(1, page_index, page_image_key(IMAGE), page["title"], page["prompt"], page_index == 2)
+
+
+class FakeFactory:
+    def __init__(self, repository: FakeEbookRepository, store: DiskPageThumbnailStore):
+        self.repository = repository
+        self.store = store
+
+    def get_ebook_repository(self) -> FakeEbookRepository:
+        return self.repository
+
+    def get_thumbnail_store(self) -> DiskPageThumbnailStore:
+        return self.store
+
+
+@pytest.fixture
+def repository():
+    return FakeEbookRepository()
+
+
+@pytest.fixture
+def client(repository, tmp_path):
+    app = FastAPI()
+    app.include_router(page_routes.router, prefix="/api/ebooks")
+    factory = FakeFactory(repository, DiskPageThumbnailStore(store_path=str(tmp_path)))
+    app.dependency_overrides[get_repository_factory] = lambda: factory
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_page_image_revalidation_does_not_load_the_ebook(client, repository):
+    async with client:
+        first = await client.get("/api/ebooks/1/pages/1/image", params={"w": 256})
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "image/webp"
+        assert repository.full_loads == 1  # Thumbnails rendered on first read
+
+        cached = await client.get("/api/ebooks/1/pages/1/image", params={"w": 256})
+        revalidated = await client.get("/api/ebooks/1/pages/1/image", params={"w": 256}, headers={"If-None-Match": first.headers["etag"]})
+
+    assert cached.content == first.content
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == first.headers["etag"]
+    assert repository.full_loads == 1
+
+
+async def test_page_data_reads_page_metadata_only(client, repository):
+    async with client:
+        data = (await client.get("/api/ebooks/1/pages/1/data")).json()
+        back_cover = await client.get("/api/ebooks/1/pages/2/data")
+        missing = await client.get("/api/ebooks/2/pages/0/data")
+
+    key = page_image_key(IMAGE)
+    assert data["title"] == "Page 1"
+    assert data["prompt"] == "Page 1 prompt"
+    assert data["image_urls"]["256"] == f"/api/ebooks/1/pages/1/image?w=256&v={key[:16]}"
+    assert back_cover.status_code == 400
+    assert missing.status_code == 404
+    assert repository.full_loads == 2  # Only to build the two error messages
@@ -3,23 +3,26 @@ Configuration constants for the ebook generation system.
 
 Values are now loaded from YAML config files in config/ directory.
 This module provides backward compatibility for existing imports.
+
+Config-backed values are resolved lazily (module __getattr__) from the
+current configuration snapshot, so importing this module never reads YAML.
+Read them at call time (constants.MAX_PAGES) rather than binding them with
+"from ... import" at module level, to keep import time low and to follow
+configuration reloads.
 """
 
 from enum import Enum
+from typing import Any
 
-from backoffice.config import ConfigLoader
-
-# Initialize config loader
-_config = ConfigLoader()
+from backoffice.config import get_app_config
 
 # Default values for ebook generation (from config/business/limits.yaml)
-DEFAULT_EBOOK_FORMAT = _config.get_default_format()
-DEFAULT_PDF_ENGINE = _config.get_default_engine()
+DEFAULT_EBOOK_FORMAT: str
+DEFAULT_PDF_ENGINE: str
 
-# Ebook configuration validation (from config/business/limits.yaml)
-_page_limits = _config.get_page_limits()
-MIN_PAGES = _page_limits["min"]
-MAX_PAGES = _page_limits["max"]
+# Ebook configuration validation
+MIN_PAGES: int
+MAX_PAGES: int
 
 # Legacy: chapters no longer used for coloring books
 MIN_CHAPTERS = 1
@@ -35,5 +38,22 @@ class PageFormat(Enum):
 
 
 # DPI validation constants (from config/business/limits.yaml)
-COVER_MIN_PIXELS_SQUARE = _config.get_cover_min_pixels()
-CONTENT_MIN_PIXELS_SQUARE = _config.get_content_min_pixels()
+COVER_MIN_PIXELS_SQUARE: int
+CONTENT_MIN_PIXELS_SQUARE: int
+
+# Constant name -> attribute of the business limits snapshot
+_LIMITS_ATTRIBUTES = {
+    "DEFAULT_EBOOK_FORMAT": "default_format",
+    "DEFAULT_PDF_ENGINE": "default_engine",
+    "MIN_PAGES": "min_pages",
+    "MAX_PAGES": "max_pages",
+    "COVER_MIN_PIXELS_SQUARE": "cover_min_pixels",
+    "CONTENT_MIN_PIXELS_SQUARE": "content_min_pixels",
+}
+
+
+def __getattr__(name: str) -> Any:
+    attribute = _LIMITS_ATTRIBUTES.get(name)
+    if attribute is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(get_app_config().limits, attribute)
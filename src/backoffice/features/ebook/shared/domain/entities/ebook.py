@@ -1,19 +1,11 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
-from backoffice.config import ConfigLoader
-from backoffice.features.ebook.shared.domain.constants import (
-    DEFAULT_EBOOK_FORMAT,
-    DEFAULT_PDF_ENGINE,
-    MAX_CHAPTERS,
-    MAX_PAGES,
-    MIN_CHAPTERS,
-    MIN_PAGES,
-)
-
-# Initialize config loader for KDP specs
-_config = ConfigLoader()
+from backoffice.config import get_config_loader
+from backoffice.features.ebook.shared.domain import constants
+from backoffice.features.ebook.shared.domain.constants import MAX_CHAPTERS, MIN_CHAPTERS
 
 
 class EbookStatus(Enum):
@@ -24,8 +16,8 @@ class EbookStatus(Enum):
 
 @dataclass
 class EbookConfig:
-    engine: str = DEFAULT_PDF_ENGINE
-    format: str = DEFAULT_EBOOK_FORMAT
+    engine: str = field(default_factory=lambda: constants.DEFAULT_PDF_ENGINE)
+    format: str = field(default_factory=lambda: constants.DEFAULT_EBOOK_FORMAT)
     number_of_chapters: int | None = None
     number_of_pages: int | None = None
     ebook_type: str = "story"  # coloring_book, children_story, professional, story
@@ -43,8 +35,9 @@ class EbookConfig:
             if not isinstance(self.number_of_pages, int):
                 type_name = type(self.number_of_pages).__name__
                 raise ValueError(f"Number of pages must be an integer, got {type_name}")
-            if not (MIN_PAGES <= self.number_of_pages <= MAX_PAGES):
-                raise ValueError(f"Number of pages must be between {MIN_PAGES} and {MAX_PAGES}")
+            min_pages, max_pages = constants.MIN_PAGES, constants.MAX_PAGES
+            if not (min_pages <= self.number_of_pages <= max_pages):
+                raise ValueError(f"Number of pages must be between {min_pages} and {max_pages}")
 
 
 @dataclass
@@ -72,6 +65,28 @@ class Ebook:
     page_count: int | None = None
 
 
+@dataclass(frozen=True)
+class EbookPdfInfo:
+    """Lightweight metadata of a stored ebook PDF (no page images, no PDF bytes)."""
+
+    ebook_id: int
+    title: str
+    content_hash: str | None  # SHA-256 of the stored PDF, None if no PDF stored
+    pdf_dirty_at: datetime | None = None  # Set while page changes await a PDF rebuild
+
+
+@dataclass(frozen=True)
+class EbookPageInfo:
+    """Lightweight metadata of one page of an ebook (no image data)."""
+
+    ebook_id: int
+    page_index: int
+    image_key: str  # SHA-256 of the page image (page_image_key)
+    title: str | None
+    prompt: str | None
+    is_back_cover: bool  # Last page of pages_meta
+
+
 # KDP Export configurations
 @dataclass
 class BackCoverConfig:
@@ -91,32 +106,39 @@ class KDPExportConfig:
     This allows modifying KDP specs without touching code.
     """
 
-    trim_size: tuple[float, float] = field(default_factory=lambda: _config.get_kdp_trim_size())
-    bleed_size: float = field(default_factory=lambda: _config.get_kdp_bleed())
-    top_margin_size: float = field(default_factory=lambda: _config.get_kdp_top_margin())
-    bottom_margin_size: float = field(default_factory=lambda: _config.get_kdp_bottom_margin())
-    side_margin_size: float = field(default_factory=lambda: _config.get_kdp_side_margin())
-    gutter_margin_size: float = field(default_factory=lambda: _config.get_kdp_gutter())
-    paper_type: str = field(default_factory=lambda: _config.get_default_paper_type())
-    include_barcode: bool = field(default_factory=lambda: _config.get_default_include_barcode())
-    cover_finish: str = field(default_factory=lambda: _config.get_default_cover_finish())
-    icc_rgb_profile: str = field(default_factory=lambda: _config.get_color_profiles()["rgb"])
-    barcode_width: float = field(default_factory=lambda: _config.get_barcode_width())
-    barcode_height: float = field(default_factory=lambda: _config.get_barcode_height())
-    barcode_margin: float = field(default_factory=lambda: _config.get_barcode_margin())
+    trim_size: tuple[float, float] = field(default_factory=lambda: get_config_loader().get_kdp_trim_size())
+    bleed_size: float = field(default_factory=lambda: get_config_loader().get_kdp_bleed())
+    top_margin_size: float = field(default_factory=lambda: get_config_loader().get_kdp_top_margin())
+    bottom_margin_size: float = field(default_factory=lambda: get_config_loader().get_kdp_bottom_margin())
+    side_margin_size: float = field(default_factory=lambda: get_config_loader().get_kdp_side_margin())
+    gutter_margin_size: float = field(default_factory=lambda: get_config_loader().get_kdp_gutter())
+    paper_type: str = field(default_factory=lambda: get_config_loader().get_default_paper_type())
+    include_barcode: bool = field(default_factory=lambda: get_config_loader().get_default_include_barcode())
+    cover_finish: str = field(default_factory=lambda: get_config_loader().get_default_cover_finish())
+    icc_rgb_profile: str = field(default_factory=lambda: get_config_loader().get_color_profiles()["rgb"])
+    barcode_width: float = field(default_factory=lambda: get_config_loader().get_barcode_width())
+    barcode_height: float = field(default_factory=lambda: get_config_loader().get_barcode_height())
+    barcode_margin: float = field(default_factory=lambda: get_config_loader().get_barcode_margin())
+    encoding_profile: str = field(default_factory=lambda: get_config_loader().get_default_encoding_profile())
+    linearize: bool = field(default_factory=lambda: get_config_loader().get_linearize_pdf())
 
     def __post_init__(self):
         """Validate config values against YAML specifications."""
         # Validate paper_type
-        valid_papers = _config.get_valid_paper_types()
+        valid_papers = get_config_loader().get_valid_paper_types()
         if self.paper_type not in valid_papers:
             raise ValueError(f"Invalid paper_type: '{self.paper_type}'. Must be one of: {', '.join(valid_papers)}. Check config/kdp/specifications.yaml")
 
         # Validate cover_finish
-        valid_finishes = _config.get_valid_cover_finishes()
+        valid_finishes = get_config_loader().get_valid_cover_finishes()
         if self.cover_finish not in valid_finishes:
             raise ValueError(f"Invalid cover_finish: '{self.cover_finish}'. Must be one of: {', '.join(valid_finishes)}. Check config/kdp/specifications.yaml")
 
+        # Validate encoding_profile
+        valid_profiles = list(get_config_loader().get_encoding_profiles())
+        if self.encoding_profile not in valid_profiles:
+            raise ValueError(f"Invalid encoding_profile: '{self.encoding_profile}'. Must be one of: {', '.join(valid_profiles)}. Check config/kdp/specifications.yaml")
+
 
 # KDP utility functions
 def calculate_spine_width(page_count: int, paper_type: str, gutter: float) -> tuple[float, float]:
@@ -131,17 +153,25 @@ def calculate_spine_width(page_count: int, paper_type: str, gutter: float) -> tu
     #           => 0.105 (Spine Safe Area width) = 102 * formula
     #           => formula = 0.105 / 102 => 0.00102941176471
 
-    formula = _config.get_spine_formula(paper_type)
+    formula = get_config_loader().get_spine_formula(paper_type)
     spine_width = page_count * formula
     spine_safe_area_width = spine_width - 2 * gutter
 
     return spine_width, spine_safe_area_width
 
 
-# Spine width constants (from config/kdp/specifications.yaml)
-MIN_SPINE_WIDTH_FOR_TEXT = _config.get_spine_min_width()
-RECOMMENDED_SPINE_WIDTH = _config.get_spine_recommended_width()
-MIN_SPINE_MARGIN = _config.get_spine_min_width()  # Same as min width
+# Spine width constants (from config/kdp/specifications.yaml), resolved lazily
+MIN_SPINE_WIDTH_FOR_TEXT: float
+RECOMMENDED_SPINE_WIDTH: float
+MIN_SPINE_MARGIN: float  # Same as min width
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("MIN_SPINE_WIDTH_FOR_TEXT", "MIN_SPINE_MARGIN"):
+        return get_config_loader().get_spine_min_width()
+    if name == "RECOMMENDED_SPINE_WIDTH":
+        return get_config_loader().get_spine_recommended_width()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def can_have_spine_text(page_count: int, paper_type: str) -> tuple[bool, str]:
@@ -150,12 +180,12 @@ def can_have_spine_text(page_count: int, paper_type: str) -> tuple[bool, str]:
     Returns:
         (can_have_text, reason_or_warning)
     """
-    spine_width = calculate_spine_width(page_count, paper_type, _config.get_kdp_gutter())[0]
+    spine_width = calculate_spine_width(page_count, paper_type, get_config_loader().get_kdp_gutter())[0]
 
-    if spine_width < MIN_SPINE_WIDTH_FOR_TEXT:
+    if spine_width < get_config_loader().get_spine_min_width():
         return False, f'Tranche trop étroite ({spine_width:.4f}")'
 
-    if spine_width < RECOMMENDED_SPINE_WIDTH:
+    if spine_width < get_config_loader().get_spine_recommended_width():
         return True, f'⚠️ Tranche borderline ({spine_width:.4f}"), lisibilité non garantie'
 
     return True, ""
@@ -26,6 +26,7 @@ class ErrorCode(Enum):
     # Validation errors
     VALIDATION_ERROR = "validation.error"
     EBOOK_NOT_FOUND = "validation.ebook_not_found"
+    PREVIEW_CANDIDATE_EXPIRED = "validation.preview_candidate_expired"
 
 
 @dataclass
@@ -59,6 +59,11 @@ class ModelRegistry:
             cls._instance = cls(config_path)
         return cls._instance
 
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Drop the singleton so the next get_instance() re-reads the config (config reload)."""
+        cls._instance = None
+
     def _load_config(self) -> None:
         """Load and validate model mappings from YAML.
 
@@ -2,7 +2,7 @@
 
 import logging
 
-from backoffice.features.ebook.shared.domain.constants import MAX_PAGES
+from backoffice.features.ebook.shared.domain import constants
 from backoffice.features.ebook.shared.domain.entities.generation_request import ColorMode, ImageSpec
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 
@@ -30,12 +30,13 @@ class QualityValidator:
             DomainError: If validation fails
         """
         # Check page count limit
-        if page_count > MAX_PAGES:
+        max_pages = constants.MAX_PAGES
+        if page_count > max_pages:
             raise DomainError(
                 code=ErrorCode.PAGE_LIMIT_EXCEEDED,
-                message=f"Page count {page_count} exceeds limit of {MAX_PAGES}",
-                actionable_hint=f"Reduce page count to {MAX_PAGES} or less",
-                context={"requested": page_count, "max": MAX_PAGES},
+                message=f"Page count {page_count} exceeds limit of {max_pages}",
+                actionable_hint=f"Reduce page count to {max_pages} or less",
+                context={"requested": page_count, "max": max_pages},
             )
 
         # Check resolution limit
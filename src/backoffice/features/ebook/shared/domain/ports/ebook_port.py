@@ -1,7 +1,10 @@
+import hashlib
 from abc import ABC, abstractmethod
+from datetime import UTC, datetime
 
-from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookPageInfo, EbookPdfInfo, EbookStatus
 from backoffice.features.ebook.shared.domain.entities.pagination import PaginatedResult, PaginationParams
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import page_meta_image_key
 
 
 class EbookPort(ABC):
@@ -99,6 +102,54 @@ class EbookPort(ABC):
         """
         pass
 
+    async def get_ebook_pdf_info(self, ebook_id: int) -> EbookPdfInfo | None:
+        """
+        Récupère les métadonnées légères du PDF d'un ebook (titre, hash du contenu).
+
+        L'implémentation par défaut charge l'ebook et le PDF complets ; les
+        repositories doivent la surcharger par une requête légère.
+
+        Args:
+            ebook_id: ID de l'ebook
+
+        Returns:
+            EbookPdfInfo | None: Métadonnées ou None si l'ebook est introuvable
+        """
+        ebook = await self.get_by_id(ebook_id)
+        if not ebook:
+            return None
+        pdf_bytes = await self.get_ebook_bytes(ebook_id)
+        content_hash = hashlib.sha256(pdf_bytes).hexdigest() if pdf_bytes else None
+        return EbookPdfInfo(ebook_id=ebook_id, title=ebook.title, content_hash=content_hash)
+
+    async def get_page_info(self, ebook_id: int, page_index: int) -> EbookPageInfo | None:
+        """
+        Récupère les métadonnées légères d'une page (clé d'image, titre, prompt).
+
+        L'implémentation par défaut charge l'ebook complet ; les repositories
+        doivent la surcharger par une requête légère qui ne lit pas les images.
+
+        Args:
+            ebook_id: ID de l'ebook
+            page_index: Index de la page dans pages_meta (0 pour la couverture)
+
+        Returns:
+            EbookPageInfo | None: Métadonnées ou None si l'ebook ou la page est introuvable
+        """
+        ebook = await self.get_by_id(ebook_id)
+        pages_meta = (ebook.structure_json or {}).get("pages_meta", []) if ebook else []
+        if not 0 <= page_index < len(pages_meta):
+            return None
+        page = pages_meta[page_index]
+        return EbookPageInfo(
+            ebook_id=ebook_id,
+            page_index=page_index,
+            image_key=page_meta_image_key(page),
+            title=page.get("title"),
+            prompt=page.get("prompt"),
+            is_back_cover=page_index == len(pages_meta) - 1,
+        )
+
     @abstractmethod
     async def save_ebook_bytes(self, ebook_id: int, ebook_bytes: bytes) -> None:
         """
@@ -109,3 +160,38 @@ class EbookPort(ABC):
             ebook_bytes: Bytes du PDF à sauvegarder
         """
         pass
+
+    async def mark_pdf_dirty(self, ebook_id: int) -> datetime:
+        """
+        Marque le PDF stocké comme obsolète (pages modifiées depuis sa génération).
+
+        L'implémentation par défaut ne persiste rien : seul le planificateur
+        en mémoire sait qu'une reconstruction est due.
+
+        Args:
+            ebook_id: ID de l'ebook
+
+        Returns:
+            datetime: Horodatage de la modification
+        """
+        return datetime.now(UTC)
+
+    async def mark_pdf_rebuilt(self, ebook_id: int, dirty_at: datetime, preview_url: str | None, drive_id: str | None) -> None:
+        """
+        Enregistre l'emplacement du PDF reconstruit et lève le marqueur d'obsolescence.
+
+        Le marqueur n'est levé que s'il n'a pas changé depuis dirty_at : une
+        modification survenue pendant la reconstruction en demande une autre.
+        Seuls preview_url et drive_id sont écrits (pas structure_json).
+
+        Args:
+            ebook_id: ID de l'ebook
+            dirty_at: Marqueur lu avant la reconstruction
+            preview_url: URL du PDF reconstruit
+            drive_id: ID de stockage du PDF reconstruit
+        """
+        ebook = await self.get_by_id(ebook_id)
+        if ebook:
+            ebook.preview_url = preview_url
+            ebook.drive_id = drive_id
+            await self.save(ebook)
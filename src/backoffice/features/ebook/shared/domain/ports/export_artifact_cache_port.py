@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+
+
+class ExportArtifactCachePort(ABC):
+    """Port for caching assembled export artifacts (KDP PDFs, cover previews)
+
+    Keys are content hashes (see KdpExportCacheKey): an entry is never stale,
+    it just stops being requested once its inputs change.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Get a cached artifact
+
+        Args:
+            key: Artifact content key
+
+        Returns:
+            Artifact bytes, or None on cache miss
+        """
+        pass
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes) -> None:
+        """Store an artifact
+
+        Args:
+            key: Artifact content key
+            data: Artifact bytes
+        """
+        pass
+
+    @abstractmethod
+    async def get_path(self, key: str) -> str | None:
+        """Get the local file path of a cached artifact (zero-copy responses)
+
+        Args:
+            key: Artifact content key
+
+        Returns:
+            File path, or None on cache miss
+        """
+        pass
@@ -0,0 +1,68 @@
+import base64
+import hashlib
+from abc import ABC, abstractmethod
+
+# Rendition widths (px): grid thumbnail, detail view, modal/zoom
+THUMBNAIL_WIDTHS: tuple[int, ...] = (256, 768, 1600)
+
+
+def page_image_key(image_data: bytes) -> str:
+    """Content key of a page image (SHA-256 of the original bytes)."""
+    return hashlib.sha256(image_data).hexdigest()
+
+
+def page_meta_image_key(page_meta: dict) -> str:
+    """Page image key of a pages_meta entry: its stored "image_key", or hashed from its image."""
+    return page_meta.get("image_key") or page_image_key(base64.b64decode(page_meta.get("image_data_base64", "")))
+
+
+def select_thumbnail_width(requested: int | None) -> int:
+    """Snap a requested width to the smallest rendition that covers it.
+
+    Args:
+        requested: Requested width in px (None for the default detail size)
+
+    Returns:
+        One of THUMBNAIL_WIDTHS
+    """
+    if requested is None:
+        return THUMBNAIL_WIDTHS[1]
+    for width in THUMBNAIL_WIDTHS:
+        if width >= requested:
+            return width
+    return THUMBNAIL_WIDTHS[-1]
+
+
+class PageThumbnailPort(ABC):
+    """Port for storing WebP renditions of page images
+
+    Renditions are keyed by page_image_key(original bytes): a page edit
+    produces a new key, so stored renditions are never stale.
+    """
+
+    @abstractmethod
+    async def render(self, image_data: bytes) -> str:
+        """Render and store all THUMBNAIL_WIDTHS renditions of a page image
+
+        Idempotent: renditions that already exist are not re-rendered.
+
+        Args:
+            image_data: Original page image bytes (PNG/JPEG)
+
+        Returns:
+            Page image key
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, page_key: str, width: int) -> bytes | None:
+        """Get a stored rendition
+
+        Args:
+            page_key: Page image key
+            width: Rendition width (one of THUMBNAIL_WIDTHS)
+
+        Returns:
+            WebP bytes, or None if not rendered yet
+        """
+        pass
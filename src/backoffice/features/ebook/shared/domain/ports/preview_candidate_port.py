@@ -0,0 +1,63 @@
+"""Port for short-lived preview candidates (regenerate/edit modal iterations)."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PreviewCandidate:
+    """A previewed page image kept server-side until applied or expired."""
+
+    candidate_id: str
+    ebook_id: int
+    page_index: int
+    image_data: bytes
+    prompt: str | None = None
+
+
+class PreviewCandidatePort(ABC):
+    """Port for storing preview candidates
+
+    Preview and edit endpoints store their result here and return the
+    candidate id; later iterations and apply calls reference the id instead
+    of sending the image back. Candidates expire after a TTL and each ebook
+    keeps a bounded number of them.
+    """
+
+    @abstractmethod
+    async def put(self, ebook_id: int, page_index: int, image_data: bytes, prompt: str | None = None) -> PreviewCandidate:
+        """Store a candidate (evicts the ebook's oldest candidates over quota)
+
+        Args:
+            ebook_id: ID of the ebook
+            page_index: Page the candidate was generated for (0 for cover)
+            image_data: Candidate image bytes
+            prompt: Generation prompt used for the candidate (None for edits)
+
+        Returns:
+            Stored candidate with its id
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, ebook_id: int, candidate_id: str) -> PreviewCandidate | None:
+        """Get a candidate
+
+        Args:
+            ebook_id: ID of the ebook owning the candidate
+            candidate_id: Candidate id
+
+        Returns:
+            Candidate, or None if unknown or expired
+        """
+        pass
+
+    @abstractmethod
+    async def discard(self, ebook_id: int, page_index: int) -> None:
+        """Drop all candidates of a page (after an apply)
+
+        Args:
+            ebook_id: ID of the ebook
+            page_index: Page index
+        """
+        pass
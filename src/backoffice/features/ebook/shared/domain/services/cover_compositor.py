@@ -5,11 +5,14 @@ from __future__ import annotations
 import io
 import logging
 import textwrap
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from PIL import Image, ImageDraw, ImageFont
 
+from backoffice.features.shared.infrastructure.tracing import traced
+
 if TYPE_CHECKING:
     from backoffice.features.ebook.shared.domain.entities.theme_profile import ThemeProfile
 
@@ -64,6 +67,10 @@ BACK_COVER_TAGLINE_FONT_SIZE = 28
 BACK_COVER_DESCRIPTION_FONT_SIZE = 20
 BACK_COVER_CREDITS_FONT_SIZE = 36
 BACK_COVER_TEXT_LINE_SPACING = 12  # extra pixels between lines
+BACK_COVER_TAGLINE_FONT = ("Poppins-Bold.ttf", BACK_COVER_TAGLINE_FONT_SIZE)
+BACK_COVER_DESCRIPTION_FONT = ("Poppins-Regular.ttf", BACK_COVER_DESCRIPTION_FONT_SIZE)
+BACK_COVER_CREDITS_FONT = ("Poppins-Regular.ttf", BACK_COVER_CREDITS_FONT_SIZE)
+BACK_COVER_FONTS = (BACK_COVER_TAGLINE_FONT, BACK_COVER_DESCRIPTION_FONT, BACK_COVER_CREDITS_FONT)
 
 # Semi-transparent backdrop for text readability
 BACK_COVER_TEXT_BACKDROP_COLOR = (255, 255, 255, 180)  # white, 70% opacity
@@ -79,6 +86,14 @@ BACK_COVER_BARCODE_MARGIN_PX = 75  # 0.25" @ 300 DPI
 _ALLOWED_OVERLAY_PREFIXES = ("config/branding/",)
 
 
+@lru_cache(maxsize=16)
+def _load_font_file(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    if Path(font_path).exists():
+        return ImageFont.truetype(font_path, size)
+    logger.warning(f"Font not found: {font_path}, using default")
+    return cast(ImageFont.FreeTypeFont, ImageFont.load_default())
+
+
 class CoverCompositor:
     """Composites title and footer PNG overlays onto a generated cover image."""
 
@@ -111,6 +126,7 @@ class CoverCompositor:
         logger.warning(f"Rejected overlay path (not in allowed directory): {image_path}")
         return False
 
+    @traced("cover_compositor.apply_cover_overlays")
     def apply_cover_overlays(
         self,
         cover_data: bytes,
@@ -137,6 +153,7 @@ class CoverCompositor:
             footer_image_path=theme_profile.cover_footer_image,
         )
 
+    @traced("cover_compositor.compose_cover")
     def compose_cover(
         self,
         base_cover: bytes,
@@ -222,6 +239,7 @@ class CoverCompositor:
     # Back cover overlays
     # ------------------------------------------------------------------
 
+    @traced("cover_compositor.apply_back_cover_overlays")
     def apply_back_cover_overlays(
         self,
         back_cover_data: bytes,
@@ -248,9 +266,9 @@ class CoverCompositor:
         logger.info(f"Compositing back cover: {cover_width}x{cover_height}, previews={config.preview_pages}")
 
         # Load fonts
-        tagline_font = self._load_font("Poppins-Bold.ttf", BACK_COVER_TAGLINE_FONT_SIZE)
-        desc_font = self._load_font("Poppins-Regular.ttf", BACK_COVER_DESCRIPTION_FONT_SIZE)
-        credits_font = self._load_font("Poppins-Regular.ttf", BACK_COVER_CREDITS_FONT_SIZE)
+        tagline_font = self._load_font(*BACK_COVER_TAGLINE_FONT)
+        desc_font = self._load_font(*BACK_COVER_DESCRIPTION_FONT)
+        credits_font = self._load_font(*BACK_COVER_CREDITS_FONT)
 
         # --- Zone 1: Preview images (top) ---
         max_preview_height = int(cover_height * BACK_COVER_PREVIEW_HEIGHT_RATIO)
@@ -510,7 +528,7 @@ class CoverCompositor:
 
     @staticmethod
     def _load_font(filename: str, size: int) -> ImageFont.FreeTypeFont:
-        """Load a font from the branding fonts directory.
+        """Load a font from the branding fonts directory (cached per file and size).
 
         Args:
             filename: Font filename (e.g. 'Poppins-Bold.ttf')
@@ -519,11 +537,18 @@ class CoverCompositor:
         Returns:
             Loaded font, or default font if not found
         """
-        font_path = Path(BACK_COVER_FONT_DIR) / filename
-        if font_path.exists():
-            return ImageFont.truetype(str(font_path), size)
-        logger.warning(f"Font not found: {font_path}, using default")
-        return cast(ImageFont.FreeTypeFont, ImageFont.load_default())
+        return _load_font_file(str(Path(BACK_COVER_FONT_DIR) / filename), size)
+
+    @staticmethod
+    def preload_fonts() -> int:
+        """Load every back cover font (warm-up).
+
+        Returns:
+            Number of fonts loaded
+        """
+        for filename, size in BACK_COVER_FONTS:
+            CoverCompositor._load_font(filename, size)
+        return len(BACK_COVER_FONTS)
 
     @staticmethod
     def _get_font_line_height(font: ImageFont.FreeTypeFont) -> int:
@@ -11,6 +11,7 @@ from backoffice.features.ebook.shared.domain.policies.quality_validator import Q
 from backoffice.features.ebook.shared.domain.ports.content_page_generation_port import (
     ContentPageGenerationPort,
 )
+from backoffice.features.shared.infrastructure.metrics import limited, record_cache
 
 logger = logging.getLogger(__name__)
 
@@ -84,8 +85,9 @@ class ContentPageGenerationService:
             logger.error("❌ Content page provider not available")
             raise RuntimeError("Content page provider is not available")
 
-        # Generate page
-        page_data = await self.page_port.generate_page(prompt, spec, seed, workflow_params)
+        # Generate page (bounded with batch generations sharing this service)
+        async with limited(self._semaphore, "page_generation"):
+            page_data = await self.page_port.generate_page(prompt, spec, seed, workflow_params)
 
         # Post-validation
         QualityValidator.validate_image(
@@ -181,16 +183,20 @@ class ContentPageGenerationService:
         cache_key = self._compute_cache_key(prompt, seed)
         if self.enable_cache and cache_key in self._cache:
             logger.info(f"✅ Cache hit for page {page_number} - NO COST TRACKED (cache return)")
+            record_cache("page_generation", hit=True)
             return self._cache[cache_key]
 
         # Acquire semaphore for concurrency control
-        async with self._semaphore:
+        async with limited(self._semaphore, "page_generation"):
             logger.info(f"⚙️ Generating page {page_number}...")
 
             # Double-check cache after acquiring semaphore
             if self.enable_cache and cache_key in self._cache:
                 logger.info(f"✅ Cache hit for page {page_number} (after semaphore) - NO COST TRACKED (cache return)")
+                record_cache("page_generation", hit=True)
                 return self._cache[cache_key]
+            if self.enable_cache:
+                record_cache("page_generation", hit=False)
 
             # Generate page
             image_data = await self.page_port.generate_page(
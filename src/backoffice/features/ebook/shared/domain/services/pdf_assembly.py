@@ -3,6 +3,7 @@
 import logging
 
 from backoffice.features.ebook.shared.domain.ports.assembly_port import AssembledPage, AssemblyPort
+from backoffice.features.shared.infrastructure.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,7 @@ class PDFAssemblyService:
         """
         self.assembly_port = assembly_port
 
+    @traced("assembly.assemble_ebook")
     async def assemble_ebook(
         self,
         cover: AssembledPage,
@@ -0,0 +1,80 @@
+"""Debounced, per-ebook scheduling of PDF rebuilds."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PdfRebuildScheduler:
+    """Rebuild an ebook PDF once page edits settle.
+
+    Edits call schedule(): each call restarts the ebook's debounce timer, so a
+    burst of edits costs a single rebuild. Rebuilds of the same ebook never
+    overlap. flush() runs a pending rebuild immediately (or waits for the
+    running one) for readers that need the PDF now.
+
+    The rebuild callable must be idempotent and skip ebooks whose PDF is
+    already current: flush() may be called for an ebook marked dirty by
+    another process, which has no timer here.
+    """
+
+    def __init__(self, rebuild: Callable[[int], Awaitable[None]], debounce_seconds: float = 5.0):
+        """Initialize scheduler.
+
+        Args:
+            rebuild: Coroutine function rebuilding the PDF of an ebook
+            debounce_seconds: Quiet period after the last edit before rebuilding
+        """
+        self._rebuild = rebuild
+        self.debounce_seconds = debounce_seconds
+        self._timers: dict[int, asyncio.Task] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()  # Strong references until done
+
+    def schedule(self, ebook_id: int) -> None:
+        """(Re)start the debounce timer of an ebook.
+
+        Args:
+            ebook_id: ID of the ebook whose pages changed
+        """
+        self._cancel_timer(ebook_id)
+        task = asyncio.create_task(self._debounced_rebuild(ebook_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self._timers[ebook_id] = task
+        logger.info(f"⏳ PDF rebuild of ebook {ebook_id} scheduled in {self.debounce_seconds:g}s")
+
+    def is_pending(self, ebook_id: int) -> bool:
+        """Whether a rebuild is waiting for its debounce timer."""
+        return ebook_id in self._timers
+
+    async def flush(self, ebook_id: int) -> None:
+        """Rebuild now instead of waiting for the debounce timer.
+
+        Args:
+            ebook_id: ID of the ebook
+        """
+        self._cancel_timer(ebook_id)
+        await self._run(ebook_id)
+
+    def _cancel_timer(self, ebook_id: int) -> None:
+        # Timers leave _timers before rebuilding, so only sleeping timers are cancelled
+        timer = self._timers.pop(ebook_id, None)
+        if timer is not None:
+            timer.cancel()
+
+    async def _debounced_rebuild(self, ebook_id: int) -> None:
+        await asyncio.sleep(self.debounce_seconds)
+        self._timers.pop(ebook_id, None)
+        await self._run(ebook_id)
+
+    async def _run(self, ebook_id: int) -> None:
+        lock = self._locks.setdefault(ebook_id, asyncio.Lock())
+        async with lock:
+            try:
+                await self._rebuild(ebook_id)
+            except Exception as e:
+                # The ebook stays dirty: the next edit or PDF read retries
+                logger.error(f"❌ PDF rebuild of ebook {ebook_id} failed: {e}", exc_info=True)
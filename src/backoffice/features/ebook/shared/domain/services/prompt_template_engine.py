@@ -3,7 +3,8 @@
 This engine loads templates from themes/*.yml files with random variables
 to create diverse prompts while maintaining consistency within the same generation (via seed).
 
-Templates are NO LONGER hardcoded - they are loaded from YAML files.
+Templates are NO LONGER hardcoded - they are loaded from YAML files,
+compiled once per file version by the theme registry.
 """
 
 import logging
@@ -11,8 +12,6 @@ import random
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
 
@@ -119,89 +118,33 @@ class PromptTemplateEngine:
             FileNotFoundError: If theme file doesn't exist
             ValueError: If template is missing from YAML
         """
-        theme_file = self.themes_directory / f"{theme_id}.yml"
-
-        if not theme_file.exists():
-            raise FileNotFoundError(f"Theme file not found: {theme_file}")
+        from backoffice.features.ebook.shared.domain.theme.theme_registry import (
+            get_theme_registry,
+        )
 
-        with open(theme_file, encoding="utf-8") as f:
-            theme_data = yaml.safe_load(f)
+        theme = get_theme_registry(self.themes_directory).get(theme_id)
+        if theme is None:
+            raise FileNotFoundError(f"Theme file not found: {self.themes_directory / f'{theme_id}.yml'}")
 
-        # Determine section name based on template type
+        # Determine section based on template type
         section_name = "coloring_page_templates" if template_type == "coloring_page" else "cover_templates"
+        templates: dict[str, PromptTemplate]
+        if template_type == "coloring_page":
+            templates = theme.page_templates
+        else:
+            templates = {key: cover.template for key, cover in theme.cover_templates.items()}
 
-        # Check if section exists
-        if section_name not in theme_data:
-            raise ValueError(f"Theme '{theme_id}' missing '{section_name}' section in {theme_file}")
-
-        templates = theme_data[section_name]
+        if not templates:
+            raise ValueError(f"Theme '{theme_id}' missing '{section_name}' section")
 
         # Try to load template by key first, then fallback to default
         if template_key and template_key in templates:
             logger.info(f"Using {template_type} template '{template_key}' in theme '{theme_id}'")
-            template_data = templates[template_key]
-        elif "default" in templates:
+            return templates[template_key]
+        if "default" in templates:
             logger.info(f"Template '{template_key}' not found, using default {template_type} template for theme '{theme_id}'")
-            template_data = templates["default"]
-        else:
-            raise ValueError(f"Theme '{theme_id}' has no template for '{template_key}' and no default template in {section_name}")
-
-        # Handle old format (prompt_blocks for cover) vs new format
-        if template_type == "cover" and "prompt_blocks" in template_data:
-            # Old format: assemble from blocks
-            blocks = template_data["prompt_blocks"]
-            prompt = f"{blocks['subject']}, {blocks['environment']}, {blocks['tone']}. {', '.join(blocks['positives'])}"
-            return PromptTemplate(
-                base_structure=prompt,
-                variables={},
-                quality_settings="",
-                workflow_params={"negative": ", ".join(blocks["negatives"])},
-            )
-        elif "prompt" in template_data:
-            # Direct prompt (for diffusers/SDXL with short CLIP-friendly prompts)
-            # Works for both cover and coloring_page templates
-            # Still include quality_settings if defined (for hybrid templates)
-            quality_settings = template_data.get("quality_settings", "")
-            logger.info(f"Using direct prompt for {template_type} (no variable expansion, quality_settings={'yes' if quality_settings else 'no'})")
-            return PromptTemplate(
-                base_structure=template_data["prompt"],
-                variables={},  # No variables = prompt used as-is
-                quality_settings=quality_settings,
-                workflow_params=template_data.get("workflow_params", None),
-            )
-        else:
-            # Coloring page format with variables (base_structure + variables + quality_settings)
-            # Parse species_profiles if present (for semantic constraints)
-            species_profiles = None
-            if "species_profiles" in template_data:
-                species_profiles = {}
-                for species_name, profile_data in template_data["species_profiles"].items():
-                    species_profiles[species_name] = SpeciesProfile(
-                        actions=profile_data.get("actions", []),
-                        environments=profile_data.get("environments", []),
-                        secondary_elements=profile_data.get("secondary_elements"),
-                    )
-                logger.info(f"Loaded species_profiles with {len(species_profiles)} species")
-
-            # Parse quality_settings_by_audience if present (for audience-specific prompts)
-            quality_settings_by_audience = None
-            if "quality_settings_by_audience" in template_data:
-                quality_settings_by_audience = {}
-                for audience_key, profile_data in template_data["quality_settings_by_audience"].items():
-                    quality_settings_by_audience[audience_key] = AudienceQualityProfile(
-                        prefix=profile_data.get("prefix", ""),
-                        suffix=profile_data.get("suffix", ""),
-                    )
-                logger.info(f"Loaded quality_settings_by_audience with {len(quality_settings_by_audience)} profiles")
-
-            return PromptTemplate(
-                base_structure=template_data["base_structure"],
-                variables=template_data["variables"],
-                quality_settings=template_data.get("quality_settings", ""),
-                workflow_params=template_data.get("workflow_params", None),
-                species_profiles=species_profiles,
-                quality_settings_by_audience=quality_settings_by_audience,
-            )
+            return templates["default"]
+        raise ValueError(f"Theme '{theme_id}' has no template for '{template_key}' and no default template in {section_name}")
 
     def generate_prompts(
         self,
@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from typing import Literal
 
-import yaml
+from backoffice.features.ebook.shared.domain.theme.theme_registry import get_theme_registry
 
 logger = logging.getLogger(__name__)
 
@@ -28,28 +28,12 @@ def load_workflow_params(theme_id: str, image_type: str, themes_directory: Path)
 
     logger.info(f"Loading workflow_params for {image_type} using template: {template_key}")
 
-    # Load theme YAML
-    theme_file = themes_directory / f"{theme_id}.yml"
-    if not theme_file.exists():
-        logger.warning(f"Theme file not found: {theme_file}, returning empty workflow_params")
+    theme = get_theme_registry(themes_directory).get(theme_id)
+    if theme is None:
+        logger.warning(f"Theme file not found: {themes_directory / f'{theme_id}.yml'}, returning empty workflow_params")
         return {}
 
-    with theme_file.open("r", encoding="utf-8") as f:
-        theme_data = yaml.safe_load(f)
-
-    # Get the appropriate template section
-    if image_type == "cover":
-        templates = theme_data.get("cover_templates", {})
-    else:
-        templates = theme_data.get("coloring_page_templates", {})
-
-    template = templates.get(template_key, {})
-    workflow_params_raw = template.get("workflow_params", {})
-
-    # Ensure all values are strings
-    workflow_params: dict[str, str] = {}
-    for key, value in workflow_params_raw.items():
-        workflow_params[str(key)] = str(value)
+    workflow_params = theme.workflow_params(image_type, template_key)
 
     logger.debug(f"Loaded workflow_params: {workflow_params}")
     return workflow_params
@@ -70,21 +54,20 @@ def build_cover_prompt_from_yaml(theme_id: str, themes_directory: Path) -> str:
     config = get_config_loader()
     template_key = config.get_template_key_for_type("cover")
 
-    # Load theme YAML
-    theme_file = themes_directory / f"{theme_id}.yml"
-    with theme_file.open("r", encoding="utf-8") as f:
-        theme_data = yaml.safe_load(f)
+    theme = get_theme_registry(themes_directory).get(theme_id)
+    if theme is None:
+        raise FileNotFoundError(f"Theme file not found: {themes_directory / f'{theme_id}.yml'}")
 
-    cover_template = theme_data.get("cover_templates", {}).get(template_key, {})
+    cover_template = theme.cover_template(template_key)
 
     # Check if we have a direct prompt (comfy style) or prompt_blocks (default style)
     base_prompt: str
-    if "prompt" in cover_template:
+    if cover_template is not None and cover_template.prompt is not None:
         # ComfyUI style: direct prompt
-        base_prompt = str(cover_template["prompt"])
-    elif "prompt_blocks" in cover_template:
+        base_prompt = cover_template.prompt
+    elif cover_template is not None and cover_template.prompt_blocks:
         # Default style: build from blocks
-        blocks = cover_template["prompt_blocks"]
+        blocks = cover_template.prompt_blocks
         parts = []
         for key in ["main_subject", "setting", "style", "quality_tags"]:
             if key in blocks:
@@ -1,10 +1,8 @@
 import logging
 from pathlib import Path
 
-from backoffice.features.ebook.shared.domain.entities.theme_profile import (
-    ThemeProfile,
-    load_theme_from_yaml,
-)
+from backoffice.features.ebook.shared.domain.entities.theme_profile import ThemeProfile
+from backoffice.features.ebook.shared.domain.theme.theme_registry import get_theme_registry
 
 logger = logging.getLogger(__name__)
 
@@ -14,40 +12,33 @@ class ThemeLoader:
 
     def __init__(self, themes_directory: Path):
         self.themes_directory = themes_directory
-        self._theme_cache: dict[str, ThemeProfile] = {}
+        self._registry = get_theme_registry(themes_directory)
         self._neutral_theme: ThemeProfile | None = None
 
     def load_theme(self, theme_id: str) -> ThemeProfile:
-        """Load a theme by ID with caching and fallback"""
-        # Check cache first
-        if theme_id in self._theme_cache:
-            logger.debug(f"Theme '{theme_id}' loaded from cache")
-            return self._theme_cache[theme_id]
-
-        # Try to load from file
-        theme_file = self.themes_directory / f"{theme_id}.yml"
-
+        """Load a theme by ID from the compiled theme registry, with fallback"""
         try:
-            if not theme_file.exists():
-                logger.warning(f"Theme file not found: {theme_file}")
-                return self._get_fallback_theme()
-
-            theme = load_theme_from_yaml(theme_file)
+            compiled = self._registry.get(theme_id)
+        except ValueError as e:
+            logger.error(f"Failed to load theme '{theme_id}': {e}")
+            return self._get_fallback_theme()
 
-            # Validate theme ID matches filename
-            if theme.id != theme_id:
-                logger.warning(f"Theme ID mismatch: file '{theme_id}.yml' contains theme '{theme.id}'")
-                return self._get_fallback_theme()
+        if compiled is None:
+            logger.warning(f"Theme file not found: {self.themes_directory / f'{theme_id}.yml'}")
+            return self._get_fallback_theme()
 
-            # Cache successful load
-            self._theme_cache[theme_id] = theme
-            logger.info(f"Theme '{theme_id}' loaded successfully")
-            return theme
+        theme = compiled.profile
+        if theme is None:
+            logger.error(f"Failed to load theme '{theme_id}': {compiled.profile_error}")
+            return self._get_fallback_theme()
 
-        except Exception as e:
-            logger.error(f"Failed to load theme '{theme_id}': {e}")
+        # Validate theme ID matches filename
+        if theme.id != theme_id:
+            logger.warning(f"Theme ID mismatch: file '{theme_id}.yml' contains theme '{theme.id}'")
             return self._get_fallback_theme()
 
+        return theme
+
     def get_available_themes(self) -> list[ThemeProfile]:
         """Get list of all available themes"""
         themes = []
@@ -79,7 +70,7 @@ class ThemeLoader:
 
     def clear_cache(self) -> None:
         """Clear the theme cache"""
-        self._theme_cache.clear()
+        self._registry.clear()
         self._neutral_theme = None
         logger.info("Theme cache cleared")
 
@@ -92,11 +83,12 @@ class ThemeLoader:
         neutral_file = self.themes_directory / "neutral-default.yml"
 
         try:
-            if neutral_file.exists():
-                self._neutral_theme = load_theme_from_yaml(neutral_file)
+            compiled = self._registry.get(neutral_file.stem)
+            if compiled is not None and compiled.profile is not None:
+                self._neutral_theme = compiled.profile
                 logger.info("Loaded neutral-default theme as fallback")
                 return self._neutral_theme
-        except Exception as e:
+        except ValueError as e:
             logger.error(f"Failed to load neutral-default theme: {e}")
 
         # Create hardcoded fallback if file doesn't exist or fails
@@ -0,0 +1,324 @@
+"""Process-wide registry of compiled theme configurations.
+
+Every theme YAML (config/branding/themes/<id>.yml) is parsed and validated
+ONCE per file version, then shared by all consumers: prompt engine, workflow
+helpers, generation strategy, regeneration use cases and forms.
+
+A file version is its mtime plus the SHA-256 of its content: an unchanged
+mtime is trusted, a touched file is re-hashed and only re-parsed if its
+content actually changed.
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from backoffice.features.ebook.shared.domain.entities.theme_profile import (
+    ThemeProfile,
+    ThemeProfileModel,
+)
+from backoffice.features.ebook.shared.domain.services.prompt_template_engine import (
+    AudienceQualityProfile,
+    PromptTemplate,
+    SpeciesProfile,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ThemeVersion:
+    """Version of a theme file (mtime + content hash)."""
+
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class CoverTemplate:
+    """Compiled cover template of a theme.
+
+    Attributes:
+        prompt: Direct prompt (comfy/diffusers style), if any
+        prompt_blocks: Raw prompt blocks (default style), if any
+        workflow_params: Workflow parameters as strings (node_id -> value)
+        template: Template ready for the prompt engine
+    """
+
+    prompt: str | None
+    prompt_blocks: dict[str, Any] | None
+    workflow_params: dict[str, str]
+    template: PromptTemplate
+
+
+@dataclass(frozen=True)
+class CompiledTheme:
+    """Theme YAML parsed and validated once, with typed templates.
+
+    Attributes:
+        id: Theme identifier (file stem)
+        label: Human-readable name
+        description: Short description for forms
+        version: File version the theme was compiled from
+        cover_templates: Cover templates by template key
+        page_templates: Coloring page templates by template key
+        profile: Validated theme profile (None if the file is not a valid profile)
+        profile_error: Validation error of the profile, if any
+    """
+
+    id: str
+    label: str
+    description: str
+    version: ThemeVersion
+    cover_templates: dict[str, CoverTemplate] = field(default_factory=dict)
+    page_templates: dict[str, PromptTemplate] = field(default_factory=dict)
+    profile: ThemeProfile | None = None
+    profile_error: str | None = None
+
+    def cover_template(self, template_key: str) -> CoverTemplate | None:
+        """Cover template for a template key (no fallback)."""
+        return self.cover_templates.get(template_key)
+
+    def page_template(self, template_key: str | None) -> PromptTemplate | None:
+        """Coloring page template for a template key, falling back to default."""
+        if template_key and template_key in self.page_templates:
+            return self.page_templates[template_key]
+        return self.page_templates.get("default")
+
+    def workflow_params(self, image_type: str, template_key: str) -> dict[str, str]:
+        """Workflow parameters of the template used for an image type.
+
+        Args:
+            image_type: Type of image ("cover" or "coloring_page")
+            template_key: Template key ("comfy", "diffusers" or "default")
+
+        Returns:
+            Workflow parameters (empty if the template does not exist)
+        """
+        if image_type == "cover":
+            cover = self.cover_templates.get(template_key)
+            return dict(cover.workflow_params) if cover else {}
+
+        page = self.page_templates.get(template_key)
+        if page is None or not page.workflow_params:
+            return {}
+        return {str(key): str(value) for key, value in page.workflow_params.items()}
+
+
+@dataclass
+class _Entry:
+    theme: CompiledTheme
+    mtime_ns: int
+
+
+class ThemeRegistry:
+    """Cache of compiled themes of a themes directory, keyed by file version."""
+
+    def __init__(self, themes_directory: Path):
+        self.themes_directory = themes_directory
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.parse_count = 0  # Number of YAML parses (for diagnostics and tests)
+
+    def get(self, theme_id: str) -> CompiledTheme | None:
+        """Get a compiled theme, re-parsing it only if its file changed.
+
+        Args:
+            theme_id: Theme identifier (file stem)
+
+        Returns:
+            Compiled theme, or None if the theme file does not exist
+
+        Raises:
+            ValueError: If the file is not valid theme YAML
+        """
+        theme_file = self.themes_directory / f"{theme_id}.yml"
+        try:
+            mtime_ns = theme_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._entries.pop(theme_id, None)
+            return None
+
+        entry = self._entries.get(theme_id)
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            return entry.theme
+
+        with self._lock:
+            entry = self._entries.get(theme_id)
+            if entry is not None and entry.mtime_ns == mtime_ns:
+                return entry.theme
+
+            content = theme_file.read_bytes()
+            sha256 = hashlib.sha256(content).hexdigest()
+            if entry is not None and entry.theme.version.sha256 == sha256:
+                # Touched but unchanged: keep the compiled theme
+                self._entries[theme_id] = _Entry(theme=entry.theme, mtime_ns=mtime_ns)
+                return entry.theme
+
+            theme = self._compile(theme_id, content, ThemeVersion(mtime_ns=mtime_ns, sha256=sha256))
+            self._entries[theme_id] = _Entry(theme=theme, mtime_ns=mtime_ns)
+            return theme
+
+    def list_themes(self) -> list[CompiledTheme]:
+        """Get all themes of the directory sorted by id, skipping invalid files."""
+        themes = []
+        for theme_file in sorted(self.themes_directory.glob("*.yml")):
+            try:
+                theme = self.get(theme_file.stem)
+            except ValueError as e:
+                logger.error(f"Skipping invalid theme {theme_file.name}: {e}")
+                continue
+            if theme is not None:
+                themes.append(theme)
+        return themes
+
+    def clear(self) -> None:
+        """Drop every compiled theme (next access re-parses)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _compile(self, theme_id: str, content: bytes, version: ThemeVersion) -> CompiledTheme:
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in theme '{theme_id}': {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError(f"Theme '{theme_id}' is empty or not a mapping")
+
+        self.parse_count += 1
+
+        profile: ThemeProfile | None = None
+        profile_error: str | None = None
+        try:
+            profile = ThemeProfile.from_model(ThemeProfileModel(**data))
+        except Exception as e:
+            profile_error = str(e)
+            logger.warning(f"Theme '{theme_id}' is not a valid theme profile: {e}")
+
+        try:
+            theme = CompiledTheme(
+                id=theme_id,
+                label=data.get("label", theme_id.capitalize()),
+                description=data.get("description", ""),
+                version=version,
+                cover_templates={str(key): _compile_cover_template(value) for key, value in (data.get("cover_templates") or {}).items()},
+                page_templates={str(key): _compile_page_template(value) for key, value in (data.get("coloring_page_templates") or {}).items()},
+                profile=profile,
+                profile_error=profile_error,
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid template in theme '{theme_id}': {e!r}") from e
+        logger.info(f"🎨 Theme '{theme_id}' compiled ({len(theme.cover_templates)} cover / {len(theme.page_templates)} page templates, sha256 {version.sha256[:12]})")
+        return theme
+
+
+def _compile_cover_template(template_data: dict[str, Any]) -> CoverTemplate:
+    workflow_params = {str(key): str(value) for key, value in (template_data.get("workflow_params") or {}).items()}
+    blocks = template_data.get("prompt_blocks")
+
+    if blocks:
+        # Old format: assemble from blocks
+        prompt = f"{blocks['subject']}, {blocks['environment']}, {blocks['tone']}. {', '.join(blocks['positives'])}"
+        template = PromptTemplate(
+            base_structure=prompt,
+            variables={},
+            quality_settings="",
+            workflow_params={"negative": ", ".join(blocks["negatives"])},
+        )
+    else:
+        template = PromptTemplate(
+            base_structure=template_data.get("prompt", ""),
+            variables={},
+            quality_settings=template_data.get("quality_settings", ""),
+            workflow_params=template_data.get("workflow_params", None),
+        )
+
+    return CoverTemplate(
+        prompt=str(template_data["prompt"]) if "prompt" in template_data else None,
+        prompt_blocks=blocks,
+        workflow_params=workflow_params,
+        template=template,
+    )
+
+
+def _compile_page_template(template_data: dict[str, Any]) -> PromptTemplate:
+    if "prompt" in template_data:
+        # Direct prompt (for diffusers/SDXL with short CLIP-friendly prompts)
+        return PromptTemplate(
+            base_structure=template_data["prompt"],
+            variables={},  # No variables = prompt used as-is
+            quality_settings=template_data.get("quality_settings", ""),
+            workflow_params=template_data.get("workflow_params", None),
+        )
+
+    # Coloring page format with variables (base_structure + variables + quality_settings)
+    species_profiles = None
+    if "species_profiles" in template_data:
+        species_profiles = {
+            species_name: SpeciesProfile(
+                actions=profile_data.get("actions", []),
+                environments=profile_data.get("environments", []),
+                secondary_elements=profile_data.get("secondary_elements"),
+            )
+            for species_name, profile_data in template_data["species_profiles"].items()
+        }
+
+    quality_settings_by_audience = None
+    if "quality_settings_by_audience" in template_data:
+        quality_settings_by_audience = {
+            audience_key: AudienceQualityProfile(
+                prefix=profile_data.get("prefix", ""),
+                suffix=profile_data.get("suffix", ""),
+            )
+            for audience_key, profile_data in template_data["quality_settings_by_audience"].items()
+        }
+
+    return PromptTemplate(
+        base_structure=template_data["base_structure"],
+        variables=template_data["variables"],
+        quality_settings=template_data.get("quality_settings", ""),
+        workflow_params=template_data.get("workflow_params", None),
+        species_profiles=species_profiles,
+        quality_settings_by_audience=quality_settings_by_audience,
+    )
+
+
+_registries: dict[Path, ThemeRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def find_themes_directory() -> Path:
+    """Find config/branding/themes by walking up from this file.
+
+    Raises:
+        FileNotFoundError: If no themes directory is found
+    """
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        themes_path = current / "config" / "branding" / "themes"
+        if themes_path.exists():
+            return themes_path
+        current = current.parent
+    raise FileNotFoundError("Could not find config/branding/themes in project tree")
+
+
+def get_theme_registry(themes_directory: Path | None = None) -> ThemeRegistry:
+    """Get the process-wide registry of a themes directory.
+
+    Args:
+        themes_directory: Themes directory (project config/branding/themes if None)
+
+    Returns:
+        Shared ThemeRegistry for that directory
+    """
+    directory = (themes_directory or find_themes_directory()).resolve()
+    registry = _registries.get(directory)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(directory, ThemeRegistry(directory))
+    return registry
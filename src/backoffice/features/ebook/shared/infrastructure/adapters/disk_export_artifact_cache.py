@@ -0,0 +1,137 @@
+"""Disk-backed cache for assembled export artifacts (KDP PDFs, cover previews)."""
+
+import asyncio
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from backoffice.features.ebook.shared.domain.ports.export_artifact_cache_port import ExportArtifactCachePort
+from backoffice.features.shared.infrastructure.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{16,128}$")
+_ENTRY_SUFFIX = ".bin"
+
+DEFAULT_CACHE_PATH = "./storage/cache/exports"
+DEFAULT_MAX_MB = 2048
+
+
+class DiskExportArtifactCache(ExportArtifactCachePort):
+    """Export artifact cache stored as one file per key.
+
+    Entries survive restarts. Reads refresh the entry mtime, and writes evict
+    least recently used entries until the cache fits in max_bytes.
+
+    Storage structure:
+        storage/cache/exports/
+        ├── {key}.bin
+        └── ...
+    """
+
+    def __init__(self, cache_path: str | None = None, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            cache_path: Cache directory. Defaults to './storage/cache/exports'
+            max_bytes: Total size above which LRU entries are evicted
+        """
+        self.cache_path = Path(cache_path or DEFAULT_CACHE_PATH)
+        self.max_bytes = max_bytes
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        if not _KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return self.cache_path / f"{key}{_ENTRY_SUFFIX}"
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._put, key, data)
+
+    async def get_path(self, key: str) -> str | None:
+        path = self._entry_path(key)
+        try:
+            os.utime(path)  # Refresh recency for LRU eviction
+        except FileNotFoundError:
+            return None
+        return str(path)
+
+    def _get(self, key: str) -> bytes | None:
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            logger.debug(f"Export cache miss: {key[:12]}")
+            record_cache("export_artifact", hit=False)
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        logger.info(f"✅ Export cache hit: {key[:12]} ({len(data)} bytes)")
+        record_cache("export_artifact", hit=True)
+        return data
+
+    def _put(self, key: str, data: bytes) -> None:
+        path = self._entry_path(key)
+        if len(data) > self.max_bytes:
+            logger.warning(f"⚠️ Export artifact {key[:12]} ({len(data)} bytes) exceeds cache size, not cached")
+            return
+
+        # Atomic write: concurrent readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"📊 Export cache stored: {key[:12]} ({len(data)} bytes)")
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry in self.cache_path.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Evicted concurrently
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            entry.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Export cache evicted: {entry.stem[:12]} ({size} bytes)")
+
+
+_export_artifact_cache: DiskExportArtifactCache | None = None
+
+
+def get_export_artifact_cache() -> DiskExportArtifactCache:
+    """Get the process-wide export artifact cache.
+
+    Configured with EXPORT_CACHE_PATH (default './storage/cache/exports')
+    and EXPORT_CACHE_MAX_MB (default 2048).
+    """
+    global _export_artifact_cache
+    if _export_artifact_cache is None:
+        cache_path = os.getenv("EXPORT_CACHE_PATH", DEFAULT_CACHE_PATH)
+        max_mb = int(os.getenv("EXPORT_CACHE_MAX_MB", str(DEFAULT_MAX_MB)))
+        _export_artifact_cache = DiskExportArtifactCache(cache_path=cache_path, max_bytes=max_mb * 1024 * 1024)
+        logger.info(f"✅ Export artifact cache at: {cache_path} (max {max_mb} MB)")
+    return _export_artifact_cache
@@ -0,0 +1,178 @@
+"""Disk-backed store for WebP page thumbnails (256/768/1600px renditions)."""
+
+import asyncio
+import logging
+import os
+import re
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import (
+    THUMBNAIL_WIDTHS,
+    PageThumbnailPort,
+    page_image_key,
+)
+
+logger = logging.getLogger(__name__)
+
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+DEFAULT_STORE_PATH = "./storage/thumbnails"
+DEFAULT_MAX_MB = 1024
+WEBP_QUALITY = 80
+
+
+def render_webp_thumbnails(image_data: bytes, widths: tuple[int, ...] = THUMBNAIL_WIDTHS) -> dict[int, bytes]:
+    """Downscale a page image to WebP renditions.
+
+    Images are never upscaled: widths larger than the original are encoded
+    at the original size.
+
+    Args:
+        image_data: Original image bytes
+        widths: Target widths in px
+
+    Returns:
+        WebP bytes by width
+    """
+    from PIL import Image  # Deferred: only needed when renditions are built
+
+    with Image.open(BytesIO(image_data)) as source:
+        source.load()
+        mode = "RGBA" if source.mode in ("RGBA", "LA", "PA") or "transparency" in source.info else "RGB"
+        image = source.convert(mode)
+
+    renditions = {}
+    for width in widths:
+        rendition = image
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            rendition = image.resize((width, height), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        rendition.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+        renditions[width] = buffer.getvalue()
+    return renditions
+
+
+class DiskPageThumbnailStore(PageThumbnailPort):
+    """Page thumbnails stored as one WebP file per rendition.
+
+    Reads refresh the rendition mtime, and renders evict least recently used
+    renditions until the store fits in max_bytes (evicted renditions are
+    rendered again on their next read).
+
+    Storage structure:
+        storage/thumbnails/
+        ├── ab/
+        │   ├── {key}_256.webp
+        │   ├── {key}_768.webp
+        │   └── {key}_1600.webp
+        └── ...
+    """
+
+    def __init__(self, store_path: str | None = None, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        """Initialize the store.
+
+        Args:
+            store_path: Store directory. Defaults to './storage/thumbnails'
+            max_bytes: Total size above which LRU renditions are evicted
+        """
+        self.store_path = Path(store_path or DEFAULT_STORE_PATH)
+        self.max_bytes = max_bytes
+        self.store_path.mkdir(parents=True, exist_ok=True)
+
+    def _rendition_path(self, page_key: str, width: int) -> Path:
+        if not _KEY_PATTERN.match(page_key):
+            raise ValueError(f"Invalid page key: {page_key!r}")
+        if width not in THUMBNAIL_WIDTHS:
+            raise ValueError(f"Unsupported thumbnail width: {width}")
+        return self.store_path / page_key[:2] / f"{page_key}_{width}.webp"
+
+    async def render(self, image_data: bytes) -> str:
+        page_key = page_image_key(image_data)
+        await asyncio.to_thread(self._render, page_key, image_data)
+        return page_key
+
+    async def get(self, page_key: str, width: int) -> bytes | None:
+        return await asyncio.to_thread(self._get, page_key, width)
+
+    def _get(self, page_key: str, width: int) -> bytes | None:
+        path = self._rendition_path(page_key, width)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _render(self, page_key: str, image_data: bytes) -> None:
+        missing = tuple(width for width in THUMBNAIL_WIDTHS if not self._rendition_path(page_key, width).exists())
+        if not missing:
+            return
+
+        renditions = render_webp_thumbnails(image_data, missing)
+        written = []
+        for width, data in renditions.items():
+            path = self._rendition_path(page_key, width)
+            self._write_atomic(path, data)
+            written.append(path)
+
+        sizes = ", ".join(f"{width}px={len(data) // 1024}KB" for width, data in renditions.items())
+        logger.info(f"🖼️ Page thumbnails stored: {page_key[:12]} ({sizes})")
+        self._evict(keep=set(written))
+
+    def _evict(self, keep: set[Path]) -> None:
+        """Remove least recently used renditions until the store fits in max_bytes."""
+        entries = []
+        for entry in self.store_path.glob("*/*.webp"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Evicted concurrently
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if entry in keep:
+                continue
+            entry.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Page thumbnail evicted: {entry.stem[:12]} ({size} bytes)")
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+_page_thumbnail_store: DiskPageThumbnailStore | None = None
+
+
+def get_page_thumbnail_store() -> DiskPageThumbnailStore:
+    """Get the process-wide page thumbnail store.
+
+    Configured with THUMBNAIL_STORE_PATH (default './storage/thumbnails')
+    and THUMBNAIL_STORE_MAX_MB (default 1024).
+    """
+    global _page_thumbnail_store
+    if _page_thumbnail_store is None:
+        store_path = os.getenv("THUMBNAIL_STORE_PATH", DEFAULT_STORE_PATH)
+        max_mb = int(os.getenv("THUMBNAIL_STORE_MAX_MB", str(DEFAULT_MAX_MB)))
+        _page_thumbnail_store = DiskPageThumbnailStore(store_path=store_path, max_bytes=max_mb * 1024 * 1024)
+        logger.info(f"✅ Page thumbnail store at: {store_path} (max {max_mb} MB)")
+    return _page_thumbnail_store
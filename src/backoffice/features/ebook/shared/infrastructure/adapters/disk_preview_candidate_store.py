@@ -0,0 +1,182 @@
+"""Disk-backed store for preview candidates with TTL and per-ebook quotas."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import secrets
+import tempfile
+import time
+from pathlib import Path
+
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import (
+    PreviewCandidate,
+    PreviewCandidatePort,
+)
+
+logger = logging.getLogger(__name__)
+
+_CANDIDATE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+_IMAGE_SUFFIX = ".img"
+_META_SUFFIX = ".json"
+
+DEFAULT_STORE_PATH = "./storage/candidates"
+DEFAULT_TTL_MINUTES = 60
+DEFAULT_MAX_PER_EBOOK = 20
+
+
+class DiskPreviewCandidateStore(PreviewCandidatePort):
+    """Preview candidates stored as files, grouped by ebook.
+
+    Files are shared by all workers, so a candidate produced by one process
+    can be applied through another. Expiry is based on the image mtime and
+    expired entries are purged on every write for the same ebook.
+
+    Storage structure:
+        storage/candidates/
+        ├── {ebook_id}/
+        │   ├── {candidate_id}.img
+        │   └── {candidate_id}.json   (page_index, prompt)
+        └── ...
+    """
+
+    def __init__(
+        self,
+        store_path: str | None = None,
+        ttl_seconds: int = DEFAULT_TTL_MINUTES * 60,
+        max_per_ebook: int = DEFAULT_MAX_PER_EBOOK,
+    ):
+        """Initialize the store.
+
+        Args:
+            store_path: Store directory. Defaults to './storage/candidates'
+            ttl_seconds: Candidate lifetime
+            max_per_ebook: Candidates kept per ebook (oldest evicted first)
+        """
+        self.store_path = Path(store_path or DEFAULT_STORE_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_per_ebook = max_per_ebook
+        self.store_path.mkdir(parents=True, exist_ok=True)
+
+    def _ebook_dir(self, ebook_id: int) -> Path:
+        return self.store_path / str(int(ebook_id))
+
+    async def put(self, ebook_id: int, page_index: int, image_data: bytes, prompt: str | None = None) -> PreviewCandidate:
+        candidate = PreviewCandidate(
+            candidate_id=secrets.token_hex(16),
+            ebook_id=ebook_id,
+            page_index=page_index,
+            image_data=image_data,
+            prompt=prompt,
+        )
+        await asyncio.to_thread(self._put, candidate)
+        return candidate
+
+    async def get(self, ebook_id: int, candidate_id: str) -> PreviewCandidate | None:
+        if not _CANDIDATE_ID_PATTERN.match(candidate_id):
+            return None
+        return await asyncio.to_thread(self._get, ebook_id, candidate_id)
+
+    async def discard(self, ebook_id: int, page_index: int) -> None:
+        await asyncio.to_thread(self._discard, ebook_id, page_index)
+
+    def _put(self, candidate: PreviewCandidate) -> None:
+        ebook_dir = self._ebook_dir(candidate.ebook_id)
+        ebook_dir.mkdir(parents=True, exist_ok=True)
+
+        # Metadata first: an image file always has its metadata
+        meta = {"page_index": candidate.page_index, "prompt": candidate.prompt}
+        self._write_atomic(ebook_dir / f"{candidate.candidate_id}{_META_SUFFIX}", json.dumps(meta).encode())
+        self._write_atomic(ebook_dir / f"{candidate.candidate_id}{_IMAGE_SUFFIX}", candidate.image_data)
+
+        logger.info(f"💾 Preview candidate stored: ebook {candidate.ebook_id}, page {candidate.page_index}, {candidate.candidate_id[:8]} ({len(candidate.image_data)} bytes)")
+        self._enforce_limits(ebook_dir, keep=candidate.candidate_id)
+
+    def _get(self, ebook_id: int, candidate_id: str) -> PreviewCandidate | None:
+        ebook_dir = self._ebook_dir(ebook_id)
+        image_path = ebook_dir / f"{candidate_id}{_IMAGE_SUFFIX}"
+        try:
+            if time.time() - image_path.stat().st_mtime > self.ttl_seconds:
+                self._remove(ebook_dir, candidate_id)
+                return None
+            image_data = image_path.read_bytes()
+            meta = json.loads((ebook_dir / f"{candidate_id}{_META_SUFFIX}").read_bytes())
+        except FileNotFoundError:
+            return None
+
+        return PreviewCandidate(
+            candidate_id=candidate_id,
+            ebook_id=ebook_id,
+            page_index=meta["page_index"],
+            image_data=image_data,
+            prompt=meta.get("prompt"),
+        )
+
+    def _discard(self, ebook_id: int, page_index: int) -> None:
+        ebook_dir = self._ebook_dir(ebook_id)
+        for meta_path in ebook_dir.glob(f"*{_META_SUFFIX}"):
+            try:
+                meta = json.loads(meta_path.read_bytes())
+            except (FileNotFoundError, ValueError):
+                continue
+            if meta.get("page_index") == page_index:
+                self._remove(ebook_dir, meta_path.stem)
+
+    def _enforce_limits(self, ebook_dir: Path, keep: str) -> None:
+        """Purge expired candidates, then the oldest ones over the ebook quota."""
+        entries = []
+        for image_path in ebook_dir.glob(f"*{_IMAGE_SUFFIX}"):
+            try:
+                entries.append((image_path.stat().st_mtime, image_path.stem))
+            except FileNotFoundError:
+                continue  # Removed concurrently
+
+        now = time.time()
+        live = []
+        for mtime, candidate_id in sorted(entries, reverse=True):
+            if candidate_id != keep and now - mtime > self.ttl_seconds:
+                self._remove(ebook_dir, candidate_id)
+            else:
+                live.append(candidate_id)
+
+        for candidate_id in live[self.max_per_ebook :]:
+            if candidate_id != keep:
+                self._remove(ebook_dir, candidate_id)
+                logger.info(f"Preview candidate evicted (quota): {ebook_dir.name}/{candidate_id[:8]}")
+
+    @staticmethod
+    def _remove(ebook_dir: Path, candidate_id: str) -> None:
+        (ebook_dir / f"{candidate_id}{_IMAGE_SUFFIX}").unlink(missing_ok=True)
+        (ebook_dir / f"{candidate_id}{_META_SUFFIX}").unlink(missing_ok=True)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+_preview_candidate_store: DiskPreviewCandidateStore | None = None
+
+
+def get_preview_candidate_store() -> DiskPreviewCandidateStore:
+    """Get the process-wide preview candidate store.
+
+    Configured with PREVIEW_CANDIDATE_PATH (default './storage/candidates'),
+    PREVIEW_CANDIDATE_TTL_MINUTES (default 60) and
+    PREVIEW_CANDIDATE_MAX_PER_EBOOK (default 20).
+    """
+    global _preview_candidate_store
+    if _preview_candidate_store is None:
+        store_path = os.getenv("PREVIEW_CANDIDATE_PATH", DEFAULT_STORE_PATH)
+        ttl_minutes = int(os.getenv("PREVIEW_CANDIDATE_TTL_MINUTES", str(DEFAULT_TTL_MINUTES)))
+        max_per_ebook = int(os.getenv("PREVIEW_CANDIDATE_MAX_PER_EBOOK", str(DEFAULT_MAX_PER_EBOOK)))
+        _preview_candidate_store = DiskPreviewCandidateStore(store_path=store_path, ttl_seconds=ttl_minutes * 60, max_per_ebook=max_per_ebook)
+        logger.info(f"✅ Preview candidate store at: {store_path} (TTL {ttl_minutes} min, {max_per_ebook} per ebook)")
+    return _preview_candidate_store
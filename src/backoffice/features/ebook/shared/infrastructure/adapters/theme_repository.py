@@ -3,6 +3,10 @@ from pathlib import Path
 
 from backoffice.features.ebook.shared.domain.entities.theme_profile import ThemeProfile
 from backoffice.features.ebook.shared.domain.theme.theme_loader import ThemeLoader
+from backoffice.features.ebook.shared.domain.theme.theme_registry import (
+    CompiledTheme,
+    get_theme_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,7 @@ class ThemeRepository:
 
         self.themes_directory = themes_directory
         self._theme_loader = ThemeLoader(themes_directory)
+        self._registry = get_theme_registry(themes_directory)
 
         logger.info(f"ThemeRepository initialized with themes directory: {themes_directory}")
 
@@ -34,6 +39,13 @@ class ThemeRepository:
         logger.debug(f"Retrieving theme: {theme_id}")
         return self._theme_loader.load_theme(theme_id)
 
+    def get_compiled_theme(self, theme_id: str) -> CompiledTheme | None:
+        """Get the compiled theme (typed templates, workflow params) by its ID
+
+        Returns None if the theme file does not exist.
+        """
+        return self._registry.get(theme_id)
+
     def get_available_themes(self) -> list[ThemeProfile]:
         """Get all available themes"""
         logger.debug("Retrieving all available themes")
@@ -67,11 +79,13 @@ class ThemeRepository:
 
     def get_theme_version(self, theme_id: str) -> str:
         """Get theme version/timestamp for caching purposes"""
-        theme_file = self.themes_directory / f"{theme_id}.yml"
-        if theme_file.exists():
-            # Use file modification time as version
-            mtime = theme_file.stat().st_mtime
-            return str(int(mtime))
+        try:
+            compiled = self.get_compiled_theme(theme_id)
+        except ValueError:
+            compiled = None
+        if compiled is not None:
+            # Content hash of the compiled file version
+            return compiled.version.sha256[:16]
         return "unknown"
 
     def is_available(self) -> bool:
@@ -6,9 +6,18 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
+from backoffice.features.ebook.shared.domain.ports.export_artifact_cache_port import ExportArtifactCachePort
 from backoffice.features.ebook.shared.domain.ports.file_storage_port import FileStoragePort
-from backoffice.features.ebook.shared.infrastructure.adapters.google_drive_storage_adapter import (
-    GoogleDriveStorageAdapter,
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import PageThumbnailPort
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import PreviewCandidatePort
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_export_artifact_cache import (
+    get_export_artifact_cache,
+)
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_page_thumbnail_store import (
+    get_page_thumbnail_store,
+)
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_preview_candidate_store import (
+    get_preview_candidate_store,
 )
 from backoffice.features.ebook.shared.infrastructure.adapters.local_file_storage_adapter import (
     LocalFileStorageAdapter,
@@ -49,6 +58,11 @@ class RepositoryFactory:
 
         if use_drive:
             try:
+                # Deferred: googleapiclient is heavy and only needed when Drive is configured
+                from backoffice.features.ebook.shared.infrastructure.adapters.google_drive_storage_adapter import (
+                    GoogleDriveStorageAdapter,
+                )
+
                 drive_adapter = GoogleDriveStorageAdapter()
                 if drive_adapter.is_available():
                     logger.info("✅ Using Google Drive storage (credentials found)")
@@ -67,6 +81,18 @@ class RepositoryFactory:
         """Get the global EventBus instance."""
         return get_event_bus()
 
+    def get_export_cache(self) -> ExportArtifactCachePort:
+        """Get the global export artifact cache (KDP PDFs, cover previews)."""
+        return get_export_artifact_cache()
+
+    def get_thumbnail_store(self) -> PageThumbnailPort:
+        """Get the global page thumbnail store (WebP renditions of page images)."""
+        return get_page_thumbnail_store()
+
+    def get_preview_candidate_store(self) -> PreviewCandidatePort:
+        """Get the global preview candidate store (modal regenerate/edit results)."""
+        return get_preview_candidate_store()
+
 
 def get_repository_factory(db: DatabaseDep) -> RepositoryFactory:
     return RepositoryFactory(db)
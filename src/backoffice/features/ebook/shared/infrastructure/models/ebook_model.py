@@ -40,7 +40,9 @@ class EbookModel(Base):
     structure_json: Mapped[dict | None] = mapped_column(JSON)
 
     # PDF bytes for DRAFT ebooks (awaiting approval)
-    ebook_bytes: Mapped[bytes | None] = mapped_column(LargeBinary)
+    ebook_bytes: Mapped[bytes | None] = mapped_column(LargeBinary, deferred=True)
+    ebook_bytes_sha256: Mapped[str | None] = mapped_column(String(64))  # ETag / file store key
+    pdf_dirty_at: Mapped[datetime | None]  # Latest page change not yet in ebook_bytes (None: PDF current)
 
     # Page count for KDP export
     page_count: Mapped[int | None]
@@ -1,6 +1,7 @@
 """Local Stable Diffusion provider (100% FREE, runs locally, no API token needed)."""
 import asyncio
 import base64
+import copy
 import json
 import logging
 import os
@@ -9,6 +10,7 @@ import urllib.parse
 import urllib.request
 import uuid
 from decimal import Decimal
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from urllib.error import URLError
@@ -16,6 +18,7 @@ from urllib.error import URLError
 from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import \
     ContentPageRegeneratingStatusEvent
 from backoffice.features.shared.infrastructure.events import event_bus_singleton
+from backoffice.features.shared.infrastructure.tracing import get_tracer, traced
 
 import websocket
 from PIL import Image, ImageDraw
@@ -273,6 +276,44 @@ nodes_steps_generate: dict = {
                 }
             }
 
+def find_workflows_directory() -> Path:
+    """Find config/generation/comfy by walking up from this file.
+
+    Raises:
+        FileNotFoundError: If no workflows directory is found
+    """
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        config_dir = current / "config"
+        if config_dir.exists() and (config_dir / "generation").exists():
+            return config_dir / "generation" / "comfy"
+        current = current.parent
+    raise FileNotFoundError("Could not find config/generation/comfy in project tree")
+
+
+@lru_cache(maxsize=32)
+def _parse_workflow(config_path: Path, mtime_ns: int) -> dict:
+    with open(config_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_workflow(config_path: Path) -> dict:
+    """Get a parsed workflow JSON (cached per file version, do not mutate)."""
+    return _parse_workflow(config_path, config_path.stat().st_mtime_ns)
+
+
+def preload_workflows() -> int:
+    """Parse every workflow JSON of config/generation/comfy (warm-up).
+
+    Returns:
+        Number of workflows loaded
+    """
+    workflow_files = sorted(find_workflows_directory().glob("*.json"))
+    for workflow_file in workflow_files:
+        load_workflow(workflow_file)
+    return len(workflow_files)
+
+
 class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPort):
     """Local Stable Diffusion provider using Comfy (100% FREE, no API).
 
@@ -298,18 +339,21 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
         self.workflow = None
         self.event_bus = event_bus_singleton.get_event_bus()
 
+    @traced("http.comfy.queue_prompt")
     def queue_prompt(self, prompt):
         p = {"prompt": prompt, "client_id": self.client_id}
         data = json.dumps(p).encode("utf-8")
         req = urllib.request.Request(f"http://{self.comfy_url}/prompt", data=data) # noqa: S310
         return json.loads(urllib.request.urlopen(req).read())
 
+    @traced("http.comfy.get_image")
     def get_image(self, filename, subfolder, folder_type):
         data = {"filename": filename, "subfolder": subfolder, "type": folder_type}
         url_values = urllib.parse.urlencode(data)
         with urllib.request.urlopen(f"http://{self.comfy_url}/view?{url_values}") as response:
             return response.read()
 
+    @traced("http.comfy.get_history")
     def get_history(self, prompt_id):
         with urllib.request.urlopen(f"http://{self.comfy_url}/history/{prompt_id}") as response:
             return json.loads(response.read())
@@ -328,49 +372,40 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
             current_step=None
         ))
 
-        while True:
-            out = ws.recv()
-            if isinstance(out, str):
-                message = json.loads(out)
+        # Queue wait + execution, until Comfy reports the prompt done
+        with get_tracer().span("ws.comfy.execute", prompt_id=prompt_id) as ws_span:
+            while True:
+                out = ws.recv()
+                if isinstance(out, str):
+                    message = json.loads(out)
 
-                workflow_state = "running"
-                status = 0
-                finished_step_count = 0
+                    workflow_state = "running"
+                    status = 0
+                    finished_step_count = 0
 
-                await asyncio.sleep(0.1)
+                    await asyncio.sleep(0.1)
 
-                if message["type"] == "execution_cached":
-                    for node in message["data"]["nodes"]:
-                        nb_total_steps -= workflow_nodes_steps["nodes"][node]["max"]
+                    if message["type"] == "execution_start":
+                        ws_span.add_event("execution_start")
 
-                if message["type"] == "progress_state":
-                    finished_step_count = 0
+                    if message["type"] == "execution_cached":
+                        for node in message["data"]["nodes"]:
+                            nb_total_steps -= workflow_nodes_steps["nodes"][node]["max"]
 
-                    for node_progress in message["data"]["nodes"]:
-                        value = message["data"]["nodes"][node_progress]["value"]
-                        state = message["data"]["nodes"][node_progress]["state"]
+                    if message["type"] == "progress_state":
+                        finished_step_count = 0
 
-                        if state == 'finished' or state == 'running':
-                            finished_step_count += value
+                        for node_progress in message["data"]["nodes"]:
+                            value = message["data"]["nodes"][node_progress]["value"]
+                            state = message["data"]["nodes"][node_progress]["state"]
 
+                            if state == 'finished' or state == 'running':
+                                finished_step_count += value
 
 
-                    status = finished_step_count * 100 / nb_total_steps
 
-                    await self.event_bus.publish(ContentPageRegeneratingStatusEvent(
-                        page_index=spec.page_index,
-                        ebook_id=spec.ebook_id,
-                        status=int(status),
-                        state=workflow_state,
-                        nb_total_steps=nb_total_steps,
-                        current_step=finished_step_count
-                    ))
+                        status = finished_step_count * 100 / nb_total_steps
 
-                if message["type"] == "executing":
-                    data = message["data"]
-                    if data["node"] is None and data["prompt_id"] == prompt_id:
-                        status = 100
-                        workflow_state = "finished"
                         await self.event_bus.publish(ContentPageRegeneratingStatusEvent(
                             page_index=spec.page_index,
                             ebook_id=spec.ebook_id,
@@ -380,9 +415,23 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
                             current_step=finished_step_count
                         ))
 
-                        break  # Execution is done
-            else:
-                continue  # previews are binary data
+                    if message["type"] == "executing":
+                        data = message["data"]
+                        if data["node"] is None and data["prompt_id"] == prompt_id:
+                            status = 100
+                            workflow_state = "finished"
+                            await self.event_bus.publish(ContentPageRegeneratingStatusEvent(
+                                page_index=spec.page_index,
+                                ebook_id=spec.ebook_id,
+                                status=int(status),
+                                state=workflow_state,
+                                nb_total_steps=nb_total_steps,
+                                current_step=finished_step_count
+                            ))
+
+                            break  # Execution is done
+                else:
+                    continue  # previews are binary data
 
         history = self.get_history(prompt_id)[prompt_id]
         for _ in history["outputs"]:
@@ -419,27 +468,16 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
         return False
 
     def _retrieve_workflow(self, cover: bool, edit: bool = False):
-        # Find project root by looking for config/ directory
-
-        current = Path(__file__).resolve()
-        while current.parent != current:
-            config_dir = current / "config"
-            if config_dir.exists() and (config_dir / "generation").exists():
-                if not edit:
-                    config_path = config_dir / "generation" / "comfy" / f"{self.model}"
-                else:
-                    # flux 2 dev
-                    # config_path = config_dir / "generation" / "comfy" / "edit-image-flux-2.json"
-                    config_path = config_dir / "generation" / "comfy" / "image_flux2_klein_image_edit_9b_distilled.json"
-
-                with open(config_path, encoding="utf-8") as f:
-                    workflow_data = f.read()
-
-                self.workflow = json.loads(workflow_data)
-                break
-            current = current.parent
+        workflows_dir = find_workflows_directory()
+        if not edit:
+            config_path = workflows_dir / f"{self.model}"
         else:
-            raise FileNotFoundError(f"Could not find config/generation/{self.model}.json in project tree")
+            # flux 2 dev
+            # config_path = workflows_dir / "edit-image-flux-2.json"
+            config_path = workflows_dir / "image_flux2_klein_image_edit_9b_distilled.json"
+
+        # Parsed once per file version; the copy is mutated with prompt/seed
+        self.workflow = copy.deepcopy(load_workflow(config_path))
 
     async def generate_cover(
         self,
@@ -481,7 +519,7 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
             )
 
         if prompt:
-            logger.info(f"Generate image (COMFY=>{self.model}) using this prompt: \n*****\n{prompt}\n******")
+            logger.debug(f"Generate image (COMFY=>{self.model}) with prompt: {prompt!r}")
 
         # "noise_seed" if flux-2 otherwise "seed" (if z-image)
         if self.workflow["25"]["inputs"].get("noise_seed", None):
@@ -497,7 +535,8 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
 
         try:
             comfy_ws = websocket.WebSocket()
-            comfy_ws.connect(f"ws://{self.comfy_url}/ws?clientId={self.client_id}")
+            with get_tracer().span("ws.comfy.connect"):
+                comfy_ws.connect(f"ws://{self.comfy_url}/ws?clientId={self.client_id}")
             images = await self.get_images(comfy_ws, self.workflow,
                                            spec, nodes_steps_generate)
 
@@ -555,7 +594,7 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
             )
 
         if prompt:
-            logger.info(f"Generate image (COMFY=>{self.model}) using this prompt: \n*****\n{prompt}\n******")
+            logger.debug(f"Generate image (COMFY=>{self.model}) with prompt: {prompt!r}")
 
         self._retrieve_workflow(cover=False)
 
@@ -583,7 +622,8 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
 
         try:
             ws = websocket.WebSocket()
-            ws.connect(f"ws://{self.comfy_url}/ws?clientId={self.client_id}")
+            with get_tracer().span("ws.comfy.connect"):
+                ws.connect(f"ws://{self.comfy_url}/ws?clientId={self.client_id}")
             images = await self.get_images(ws, self.workflow, spec, nodes_steps_generate)
 
             result_bytes = None
@@ -647,7 +687,7 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
             DomainError: If transformation fails
         """
         if edit_prompt:
-            logger.info(f"Edit the given image (COMFY) with this prompt: \n*****\n{edit_prompt}\n******")
+            logger.debug(f"Edit the given image (COMFY) with prompt: {edit_prompt!r}")
 
         if not self.is_available():
             raise DomainError(
@@ -699,7 +739,8 @@ class ComfyProvider(CoverGenerationPort, ContentPageGenerationPort, ImageEditPor
 
         try:
             ws = websocket.WebSocket()
-            ws.connect(f"ws://{self.comfy_url}/ws?clientId={self.client_id}")
+            with get_tracer().span("ws.comfy.connect"):
+                ws.connect(f"ws://{self.comfy_url}/ws?clientId={self.client_id}")
             images = await self.get_images(ws, self.workflow, spec, nodes_steps_edit)
 
             result_bytes = None
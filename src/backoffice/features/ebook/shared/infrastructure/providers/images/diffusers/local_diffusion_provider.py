@@ -159,6 +159,21 @@ class LocalDiffusionImageProvider(CoverGenerationPort, ContentPageGenerationPort
                     context={"model": self.model, "error": str(e)},
                 ) from e
 
+    def warm_up(self) -> None:
+        """Load the pipeline (and LoRA) ahead of the first generation.
+
+        Raises:
+            DomainError: If diffusers is not installed or the model cannot be loaded
+        """
+        if not self.is_available():
+            raise DomainError(
+                code=ErrorCode.PROVIDER_UNAVAILABLE,
+                message="Diffusers library not installed",
+                actionable_hint="Run: pip install diffusers transformers accelerate torch",
+                context={"provider": "diffusers"},
+            )
+        self._load_pipeline()
+
     def _load_lora(self):
         """Load LoRA weights into the pipeline (must hold lock)."""
         if not self.lora:
@@ -19,6 +19,7 @@ from backoffice.features.ebook.shared.domain.ports.image_edit_port import ImageE
 from backoffice.features.ebook.shared.infrastructure.utils.image_borders import (
     add_rounded_border_to_image,
 )
+from backoffice.features.shared.infrastructure.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +106,8 @@ class GeminiImageProvider(CoverGenerationPort, ContentPageGenerationPort, ImageE
                     },
                 }
 
-                response = await client.post(url, json=payload)
+                with get_tracer().span("http.gemini.generate_content", model=self.model):
+                    response = await client.post(url, json=payload)
                 response.raise_for_status()
 
                 result = response.json()
@@ -298,7 +300,8 @@ class GeminiImageProvider(CoverGenerationPort, ContentPageGenerationPort, ImageE
                     },
                 }
 
-                response = await client.post(url, json=payload)
+                with get_tracer().span("http.gemini.generate_content", model=self.model):
+                    response = await client.post(url, json=payload)
                 response.raise_for_status()
 
                 result = response.json()
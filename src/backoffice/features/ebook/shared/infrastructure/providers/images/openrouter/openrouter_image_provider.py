@@ -22,6 +22,7 @@ from backoffice.features.ebook.shared.infrastructure.providers.images.openrouter
 from backoffice.features.ebook.shared.infrastructure.utils.image_borders import (
     add_rounded_border_to_image,
 )
+from backoffice.features.shared.infrastructure.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -129,26 +130,27 @@ class OpenRouterImageProvider(CoverGenerationPort, ContentPageGenerationPort):
         try:
             # Generate via chat endpoint (Gemini-specific approach)
             # Gemini 2.5 Flash Image Preview requires modalities: ["image", "text"]
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": full_prompt,
-                    }
-                ],
-                extra_body={
-                    "modalities": ["image", "text"],  # Required for Gemini image generation
-                    "usage": {"include": True},  # Enable Usage Accounting for real cost (usage.cost)
-                },
-                extra_headers={
-                    "HTTP-Referer": "https://ebook-generator.app",
-                    "X-Title": "Ebook Generator Backoffice",
-                },
-                max_tokens=1000,
-                temperature=0.7 if seed is None else 0.3,
-                # Note: OpenRouter doesn't support seed for image generation yet
-            )
+            with get_tracer().span("http.openrouter.chat_completions", model=self.model):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": full_prompt,
+                        }
+                    ],
+                    extra_body={
+                        "modalities": ["image", "text"],  # Required for Gemini image generation
+                        "usage": {"include": True},  # Enable Usage Accounting for real cost (usage.cost)
+                    },
+                    extra_headers={
+                        "HTTP-Referer": "https://ebook-generator.app",
+                        "X-Title": "Ebook Generator Backoffice",
+                    },
+                    max_tokens=1000,
+                    temperature=0.7 if seed is None else 0.3,
+                    # Note: OpenRouter doesn't support seed for image generation yet
+                )
 
             # Extract image from response
             logger.debug("Extracting image from API response...")
@@ -256,34 +258,35 @@ class OpenRouterImageProvider(CoverGenerationPort, ContentPageGenerationPort):
             prompt_text = "Remove all text and typography from this image."
 
             # Call Gemini with image input + ultra-simple prompt
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image_url",
-                                "image_url": {"url": f"data:image/png;base64,{cover_b64}"},
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt_text,
-                            },
-                        ],
-                    }
-                ],
-                extra_body={
-                    "modalities": ["image", "text"],
-                    "usage": {"include": True},  # Enable Usage Accounting for real cost (usage.cost)
-                },
-                extra_headers={
-                    "HTTP-Referer": "https://ebook-generator.app",
-                    "X-Title": "Ebook Generator Backoffice",
-                },
-                max_tokens=1000,
-                temperature=0.3,
-            )
+            with get_tracer().span("http.openrouter.chat_completions", model=self.model):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": [
+                                {
+                                    "type": "image_url",
+                                    "image_url": {"url": f"data:image/png;base64,{cover_b64}"},
+                                },
+                                {
+                                    "type": "text",
+                                    "text": prompt_text,
+                                },
+                            ],
+                        }
+                    ],
+                    extra_body={
+                        "modalities": ["image", "text"],
+                        "usage": {"include": True},  # Enable Usage Accounting for real cost (usage.cost)
+                    },
+                    extra_headers={
+                        "HTTP-Referer": "https://ebook-generator.app",
+                        "X-Title": "Ebook Generator Backoffice",
+                    },
+                    max_tokens=1000,
+                    temperature=0.3,
+                )
 
             # Extract transformed image (without text)
             image_bytes = self._extract_image_from_response(response)
@@ -1,6 +1,10 @@
 """Factory for creating provider instances (V1 slim)."""
 
+import functools
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 from backoffice.features.ebook.shared.domain.policies.model_registry import ModelRegistry
 from backoffice.features.ebook.shared.domain.ports.assembly_port import AssemblyPort
@@ -9,9 +13,41 @@ from backoffice.features.ebook.shared.domain.ports.content_page_generation_port
 )
 from backoffice.features.ebook.shared.domain.ports.cover_generation_port import CoverGenerationPort
 from backoffice.features.ebook.shared.domain.ports.image_edit_port import ImageEditPort
+from backoffice.features.shared.infrastructure.metrics import PROVIDER_CALL_DURATION, record_cache
+from backoffice.features.shared.infrastructure.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
+ProviderT = TypeVar("ProviderT")
+
+# Provider calls timed in backoffice_provider_call_duration_seconds
+INSTRUMENTED_OPERATIONS = ("generate_cover", "remove_text_from_cover", "generate_page", "edit_image")
+
+
+def _timed_call(method: Callable[..., Awaitable[Any]], provider: str, model: str, operation: str) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            with get_tracer().span(f"provider.{operation}", provider=provider, model=model):
+                result = await method(*args, **kwargs)
+            outcome = "success"
+            return result
+        finally:
+            PROVIDER_CALL_DURATION.observe(time.perf_counter() - start, provider=provider, model=model, operation=operation, outcome=outcome)
+
+    return wrapper
+
+
+def instrument_provider(instance: ProviderT, provider: str, model: str) -> ProviderT:
+    """Time and trace the image operations of a provider instance (type and isinstance unchanged)."""
+    for operation in INSTRUMENTED_OPERATIONS:
+        method = getattr(instance, operation, None)
+        if method is not None:
+            setattr(instance, operation, _timed_call(method, provider, model, operation))
+    return instance
+
 
 class ProviderFactory:
     """Factory for creating provider instances based on model registry (V1 slim).
@@ -65,7 +101,9 @@ class ProviderFactory:
         )
 
         # Return cached instance if available
-        if cache_key in ProviderFactory._cover_provider_cache:
+        cached = cache_key in ProviderFactory._cover_provider_cache
+        record_cache("provider_instances", hit=cached)
+        if cached:
             logger.debug(f"♻️ Reusing cached cover provider: {cache_key}")
             return ProviderFactory._cover_provider_cache[cache_key]
 
@@ -111,7 +149,7 @@ class ProviderFactory:
             raise ValueError(f"Unknown cover provider: {model_mapping.provider}. Supported: openrouter, gemini, comfy, diffusers")
 
         # Cache and return
-        ProviderFactory._cover_provider_cache[cache_key] = provider
+        ProviderFactory._cover_provider_cache[cache_key] = instrument_provider(provider, model_mapping.provider, model_mapping.model)
         return provider
 
     @staticmethod
@@ -137,7 +175,9 @@ class ProviderFactory:
         )
 
         # Return cached instance if available
-        if cache_key in ProviderFactory._page_provider_cache:
+        cached = cache_key in ProviderFactory._page_provider_cache
+        record_cache("provider_instances", hit=cached)
+        if cached:
             logger.debug(f"♻️ Reusing cached page provider: {cache_key}")
             return ProviderFactory._page_provider_cache[cache_key]
 
@@ -183,7 +223,7 @@ class ProviderFactory:
             raise ValueError(f"Unknown content page provider: {model_mapping.provider}. Supported: openrouter, gemini, comfy, diffusers")
 
         # Cache and return
-        ProviderFactory._page_provider_cache[cache_key] = provider
+        ProviderFactory._page_provider_cache[cache_key] = instrument_provider(provider, model_mapping.provider, model_mapping.model)
         return provider
 
     @staticmethod
@@ -210,7 +250,9 @@ class ProviderFactory:
         )
 
         # Return cached instance if available
-        if cache_key in ProviderFactory._edit_provider_cache:
+        cached = cache_key in ProviderFactory._edit_provider_cache
+        record_cache("provider_instances", hit=cached)
+        if cached:
             logger.debug(f"♻️ Reusing cached edit provider: {cache_key}")
             return ProviderFactory._edit_provider_cache[cache_key]
 
@@ -247,7 +289,8 @@ class ProviderFactory:
             raise ValueError(f"Unknown image edit provider: {model_mapping.provider}. Supported: openrouter, gemini, comfy")
 
         # Cache and return
-        ProviderFactory._edit_provider_cache[cache_key] = provider
+        provider_name = "gemini" if model_mapping.provider == "openrouter" else model_mapping.provider
+        ProviderFactory._edit_provider_cache[cache_key] = instrument_provider(provider, provider_name, model_mapping.model)
         return provider
 
     @staticmethod
@@ -7,21 +7,26 @@ from typing import cast
 import img2pdf
 from PIL import Image
 
+from backoffice.config.loader import get_config_loader
 from backoffice.features.ebook.shared.domain.entities.ebook import (
     Ebook,
     KDPExportConfig,
-    calculate_spine_width,
     inches_to_px,
 )
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
+from backoffice.features.ebook.shared.infrastructure.providers.publishing import pdf_linearization
 from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import (
-    color_utils,
+    cover_composer,
+    page_encoding,
     spine_generator,
+    visual_validator,
 )
+from backoffice.features.shared.infrastructure.tracing import traced, traced_methods
 
 logger = logging.getLogger(__name__)
 
 
+@traced_methods("kdp_cover_assembly")
 class KDPAssemblyProvider:
     """Assembly provider for Amazon KDP paperback format.
 
@@ -41,8 +46,7 @@ class KDPAssemblyProvider:
         front_cover_bytes: bytes,
         kdp_config: KDPExportConfig,
         isbn: str | None = None,
-        spine_colors: list = None
-
+        spine_colors: list | None = None,
     ) -> bytes:
         """Assemble KDP-ready PDF with back, spine, and front.
 
@@ -60,13 +64,62 @@ class KDPAssemblyProvider:
         Raises:
             DomainError: If assembly fails or requirements not met
         """
-        # 1. Calculate dimensions (rounded to even) https://kdp.amazon.com/cover-calculator
-        front_cover_width_px = inches_to_px(kdp_config.trim_size[0])
-        front_cover_height_px = inches_to_px(kdp_config.trim_size[1])
+        # 1-5. Compose back + spine + front on one canvas
+        full_cover = self.compose_kdp_cover(ebook, back_cover_bytes, front_cover_bytes, kdp_config, spine_colors)
+
+        # 6. Visual validation against KDP template (informational, same canvas)
+        validation_result = visual_validator.validate_full_cover_against_template(full_cover.image)
+        if validation_result.get("valid"):
+            logger.info(f"✅ {validation_result['message']}")
+        else:
+            logger.warning(f"⚠️ KDP template validation (non-critical): {validation_result['message']}")
+
+        # 7. Encode per profile: lossless PNG/Flate or high-quality JPEG (RGB mode for KDP)
+        profiles = get_config_loader().get_encoding_profiles()
+        profile = page_encoding.EncodingProfile.from_config(kdp_config.encoding_profile, profiles[kdp_config.encoding_profile])
+        cover_image_bytes, cover_encoding, cover_error = page_encoding.encode_image(full_cover.image, profile.cover, jpeg_quality=profile.jpeg_quality)
+        logger.info(f"📊 KDP cover encoding: profile={profile.name} encoding={cover_encoding.value} bytes={len(cover_image_bytes)} mae={cover_error:.2f}")
+
+        # 8. ✅ Convert to PDF with img2pdf (preserves RGB - KDP will convert to CMYK for print)
+        layout = img2pdf.get_fixed_dpi_layout_fun((300, 300))
+        pdf_bytes = cast(bytes, img2pdf.convert([cover_image_bytes], layout_fun=layout))
+        if kdp_config.linearize:
+            pdf_bytes = pdf_linearization.linearize_pdf(pdf_bytes)
 
-        bleed_px = inches_to_px(kdp_config.bleed_size)
+        # 9. Validate KDP requirements
+        self._validate_kdp_requirements(cast(int, ebook.page_count) + 1, kdp_config)  # page_count checked in compose_kdp_cover
+
+        logger.info(f"✅ KDP PDF assembled: {len(pdf_bytes)} bytes")
+        return pdf_bytes
+
+    @traced("kdp_cover_assembly.compose_kdp_cover")
+    def compose_kdp_cover(
+        self,
+        ebook: Ebook,
+        back_cover_bytes: bytes,
+        front_cover_bytes: bytes,
+        kdp_config: KDPExportConfig,
+        spine_colors: list | None = None,
+    ) -> cover_composer.ComposedCover:
+        """Compose the full KDP cover (back + spine + front) in memory.
+
+        Shared by PDF assembly and the cover preview so both show exactly
+        the same canvas.
 
-        # Validate page_count is present
+        Args:
+            ebook: Ebook entity with metadata
+            back_cover_bytes: Back cover image bytes (RGB PNG/JPEG)
+            front_cover_bytes: Front cover image bytes (RGB PNG/JPEG)
+            kdp_config: KDP export configuration
+            spine_colors: Colors that should be used for spine (background and text)
+
+        Returns:
+            Composed full cover canvas @ 300 DPI
+
+        Raises:
+            DomainError: If page_count is missing or the spine has wrong dimensions
+        """
+        # 1. Validate page_count is present
         if ebook.page_count is None:
             raise DomainError(
                 code=ErrorCode.VALIDATION_ERROR,
@@ -74,109 +127,41 @@ class KDPAssemblyProvider:
                 actionable_hint="Regenerate the ebook to populate page_count",
             )
 
-        spine_width_inches, spine_safe_area_inches = calculate_spine_width(ebook.page_count + 1, # legal page to consider
-                                                        kdp_config.paper_type,
-                                                        kdp_config.gutter_margin_size)
-
-        spine_dimensions_inches = (spine_width_inches,
-                                   kdp_config.trim_size[1] + kdp_config.top_margin_size + kdp_config.bottom_margin_size)
-        spine_dimensions_px = (inches_to_px(spine_dimensions_inches[0]), inches_to_px(spine_dimensions_inches[1]))
-        spine_safe_area_dimensions_inches = (spine_safe_area_inches,
-                                             kdp_config.trim_size[1]-2*kdp_config.bleed_size - kdp_config.top_margin_size + kdp_config.bottom_margin_size)
-        spine_safe_area_dimensions_px = (inches_to_px(spine_safe_area_dimensions_inches[0]), inches_to_px(spine_safe_area_dimensions_inches[1]))
-
-        logger.info(f"KDP Spine dimensions: {spine_dimensions_inches[0]:.6f}x{spine_dimensions_inches[1]:.6f} inches => {spine_dimensions_px[0]}x{spine_dimensions_px[1]}px, bleed={kdp_config.bleed_size} inches => {bleed_px}px")
-        logger.info(f"KDP Spine safe area: {spine_safe_area_dimensions_inches[0]:.6f}x{spine_safe_area_dimensions_inches[1]:.6f} inches ({spine_safe_area_dimensions_px[0]}x{spine_safe_area_dimensions_px[1]}px)")
+        # 2. Calculate dimensions (rounded to even) https://kdp.amazon.com/cover-calculator
+        page_count = ebook.page_count + 1  # legal page to consider
+        cover_layout = cover_composer.compute_cover_layout(kdp_config, page_count)
+        bleed_px = inches_to_px(kdp_config.bleed_size)
 
-        logger.info(f"KDP front cover dimensions: trim={kdp_config.trim_size[0]:.6f}x{kdp_config.trim_size[1]:.6f} ({front_cover_width_px}x{front_cover_height_px}px), bleed={bleed_px}px")
+        logger.info(f"KDP Spine dimensions: {cover_layout.spine_size[0]}x{cover_layout.spine_size[1]}px (safe {cover_layout.spine_safe_width}px), bleed={kdp_config.bleed_size} inches => {bleed_px}px")
+        logger.info(f"KDP cover panel dimensions: {cover_layout.panel_size[0]}x{cover_layout.panel_size[1]}px, full cover {cover_layout.size[0]}x{cover_layout.size[1]}px")
 
-        # 2. Generate spine (RGB format - KDP requirement)
+        # 3. Generate spine (RGB format - KDP requirement)
         spine_bytes = spine_generator.generate_spine(
             front_cover_bytes=front_cover_bytes,
-            spine_width_px=spine_dimensions_px[0],
-            spine_height_px=spine_dimensions_px[1],
+            spine_width_px=cover_layout.spine_size[0],
+            spine_height_px=cover_layout.spine_size[1],
             spine_colors=spine_colors,
-            page_count=ebook.page_count + 1, # legal page to add
+            page_count=page_count,
             paper_type=kdp_config.paper_type,
             title=ebook.title,
             author=ebook.author,
         )
 
-        # 3. Load and normalize all to RGB (KDP requirement)
-        back_img = color_utils.ensure_rgb(Image.open(BytesIO(back_cover_bytes)))
-        spine_img = color_utils.ensure_rgb(Image.open(BytesIO(spine_bytes)))
-        front_img = color_utils.ensure_rgb(Image.open(BytesIO(front_cover_bytes)))
-
-        # 4. ✅ Validate dimensions (front_cover_width and front_cover_height already include bleed)
-        expected_back = (inches_to_px(kdp_config.trim_size[0] + kdp_config.side_margin_size),
-                         inches_to_px(kdp_config.trim_size[1] + kdp_config.top_margin_size + kdp_config.bottom_margin_size))
-
-        expected_spine = (spine_dimensions_px[0], spine_dimensions_px[1])
-
-        expected_front = (inches_to_px(kdp_config.trim_size[0] + kdp_config.side_margin_size),
-                          inches_to_px(kdp_config.trim_size[1] + kdp_config.top_margin_size + kdp_config.bottom_margin_size))
-
-        if back_img.size != expected_back:
-            # Back may need resizing (same as front cover)
-            logger.warning(f"Back cover size mismatch: {back_img.size} != {expected_back}, resizing...")
-            back_img = back_img.resize(expected_back, Image.Resampling.LANCZOS)
+        # 4. Load images (normalized to RGB by the composer)
+        back_img = Image.open(BytesIO(back_cover_bytes))
+        spine_img = Image.open(BytesIO(spine_bytes))
+        front_img = Image.open(BytesIO(front_cover_bytes))
 
-        if spine_img.size != expected_spine:
-            logger.error(f"Spine size mismatch: {spine_img.size} != {expected_spine}")
+        # 5. Assemble horizontally on one canvas
+        try:
+            return cover_composer.compose_full_cover(back_img, front_img, cover_layout, spine_img=spine_img)
+        except ValueError as e:
+            logger.error(f"Spine size mismatch: {e}")
             raise DomainError(
                 code=ErrorCode.VALIDATION_ERROR,
-                message=f"Spine dimensions incorrect: {spine_img.size} != {expected_spine}",
+                message=str(e),
                 actionable_hint="Check spine generation",
-            )
-
-        if front_img.size != expected_front:
-            # Front may need resizing
-            logger.warning(f"Front cover size mismatch: {front_img.size} != {expected_front}, resizing...")
-            front_img = front_img.resize(expected_front, Image.Resampling.LANCZOS)
-
-        # 5. Assemble horizontally
-        total_width = 2*inches_to_px(kdp_config.trim_size[0]) + spine_dimensions_px[0] + 2*inches_to_px(kdp_config.side_margin_size)
-        total_height = inches_to_px(kdp_config.trim_size[1]) + inches_to_px(kdp_config.top_margin_size + kdp_config.bottom_margin_size)
-
-        logger.info(f"Full cover dimensions: {total_width}x{total_height}px")
-
-        # RGB mode with white background (KDP requirement)
-        full_cover = Image.new("RGB", (total_width, total_height), (255, 255, 255))
-
-        # Add barcode space to back cover BEFORE pasting
-        # (back cover has left bleed + trim, no right bleed - spine comes after)
-        logger.info("📦 Adding KDP barcode space to back cover...")
-        back_buffer = BytesIO()
-        # Use PNG format (RGB mode for KDP)
-        back_img.save(back_buffer, format="PNG")
-
-        # Paste back (position 0)
-        full_cover.paste(back_img, (0, 0))
-
-        # Paste spine
-        full_cover.paste(spine_img, (inches_to_px(kdp_config.trim_size[0]) + inches_to_px(kdp_config.side_margin_size), 0))
-
-        # Paste front
-        full_cover.paste(front_img, (inches_to_px(kdp_config.trim_size[0]) + inches_to_px(kdp_config.side_margin_size) + spine_dimensions_px[0], 0))
-
-        # 6. Save as PNG with DPI (RGB mode for KDP)
-        cover_buffer = BytesIO()
-        full_cover.save(cover_buffer, format="PNG", dpi=(300, 300))
-
-        # save the image of the full cover in temp folder
-        full_cover.save("/tmp/full_cover.png", format="PNG", dpi=(300, 300))
-
-        cover_tiff_bytes = cover_buffer.getvalue()
-
-        # 7. ✅ Convert to PDF with img2pdf (preserves RGB - KDP will convert to CMYK for print)
-        layout = img2pdf.get_fixed_dpi_layout_fun((300, 300))
-        pdf_bytes = cast(bytes, img2pdf.convert([cover_tiff_bytes], layout_fun=layout))
-
-        # 8. Validate KDP requirements
-        self._validate_kdp_requirements(ebook.page_count + 1, kdp_config)
-
-        logger.info(f"✅ KDP PDF assembled: {len(pdf_bytes)} bytes")
-        return pdf_bytes
+            ) from e
 
     def _validate_kdp_requirements(self, page_count: int, config: KDPExportConfig):
         """Validate KDP requirements.
@@ -1,11 +1,16 @@
 """KDP interior assembly provider for Amazon KDP manuscript/interior PDF generation."""
 
+import asyncio
 import base64
+import hashlib
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
-from typing import Any
+from typing import Any, cast
 
 import img2pdf
+import pikepdf
 from PIL import Image
 
 from backoffice.config.loader import get_config_loader
@@ -15,13 +20,17 @@ from backoffice.features.ebook.shared.domain.entities.ebook import (
     inches_to_px,
 )
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
+from backoffice.features.ebook.shared.infrastructure.providers.publishing import pdf_linearization
+from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import page_encoding
 from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils.legal_page_generator import (
     generate_legal_page,
 )
+from backoffice.features.shared.infrastructure.tracing import traced_methods
 
 logger = logging.getLogger(__name__)
 
 
+@traced_methods("kdp_interior_assembly")
 class KDPInteriorAssemblyProvider:
     """Assembly provider for Amazon KDP interior/manuscript format.
 
@@ -31,8 +40,22 @@ class KDPInteriorAssemblyProvider:
     - Black & white or color mode (based on page metadata)
     - 300 DPI resolution
     - KDP-compliant dimensions (8×10" default)
+
+    Pages are resized and encoded per the KDPExportConfig encoding profile
+    (1-bit line art, 8-bit gray, RGB or JPEG) in parallel worker processes.
+    Identical page images (blank padding, repeated pages) are processed once
+    and share a single image XObject in the output PDF.
     """
 
+    def __init__(self, max_workers: int | None = None):
+        """Initialize interior assembly provider.
+
+        Args:
+            max_workers: Max worker processes for page encoding
+                (defaults to the number of CPUs, 1 disables the process pool)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+
     async def assemble_kdp_interior(
         self,
         ebook: Ebook,
@@ -47,6 +70,26 @@ class KDPInteriorAssemblyProvider:
         Returns:
             PDF bytes ready for KDP interior upload
 
+        Raises:
+            DomainError: If assembly fails or requirements not met
+        """
+        pdf_bytes, _ = await self.assemble_kdp_interior_with_report(ebook, kdp_config)
+        return pdf_bytes
+
+    async def assemble_kdp_interior_with_report(
+        self,
+        ebook: Ebook,
+        kdp_config: KDPExportConfig,
+    ) -> tuple[bytes, page_encoding.EncodingReport]:
+        """Assemble KDP interior PDF and report image sizes and fidelity.
+
+        Args:
+            ebook: Ebook entity with structure_json containing pages
+            kdp_config: KDP export configuration
+
+        Returns:
+            (PDF bytes, encoding report for the embedded images)
+
         Raises:
             DomainError: If assembly fails or requirements not met
         """
@@ -88,76 +131,180 @@ class KDPInteriorAssemblyProvider:
                 actionable_hint="Ebook must have content pages between cover and back",
             )
 
-        # 3b. Auto-complete to KDP minimum (24 pages) if needed
+        # 3b. Decode pages (legal page first, blank padding last)
+        page_size = (page_width_px, page_height_px)
+        page_images: list[bytes] = []
+        line_art_hints: list[bool] = []
+
+        # 3c. Generate legal/copyright page and prepend
+        legal_page_bytes = self._generate_legal_page(ebook, page_width_px, page_height_px)
+        if legal_page_bytes:
+            page_images.append(legal_page_bytes)
+            line_art_hints.append(True)
+            logger.info("Legal/copyright page prepended to interior")
+
+        for page_meta in interior_pages:
+            page_images.append(base64.b64decode(page_meta["image_data_base64"]))
+            line_art_hints.append(page_meta.get("color_mode") == "BLACK_WHITE")
+
+        # 3d. Auto-complete to KDP minimum (24 pages) if needed
         min_pages_required = 24  # KDP minimum for standard_color
         if len(interior_pages) < min_pages_required:
             pages_to_add = min_pages_required - len(interior_pages)
             logger.info(f"⚠️ Interior has {len(interior_pages)} pages (< {min_pages_required}), adding {pages_to_add} blank page(s) for KDP compliance")
 
-            # Generate blank white page (2626x2626 for 8.5 (bleed included)" + margin @ 300 DPI)
-            blank_img = Image.new("RGB", (page_width_px, page_height_px), (255, 255, 255))
+            # Generate blank white page once (2626x2626 for 8.5 (bleed included)" + margin @ 300 DPI)
+            blank_img = Image.new("RGB", page_size, (255, 255, 255))
             buffer = BytesIO()
-            blank_img.save(buffer, format="PNG")
-            blank_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-
-            # Add blank pages before the validation
-            for i in range(pages_to_add):
-                interior_pages.append(
-                    {
-                        "page_number": len(interior_pages) + 1,
-                        "title": f"Blank Page {i + 1}",
-                        "image_data_base64": blank_base64,
-                        "format": "PNG",
-                        "color_mode": "BLACK_WHITE",
-                    }
-                )
+            blank_img.save(buffer, format="PNG", dpi=(300, 300))
+            page_images.extend([buffer.getvalue()] * pages_to_add)
+            line_art_hints.extend([True] * pages_to_add)
 
-            new_total = len(interior_pages)
-            logger.info(f"✅ Added {pages_to_add} blank page(s), new total: {new_total} interior pages")
+            logger.info(f"✅ Added {pages_to_add} blank page(s), new total: {len(interior_pages) + pages_to_add} interior pages")
 
-        # 3c. Generate legal/copyright page and prepend
-        legal_page_bytes = self._generate_legal_page(ebook, page_width_px, page_height_px)
-        processed_images: list[bytes] = []
-        if legal_page_bytes:
-            processed_images.append(legal_page_bytes)
-            logger.info("Legal/copyright page prepended to interior")
+        # 4. Deduplicate identical images, then encode the unique ones in parallel
+        unique_images, page_order = self._deduplicate_pages(page_images)
+        unique_hints = [False] * len(unique_images)
+        for unique_idx, hint in zip(page_order, line_art_hints, strict=True):
+            unique_hints[unique_idx] = unique_hints[unique_idx] or hint
 
-        # 4. Process each interior page
-        for idx, page_meta in enumerate(interior_pages, start=1):
-            page_number = page_meta.get("page_number", idx)
-            logger.info(f"Processing interior page {idx}/{len(interior_pages)} (page_number={page_number})")
-
-            # Decode base64 image
-            image_data = base64.b64decode(page_meta["image_data_base64"])
-            img = Image.open(BytesIO(image_data))
-
-            # Resize to exact dimensions with bleed
-            if img.size != (page_width_px, page_height_px):
-                expected_size = f"{page_width_px}x{page_height_px}"
-                logger.warning(f"Page {page_number} size mismatch: {img.size} != {expected_size}, resizing...")
-                img = img.resize((page_width_px, page_height_px), Image.Resampling.LANCZOS)
-
-            # Ensure RGB mode (KDP interior can be RGB or CMYK, but RGB is simpler)
-            if img.mode != "RGB":
-                logger.info(f"Converting page {page_number} from {img.mode} to RGB")
-                img = img.convert("RGB")
-
-            # Save to bytes with 300 DPI
-            img_buffer = BytesIO()
-            img.save(img_buffer, format="PNG", dpi=(300, 300))
-            processed_images.append(img_buffer.getvalue())
-
-        # 5. Convert to PDF with img2pdf
-        logger.info(f"Converting {len(processed_images)} pages to PDF...")
-        layout = img2pdf.get_fixed_dpi_layout_fun((300, 300))
-        pdf_bytes = bytes(img2pdf.convert(processed_images, layout_fun=layout))
+        profile = self._load_encoding_profile(kdp_config.encoding_profile)
+        logger.info(f"Processing {len(unique_images)} unique image(s) for {len(page_order)} pages (encoding profile: {profile.name})")
+        encoded_pages = await self._encode_pages(unique_images, unique_hints, page_size, profile)
+
+        # 5. Convert to PDF (identical pages share a single image XObject, linearized for fast web view)
+        logger.info(f"Converting {len(page_order)} pages to PDF...")
+        pdf_bytes = await asyncio.to_thread(self._build_pdf, [page.data for page in encoded_pages], page_order, kdp_config.linearize)
+        report = self._build_report(profile, unique_images, encoded_pages, page_order, len(pdf_bytes))
+        logger.info(f"📊 KDP interior encoding report: {report.summary()}")
 
         # 6. Validate KDP requirements
-        total_interior_pages = len(processed_images)
+        total_interior_pages = len(page_order)
         self._validate_kdp_interior_requirements(total_interior_pages, kdp_config)
 
         logger.info(f"✅ KDP interior PDF assembled: {len(pdf_bytes)} bytes ({total_interior_pages} pages)")
-        return pdf_bytes
+        return pdf_bytes, report
+
+    @staticmethod
+    def _deduplicate_pages(page_images: list[bytes]) -> tuple[list[bytes], list[int]]:
+        """Collapse identical page images.
+
+        Args:
+            page_images: Encoded page images in reading order
+
+        Returns:
+            (unique images, index into unique images for each page)
+        """
+        unique_images: list[bytes] = []
+        index_by_hash: dict[str, int] = {}
+        page_order: list[int] = []
+
+        for image_bytes in page_images:
+            digest = hashlib.sha256(image_bytes).hexdigest()
+            if digest not in index_by_hash:
+                index_by_hash[digest] = len(unique_images)
+                unique_images.append(image_bytes)
+            page_order.append(index_by_hash[digest])
+
+        return unique_images, page_order
+
+    @staticmethod
+    def _load_encoding_profile(name: str) -> page_encoding.EncodingProfile:
+        """Load an image encoding profile from config/kdp/specifications.yaml."""
+        profiles = get_config_loader().get_encoding_profiles()
+        return page_encoding.EncodingProfile.from_config(name, profiles[name])
+
+    async def _encode_pages(
+        self,
+        images: list[bytes],
+        line_art_hints: list[bool],
+        page_size: tuple[int, int],
+        profile: page_encoding.EncodingProfile,
+    ) -> list[page_encoding.EncodedPage]:
+        """Resize and encode pages per profile, skipping pages already print-ready.
+
+        Args:
+            images: Unique encoded page images
+            line_art_hints: Pages known to be black & white
+            page_size: Target (width, height) in pixels
+            profile: Encoding profile
+
+        Returns:
+            Encoded pages ready for img2pdf, in the same order
+        """
+        encoded: list[page_encoding.EncodedPage | None] = [None] * len(images)
+        pending: list[int] = []
+
+        for idx, image_bytes in enumerate(images):
+            # Legacy RGB profile: embed target-size RGB images as-is
+            if profile.is_lossless_rgb and page_encoding.is_print_ready(image_bytes, page_size):
+                encoded[idx] = page_encoding.EncodedPage(data=image_bytes, content_class=None, encoding=page_encoding.PageEncoding.RGB, mean_abs_error=0.0)
+            else:
+                pending.append(idx)
+
+        workers = min(self.max_workers, len(pending))
+
+        if workers == 1:
+            for idx in pending:
+                encoded[idx] = await asyncio.to_thread(page_encoding.encode_page, images[idx], page_size, profile, line_art_hints[idx])
+        elif workers > 1:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(executor, page_encoding.encode_page, images[idx], page_size, profile, line_art_hints[idx]) for idx in pending)
+                )
+            for idx, page in zip(pending, results, strict=True):
+                encoded[idx] = page
+
+        return [cast(page_encoding.EncodedPage, page) for page in encoded]
+
+    @staticmethod
+    def _build_report(
+        profile: page_encoding.EncodingProfile,
+        source_images: list[bytes],
+        encoded_pages: list[page_encoding.EncodedPage],
+        page_order: list[int],
+        pdf_size: int,
+    ) -> page_encoding.EncodingReport:
+        """Build the per-export size and fidelity report."""
+        report = page_encoding.EncodingReport(profile=profile.name, pdf_bytes=pdf_size)
+        for unique_idx, (source, page) in enumerate(zip(source_images, encoded_pages, strict=True)):
+            report.images.append(
+                page_encoding.PageEncodingStats(
+                    page_numbers=[number for number, idx in enumerate(page_order, start=1) if idx == unique_idx],
+                    content_class=page.content_class,
+                    encoding=page.encoding,
+                    source_bytes=len(source),
+                    encoded_bytes=len(page.data),
+                    mean_abs_error=page.mean_abs_error,
+                )
+            )
+        return report
+
+    @staticmethod
+    def _build_pdf(unique_images: list[bytes], page_order: list[int], linearize: bool = False) -> bytes:
+        """Build the interior PDF, embedding each unique image only once.
+
+        Args:
+            unique_images: Encoded page images (PNG, JPEG or TIFF)
+            page_order: Index into unique_images for each page
+            linearize: Emit a linearized (fast web view) PDF
+
+        Returns:
+            PDF bytes
+        """
+        layout = img2pdf.get_fixed_dpi_layout_fun((300, 300))
+        unique_pdf = cast(bytes, img2pdf.convert(unique_images, layout_fun=layout))
+
+        if len(unique_images) == len(page_order):
+            return pdf_linearization.linearize_pdf(unique_pdf) if linearize else unique_pdf
+
+        # Reference the same page (and therefore the same image XObject) several times
+        with pikepdf.open(BytesIO(unique_pdf)) as source, pikepdf.new() as output:
+            for idx in page_order:
+                output.pages.append(source.pages[idx])
+
+            return pdf_linearization.save_pdf(output, linearize=linearize)
 
     def _generate_legal_page(self, ebook: Ebook, page_width_px: int, page_height_px: int) -> bytes | None:
         """Generate legal/copyright page from theme and legal config.
@@ -0,0 +1,131 @@
+"""Full KDP cover composition (back + spine + front) on a single in-memory canvas.
+
+The PDF writer (KDPAssemblyProvider), the template validator and the cover
+preview all consume the ComposedCover built here, so the cover is laid out
+once and never round-tripped through PNG between stages.
+"""
+
+import logging
+from dataclasses import dataclass
+from io import BytesIO
+
+from PIL import Image
+
+from backoffice.features.ebook.shared.domain.entities.ebook import (
+    KDPExportConfig,
+    calculate_spine_width,
+    inches_to_px,
+)
+from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import (
+    color_utils,
+)
+
+logger = logging.getLogger(__name__)
+
+# Spine fill when no generated spine is provided (visual checks only)
+PLACEHOLDER_SPINE_COLOR = (240, 240, 240)
+
+
+@dataclass(frozen=True)
+class CoverLayout:
+    """Pixel geometry of a full KDP cover @ 300 DPI."""
+
+    panel_size: tuple[int, int]  # Back and front panels (trim + outer bleed)
+    spine_size: tuple[int, int]
+    spine_safe_width: int
+
+    @property
+    def spine_x(self) -> int:
+        return self.panel_size[0]
+
+    @property
+    def front_x(self) -> int:
+        return self.panel_size[0] + self.spine_size[0]
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return (2 * self.panel_size[0] + self.spine_size[0], self.panel_size[1])
+
+
+@dataclass
+class ComposedCover:
+    """Full cover canvas (RGB) with the layout used to build it."""
+
+    image: Image.Image
+    layout: CoverLayout
+
+    def to_png(self) -> bytes:
+        """Encode the canvas as PNG @ 300 DPI."""
+        buffer = BytesIO()
+        self.image.save(buffer, format="PNG", dpi=(300, 300))
+        return buffer.getvalue()
+
+
+def compute_cover_layout(kdp_config: KDPExportConfig, page_count: int) -> CoverLayout:
+    """Compute full cover geometry from the KDP config.
+
+    Args:
+        kdp_config: KDP export configuration (trim, margins, paper type)
+        page_count: Printed page count (including legal page) for spine width
+
+    Returns:
+        Cover layout in pixels
+    """
+    spine_width_inches, spine_safe_area_inches = calculate_spine_width(page_count, kdp_config.paper_type, kdp_config.gutter_margin_size)
+    height_px = inches_to_px(kdp_config.trim_size[1] + kdp_config.top_margin_size + kdp_config.bottom_margin_size)
+    return CoverLayout(
+        panel_size=(inches_to_px(kdp_config.trim_size[0] + kdp_config.side_margin_size), height_px),
+        spine_size=(inches_to_px(spine_width_inches), height_px),
+        spine_safe_width=inches_to_px(spine_safe_area_inches),
+    )
+
+
+def compose_full_cover(
+    back_img: Image.Image,
+    front_img: Image.Image,
+    layout: CoverLayout,
+    spine_img: Image.Image | None = None,
+) -> ComposedCover:
+    """Paste back, spine and front onto one RGB canvas.
+
+    Panels with the wrong size are resized (LANCZOS); the spine must match
+    the layout exactly since it is generated from the same geometry.
+
+    Args:
+        back_img: Back cover image
+        front_img: Front cover image
+        layout: Target cover layout
+        spine_img: Generated spine (placeholder fill if None)
+
+    Returns:
+        Composed full cover
+
+    Raises:
+        ValueError: If the spine does not match the layout
+    """
+    back_img = _fit_panel(color_utils.ensure_rgb(back_img), layout.panel_size, "Back cover")
+    front_img = _fit_panel(color_utils.ensure_rgb(front_img), layout.panel_size, "Front cover")
+
+    # RGB mode with white background (KDP requirement)
+    canvas = Image.new("RGB", layout.size, (255, 255, 255))
+    canvas.paste(back_img, (0, 0))
+
+    if spine_img is None:
+        canvas.paste(PLACEHOLDER_SPINE_COLOR, (layout.spine_x, 0, layout.front_x, layout.size[1]))
+    else:
+        spine_img = color_utils.ensure_rgb(spine_img)
+        if spine_img.size != layout.spine_size:
+            raise ValueError(f"Spine dimensions incorrect: {spine_img.size} != {layout.spine_size}")
+        canvas.paste(spine_img, (layout.spine_x, 0))
+
+    canvas.paste(front_img, (layout.front_x, 0))
+
+    logger.info(f"Full cover composed: {layout.size[0]}x{layout.size[1]}px (spine {layout.spine_size[0]}px)")
+    return ComposedCover(image=canvas, layout=layout)
+
+
+def _fit_panel(img: Image.Image, size: tuple[int, int], label: str) -> Image.Image:
+    if img.size != size:
+        logger.warning(f"{label} size mismatch: {img.size} != {size}, resizing...")
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
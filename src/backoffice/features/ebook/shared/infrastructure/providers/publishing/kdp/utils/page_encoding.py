@@ -0,0 +1,250 @@
+"""Print-optimized image encodings for KDP PDF assembly.
+
+Coloring pages are pure black line art: embedding them as 8-bit RGB wastes
+most of the PDF. Encoding profiles (config/kdp/specifications.yaml, section
+export.encoding) pick an encoding per content class:
+
+- line_art: thresholded to 1-bit, CCITT G4 (bilevel_g4) or Flate (bilevel_flate)
+- grayscale: 8-bit gray Flate (gray)
+- color / cover: 8-bit RGB Flate (rgb) or high-quality JPEG (jpeg)
+
+Kept free of project imports so worker processes stay cheap to start
+(encode_page runs inside a ProcessPoolExecutor).
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from io import BytesIO
+from typing import Any
+
+from PIL import Image, ImageChops, ImageStat, features
+
+# Formats img2pdf can embed as-is without re-encoding
+_PASSTHROUGH_FORMATS = ("PNG", "JPEG")
+
+# Content classification: sample size and tolerances
+_CLASSIFY_SAMPLE_PX = 512
+_COLOR_CHANNEL_DELTA = 32  # Max channel spread still considered gray
+_COLOR_PIXEL_RATIO = 0.01  # Share of colored pixels above which a page is color
+_MIDTONE_RANGE = (64, 192)  # Gray levels that are neither ink nor paper
+
+
+class PageEncoding(str, Enum):
+    """Image encoding used when embedding a page in the PDF."""
+
+    BILEVEL_G4 = "bilevel_g4"
+    BILEVEL_FLATE = "bilevel_flate"
+    GRAY = "gray"
+    RGB = "rgb"
+    JPEG = "jpeg"
+
+
+class ContentClass(str, Enum):
+    """Detected page content."""
+
+    LINE_ART = "line_art"
+    GRAYSCALE = "grayscale"
+    COLOR = "color"
+
+
+@dataclass(frozen=True)
+class EncodingProfile:
+    """Encoding choices per content class (one profile per YAML entry)."""
+
+    name: str
+    line_art: PageEncoding = PageEncoding.BILEVEL_G4
+    grayscale: PageEncoding = PageEncoding.GRAY
+    color: PageEncoding = PageEncoding.RGB
+    cover: PageEncoding = PageEncoding.RGB
+    threshold: int = 128
+    jpeg_quality: int = 95
+    line_art_tolerance: float = 0.05  # Max share of midtone pixels for line art
+
+    @classmethod
+    def from_config(cls, name: str, config: dict[str, Any]) -> "EncodingProfile":
+        """Build a profile from its specifications.yaml entry.
+
+        Raises:
+            ValueError: If an encoding name is unknown
+        """
+        return cls(
+            name=name,
+            line_art=PageEncoding(config.get("line_art", cls.line_art.value)),
+            grayscale=PageEncoding(config.get("grayscale", cls.grayscale.value)),
+            color=PageEncoding(config.get("color", cls.color.value)),
+            cover=PageEncoding(config.get("cover", cls.cover.value)),
+            threshold=int(config.get("threshold", cls.threshold)),
+            jpeg_quality=int(config.get("jpeg_quality", cls.jpeg_quality)),
+            line_art_tolerance=float(config.get("line_art_tolerance", cls.line_art_tolerance)),
+        )
+
+    def encoding_for(self, content_class: ContentClass) -> PageEncoding:
+        """Get the encoding for a content class."""
+        return {
+            ContentClass.LINE_ART: self.line_art,
+            ContentClass.GRAYSCALE: self.grayscale,
+            ContentClass.COLOR: self.color,
+        }[content_class]
+
+    @property
+    def is_lossless_rgb(self) -> bool:
+        """True if every interior page is embedded as RGB Flate (legacy behavior)."""
+        return self.line_art == self.grayscale == self.color == PageEncoding.RGB
+
+
+@dataclass(frozen=True)
+class EncodedPage:
+    """Result of encoding one page image."""
+
+    data: bytes
+    content_class: ContentClass | None  # None when embedded as-is (not classified)
+    encoding: PageEncoding
+    mean_abs_error: float  # 0-255, vs. the resized source
+
+
+@dataclass
+class PageEncodingStats:
+    """Size and fidelity of one embedded image."""
+
+    page_numbers: list[int]  # Interior pages using this image (1-based)
+    content_class: ContentClass | None
+    encoding: PageEncoding
+    source_bytes: int
+    encoded_bytes: int
+    mean_abs_error: float
+
+
+@dataclass
+class EncodingReport:
+    """Per-export size and fidelity report."""
+
+    profile: str
+    images: list[PageEncodingStats] = field(default_factory=list)
+    pdf_bytes: int = 0
+
+    @property
+    def source_bytes(self) -> int:
+        return sum(stats.source_bytes for stats in self.images)
+
+    @property
+    def encoded_bytes(self) -> int:
+        return sum(stats.encoded_bytes for stats in self.images)
+
+    @property
+    def max_error(self) -> float:
+        return max((stats.mean_abs_error for stats in self.images), default=0.0)
+
+    def summary(self) -> str:
+        """One-line summary for logs."""
+        counts: dict[str, int] = {}
+        for stats in self.images:
+            counts[stats.encoding.value] = counts.get(stats.encoding.value, 0) + 1
+        ratio = self.source_bytes / self.encoded_bytes if self.encoded_bytes else 1.0
+        encodings = ", ".join(f"{name}={count}" for name, count in sorted(counts.items()))
+        return (
+            f"profile={self.profile} images={len(self.images)} ({encodings}) "
+            f"source={self.source_bytes} encoded={self.encoded_bytes} ({ratio:.1f}x) "
+            f"pdf={self.pdf_bytes} max_mae={self.max_error:.2f}"
+        )
+
+
+def is_print_ready(image_bytes: bytes, size: tuple[int, int]) -> bool:
+    """Check whether a page image can be embedded without re-encoding.
+
+    Only reads the image header (PIL opens lazily), so this is cheap
+    enough to call in the event loop thread.
+
+    Args:
+        image_bytes: Encoded page image
+        size: Expected (width, height) in pixels
+
+    Returns:
+        True if the image already has the target size, RGB mode and an
+        embeddable format
+    """
+    with Image.open(BytesIO(image_bytes)) as img:
+        return img.size == size and img.mode == "RGB" and img.format in _PASSTHROUGH_FORMATS
+
+
+def classify_page(img: Image.Image, line_art_tolerance: float) -> ContentClass:
+    """Detect whether a page is line art, grayscale or color.
+
+    Works on a nearest-neighbour sample so anti-aliased edges are not
+    smeared into midtones.
+    """
+    sample = img.convert("RGB").resize((_CLASSIFY_SAMPLE_PX, _CLASSIFY_SAMPLE_PX), Image.Resampling.NEAREST)
+    total = _CLASSIFY_SAMPLE_PX * _CLASSIFY_SAMPLE_PX
+
+    red, green, blue = sample.split()
+    spread = ImageChops.lighter(ImageChops.difference(red, green), ImageChops.difference(green, blue))
+    colored = sum(spread.histogram()[_COLOR_CHANNEL_DELTA:])
+    if colored / total > _COLOR_PIXEL_RATIO:
+        return ContentClass.COLOR
+
+    histogram = sample.convert("L").histogram()
+    midtones = sum(histogram[_MIDTONE_RANGE[0] : _MIDTONE_RANGE[1]])
+    if midtones / total <= line_art_tolerance:
+        return ContentClass.LINE_ART
+    return ContentClass.GRAYSCALE
+
+
+def encode_image(img: Image.Image, encoding: PageEncoding, threshold: int = 128, jpeg_quality: int = 95) -> tuple[bytes, PageEncoding, float]:
+    """Encode an image for embedding by img2pdf.
+
+    Args:
+        img: Image at its final size
+        encoding: Target encoding
+        threshold: Gray level below which pixels become ink (bilevel only)
+        jpeg_quality: JPEG quality (jpeg only)
+
+    Returns:
+        (encoded bytes, encoding actually used, mean absolute error vs. img on a 0-255 scale)
+    """
+    if encoding == PageEncoding.BILEVEL_G4 and not features.check("libtiff"):
+        encoding = PageEncoding.BILEVEL_FLATE  # Pillow built without libtiff
+
+    buffer = BytesIO()
+    reference = img.convert("L") if encoding in (PageEncoding.BILEVEL_G4, PageEncoding.BILEVEL_FLATE, PageEncoding.GRAY) else img.convert("RGB")
+
+    if encoding in (PageEncoding.BILEVEL_G4, PageEncoding.BILEVEL_FLATE):
+        encoded = reference.point(lambda p: 255 if p >= threshold else 0, mode="1")
+        if encoding == PageEncoding.BILEVEL_G4:
+            encoded.save(buffer, format="TIFF", compression="group4", dpi=(300, 300))
+        else:
+            encoded.save(buffer, format="PNG", optimize=True, dpi=(300, 300))
+        decoded = encoded.convert("L")
+    elif encoding == PageEncoding.JPEG:
+        reference.save(buffer, format="JPEG", quality=jpeg_quality, subsampling=0, dpi=(300, 300))
+        decoded = Image.open(BytesIO(buffer.getvalue())).convert("RGB")
+    else:
+        # Lossless Flate (gray or rgb)
+        reference.save(buffer, format="PNG", dpi=(300, 300))
+        return buffer.getvalue(), encoding, 0.0
+
+    error = sum(ImageStat.Stat(ImageChops.difference(reference, decoded)).mean) / len(reference.getbands())
+    return buffer.getvalue(), encoding, error
+
+
+def encode_page(image_bytes: bytes, size: tuple[int, int], profile: EncodingProfile, line_art_hint: bool = False) -> EncodedPage:
+    """Resize a page to the target size and encode it according to a profile.
+
+    Args:
+        image_bytes: Encoded page image
+        size: Target (width, height) in pixels
+        profile: Encoding profile
+        line_art_hint: Page is known to be black & white (skips classification)
+
+    Returns:
+        Encoded page ready for img2pdf
+    """
+    img = Image.open(BytesIO(image_bytes))
+
+    if img.size != size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
+    content_class = ContentClass.LINE_ART if line_art_hint else classify_page(img, profile.line_art_tolerance)
+    data, encoding, error = encode_image(img, profile.encoding_for(content_class), profile.threshold, profile.jpeg_quality)
+    return EncodedPage(data=data, content_class=content_class, encoding=encoding, mean_abs_error=error)
@@ -9,8 +9,8 @@ from PIL import Image, ImageDraw, ImageFont
 from PIL.Image import Image as PILImage
 from PIL.ImageFont import FreeTypeFont
 
+from backoffice.config import get_config_loader
 from backoffice.features.ebook.shared.domain.entities.ebook import (
-    MIN_SPINE_MARGIN,
     can_have_spine_text,
     inches_to_px,
 )
@@ -138,7 +138,7 @@ def create_spine_with_text(width: int, height: int, spine_colors: list, title: s
     y = (width - text_height) // 2
 
     # ✅ Validate margins (0.0625" top/bottom)
-    min_margin_px = inches_to_px(MIN_SPINE_MARGIN)
+    min_margin_px = inches_to_px(get_config_loader().get_spine_min_width())  # Min spine margin = min width
     if y < min_margin_px:
         logger.error(f"Texte spine trop proche du bord haut: y={y}, min={min_margin_px}")
         raise ValueError("Texte spine trop proche du bord haut")
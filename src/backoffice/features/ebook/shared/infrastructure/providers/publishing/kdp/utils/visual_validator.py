@@ -5,6 +5,7 @@ against official Amazon KDP templates by overlaying the template.
 """
 
 import logging
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import cast
@@ -12,13 +13,9 @@ from typing import cast
 from PIL import Image, ImageDraw, ImageFont
 from PIL.ImageFont import FreeTypeFont
 
-from backoffice.features.ebook.shared.domain.entities.ebook import (
-    KDPExportConfig,
-    calculate_spine_width,
-    inches_to_px,
-)
+from backoffice.features.ebook.shared.domain.entities.ebook import KDPExportConfig
 from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import (
-    barcode_utils,
+    cover_composer,
 )
 
 logger = logging.getLogger(__name__)
@@ -31,6 +28,21 @@ _PROJECT_ROOT = _CURRENT_FILE.parent.parent.parent.parent.parent.parent.parent.p
 KDP_TEMPLATE_PATH = _PROJECT_ROOT / "config" / "kdp" / "PAPERBACK_8.500x8.500_24_STANDARD_WHITE_fr_FR.png"
 
 
+def _open_cover(full_cover: bytes | Image.Image) -> Image.Image:
+    """Accept an in-memory canvas (no decode) or encoded image bytes."""
+    return full_cover if isinstance(full_cover, Image.Image) else Image.open(BytesIO(full_cover))
+
+
+@lru_cache(maxsize=1)
+def _load_template_300dpi() -> Image.Image:
+    """Load the 600 DPI KDP template once, resized to 300 DPI (RGBA)."""
+    template_full = Image.open(KDP_TEMPLATE_PATH).convert("RGBA")
+    template_w, template_h = template_full.size
+    template_300 = template_full.resize((template_w // 2, template_h // 2), Image.Resampling.LANCZOS)
+    logger.info(f"✂️ Template resized: {template_w}×{template_h}px @ 600 DPI → {template_300.size[0]}×{template_300.size[1]}px @ 300 DPI")
+    return template_300
+
+
 def assemble_full_kdp_cover(
     back_cover_bytes: bytes,
     front_cover_bytes: bytes,
@@ -38,7 +50,9 @@ def assemble_full_kdp_cover(
 ) -> bytes:
     """Assemble a complete KDP cover (back + spine + front) from individual covers.
 
-    Follows exact KDP specifications for 8.5"×8.5" paperback with bleeds.
+    Uses the same composition engine as KDPAssemblyProvider, with a
+    placeholder spine. Covers with the wrong size are resized to the
+    panel size (trim + outer bleed).
 
     Args:
         back_cover_bytes: Back cover image bytes (8.5"×8.5" @ 300 DPI)
@@ -46,93 +60,23 @@ def assemble_full_kdp_cover(
         page_count: Number of pages for spine width calculation (default: 24)
 
     Returns:
-        Full KDP cover image bytes @ 300 DPI with bleeds
-        Dimensions: 17.304" × 8.75" @ 300 DPI = 5191×2625px
-
-    Raises:
-        ValueError: If image dimensions don't match requirements
+        Full KDP cover PNG bytes @ 300 DPI with bleeds
     """
-    config = KDPExportConfig()
-
-    # Load covers
-    back = Image.open(BytesIO(back_cover_bytes)).convert("RGB")
-    front = Image.open(BytesIO(front_cover_bytes)).convert("RGB")
-
-    # Verify dimensions (should be 2550×2550px @ 300 DPI for 8.5"×8.5")
-    expected_size = (2550, 2550)
-    if back.size != expected_size:
-        raise ValueError(f"Back cover must be {expected_size}, got {back.size}")
-    if front.size != expected_size:
-        raise ValueError(f"Front cover must be {expected_size}, got {front.size}")
-
-    # Calculate spine width in inches
-    spine_width_inches = calculate_spine_width(page_count, config.paper_type, config.gutter_margin_size)[0]
-    spine_width_px = inches_to_px(spine_width_inches)
-
-    # Calculate full cover dimensions @ 300 DPI
-    bleed_px = inches_to_px(config.bleed_size)  # 0.125" = 38px
-
-    # ✅ KDP full cover structure (matches cover_assembly_provider.py):
-    # [LEFT_BLEED][BACK_TRIM][SPINE][FRONT_TRIM][RIGHT_BLEED]
-    # Total: 38 + 2550 + spine + 2550 + 38 = 5192px + spine
-    full_width = bleed_px + back.width + spine_width_px + front.width + bleed_px
-    full_height = bleed_px + back.height + bleed_px
-
-    logger.info(f'Assembling full KDP cover: {full_width}×{full_height}px ({full_width / 300:.3f}" × {full_height / 300:.3f}" @ 300 DPI) with {spine_width_px}px spine for {page_count} pages')
-
-    # Create blank canvas with bleeds
-    canvas = Image.new("RGB", (full_width, full_height), color=(255, 255, 255))
-
-    # ✅ Add barcode space to back cover for KDP validation preview
-    # Note: Back cover from DB is raw (no barcode). We add it here to simulate
-    # the final KDP export and validate positioning against the KDP template.
-    logger.info("Adding KDP barcode space to back cover for validation preview...")
-    back_buffer = BytesIO()
-    back.save(back_buffer, format="PNG")
-    back_with_barcode = barcode_utils.add_barcode_space(
-        back_buffer.getvalue(),
-        barcode_width_inches=config.barcode_width,
-        barcode_height_inches=config.barcode_height,
-        barcode_margin_inches=config.barcode_margin,
-        image_includes_bleeds=False,  # Back cover is 2550×2550 (no bleeds yet)
-        bleed_size_inches=config.bleed_size,
-        has_right_bleed=False,  # NO right bleed - spine comes after
-    )
-    back = Image.open(BytesIO(back_with_barcode)).convert("RGB")
-
-    # ✅ Paste back cover at (bleed_px, bleed_px) - creates left bleed
-    canvas.paste(back, (bleed_px, bleed_px))
-
-    # ✅ Spine position: immediately after back trim (NO gap, NO extra bleed)
-    # Position: left_bleed + back_width = 38 + 2550 = 2588px
-    spine_x = bleed_px + back.width
-    # Draw spine color (use back cover's dominant color or white)
-    spine_region = (spine_x, bleed_px, spine_x + spine_width_px, bleed_px + back.height)
-    draw = ImageDraw.Draw(canvas)
-    draw.rectangle(spine_region, fill=(240, 240, 240))  # Light gray for spine
-
-    # ✅ Paste front cover: immediately after spine (NO gap, NO extra bleed)
-    # Position: spine_x + spine_width = 2588 + 16 = 2604px
-    front_x = spine_x + spine_width_px
-    canvas.paste(front, (front_x, bleed_px))
-
-    # Convert to bytes
-    buffer = BytesIO()
-    canvas.save(buffer, format="PNG")
-
-    logger.info(f"✅ Full cover assembled: {full_width}×{full_height}px")
-    return buffer.getvalue()
+    layout = cover_composer.compute_cover_layout(KDPExportConfig(), page_count)
+    back = Image.open(BytesIO(back_cover_bytes))
+    front = Image.open(BytesIO(front_cover_bytes))
+    return cover_composer.compose_full_cover(back, front, layout).to_png()
 
 
 def overlay_kdp_template(
-    full_cover_bytes: bytes,
+    full_cover: bytes | Image.Image,
     template_opacity: float = 0.3,
     show_measurements: bool = True,
 ) -> bytes:
     """Overlay official KDP template on full cover for visual validation.
 
     Args:
-        full_cover_bytes: Full KDP cover image bytes (back+spine+front @ 300 DPI)
+        full_cover: Full KDP cover canvas or image bytes (back+spine+front @ 300 DPI)
         template_opacity: Opacity of template overlay (0.0-1.0, default: 0.3)
         show_measurements: Add measurement annotations (default: True)
 
@@ -149,15 +93,11 @@ def overlay_kdp_template(
 
     try:
         # Load full cover @ 300 DPI
-        cover_img = Image.open(BytesIO(full_cover_bytes)).convert("RGBA")
+        cover_img = _open_cover(full_cover).convert("RGBA")
         w, h = cover_img.size
 
-        # Load KDP template @ 600 DPI (10383×5250px)
-        template_full = Image.open(KDP_TEMPLATE_PATH).convert("RGBA")
-        template_w, template_h = template_full.size
-
-        # Resize template from 600 DPI to 300 DPI (÷2)
-        template_300 = template_full.resize((template_w // 2, template_h // 2), Image.Resampling.LANCZOS)
+        # KDP template @ 600 DPI (10383×5250px) resized to 300 DPI (÷2), cached
+        template_300 = _load_template_300dpi()
 
         # Verify dimensions match after resize
         if cover_img.size != template_300.size:
@@ -166,8 +106,8 @@ def overlay_kdp_template(
             logger.warning(f"⚠️ Size mismatch after resize: Cover={cover_size}, Template={template_size}")
             # Resize template to exactly match cover
             template_300 = template_300.resize(cover_img.size, Image.Resampling.LANCZOS)
-
-        logger.info(f"✂️ Template resized: {template_w}×{template_h}px @ 600 DPI → {template_300.size[0]}×{template_300.size[1]}px @ 300 DPI")
+        else:
+            template_300 = template_300.copy()  # Keep the cached template untouched
 
         # Adjust template opacity
         alpha = template_300.split()[3]
@@ -243,12 +183,12 @@ def _add_measurement_annotations(img: Image.Image) -> Image.Image:
 
 
 def validate_full_cover_against_template(
-    full_cover_bytes: bytes,
+    full_cover: bytes | Image.Image,
 ) -> dict[str, bool | str | tuple[int, int]]:
     """Validate a full KDP cover against template dimensions.
 
     Args:
-        full_cover_bytes: Full cover image bytes (back+spine+front)
+        full_cover: Full cover canvas or image bytes (back+spine+front)
 
     Returns:
         Validation results with boolean checks and messages
@@ -261,7 +201,7 @@ def validate_full_cover_against_template(
 
     try:
         # Load images
-        cover_img = Image.open(BytesIO(full_cover_bytes))
+        cover_img = _open_cover(full_cover)
         template_img = Image.open(KDP_TEMPLATE_PATH)
 
         cover_size = cover_img.size
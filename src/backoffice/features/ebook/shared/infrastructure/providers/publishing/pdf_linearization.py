@@ -0,0 +1,65 @@
+"""PDF linearization (fast web view) for in-browser previews.
+
+A linearized PDF starts with the hint tables and every object needed for
+page 1, so a viewer fetching the file with HTTP Range requests can render
+the first page after a small fraction of the file has arrived.
+"""
+
+import logging
+from io import BytesIO
+from pathlib import Path
+
+import pikepdf
+
+from backoffice.features.shared.infrastructure.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+
+def save_pdf(pdf: pikepdf.Pdf, linearize: bool) -> bytes:
+    """Serialize an open PDF, optionally linearized.
+
+    Args:
+        pdf: Open pikepdf document
+        linearize: Write hint tables and page 1 objects first
+
+    Returns:
+        PDF bytes
+    """
+    buffer = BytesIO()
+    pdf.save(buffer, linearize=linearize)
+    return buffer.getvalue()
+
+
+@traced("assembly.linearize_pdf")
+def linearize_pdf(pdf_bytes: bytes) -> bytes:
+    """Rewrite PDF bytes as a linearized PDF.
+
+    Args:
+        pdf_bytes: Any valid PDF
+
+    Returns:
+        Linearized PDF bytes (same content)
+    """
+    with pikepdf.open(BytesIO(pdf_bytes)) as pdf:
+        linearized = save_pdf(pdf, linearize=True)
+    logger.info(f"📊 PDF linearized: {len(pdf_bytes)} → {len(linearized)} bytes")
+    return linearized
+
+
+@traced("assembly.linearize_pdf_file")
+def linearize_pdf_file(path: str | Path) -> None:
+    """Linearize a PDF file in place.
+
+    Args:
+        path: Path of the PDF to rewrite
+    """
+    with pikepdf.open(path, allow_overwriting_input=True) as pdf:
+        pdf.save(path, linearize=True)
+    logger.info(f"📊 PDF linearized in place: {path}")
+
+
+def is_linearized(pdf_bytes: bytes) -> bool:
+    """Check whether a PDF is linearized (fast web view)."""
+    with pikepdf.open(BytesIO(pdf_bytes)) as pdf:
+        return bool(pdf.is_linearized)
@@ -1,12 +1,15 @@
 """WeasyPrint provider for PDF assembly."""
 
 import logging
+import time
 from pathlib import Path
 
-from weasyprint import HTML
-
+from backoffice.config.loader import get_config_loader
 from backoffice.features.ebook.shared.domain.errors.error_taxonomy import DomainError, ErrorCode
 from backoffice.features.ebook.shared.domain.ports.assembly_port import AssembledPage, AssemblyPort
+from backoffice.features.ebook.shared.infrastructure.providers.publishing import pdf_linearization
+from backoffice.features.shared.infrastructure.metrics import BYTES_PRODUCED, PDF_ASSEMBLY_DURATION
+from backoffice.features.shared.infrastructure.tracing import get_tracer, traced
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +21,21 @@ class WeasyPrintAssemblyProvider(AssemblyPort):
     - Simple HTML template with cover + content pages
     - Full-bleed images (no borders)
     - No TOC or page numbering
+
+    Output is linearized (fast web view) when export.linearize is enabled in
+    config/kdp/specifications.yaml, so the dashboard preview renders page 1
+    before the whole PDF is downloaded.
     """
 
+    def __init__(self, linearize: bool | None = None):
+        """Initialize provider.
+
+        Args:
+            linearize: Linearize output PDFs (defaults to export.linearize config)
+        """
+        self.linearize = get_config_loader().get_linearize_pdf() if linearize is None else linearize
+
+    @traced("assembly.weasyprint.assemble_pdf")
     async def assemble_pdf(
         self,
         cover: AssembledPage,
@@ -39,15 +55,22 @@ class WeasyPrintAssemblyProvider(AssemblyPort):
         Raises:
             DomainError: If assembly fails
         """
+        start = time.perf_counter()
         try:
             logger.info(f"Assembling PDF: covers + {len(pages)} pages")
 
             # Build HTML with embedded images
-            html_content = self._build_html(cover, pages)
+            with get_tracer().span("assembly.weasyprint.build_html", pages=len(pages)):
+                html_content = self._build_html(cover, pages)
+
+            # Generate PDF using WeasyPrint (deferred import: loads pango/cairo)
+            from weasyprint import HTML
 
-            # Generate PDF using WeasyPrint
             logger.info(f"Rendering PDF to: {output_path}")
-            HTML(string=html_content).write_pdf(output_path)
+            with get_tracer().span("assembly.weasyprint.write_pdf"):
+                HTML(string=html_content).write_pdf(output_path)
+            if self.linearize and Path(output_path).exists():
+                pdf_linearization.linearize_pdf_file(output_path)
 
             # Verify output
             output_file = Path(output_path)
@@ -60,6 +83,8 @@ class WeasyPrintAssemblyProvider(AssemblyPort):
                 )
 
             file_size = output_file.stat().st_size
+            PDF_ASSEMBLY_DURATION.observe(time.perf_counter() - start)
+            BYTES_PRODUCED.inc(file_size, artifact="pdf")
             logger.info(f"✅ PDF assembled: {output_path} ({file_size} bytes)")
 
             return f"file://{output_path}"
@@ -4,8 +4,12 @@ from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookS
 from backoffice.features.ebook.shared.domain.entities.pagination import PaginatedResult, PaginationParams
 from backoffice.features.ebook.shared.domain.ports.ebook_query_port import EbookQueryPort
 from backoffice.features.ebook.shared.infrastructure.models.ebook_model import EbookModel
+from backoffice.features.shared.infrastructure.metrics import DB_QUERY_DURATION, timed_methods
+from backoffice.features.shared.infrastructure.tracing import traced_methods
 
 
+@timed_methods(DB_QUERY_DURATION, "repository", "method")
+@traced_methods("db.ebook_query")
 class SqlAlchemyEbookQuery(EbookQueryPort):
     """SQLAlchemy implementation of ebook query operations"""
 
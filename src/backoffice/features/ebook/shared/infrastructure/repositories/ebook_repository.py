@@ -1,14 +1,20 @@
+import hashlib
 from datetime import UTC, datetime
 
 from sqlalchemy.orm import Session
 
-from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookPageInfo, EbookPdfInfo, EbookStatus
 from backoffice.features.ebook.shared.domain.entities.pagination import PaginatedResult, PaginationParams
 from backoffice.features.ebook.shared.domain.ports.ebook_port import EbookPort
 from backoffice.features.ebook.shared.domain.ports.ebook_query_port import EbookQueryPort
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import page_meta_image_key
 from backoffice.features.ebook.shared.infrastructure.models.ebook_model import EbookModel
+from backoffice.features.shared.infrastructure.metrics import DB_QUERY_DURATION, timed_methods
+from backoffice.features.shared.infrastructure.tracing import traced_methods
 
 
+@timed_methods(DB_QUERY_DURATION, "repository", "method")
+@traced_methods("db.ebook_repository")
 class SqlAlchemyEbookRepository(EbookPort):
     def __init__(self, db: Session, query_port: EbookQueryPort | None = None):
         self.db = db
@@ -56,7 +62,7 @@ class SqlAlchemyEbookRepository(EbookPort):
             theme_id=ebook.theme_id,
             theme_version=ebook.theme_version,
             audience=ebook.audience,
-            structure_json=ebook.structure_json,
+            structure_json=_with_page_image_keys(ebook.structure_json),
             page_count=ebook.page_count,
         )
         self.db.add(db_ebook)
@@ -78,7 +84,7 @@ class SqlAlchemyEbookRepository(EbookPort):
         db_ebook.theme_id = ebook.theme_id
         db_ebook.theme_version = ebook.theme_version
         db_ebook.audience = ebook.audience
-        db_ebook.structure_json = ebook.structure_json
+        db_ebook.structure_json = _with_page_image_keys(ebook.structure_json)
         db_ebook.page_count = ebook.page_count
 
         self.db.commit()
@@ -94,8 +100,58 @@ class SqlAlchemyEbookRepository(EbookPort):
 
     async def get_ebook_bytes(self, ebook_id: int) -> bytes | None:
         """Récupère les bytes du PDF d'un ebook."""
-        db_ebook = self.db.query(EbookModel).filter(EbookModel.id == ebook_id).first()
-        return db_ebook.ebook_bytes if db_ebook else None
+        row = self.db.query(EbookModel.ebook_bytes).filter(EbookModel.id == ebook_id).first()
+        return row.ebook_bytes if row else None
+
+    async def get_ebook_pdf_info(self, ebook_id: int) -> EbookPdfInfo | None:
+        """Récupère titre et hash du PDF sans charger les pages ni le PDF."""
+        row = self.db.query(EbookModel.title, EbookModel.ebook_bytes_sha256, EbookModel.pdf_dirty_at).filter(EbookModel.id == ebook_id).first()
+        if not row:
+            return None
+
+        content_hash = row.ebook_bytes_sha256
+        if content_hash is None:
+            # PDF stored before hashes were recorded: hash it once and persist
+            pdf_bytes = await self.get_ebook_bytes(ebook_id)
+            if pdf_bytes:
+                content_hash = hashlib.sha256(pdf_bytes).hexdigest()
+                self.db.query(EbookModel).filter(EbookModel.id == ebook_id).update({EbookModel.ebook_bytes_sha256: content_hash})
+                self.db.commit()
+
+        return EbookPdfInfo(ebook_id=ebook_id, title=str(row.title), content_hash=content_hash, pdf_dirty_at=row.pdf_dirty_at)
+
+    async def get_page_info(self, ebook_id: int, page_index: int) -> EbookPageInfo | None:
+        """Récupère clé d'image, titre et prompt d'une page sans lire les images."""
+        if page_index < 0:
+            return None
+
+        def page_field(index: int, name: str):
+            return EbookModel.structure_json[("pages_meta", index, name)].as_string()
+
+        row = (
+            self.db.query(
+                page_field(page_index, "image_key").label("image_key"),
+                page_field(page_index, "title").label("title"),
+                page_field(page_index, "prompt").label("prompt"),
+                page_field(page_index + 1, "image_key").label("next_image_key"),
+            )
+            .filter(EbookModel.id == ebook_id)
+            .first()
+        )
+        if not row:
+            return None
+        if row.image_key is None:
+            # Page absente, ou pages enregistrées avant les clés d'image : chargement complet
+            return await super().get_page_info(ebook_id, page_index)
+
+        return EbookPageInfo(
+            ebook_id=ebook_id,
+            page_index=page_index,
+            image_key=row.image_key,
+            title=row.title,
+            prompt=row.prompt,
+            is_back_cover=row.next_image_key is None,  # Toutes les pages ont une clé
+        )
 
     async def save_ebook_bytes(self, ebook_id: int, ebook_bytes: bytes) -> None:
         """Sauvegarde les bytes du PDF d'un ebook."""
@@ -104,6 +160,20 @@ class SqlAlchemyEbookRepository(EbookPort):
             raise ValueError(f"Ebook with id {ebook_id} not found")
 
         db_ebook.ebook_bytes = ebook_bytes
+        db_ebook.ebook_bytes_sha256 = hashlib.sha256(ebook_bytes).hexdigest() if ebook_bytes else None
+        self.db.commit()
+
+    async def mark_pdf_dirty(self, ebook_id: int) -> datetime:
+        """Marque le PDF comme obsolète (sans charger l'ebook)."""
+        dirty_at = datetime.now(UTC).replace(tzinfo=None)  # UTC naïf, comme la colonne DateTime()
+        self.db.query(EbookModel).filter(EbookModel.id == ebook_id).update({EbookModel.pdf_dirty_at: dirty_at})
+        self.db.commit()
+        return dirty_at
+
+    async def mark_pdf_rebuilt(self, ebook_id: int, dirty_at: datetime, preview_url: str | None, drive_id: str | None) -> None:
+        """Enregistre l'emplacement du PDF reconstruit ; lève le marqueur s'il n'a pas changé."""
+        self.db.query(EbookModel).filter(EbookModel.id == ebook_id).update({EbookModel.preview_url: preview_url, EbookModel.drive_id: drive_id})
+        self.db.query(EbookModel).filter(EbookModel.id == ebook_id, EbookModel.pdf_dirty_at <= dirty_at).update({EbookModel.pdf_dirty_at: None})
         self.db.commit()
 
     def _to_domain(self, db_ebook: EbookModel) -> Ebook:
@@ -121,3 +191,15 @@ class SqlAlchemyEbookRepository(EbookPort):
             structure_json=db_ebook.structure_json,
             page_count=db_ebook.page_count,
         )
+
+
+def _with_page_image_keys(structure_json: dict | None) -> dict | None:
+    """Ajoute à chaque page la clé de son image, lue par get_page_info sans décoder les images.
+
+    Les use cases remplacent une page modifiée par un nouveau dict : seules les
+    pages sans clé (nouvelles ou modifiées) sont hachées.
+    """
+    if not structure_json or "pages_meta" not in structure_json:
+        return structure_json
+    pages_meta = [page if "image_key" in page else {**page, "image_key": page_meta_image_key(page)} for page in structure_json["pages_meta"]]
+    return {**structure_json, "pages_meta": pages_meta}
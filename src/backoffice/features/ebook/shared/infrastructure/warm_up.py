@@ -0,0 +1,214 @@
+"""Startup warm-up of the expensive caches (run from the FastAPI lifespan).
+
+Each component builds one cache that the first request would otherwise pay
+for: model registry, compiled themes, provider instances, Comfy workflow JSON,
+the SDXL pipeline, cover fonts and the KDP template PNG.
+
+Configuration (environment):
+- WARMUP_COMPONENTS: comma-separated components to run ("all" by default,
+  "none" to disable warm-up)
+- WARMUP_SKIP: comma-separated components to leave out
+- WARMUP_BLOCKING: "false" to serve requests while warming up (/readyz
+  answers 503 until done)
+
+A failing component is logged and reported but does not block readiness: the
+cache is simply built on first use, as without warm-up.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_model_registry() -> str | None:
+    from backoffice.features.ebook.shared.domain.policies.model_registry import ModelRegistry
+
+    registry = ModelRegistry.get_instance()
+    return f"cover={registry.get_cover_model().provider}, page={registry.get_page_model().provider}"
+
+
+def _warm_themes() -> str | None:
+    from backoffice.features.ebook.shared.domain.theme.theme_registry import get_theme_registry
+
+    return f"{len(get_theme_registry().list_themes())} themes"
+
+
+def _warm_providers() -> str | None:
+    from backoffice.features.ebook.shared.infrastructure.providers.provider_factory import ProviderFactory
+
+    factories: dict[str, Callable[[], object]] = {
+        "cover": ProviderFactory.create_cover_provider,
+        "page": ProviderFactory.create_content_page_provider,
+        "edit": ProviderFactory.create_image_edit_provider,
+        "assembly": ProviderFactory.create_assembly_provider,
+    }
+    errors = []
+    for name, create in factories.items():
+        try:
+            create()
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+    if errors:
+        raise RuntimeError("; ".join(errors))
+    return ", ".join(factories)
+
+
+def _configured_providers() -> set[str]:
+    from backoffice.features.ebook.shared.domain.policies.model_registry import ModelRegistry
+
+    registry = ModelRegistry.get_instance()
+    return {registry.get_cover_model().provider, registry.get_page_model().provider, registry.get_page_model(edit=True).provider}
+
+
+def _warm_comfy_workflows() -> str | None:
+    if "comfy" not in _configured_providers():
+        return None
+
+    from backoffice.features.ebook.shared.infrastructure.providers.images.comfy import comfy_provider
+
+    return f"{comfy_provider.preload_workflows()} workflows"
+
+
+def _warm_sdxl() -> str | None:
+    if "diffusers" not in _configured_providers():
+        return None
+
+    from backoffice.features.ebook.shared.domain.policies.model_registry import ModelRegistry
+    from backoffice.features.ebook.shared.infrastructure.providers.provider_factory import ProviderFactory
+
+    registry = ModelRegistry.get_instance()
+    loaded = []
+    for mapping, create in (
+        (registry.get_cover_model(), ProviderFactory.create_cover_provider),
+        (registry.get_page_model(), ProviderFactory.create_content_page_provider),
+    ):
+        if mapping.provider == "diffusers":
+            create().warm_up()  # type: ignore[attr-defined]
+            loaded.append(mapping.model)
+    return ", ".join(loaded) or None
+
+
+def _warm_fonts() -> str | None:
+    from backoffice.features.ebook.shared.domain.services.cover_compositor import CoverCompositor
+
+    return f"{CoverCompositor.preload_fonts()} fonts"
+
+
+def _warm_kdp_template() -> str | None:
+    from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import visual_validator
+
+    template = visual_validator._load_template_300dpi()
+    return f"{template.size[0]}x{template.size[1]}px"
+
+
+# Component name -> warm-up function (returns a detail, or None if not applicable)
+WARM_UP_COMPONENTS: dict[str, Callable[[], str | None]] = {
+    "model_registry": _warm_model_registry,
+    "themes": _warm_themes,
+    "providers": _warm_providers,
+    "comfy_workflows": _warm_comfy_workflows,
+    "sdxl": _warm_sdxl,
+    "fonts": _warm_fonts,
+    "kdp_template": _warm_kdp_template,
+}
+
+
+@dataclass
+class ComponentWarmUp:
+    """Outcome of one warm-up component."""
+
+    name: str
+    status: str  # "ok", "skipped" or "failed"
+    duration_ms: float
+    detail: str = ""
+
+
+@dataclass
+class WarmUpState:
+    """Progress of the startup warm-up (backs /readyz)."""
+
+    finished: bool = False
+    started_at: datetime | None = None
+    duration_ms: float = 0.0
+    components: list[ComponentWarmUp] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "finished": self.finished,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "duration_ms": round(self.duration_ms, 1),
+            "components": {c.name: {"status": c.status, "duration_ms": round(c.duration_ms, 1), "detail": c.detail} for c in self.components},
+        }
+
+
+_state = WarmUpState()
+
+
+def get_warm_up_state() -> WarmUpState:
+    """Get the warm-up state of this process."""
+    return _state
+
+
+def enabled_components() -> list[str]:
+    """Components to warm up, from WARMUP_COMPONENTS / WARMUP_SKIP.
+
+    Raises:
+        ValueError: If an unknown component is configured
+    """
+    requested = os.getenv("WARMUP_COMPONENTS", "all").strip().lower()
+    skipped = {name.strip() for name in os.getenv("WARMUP_SKIP", "").lower().split(",") if name.strip()}
+    if requested in ("", "none"):
+        return []
+    names = list(WARM_UP_COMPONENTS) if requested == "all" else [name.strip() for name in requested.split(",") if name.strip()]
+
+    unknown = (set(names) | skipped) - set(WARM_UP_COMPONENTS)
+    if unknown:
+        raise ValueError(f"Unknown warm-up components: {sorted(unknown)}. Supported: {', '.join(WARM_UP_COMPONENTS)}")
+    return [name for name in names if name not in skipped]
+
+
+def is_blocking() -> bool:
+    """Whether startup waits for the warm-up (WARMUP_BLOCKING, default true)."""
+    return os.getenv("WARMUP_BLOCKING", "true").lower() != "false"
+
+
+async def run_warm_up(components: list[str] | None = None) -> WarmUpState:
+    """Run the warm-up components one after the other, off the event loop.
+
+    Args:
+        components: Components to run (enabled_components() if None)
+
+    Returns:
+        Final warm-up state (also available via get_warm_up_state())
+    """
+    global _state
+    names = enabled_components() if components is None else components
+    state = WarmUpState(started_at=datetime.now(UTC))
+    _state = state
+
+    start = time.perf_counter()
+    for name in names:
+        component_start = time.perf_counter()
+        try:
+            detail = await asyncio.to_thread(WARM_UP_COMPONENTS[name])
+            status = "ok" if detail is not None else "skipped"
+        except Exception as e:
+            detail, status = str(e), "failed"
+        duration_ms = (time.perf_counter() - component_start) * 1000
+        state.components.append(ComponentWarmUp(name=name, status=status, duration_ms=duration_ms, detail=detail or "not configured"))
+
+        if status == "failed":
+            logger.warning(f"⚠️ Warm-up {name} failed after {duration_ms:.0f}ms (built on first use): {detail}")
+        else:
+            logger.info(f"🔥 Warm-up {name}: {status} in {duration_ms:.0f}ms ({detail or 'not configured'})")
+
+    state.duration_ms = (time.perf_counter() - start) * 1000
+    state.finished = True
+    logger.info(f"✅ Warm-up finished in {state.duration_ms:.0f}ms ({len(names)} components)")
+    return state
@@ -0,0 +1,82 @@
+"""Tests for PdfRebuildScheduler."""
+
+import asyncio
+
+from backoffice.features.ebook.shared.domain.services.pdf_rebuild_scheduler import PdfRebuildScheduler
+
+
+class RecordingRebuild:
+    def __init__(self, fail: bool = False):
+        self.calls: list[int] = []
+        self.fail = fail
+
+    async def __call__(self, ebook_id: int) -> None:
+        self.calls.append(ebook_id)
+        if self.fail:
+            raise RuntimeError("assembly failed")
+
+
+async def test_burst_of_edits_triggers_a_single_rebuild():
+    """Each schedule() restarts the timer: only the last one fires."""
+    rebuild = RecordingRebuild()
+    scheduler = PdfRebuildScheduler(rebuild, debounce_seconds=0.05)
+
+    for _ in range(5):
+        scheduler.schedule(1)
+        await asyncio.sleep(0.01)
+    scheduler.schedule(2)
+    assert rebuild.calls == []
+
+    await asyncio.sleep(0.15)
+
+    assert sorted(rebuild.calls) == [1, 2]
+    assert not scheduler.is_pending(1)
+
+
+async def test_flush_rebuilds_immediately_and_cancels_timer():
+    rebuild = RecordingRebuild()
+    scheduler = PdfRebuildScheduler(rebuild, debounce_seconds=0.05)
+    scheduler.schedule(1)
+
+    await scheduler.flush(1)
+    assert rebuild.calls == [1]
+
+    await asyncio.sleep(0.1)
+    assert rebuild.calls == [1]
+
+
+async def test_flush_waits_for_running_rebuild():
+    """Rebuilds of one ebook never overlap."""
+    running = asyncio.Event()
+    release = asyncio.Event()
+    active = 0
+    max_active = 0
+
+    async def slow_rebuild(ebook_id: int) -> None:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        running.set()
+        await release.wait()
+        active -= 1
+
+    scheduler = PdfRebuildScheduler(slow_rebuild, debounce_seconds=0)
+    scheduler.schedule(1)
+    await running.wait()
+
+    flush = asyncio.create_task(scheduler.flush(1))
+    await asyncio.sleep(0.01)
+    assert not flush.done()
+
+    release.set()
+    await flush
+    assert max_active == 1
+
+
+async def test_failed_rebuild_is_logged_not_raised():
+    rebuild = RecordingRebuild(fail=True)
+    scheduler = PdfRebuildScheduler(rebuild, debounce_seconds=0)
+
+    await scheduler.flush(1)
+
+    assert rebuild.calls == [1]
@@ -0,0 +1,126 @@
+"""Unit tests for the compiled theme registry."""
+
+import os
+
+import pytest
+import yaml
+
+from backoffice.features.ebook.shared.domain.services.prompt_template_engine import (
+    PromptTemplateEngine,
+)
+from backoffice.features.ebook.shared.domain.theme.theme_loader import ThemeLoader
+from backoffice.features.ebook.shared.domain.theme.theme_registry import (
+    ThemeRegistry,
+    get_theme_registry,
+)
+
+
+def _theme_content(subject: str = "A cute animal") -> dict:
+    return {
+        "id": "test_theme",
+        "label": "Test Theme",
+        "description": "A theme for tests",
+        "palette": {"base": ["#ffffff"]},
+        "cover_title_image": "title.png",
+        "cover_footer_image": "footer.png",
+        "cover_templates": {
+            "default": {
+                "prompt_blocks": {
+                    "subject": subject,
+                    "environment": "colorful background",
+                    "tone": "kid-friendly",
+                    "positives": ["detailed"],
+                    "negatives": ["text"],
+                }
+            },
+            "comfy": {"prompt": "Comfy cover prompt", "workflow_params": {"steps": "25"}},
+        },
+        "coloring_page_templates": {
+            "default": {
+                "base_structure": "A {SPECIES} {ACTION}.",
+                "variables": {"SPECIES": ["cat", "bird"], "ACTION": ["running", "flying"]},
+                "species_profiles": {"cat": {"actions": ["running"], "environments": []}},
+            },
+            "comfy": {"prompt": "Comfy page prompt", "workflow_params": {"cfg": "7.5"}},
+        },
+    }
+
+
+def _write_theme(themes_dir, content: dict, mtime_ns: int | None = None):
+    theme_file = themes_dir / "test_theme.yml"
+    with open(theme_file, "w") as f:
+        yaml.dump(content, f)
+    if mtime_ns is not None:
+        os.utime(theme_file, ns=(mtime_ns, mtime_ns))
+    return theme_file
+
+
+@pytest.fixture
+def themes_dir(tmp_path):
+    themes = tmp_path / "themes"
+    themes.mkdir()
+    return themes
+
+
+def test_theme_is_compiled_with_typed_templates(themes_dir):
+    _write_theme(themes_dir, _theme_content())
+    registry = ThemeRegistry(themes_dir)
+
+    theme = registry.get("test_theme")
+
+    assert theme is not None
+    assert theme.label == "Test Theme"
+    assert theme.profile is not None and theme.profile.blocks.subject == "A cute animal"
+    assert theme.cover_template("comfy").prompt == "Comfy cover prompt"
+    assert theme.cover_template("default").prompt_blocks["tone"] == "kid-friendly"
+    assert theme.page_template("comfy").base_structure == "Comfy page prompt"
+    assert theme.page_template("missing").species_profiles["cat"].actions == ["running"]
+    assert theme.workflow_params("cover", "comfy") == {"steps": "25"}
+    assert theme.workflow_params("coloring_page", "comfy") == {"cfg": "7.5"}
+    assert theme.workflow_params("coloring_page", "diffusers") == {}
+
+
+def test_theme_is_parsed_once_per_file_version(themes_dir):
+    theme_file = _write_theme(themes_dir, _theme_content(), mtime_ns=1_000_000_000)
+    registry = ThemeRegistry(themes_dir)
+
+    first = registry.get("test_theme")
+    assert registry.get("test_theme") is first
+    assert registry.parse_count == 1
+
+    # Touched without content change: re-hashed, not re-parsed
+    os.utime(theme_file, ns=(2_000_000_000, 2_000_000_000))
+    assert registry.get("test_theme") is first
+    assert registry.parse_count == 1
+
+    # Content changed: re-parsed
+    _write_theme(themes_dir, _theme_content(subject="A brave knight"), mtime_ns=3_000_000_000)
+    updated = registry.get("test_theme")
+    assert registry.parse_count == 2
+    assert updated.profile.blocks.subject == "A brave knight"
+    assert updated.version.sha256 != first.version.sha256
+
+
+def test_missing_and_invalid_themes(themes_dir):
+    registry = ThemeRegistry(themes_dir)
+    (themes_dir / "broken.yml").write_text("key: [unclosed")
+
+    assert registry.get("nonexistent") is None
+    with pytest.raises(ValueError, match="Invalid YAML"):
+        registry.get("broken")
+    assert registry.list_themes() == []
+
+
+def test_consumers_share_the_process_wide_registry(themes_dir):
+    _write_theme(themes_dir, _theme_content())
+    registry = get_theme_registry(themes_dir)
+    registry.clear()
+    parse_count = registry.parse_count
+
+    ThemeLoader(themes_dir).load_theme("test_theme")
+    engine = PromptTemplateEngine(seed=42, themes_directory=themes_dir)
+    engine.generate_prompts(theme="test_theme", count=3)
+    engine.generate_cover_prompt(theme="test_theme", template_key="comfy")
+
+    assert get_theme_registry(themes_dir) is registry
+    assert registry.parse_count == parse_count + 1
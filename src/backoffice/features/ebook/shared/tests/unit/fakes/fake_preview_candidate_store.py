@@ -0,0 +1,28 @@
+"""Fake preview candidate store for testing."""
+
+from backoffice.features.ebook.shared.domain.ports.preview_candidate_port import (
+    PreviewCandidate,
+    PreviewCandidatePort,
+)
+
+
+class FakePreviewCandidateStore(PreviewCandidatePort):
+    """In-memory preview candidate store with sequential ids (no TTL)."""
+
+    def __init__(self):
+        self.candidates: dict[str, PreviewCandidate] = {}
+        self.discarded: list[tuple[int, int]] = []
+
+    async def put(self, ebook_id: int, page_index: int, image_data: bytes, prompt: str | None = None) -> PreviewCandidate:
+        candidate_id = f"{len(self.candidates) + 1:032x}"
+        candidate = PreviewCandidate(candidate_id=candidate_id, ebook_id=ebook_id, page_index=page_index, image_data=image_data, prompt=prompt)
+        self.candidates[candidate_id] = candidate
+        return candidate
+
+    async def get(self, ebook_id: int, candidate_id: str) -> PreviewCandidate | None:
+        candidate = self.candidates.get(candidate_id)
+        return candidate if candidate and candidate.ebook_id == ebook_id else None
+
+    async def discard(self, ebook_id: int, page_index: int) -> None:
+        self.discarded.append((ebook_id, page_index))
+        self.candidates = {key: c for key, c in self.candidates.items() if (c.ebook_id, c.page_index) != (ebook_id, page_index)}
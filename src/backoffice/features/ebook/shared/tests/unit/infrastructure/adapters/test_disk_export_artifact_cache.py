@@ -0,0 +1,45 @@
+"""Unit tests for the disk-backed export artifact cache."""
+
+import os
+
+import pytest
+
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_export_artifact_cache import (
+    DiskExportArtifactCache,
+)
+
+KEY_A = "a" * 64
+KEY_B = "b" * 64
+KEY_C = "c" * 64
+
+
+async def test_put_then_get_persists_across_instances(tmp_path):
+    """Entries are stored on disk and survive a new cache instance."""
+    await DiskExportArtifactCache(cache_path=str(tmp_path)).put(KEY_A, b"%PDF-cover")
+
+    assert await DiskExportArtifactCache(cache_path=str(tmp_path)).get(KEY_A) == b"%PDF-cover"
+    assert await DiskExportArtifactCache(cache_path=str(tmp_path)).get(KEY_B) is None
+
+
+async def test_evicts_least_recently_used_entries(tmp_path):
+    """Writes beyond max_bytes evict the entries read least recently."""
+    cache = DiskExportArtifactCache(cache_path=str(tmp_path), max_bytes=250)
+    await cache.put(KEY_A, b"a" * 100)
+    await cache.put(KEY_B, b"b" * 100)
+    os.utime(tmp_path / f"{KEY_A}.bin", (1, 1))
+    os.utime(tmp_path / f"{KEY_B}.bin", (2, 2))
+
+    await cache.get(KEY_A)  # A becomes most recently used
+    await cache.put(KEY_C, b"c" * 100)
+
+    assert await cache.get(KEY_A) is not None
+    assert await cache.get(KEY_B) is None
+    assert await cache.get(KEY_C) is not None
+
+
+async def test_rejects_invalid_keys(tmp_path):
+    """Keys must be hex digests (no path traversal)."""
+    cache = DiskExportArtifactCache(cache_path=str(tmp_path))
+
+    with pytest.raises(ValueError):
+        await cache.get("../../etc/passwd")
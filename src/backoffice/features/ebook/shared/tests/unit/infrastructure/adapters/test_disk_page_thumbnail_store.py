@@ -0,0 +1,91 @@
+"""Unit tests for the disk-backed page thumbnail store."""
+
+import os
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import (
+    THUMBNAIL_WIDTHS,
+    page_image_key,
+    select_thumbnail_width,
+)
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_page_thumbnail_store import (
+    DiskPageThumbnailStore,
+    render_webp_thumbnails,
+)
+
+
+def _png(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), (255, 255, 255)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def test_render_stores_webp_renditions_without_upscaling(tmp_path):
+    """Each width gets a WebP rendition; widths above the original keep its size."""
+    store = DiskPageThumbnailStore(store_path=str(tmp_path))
+    image_data = _png(1000, 1250)
+
+    page_key = await store.render(image_data)
+
+    assert page_key == page_image_key(image_data)
+    expected_sizes = {256: (256, 320), 768: (768, 960), 1600: (1000, 1250)}
+    for width in THUMBNAIL_WIDTHS:
+        thumbnail = await store.get(page_key, width)
+        assert thumbnail is not None
+        with Image.open(BytesIO(thumbnail)) as image:
+            assert image.format == "WEBP"
+            assert image.size == expected_sizes[width]
+
+
+async def test_render_skips_existing_renditions(tmp_path):
+    """Rendering the same page twice keeps the stored files."""
+    store = DiskPageThumbnailStore(store_path=str(tmp_path))
+    image_data = _png(600, 600)
+    page_key = await store.render(image_data)
+    rendition_path = tmp_path / page_key[:2] / f"{page_key}_256.webp"
+    rendition_path.write_bytes(b"kept")
+
+    await store.render(image_data)
+
+    assert await store.get(page_key, 256) == b"kept"
+
+
+async def test_get_rejects_invalid_keys_and_widths(tmp_path):
+    """Keys must be SHA-256 digests and widths a known rendition."""
+    store = DiskPageThumbnailStore(store_path=str(tmp_path))
+
+    with pytest.raises(ValueError):
+        await store.get("../../etc/passwd", 256)
+    with pytest.raises(ValueError):
+        await store.get("a" * 64, 300)
+    assert await store.get("a" * 64, 256) is None
+
+
+async def test_render_evicts_least_recently_used_renditions(tmp_path):
+    """Once over max_bytes, the renditions read least recently are evicted, never the new ones."""
+    images = [_png(300 + 100 * i, 300) for i in range(3)]
+    page_sizes = [sum(len(data) for data in render_webp_thumbnails(image).values()) for image in images]
+    store = DiskPageThumbnailStore(store_path=str(tmp_path), max_bytes=page_sizes[0] + max(page_sizes[1:]) + 1)
+
+    first_key = await store.render(images[0])
+    second_key = await store.render(images[1])
+    for path in tmp_path.glob("*/*.webp"):
+        os.utime(path, (0, 0))  # Both pages read long ago...
+    assert await store.get(first_key, 256) is not None  # ...then the first one again
+    third_key = await store.render(images[2])
+
+    for width in THUMBNAIL_WIDTHS:
+        assert await store.get(third_key, width) is not None
+    assert await store.get(first_key, 256) is not None
+    assert await store.get(second_key, 256) is None
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.webp")) <= store.max_bytes
+
+
+def test_select_thumbnail_width_snaps_to_covering_rendition():
+    assert select_thumbnail_width(None) == 768
+    assert select_thumbnail_width(100) == 256
+    assert select_thumbnail_width(257) == 768
+    assert select_thumbnail_width(5000) == 1600
@@ -0,0 +1,54 @@
+"""Unit tests for the disk-backed preview candidate store."""
+
+import os
+import time
+
+from backoffice.features.ebook.shared.infrastructure.adapters.disk_preview_candidate_store import (
+    DiskPreviewCandidateStore,
+)
+
+
+async def test_put_then_get_across_instances(tmp_path):
+    """Candidates are shared through the filesystem (multi-worker)."""
+    candidate = await DiskPreviewCandidateStore(store_path=str(tmp_path)).put(7, 3, b"png-bytes", prompt="a dragon")
+
+    loaded = await DiskPreviewCandidateStore(store_path=str(tmp_path)).get(7, candidate.candidate_id)
+
+    assert loaded == candidate
+    assert await DiskPreviewCandidateStore(store_path=str(tmp_path)).get(8, candidate.candidate_id) is None
+
+
+async def test_expired_candidates_are_not_returned(tmp_path):
+    store = DiskPreviewCandidateStore(store_path=str(tmp_path), ttl_seconds=60)
+    candidate = await store.put(1, 1, b"old")
+    os.utime(tmp_path / "1" / f"{candidate.candidate_id}.img", (1, 1))
+
+    assert await store.get(1, candidate.candidate_id) is None
+    assert not (tmp_path / "1" / f"{candidate.candidate_id}.json").exists()
+
+
+async def test_quota_evicts_oldest_candidates_per_ebook(tmp_path):
+    store = DiskPreviewCandidateStore(store_path=str(tmp_path), max_per_ebook=2)
+    first = await store.put(1, 1, b"first")
+    ten_seconds_ago = time.time() - 10
+    os.utime(tmp_path / "1" / f"{first.candidate_id}.img", (ten_seconds_ago, ten_seconds_ago))
+    second = await store.put(1, 1, b"second")
+    third = await store.put(1, 2, b"third")
+    other_ebook = await store.put(2, 1, b"other")
+
+    assert await store.get(1, first.candidate_id) is None
+    assert await store.get(1, second.candidate_id) is not None
+    assert await store.get(1, third.candidate_id) is not None
+    assert await store.get(2, other_ebook.candidate_id) is not None
+
+
+async def test_discard_drops_only_the_page_candidates(tmp_path):
+    store = DiskPreviewCandidateStore(store_path=str(tmp_path))
+    page_1 = await store.put(1, 1, b"one")
+    page_2 = await store.put(1, 2, b"two")
+
+    await store.discard(1, 1)
+
+    assert await store.get(1, page_1.candidate_id) is None
+    assert await store.get(1, page_2.candidate_id) is not None
+    assert await store.get(1, "../../etc/passwd") is None
@@ -0,0 +1,58 @@
+"""Tests for the lightweight page metadata query of the ebook repository."""
+
+import base64
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backoffice.features.ebook.shared.domain.entities.ebook import Ebook, EbookStatus
+from backoffice.features.ebook.shared.domain.ports.page_thumbnail_port import page_image_key
+from backoffice.features.ebook.shared.infrastructure.models.ebook_model import Base, EbookModel
+from backoffice.features.ebook.shared.infrastructure.repositories.ebook_repository import SqlAlchemyEbookRepository
+
+
+def _page(title: str, image_data: bytes) -> dict:
+    return {"title": title, "image_format": "PNG", "image_data_base64": base64.b64encode(image_data).decode(), "prompt": f"{title} prompt"}
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+async def test_page_image_keys_are_stored_and_read_without_images(db):
+    repository = SqlAlchemyEbookRepository(db)
+    pages = [_page("Cover", b"cover"), _page("Page 1", b"page-1"), _page("Back", b"back")]
+    ebook = await repository.create(Ebook(id=None, title="Dinosaurs", author="Test", created_at=None, structure_json={"pages_meta": pages}))
+
+    cover = await repository.get_page_info(ebook.id, 0)
+    back = await repository.get_page_info(ebook.id, 2)
+
+    assert cover.image_key == page_image_key(b"cover")
+    assert (cover.title, cover.prompt, cover.is_back_cover) == ("Cover", "Cover prompt", False)
+    assert back.is_back_cover
+    assert await repository.get_page_info(ebook.id, 3) is None
+    assert await repository.get_page_info(ebook.id, -1) is None
+    assert await repository.get_page_info(ebook.id + 1, 0) is None
+
+    # An edited page (new dict, as written by the use cases) gets a new key
+    ebook.structure_json["pages_meta"][1] = _page("Page 1", b"edited")
+    await repository.update(ebook)
+    assert (await repository.get_page_info(ebook.id, 1)).image_key == page_image_key(b"edited")
+
+
+async def test_pages_stored_without_keys_fall_back_to_the_full_ebook(db):
+    structure = {"pages_meta": [_page("Cover", b"cover"), _page("Back", b"back")]}
+    db.add(EbookModel(title="Legacy", author="Test", status=EbookStatus.DRAFT.value, created_at=datetime(2026, 1, 1), structure_json=structure))
+    db.commit()
+
+    page = await SqlAlchemyEbookRepository(db).get_page_info(1, 1)
+
+    assert page.image_key == page_image_key(b"back")
+    assert page.is_back_cover
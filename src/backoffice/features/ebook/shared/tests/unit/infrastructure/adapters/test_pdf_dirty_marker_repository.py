@@ -0,0 +1,42 @@
+"""Tests for the deferred PDF rebuild marker (pdf_dirty_at) of the ebook repository."""
+
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backoffice.features.ebook.shared.infrastructure.models.ebook_model import Base, EbookModel
+from backoffice.features.ebook.shared.infrastructure.repositories.ebook_repository import SqlAlchemyEbookRepository
+
+
+@pytest.fixture
+def repository():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(EbookModel(title="Dinosaurs", author="Test", status="DRAFT", created_at=datetime(2026, 1, 1)))
+    db.commit()
+    yield SqlAlchemyEbookRepository(db)
+    db.close()
+
+
+async def test_dirty_marker_is_naive_utc_and_round_trips(repository):
+    dirty_at = await repository.mark_pdf_dirty(1)
+
+    info = await repository.get_ebook_pdf_info(1)
+    assert dirty_at.tzinfo is None  # Same convention as the DateTime() column
+    assert info.pdf_dirty_at == dirty_at
+
+    await repository.mark_pdf_rebuilt(1, info.pdf_dirty_at, "http://preview.url", "drive-1")
+    assert (await repository.get_ebook_pdf_info(1)).pdf_dirty_at is None
+
+
+async def test_marker_set_during_rebuild_is_kept(repository):
+    first = await repository.mark_pdf_dirty(1)
+    time.sleep(0.001)
+    second = await repository.mark_pdf_dirty(1)  # Page edited while rebuilding
+
+    await repository.mark_pdf_rebuilt(1, first, None, None)
+    assert (await repository.get_ebook_pdf_info(1)).pdf_dirty_at == second
@@ -0,0 +1,159 @@
+"""Unit tests for KDP interior assembly (deduplication, normalization and encoding profiles)."""
+
+import base64
+from datetime import datetime
+from io import BytesIO
+
+import pikepdf
+import pytest
+from PIL import Image, ImageDraw
+
+from backoffice.features.ebook.shared.domain.entities.ebook import (
+    Ebook,
+    EbookStatus,
+    KDPExportConfig,
+    inches_to_px,
+)
+from backoffice.features.ebook.shared.infrastructure.providers.publishing import pdf_linearization
+from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.assembly.interior_assembly_provider import (
+    KDPInteriorAssemblyProvider,
+)
+from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import page_encoding
+
+
+def _png(size: tuple[int, int], color: str = "white", mode: str = "RGB") -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def kdp_config():
+    return KDPExportConfig()
+
+
+@pytest.fixture
+def page_size(kdp_config):
+    return (
+        inches_to_px(kdp_config.trim_size[0] + 2 * kdp_config.side_margin_size),
+        inches_to_px(kdp_config.trim_size[1] + kdp_config.top_margin_size + kdp_config.bottom_margin_size),
+    )
+
+
+def _line_art(size: tuple[int, int]) -> bytes:
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    for offset in range(100, min(size) - 100, 200):
+        draw.line([(offset, 100), (size[0] - offset, size[1] - 100)], fill="black", width=6)
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _ebook(interior_pages: list[bytes]) -> Ebook:
+    pages = [_png((10, 10), "blue"), *interior_pages, _png((10, 10), "green")]
+    return Ebook(
+        id=1,
+        title="Test",
+        author="Author",
+        created_at=datetime.now(),
+        status=EbookStatus.APPROVED,
+        page_count=len(pages),
+        structure_json={"pages_meta": [{"page_number": i, "image_data_base64": base64.b64encode(p).decode()} for i, p in enumerate(pages)]},
+    )
+
+
+def _image_xobjects(pdf_bytes: bytes) -> tuple[int, set[tuple[int, int]]]:
+    with pikepdf.open(BytesIO(pdf_bytes)) as pdf:
+        objgens = {xobject.objgen for page in pdf.pages for xobject in page.Resources.XObject.values()}
+        return len(pdf.pages), objgens
+
+
+def test_deduplicate_pages_keeps_order():
+    """Identical images collapse to one entry, order is preserved."""
+    unique, order = KDPInteriorAssemblyProvider._deduplicate_pages([b"a", b"b", b"a", b"c", b"b"])
+
+    assert unique == [b"a", b"b", b"c"]
+    assert order == [0, 1, 0, 2, 1]
+
+
+def test_is_print_ready(page_size):
+    """Only target-size RGB PNG/JPEG images skip re-encoding."""
+    assert page_encoding.is_print_ready(_png(page_size), page_size)
+    assert not page_encoding.is_print_ready(_png((100, 100)), page_size)
+    assert not page_encoding.is_print_ready(_png(page_size, 255, mode="L"), page_size)
+
+
+async def test_blank_padding_shares_single_xobject(kdp_config, page_size):
+    """Blank padding pages are embedded once and referenced by every page."""
+    provider = KDPInteriorAssemblyProvider(max_workers=1)
+    content = [_png(page_size, "red"), _png(page_size, "black")]
+
+    pdf_bytes = await provider.assemble_kdp_interior(_ebook(content), kdp_config)
+
+    page_count, xobjects = _image_xobjects(pdf_bytes)
+    assert page_count == 24
+    assert len(xobjects) == 3  # red, black, blank
+
+
+async def test_pages_are_normalized_to_target_size(page_size):
+    """Legacy profile: undersized or non-RGB pages are resized and converted to RGB."""
+    provider = KDPInteriorAssemblyProvider(max_workers=1)
+    content = [_png((100, 100), "red"), _png(page_size, 0, mode="L")]
+
+    pdf_bytes = await provider.assemble_kdp_interior(_ebook(content), KDPExportConfig(encoding_profile="legacy"))
+
+    with pikepdf.open(BytesIO(pdf_bytes)) as pdf:
+        for page in pdf.pages[:2]:
+            image = next(iter(page.Resources.XObject.values()))
+            assert (int(image.Width), int(image.Height)) == page_size
+            assert image.ColorSpace == pikepdf.Name.DeviceRGB
+
+
+def test_classify_page():
+    """Line art, grayscale and color pages are told apart."""
+    assert page_encoding.classify_page(Image.open(BytesIO(_line_art((1000, 1000)))), 0.05) == page_encoding.ContentClass.LINE_ART
+    assert page_encoding.classify_page(Image.new("L", (100, 100), 128), 0.05) == page_encoding.ContentClass.GRAYSCALE
+    assert page_encoding.classify_page(Image.new("RGB", (100, 100), "red"), 0.05) == page_encoding.ContentClass.COLOR
+
+
+def test_encoding_profiles_loaded_from_config():
+    """Default profile comes from specifications.yaml and unknown profiles are rejected."""
+    assert KDPExportConfig().encoding_profile == "print"
+
+    with pytest.raises(ValueError, match="encoding_profile"):
+        KDPExportConfig(encoding_profile="unknown")
+
+
+async def test_line_art_pages_embedded_as_bilevel(kdp_config, page_size):
+    """Print profile: line art is thresholded to 1-bit and the report shows the savings."""
+    provider = KDPInteriorAssemblyProvider(max_workers=1)
+    content = [_line_art(page_size), _png(page_size, "red")]
+
+    pdf_bytes, report = await provider.assemble_kdp_interior_with_report(_ebook(content), kdp_config)
+
+    with pikepdf.open(BytesIO(pdf_bytes)) as pdf:
+        line_art = next(iter(pdf.pages[0].Resources.XObject.values()))
+        color = next(iter(pdf.pages[1].Resources.XObject.values()))
+        assert int(line_art.BitsPerComponent) == 1
+        assert color.ColorSpace == pikepdf.Name.DeviceRGB
+
+    encodings = {stats.page_numbers[0]: stats.encoding for stats in report.images}
+    assert encodings[1] in (page_encoding.PageEncoding.BILEVEL_G4, page_encoding.PageEncoding.BILEVEL_FLATE)
+    assert encodings[2] == page_encoding.PageEncoding.RGB
+    assert report.pdf_bytes == len(pdf_bytes)
+    assert report.images[0].encoded_bytes < report.images[0].source_bytes
+    assert report.max_error < 10
+
+
+async def test_linearize_option(page_size):
+    """Interior PDFs are linearized (fast web view) only when requested."""
+    provider = KDPInteriorAssemblyProvider(max_workers=1)
+    ebook = _ebook([_png(page_size, "red")])
+
+    linearized = await provider.assemble_kdp_interior(ebook, KDPExportConfig(linearize=True))
+    plain = await provider.assemble_kdp_interior(ebook, KDPExportConfig(linearize=False))
+
+    assert pdf_linearization.is_linearized(linearized)
+    assert not pdf_linearization.is_linearized(plain)
+    assert _image_xobjects(linearized)[0] == _image_xobjects(plain)[0] == 24
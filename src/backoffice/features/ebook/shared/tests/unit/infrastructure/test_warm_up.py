@@ -0,0 +1,74 @@
+"""Unit tests for the startup warm-up."""
+
+import pytest
+
+from backoffice.features.ebook.shared.infrastructure import warm_up
+from backoffice.features.ebook.shared.infrastructure.providers.images.comfy import comfy_provider
+
+
+@pytest.fixture
+def fake_components(monkeypatch):
+    calls = []
+
+    def _ok():
+        calls.append("ok")
+        return "built"
+
+    def _skipped():
+        calls.append("skipped")
+        return None
+
+    def _failed():
+        calls.append("failed")
+        raise RuntimeError("model not found")
+
+    monkeypatch.setattr(warm_up, "WARM_UP_COMPONENTS", {"ok": _ok, "skipped": _skipped, "failed": _failed})
+    return calls
+
+
+async def test_warm_up_reports_each_component(fake_components):
+    state = await warm_up.run_warm_up(["ok", "skipped", "failed"])
+
+    assert fake_components == ["ok", "skipped", "failed"]
+    assert state.finished
+    assert warm_up.get_warm_up_state() is state
+    statuses = {c.name: (c.status, c.detail) for c in state.components}
+    assert statuses == {
+        "ok": ("ok", "built"),
+        "skipped": ("skipped", "not configured"),
+        "failed": ("failed", "model not found"),
+    }
+    assert all(c.duration_ms >= 0 for c in state.components)
+    assert state.to_dict()["components"]["failed"]["status"] == "failed"
+
+
+def test_enabled_components_from_environment(fake_components, monkeypatch):
+    monkeypatch.delenv("WARMUP_COMPONENTS", raising=False)
+    monkeypatch.setenv("WARMUP_SKIP", "failed")
+    assert warm_up.enabled_components() == ["ok", "skipped"]
+
+    monkeypatch.setenv("WARMUP_COMPONENTS", "none")
+    assert warm_up.enabled_components() == []
+
+    monkeypatch.setenv("WARMUP_COMPONENTS", "ok,unknown")
+    with pytest.raises(ValueError, match="unknown"):
+        warm_up.enabled_components()
+
+
+def test_comfy_workflows_are_parsed_once(tmp_path, monkeypatch):
+    workflows_dir = tmp_path / "comfy"
+    workflows_dir.mkdir()
+    (workflows_dir / "cover.json").write_text('{"6": {"inputs": {"text": ""}}}')
+    (workflows_dir / "page.json").write_text('{"25": {"inputs": {"seed": 0}}}')
+    monkeypatch.setattr(comfy_provider, "find_workflows_directory", lambda: workflows_dir)
+    comfy_provider._parse_workflow.cache_clear()
+
+    assert comfy_provider.preload_workflows() == 2
+    assert comfy_provider._parse_workflow.cache_info().misses == 2
+
+    provider = comfy_provider.ComfyProvider(model="cover.json")
+    provider._retrieve_workflow(cover=True)
+    provider.workflow["6"]["inputs"]["text"] = "a prompt"
+
+    assert comfy_provider._parse_workflow.cache_info().misses == 2
+    assert comfy_provider.load_workflow(workflows_dir / "cover.json")["6"]["inputs"]["text"] == ""
@@ -6,6 +6,8 @@ from pathlib import Path
 import pytest
 from PIL import Image
 
+from backoffice.features.ebook.shared.domain.entities.ebook import KDPExportConfig
+from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils import cover_composer
 from backoffice.features.ebook.shared.infrastructure.providers.publishing.kdp.utils.barcode_utils import (
     add_barcode_space,
 )
@@ -103,6 +105,39 @@ def test_assemble_full_kdp_cover(sample_back_cover, sample_front_cover):
     assert result_img.size[1] > 2500, "Full cover height should be > 2500px"
 
 
+def test_compose_full_cover_single_canvas():
+    """Back, spine and front are laid out side by side on one in-memory canvas."""
+    layout = cover_composer.compute_cover_layout(KDPExportConfig(), page_count=25)
+    spine = Image.new("RGB", layout.spine_size, (0, 255, 0))
+
+    cover = cover_composer.compose_full_cover(
+        Image.new("RGB", (100, 100), (255, 0, 0)),
+        Image.new("RGBA", layout.panel_size, (0, 0, 255, 255)),
+        layout,
+        spine_img=spine,
+    )
+
+    assert cover.image.size == layout.size
+    assert cover.image.getpixel((10, 10)) == (255, 0, 0)  # Back resized to panel
+    assert cover.image.getpixel((layout.spine_x, 10)) == (0, 255, 0)
+    assert cover.image.getpixel((layout.size[0] - 1, 10)) == (0, 0, 255)
+
+    with pytest.raises(ValueError, match="Spine"):
+        cover_composer.compose_full_cover(cover.image, cover.image, layout, spine_img=Image.new("RGB", (5, 5)))
+
+
+def test_overlay_and_validation_accept_in_memory_canvas():
+    """The validator consumes the composed canvas directly (no PNG round trip)."""
+    layout = cover_composer.compute_cover_layout(KDPExportConfig(), page_count=24)
+    cover = cover_composer.compose_full_cover(Image.new("RGB", layout.panel_size), Image.new("RGB", layout.panel_size), layout)
+
+    result = validate_full_cover_against_template(cover.image)
+    overlay = Image.open(BytesIO(overlay_kdp_template(cover.image, show_measurements=False)))
+
+    assert result["cover_size"] == layout.size
+    assert overlay.size == layout.size
+
+
 def test_overlay_kdp_template_success(sample_full_cover):
     """Test successful KDP template overlay on full cover."""
     result_bytes = overlay_kdp_template(
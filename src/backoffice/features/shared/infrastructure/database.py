@@ -33,7 +33,8 @@ def _get_engine() -> Engine:
         max_overflow=10,
         pool_timeout=30,
         pool_recycle=1800,
-        echo=True,
+        # SQL statements and their (possibly huge) parameters are only logged on demand
+        echo=os.getenv("SQL_ECHO", "false").lower() == "true",
     )
 
 
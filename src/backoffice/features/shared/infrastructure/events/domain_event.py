@@ -4,6 +4,8 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from backoffice.features.shared.infrastructure.tracing import current_trace_id
+
 
 @dataclass(frozen=True)
 class DomainEvent:
@@ -16,11 +18,13 @@ class DomainEvent:
         event_id: Unique identifier for this event instance
         occurred_at: Timestamp when the event occurred
         aggregate_id: ID of the aggregate root that emitted this event
+        trace_id: Trace the event was published in (None outside a trace)
     """
 
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     occurred_at: datetime = field(default_factory=datetime.utcnow)
     aggregate_id: str | None = None
+    trace_id: str | None = field(default_factory=current_trace_id)
 
     def event_name(self) -> str:
         """Get the event name (class name by default).
@@ -1,90 +1,299 @@
 """Event bus for publishing and subscribing to domain events."""
 
 import asyncio
+import itertools
 import logging
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from enum import Enum
 
 from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
 from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+from backoffice.features.shared.infrastructure.events.event_transport import EventTransport
+from backoffice.features.shared.infrastructure.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
 
+class OverflowPolicy(Enum):
+    """What a queued subscription does when its queue is full."""
+
+    DROP = "drop"  # Drop the oldest queued event (newest state wins)
+    COALESCE = "coalesce"  # Replace the queued event with the same key, else drop the oldest
+    BLOCK = "block"  # publish() waits for room (backpressure on the publisher)
+
+
+def _default_coalesce_key(event: DomainEvent) -> Hashable:
+    return type(event), event.aggregate_id
+
+
+@dataclass(frozen=True)
+class QueuedDelivery:
+    """Delivery through a bounded per-subscription queue and consumer task.
+
+    Attributes:
+        max_size: Maximum number of queued events
+        overflow: Policy applied when the queue is full
+        coalesce_key: Events with the same key replace each other while queued
+            (COALESCE only; defaults to event type + aggregate_id)
+    """
+
+    max_size: int = 100
+    overflow: OverflowPolicy = OverflowPolicy.DROP
+    coalesce_key: Callable[[DomainEvent], Hashable] = _default_coalesce_key
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError(f"Queue size must be at least 1, got {self.max_size}")
+
+
+class Subscription:
+    """A handler subscribed to an event type, identified by a stable id."""
+
+    def __init__(self, subscription_id: int, event_type: type[DomainEvent], handler: EventHandler):
+        self.id = subscription_id
+        self.event_type = event_type
+        self.handler = handler
+
+    async def deliver(self, event: DomainEvent) -> None:
+        """Run the handler, logging (never raising) its errors.
+
+        The handler runs in a span of the event's trace when that trace is
+        active in this process (queued consumers lose the publisher's context).
+        """
+        try:
+            with get_tracer().resume(event.trace_id, f"event.{event.event_name()}", handler=self.handler.__class__.__name__):
+                await self.handler.handle(event)
+            logger.debug(f"✅ {self.handler.__class__.__name__} handled {event.event_name()}")
+        except Exception as e:
+            logger.error(
+                f"❌ {self.handler.__class__.__name__} failed to handle {event.event_name()}: {str(e)}",
+                exc_info=True,
+            )
+
+    async def publish(self, event: DomainEvent) -> None:
+        """Deliver an event published on the bus (direct: awaited in publish)."""
+        await self.deliver(event)
+
+    async def join(self) -> None:
+        """Wait until every accepted event has been handled."""
+
+    def close(self) -> None:
+        """Stop delivering events to this subscription."""
+
+
+class QueuedSubscription(Subscription):
+    """Subscription with its own bounded queue drained by a consumer task."""
+
+    def __init__(self, subscription_id: int, event_type: type[DomainEvent], handler: EventHandler, delivery: QueuedDelivery):
+        super().__init__(subscription_id, event_type, handler)
+        self.delivery = delivery
+        self.dropped = 0  # Events dropped or coalesced away (diagnostics)
+        self._pending: OrderedDict[Hashable, DomainEvent] = OrderedDict()
+        self._sequence = itertools.count()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._consumer: asyncio.Task | None = None
+        self._closed = False
+
+    async def publish(self, event: DomainEvent) -> None:
+        """Queue an event; only waits when full under the BLOCK policy."""
+        if self._closed:
+            return
+
+        key: Hashable = ("seq", next(self._sequence))
+        if self.delivery.overflow is OverflowPolicy.COALESCE:
+            key = self.delivery.coalesce_key(event)
+            if key in self._pending:
+                self._pending[key] = event  # Keeps its position in the queue
+                self.dropped += 1
+                return
+
+        while len(self._pending) >= self.delivery.max_size:
+            if self.delivery.overflow is OverflowPolicy.BLOCK:
+                self._not_full.clear()
+                await self._not_full.wait()
+                if self._closed:
+                    return
+            else:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+
+        self._pending[key] = event
+        self._idle.clear()
+        self._not_empty.set()
+        self._ensure_consumer()
+
+    async def join(self) -> None:
+        await self._idle.wait()
+
+    def close(self) -> None:
+        self._closed = True
+        self._pending.clear()
+        self._idle.set()
+        self._not_full.set()  # Release blocked publishers
+        if self._consumer is not None and self._consumer is not asyncio.current_task():
+            self._consumer.cancel()
+        self._not_empty.set()  # Wakes the consumer so it exits (also when closed from its own handler)
+
+    def _ensure_consumer(self) -> None:
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._consume(), name=f"event-consumer-{self.id}")
+
+    async def _consume(self) -> None:
+        while not self._closed:
+            if not self._pending:
+                self._idle.set()
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+
+            _, event = self._pending.popitem(last=False)
+            self._not_full.set()
+            await self.deliver(event)
+
+
 class EventBus:
     """In-memory event bus for publish/subscribe pattern.
 
     Supports registering handlers for specific event types and publishing
     events to all registered handlers. Handlers are executed asynchronously.
 
-    Thread-safe for concurrent event publishing.
+    Two delivery modes per subscription:
+    - direct (default): publish() awaits the handler, concurrently with the
+      other direct handlers of the event
+    - queued (delivery=QueuedDelivery(...)): publish() only enqueues; a
+      consumer task per subscription runs the handler, so a slow handler never
+      slows publishers or other subscribers. Overflow follows the
+      subscription's OverflowPolicy.
+
+    Subscription ids are unique for the bus lifetime: unsubscribing one
+    handler never changes the id of another.
+
+    With a transport (Postgres LISTEN/NOTIFY, Unix socket broker), the event
+    types marked with distribute() are also delivered to the subscribers of
+    the other worker processes. Other events stay in-process, so handlers
+    with side effects never run once per worker.
     """
 
-    def __init__(self):
-        """Initialize event bus with empty handler registry."""
-        self._handlers: dict[type[DomainEvent], list[EventHandler]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+    def __init__(self, transport: EventTransport | None = None):
+        """Initialize event bus with empty handler registry.
+
+        Args:
+            transport: Carries distributed events between processes (in-memory only if None)
+        """
+        self._handlers: dict[type[DomainEvent], dict[int, Subscription]] = defaultdict(dict)
+        self._ids = itertools.count()
+        self._transport = transport
+        self._distributed: set[type[DomainEvent]] = set()
+        self._started = False
+
+    @property
+    def transport(self) -> EventTransport | None:
+        return self._transport
+
+    async def start(self) -> None:
+        """Connect the transport (no-op for an in-memory bus)."""
+        if self._transport is not None and not self._started:
+            await self._transport.start(self._receive_remote)
+            self._started = True
+
+    async def stop(self) -> None:
+        """Disconnect the transport."""
+        if self._transport is not None and self._started:
+            self._started = False
+            await self._transport.stop()
+
+    def distribute(self, event_type: type[DomainEvent]) -> None:
+        """Also deliver events of this type to the subscribers of the other processes."""
+        self._distributed.add(event_type)
 
-    def subscribe(self, event_type: type[DomainEvent], handler: EventHandler) -> int:
+    def subscribe(self, event_type: type[DomainEvent], handler: EventHandler, delivery: QueuedDelivery | None = None) -> int:
         """Subscribe a handler to an event type.
 
         Args:
             event_type: Type of event to handle
             handler: Handler instance to register
+            delivery: Queued delivery settings (direct delivery if None)
+
+        Returns:
+            Subscription id (also set on handler.handler_id)
         """
-        handler_id = len(self._handlers[event_type])
-        handler.handler_id = handler_id
-        self._handlers[event_type].append(handler)
+        subscription_id = next(self._ids)
+        subscription = Subscription(subscription_id, event_type, handler) if delivery is None else QueuedSubscription(subscription_id, event_type, handler, delivery)
+        handler.handler_id = subscription_id
+        self._handlers[event_type][subscription_id] = subscription
+
+        mode = "direct" if delivery is None else f"queued, max {delivery.max_size}, {delivery.overflow.value}"
+        logger.info(f"📬 Subscribed {handler.__class__.__name__} to {event_type.__name__} (id: {subscription_id}, {mode})")
+        return subscription_id
 
-        logger.info(f"📬 Subscribed {handler.__class__.__name__} to {event_type.__name__}")
-        return len(self._handlers[event_type]) - 1
+    def unsubscribe(self, event_type: type[DomainEvent], handler_id: int) -> bool:
+        """Unsubscribe a handler (safe to call from the handler itself, or twice).
+
+        Args:
+            event_type: Event type the handler was subscribed to
+            handler_id: Id returned by subscribe()
 
-    def unsubscribe(self, event_type: type[DomainEvent], handler_id: int) -> None:
-        del self._handlers[event_type][handler_id]
-        logger.info(f"📬 Unsubscribed {handler_id} to {event_type.__name__}")
+        Returns:
+            True if the subscription existed
+        """
+        subscription = self._handlers.get(event_type, {}).pop(handler_id, None)
+        if subscription is None:
+            logger.debug(f"📭 No subscription {handler_id} for {event_type.__name__}")
+            return False
+        subscription.close()
+        logger.info(f"📬 Unsubscribed {handler_id} from {event_type.__name__}")
+        return True
 
     async def publish(self, event: DomainEvent) -> None:
         """Publish an event to all registered handlers.
 
-        Handlers are executed asynchronously and in parallel. If a handler fails,
-        the error is logged but other handlers continue executing.
+        Direct handlers are executed concurrently and awaited; queued handlers
+        only get the event enqueued. If a handler fails, the error is logged
+        but other handlers continue executing. Distributed event types are
+        also sent through the transport.
 
         Args:
             event: Domain event to publish
         """
+        transport = self._transport
+        if transport is not None and self._started and type(event) in self._distributed:
+            await asyncio.gather(self._dispatch(event), transport.send(event))
+        else:
+            await self._dispatch(event)
+
+    async def _receive_remote(self, event: DomainEvent) -> None:
+        """Deliver an event published by another process to the local subscribers."""
+        if type(event) in self._distributed:
+            await self._dispatch(event)
+
+    async def _dispatch(self, event: DomainEvent) -> None:
         event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
+        subscriptions = list(self._handlers.get(event_type, {}).values())
 
-        if not handlers:
+        if not subscriptions:
             logger.debug(f"📭 No handlers registered for {event_type.__name__}")
             return
 
-        logger.info(f"📤 Publishing {event.event_name()} (id: {event.event_id}) to {len(handlers)} handler(s)")
-
-        # Execute handlers concurrently
-        async with self._lock:
-            tasks = [self._execute_handler(handler, event) for handler in handlers]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.debug(f"📤 Publishing {event.event_name()} (id: {event.event_id}) to {len(subscriptions)} handler(s)")
+        await asyncio.gather(*(subscription.publish(event) for subscription in subscriptions))
 
-    async def _execute_handler(self, handler: EventHandler, event: DomainEvent) -> None:
-        """Execute a single handler with error handling.
-
-        Args:
-            handler: Handler to execute
-            event: Event to handle
-        """
-        try:
-            await handler.handle(event)
-            logger.info(f"✅ {handler.__class__.__name__} handled {event.event_name()}")
-        except Exception as e:
-            logger.error(
-                f"❌ {handler.__class__.__name__} failed to handle {event.event_name()}: {str(e)}",
-                exc_info=True,
-            )
+    async def drain(self) -> None:
+        """Wait until every queued subscription has handled its accepted events."""
+        await asyncio.gather(*(subscription.join() for subscriptions in list(self._handlers.values()) for subscription in list(subscriptions.values())))
 
     def nb_handlers(self):
-        return len(self._handlers)
+        return sum(len(subscriptions) for subscriptions in self._handlers.values())
 
     def clear(self) -> None:
         """Clear all registered handlers (useful for testing)."""
+        for subscriptions in self._handlers.values():
+            for subscription in subscriptions.values():
+                subscription.close()
         self._handlers.clear()
         logger.info("🧹 Event bus cleared")
@@ -1,11 +1,44 @@
 """Singleton instance of EventBus for application-wide event publishing."""
 
+import os
+import tempfile
+
 from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.events.event_transport import EventTransport
+
+EVENT_BUS_TRANSPORTS = ("memory", "postgres", "unix")
 
 # Global singleton instance
 _event_bus: EventBus | None = None
 
 
+def create_event_transport() -> EventTransport | None:
+    """Build the transport selected by EVENT_BUS_TRANSPORT (None for "memory").
+
+    Raises:
+        ValueError: Unknown transport, or postgres without DATABASE_URL
+    """
+    name = os.getenv("EVENT_BUS_TRANSPORT", "memory").strip().lower() or "memory"
+    if name not in EVENT_BUS_TRANSPORTS:
+        raise ValueError(f"Unknown EVENT_BUS_TRANSPORT {name!r} (expected one of: {', '.join(EVENT_BUS_TRANSPORTS)})")
+
+    if name == "postgres":
+        from backoffice.features.shared.infrastructure.events.postgres_event_transport import PostgresNotifyEventTransport
+
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            raise ValueError("EVENT_BUS_TRANSPORT=postgres requires DATABASE_URL")
+        return PostgresNotifyEventTransport(database_url, channel=os.getenv("EVENT_BUS_CHANNEL", "backoffice_events"))
+
+    if name == "unix":
+        from backoffice.features.shared.infrastructure.events.unix_socket_event_transport import UnixSocketEventTransport
+
+        default_path = os.path.join(tempfile.gettempdir(), "backoffice-events.sock")
+        return UnixSocketEventTransport(os.getenv("EVENT_BUS_SOCKET", default_path))
+
+    return None
+
+
 def get_event_bus() -> EventBus:
     """Get or create the global EventBus instance.
 
@@ -14,7 +47,7 @@ def get_event_bus() -> EventBus:
     """
     global _event_bus
     if _event_bus is None:
-        _event_bus = EventBus()
+        _event_bus = EventBus(transport=create_event_transport())
     return _event_bus
 
 
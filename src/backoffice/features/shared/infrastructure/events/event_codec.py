@@ -0,0 +1,80 @@
+"""Compact wire format for domain events crossing process boundaries.
+
+An event is encoded as a single-line JSON array without whitespace:
+
+    ["<origin>","<EventClassName>",[<field values in declaration order>]]
+
+Field names are not repeated in every message: both ends share the event
+dataclasses, so positions are enough (a field count mismatch, e.g. during a
+rolling deploy, is rejected instead of silently shifting values). Datetimes
+travel as ISO 8601 strings. The origin identifies the publishing process so a
+transport can ignore its own echo.
+"""
+
+import dataclasses
+import json
+from datetime import datetime
+from typing import Any
+
+from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
+
+
+class EventDecodeError(ValueError):
+    """A message that cannot be turned back into a domain event."""
+
+
+def _event_types() -> dict[str, type[DomainEvent]]:
+    """Event classes by name (every imported DomainEvent subclass)."""
+    found: dict[str, type[DomainEvent]] = {}
+    pending = list(DomainEvent.__subclasses__())
+    while pending:
+        event_type = pending.pop()
+        found.setdefault(event_type.__name__, event_type)
+        pending.extend(event_type.__subclasses__())
+    return found
+
+
+def _is_datetime_field(field: dataclasses.Field) -> bool:
+    return field.type is datetime or field.type == "datetime"
+
+
+def encode_event(event: DomainEvent, origin: str) -> str:
+    """Encode an event as a compact single-line JSON message."""
+    values: list[Any] = []
+    for field in dataclasses.fields(event):
+        value = getattr(event, field.name)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+    return json.dumps([origin, type(event).__name__, values], separators=(",", ":"), ensure_ascii=False)
+
+
+def decode_event(message: str | bytes) -> tuple[str, DomainEvent]:
+    """Decode a message produced by encode_event.
+
+    Returns:
+        (origin, event)
+
+    Raises:
+        EventDecodeError: Malformed message, unknown event type or field mismatch
+    """
+    try:
+        origin, type_name, values = json.loads(message)
+    except (ValueError, TypeError) as e:
+        raise EventDecodeError(f"Malformed event message: {e}") from e
+
+    event_type = _event_types().get(type_name)
+    if event_type is None:
+        raise EventDecodeError(f"Unknown event type {type_name!r} (module not imported in this process?)")
+
+    fields = dataclasses.fields(event_type)
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise EventDecodeError(f"{type_name} expects {len(fields)} values, got {len(values) if isinstance(values, list) else type(values).__name__}")
+
+    kwargs: dict[str, Any] = {}
+    for field, value in zip(fields, values, strict=True):
+        if value is not None and _is_datetime_field(field):
+            value = datetime.fromisoformat(value)
+        kwargs[field.name] = value
+    try:
+        return origin, event_type(**kwargs)
+    except TypeError as e:
+        raise EventDecodeError(f"Cannot build {type_name}: {e}") from e
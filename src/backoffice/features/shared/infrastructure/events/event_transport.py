@@ -0,0 +1,39 @@
+"""Transport carrying domain events between the processes of a deployment."""
+
+import os
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
+
+EventReceiver = Callable[[DomainEvent], Awaitable[None]]
+
+
+def new_origin() -> str:
+    """Identifier of a transport endpoint (host, pid and a random suffix)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class EventTransport(ABC):
+    """Sends events published locally and receives events published by other processes.
+
+    A transport never hands an event back to the process that sent it: local
+    subscribers are served by the EventBus directly.
+    """
+
+    def __init__(self) -> None:
+        self.origin = new_origin()
+
+    @abstractmethod
+    async def start(self, receive: EventReceiver) -> None:
+        """Connect and start calling receive() with the events of other processes."""
+
+    @abstractmethod
+    async def send(self, event: DomainEvent) -> None:
+        """Send an event to the other processes (best effort, never raises)."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Disconnect and release the transport resources."""
@@ -0,0 +1,121 @@
+"""Event transport over PostgreSQL LISTEN/NOTIFY."""
+
+import asyncio
+import contextlib
+import logging
+import re
+from typing import Any
+
+from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
+from backoffice.features.shared.infrastructure.events.event_codec import EventDecodeError, decode_event, encode_event
+from backoffice.features.shared.infrastructure.events.event_transport import EventReceiver, EventTransport
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads must be shorter than 8000 bytes
+MAX_PAYLOAD_BYTES = 7999
+INBOX_SIZE = 1000
+
+
+def to_asyncpg_dsn(database_url: str) -> str:
+    """Drop the SQLAlchemy driver suffix (postgresql+asyncpg://... -> postgresql://...)."""
+    return re.sub(r"^(postgres(?:ql)?)\+\w+://", r"\1://", database_url)
+
+
+class PostgresNotifyEventTransport(EventTransport):
+    """Events travel as NOTIFY payloads on a channel every worker LISTENs to.
+
+    Uses one dedicated asyncpg connection (outside the SQLAlchemy pool) for
+    both LISTEN and NOTIFY. Notifications are queued and delivered in order by
+    a consumer task; the connection is re-established if it drops.
+    """
+
+    def __init__(self, dsn: str, channel: str = "backoffice_events", reconnect_delay: float = 2.0):
+        super().__init__()
+        self.dsn = to_asyncpg_dsn(dsn)
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.dropped = 0  # Events not sent or not delivered (diagnostics)
+        self._connection: Any = None
+        self._send_lock = asyncio.Lock()
+        self._inbox: asyncio.Queue[str] = asyncio.Queue(maxsize=INBOX_SIZE)
+        self._receive: EventReceiver | None = None
+        self._consumer: asyncio.Task | None = None
+        self._reconnecting: asyncio.Task | None = None
+        self._stopped = False
+
+    async def start(self, receive: EventReceiver) -> None:
+        self._receive = receive
+        self._stopped = False
+        await self._connect()
+        self._consumer = asyncio.create_task(self._consume(), name="pg-event-consumer")
+        logger.info(f"📡 Event bus listening on PostgreSQL channel {self.channel!r}")
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        connection = await asyncpg.connect(self.dsn)
+        await connection.add_listener(self.channel, self._on_notification)
+        connection.add_termination_listener(self._on_termination)
+        self._connection = connection
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            self._inbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _on_termination(self, connection: Any) -> None:
+        if self._stopped or connection is not self._connection:
+            return
+        logger.warning(f"⚠️ Event bus connection to PostgreSQL lost, reconnecting every {self.reconnect_delay}s")
+        self._connection = None
+        self._reconnecting = asyncio.create_task(self._reconnect(), name="pg-event-reconnect")
+
+    async def _reconnect(self) -> None:
+        while not self._stopped:
+            await asyncio.sleep(self.reconnect_delay)
+            try:
+                await self._connect()
+                logger.info("📡 Event bus reconnected to PostgreSQL")
+                return
+            except Exception as e:
+                logger.debug(f"Event bus reconnection failed: {e}")
+
+    async def _consume(self) -> None:
+        while True:
+            payload = await self._inbox.get()
+            try:
+                origin, event = decode_event(payload)
+            except EventDecodeError as e:
+                logger.warning(f"⚠️ Ignoring event from PostgreSQL: {e}")
+                continue
+            if origin != self.origin and self._receive is not None:
+                await self._receive(event)
+
+    async def send(self, event: DomainEvent) -> None:
+        payload = encode_event(event, self.origin)
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            self.dropped += 1
+            logger.warning(f"⚠️ {event.event_name()} too large for NOTIFY ({len(payload.encode())} bytes), not sent to other workers")
+            return
+        connection = self._connection
+        if connection is None:
+            self.dropped += 1
+            return
+        try:
+            async with self._send_lock:  # One query at a time per asyncpg connection
+                await connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        except Exception as e:
+            self.dropped += 1
+            logger.warning(f"⚠️ Failed to NOTIFY {event.event_name()}: {e}")
+
+    async def stop(self) -> None:
+        self._stopped = True
+        for task in (self._consumer, self._reconnecting):
+            if task is not None:
+                task.cancel()
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            with contextlib.suppress(Exception):
+                await connection.close()
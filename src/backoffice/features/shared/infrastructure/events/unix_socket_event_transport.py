@@ -0,0 +1,190 @@
+"""Event transport over a local Unix socket broker (workers of a single host)."""
+
+import asyncio
+import contextlib
+import fcntl
+import logging
+import os
+from typing import IO
+
+from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
+from backoffice.features.shared.infrastructure.events.event_codec import EventDecodeError, decode_event, encode_event
+from backoffice.features.shared.infrastructure.events.event_transport import EventReceiver, EventTransport
+
+logger = logging.getLogger(__name__)
+
+MAX_FRAME_BYTES = 1024 * 1024
+# A client whose unsent frames exceed this is too slow: the broker disconnects it
+MAX_CLIENT_BACKLOG_BYTES = 4 * 1024 * 1024
+
+
+class UnixSocketBroker:
+    """Relays newline-delimited frames from each connected client to all the others."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._client_tasks: set[asyncio.Task] = set()
+        self._server: asyncio.AbstractServer | None = None
+        self._closing = False
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(self._serve_client, path=self.path, limit=MAX_FRAME_BYTES)
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self._closing:  # Accepted just before stop(): the client reconnects to the next host
+            writer.close()
+            return
+        self._clients.add(writer)
+        task = asyncio.current_task()
+        if task is not None:
+            self._client_tasks.add(task)
+        try:
+            while frame := await reader.readline():
+                for client in list(self._clients):
+                    if client is writer:
+                        continue
+                    if client.transport.get_write_buffer_size() > MAX_CLIENT_BACKLOG_BYTES:
+                        logger.warning("⚠️ Event broker client too slow, disconnecting it")
+                        self._clients.discard(client)
+                        client.close()
+                        continue
+                    client.write(frame)
+        except (ConnectionError, ValueError) as e:
+            # ValueError: frame longer than MAX_FRAME_BYTES
+            logger.warning(f"⚠️ Event broker client dropped: {e}")
+        finally:
+            self._clients.discard(writer)
+            if task is not None:
+                self._client_tasks.discard(task)
+            writer.close()
+
+    async def stop(self) -> None:
+        # Stop accepting first, so reconnecting clients wait for the next host
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+        for client in list(self._clients):
+            client.close()
+        # Closed connections read EOF: let the client tasks finish instead of being cancelled
+        await asyncio.gather(*self._client_tasks, return_exceptions=True)
+        self._clients.clear()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+
+class UnixSocketEventTransport(EventTransport):
+    """Events relayed between the workers of a host through a Unix socket.
+
+    No separate broker process: the first worker that takes the lock file next
+    to the socket hosts the broker in its event loop, and every worker
+    (including that one) connects to it as a client. When the hosting worker
+    exits, its lock is released and the other workers elect a new host while
+    reconnecting. Events sent while reconnecting are dropped.
+    """
+
+    def __init__(self, path: str, connect_timeout: float = 5.0, reconnect_delay: float = 0.2):
+        super().__init__()
+        self.path = path
+        self.connect_timeout = connect_timeout
+        self.reconnect_delay = reconnect_delay
+        self.dropped = 0  # Events not sent (diagnostics)
+        self.broker: UnixSocketBroker | None = None
+        self._lock_file: IO[str] | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._receive: EventReceiver | None = None
+
+    async def start(self, receive: EventReceiver) -> None:
+        self._receive = receive
+        reader = await self._connect(deadline=asyncio.get_running_loop().time() + self.connect_timeout)
+        self._reader_task = asyncio.create_task(self._read_loop(reader), name="unix-event-reader")
+        role = "hosting the broker" if self.broker is not None else "client"
+        logger.info(f"📡 Event bus connected to {self.path} ({role})")
+
+    async def _connect(self, deadline: float | None) -> asyncio.StreamReader:
+        """Connect to the broker, hosting it if nobody does (retries until the deadline)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self.path, limit=MAX_FRAME_BYTES)
+                return reader
+            except (FileNotFoundError, ConnectionRefusedError):
+                if await self._host_broker():
+                    continue
+                if deadline is not None and loop.time() >= deadline:
+                    raise ConnectionError(f"No event broker reachable on {self.path}") from None
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def _host_broker(self) -> bool:
+        """Start the broker if no other process holds the lock."""
+        if self.broker is not None:
+            return False
+        lock_file = open(f"{self.path}.lock", "a")  # noqa: SIM115 - held for the broker lifetime
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)  # Left over by a previous host that crashed
+        broker = UnixSocketBroker(self.path)
+        await broker.start()
+        self.broker, self._lock_file = broker, lock_file
+        logger.info(f"📡 Hosting the event broker on {self.path} (pid {os.getpid()})")
+        return True
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        while True:
+            try:
+                frame = await reader.readline()
+            except (ConnectionError, ValueError):
+                frame = b""
+            if not frame:
+                self._writer = None
+                logger.warning("⚠️ Event broker connection lost, reconnecting")
+                reader = await self._connect(deadline=None)
+                continue
+            try:
+                origin, event = decode_event(frame)
+            except EventDecodeError as e:
+                logger.warning(f"⚠️ Ignoring event from broker: {e}")
+                continue
+            if origin != self.origin and self._receive is not None:
+                await self._receive(event)
+
+    async def send(self, event: DomainEvent) -> None:
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            self.dropped += 1
+            return
+        try:
+            writer.write(encode_event(event, self.origin).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError as e:
+            self.dropped += 1
+            logger.debug(f"Event not sent to broker: {e}")
+
+    async def stop(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader_task
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self.broker is not None:
+            await self.broker.stop()
+            self.broker = None
+        if self._lock_file is not None:
+            self._lock_file.close()  # Releases the flock
+            self._lock_file = None
@@ -0,0 +1,327 @@
+"""In-process metrics exposed in the Prometheus text format (GET /metrics).
+
+Cheap enough to leave on: a labelled child is looked up in a dict, an
+observation is a bisect plus three additions under a per-child lock, and
+nothing is formatted until /metrics is scraped.
+
+    with STAGE_DURATION.time(stage="cover"):
+        cover = await ...
+    PROVIDER_CALL_DURATION.labels(provider="gemini", model=m, operation="generate_cover", outcome="success").observe(1.2)
+    record_cache("export_artifact", hit=True)
+
+All the application metrics are declared at the bottom of this module, so
+their names and labels are documented in one place.
+"""
+
+import asyncio
+import bisect
+import functools
+import inspect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from typing import Any, Generic, TypeVar
+
+# Seconds: from fast DB queries to long provider calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class CounterChild:
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _Timer:
+    """Observes the elapsed time of a with-block (also across awaits)."""
+
+    __slots__ = ("_child", "_start")
+
+    def __init__(self, child: "HistogramChild"):
+        self._child = child
+        self._start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._child.observe(time.perf_counter() - self._start)
+
+
+class HistogramChild:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot: above the highest bucket
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+
+ChildT = TypeVar("ChildT", CounterChild, HistogramChild)
+
+
+class _Metric(ABC, Generic[ChildT]):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], ChildT] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self) -> ChildT:
+        """Fresh child holding the values of one label set."""
+
+    def labels(self, **labels: object) -> ChildT:
+        """Child for a label set (created on first use)."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def children(self) -> list[tuple[tuple[str, ...], ChildT]]:
+        with self._lock:
+            return list(self._children.items())
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """Exposition lines of every child."""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+class Counter(_Metric[CounterChild]):
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        self.labels(**labels).inc(amount)
+
+    def samples(self) -> Iterable[str]:
+        for key, child in self.children():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+
+
+class Histogram(_Metric[HistogramChild]):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float, **labels: object) -> None:
+        self.labels(**labels).observe(value)
+
+    def time(self, **labels: object) -> _Timer:
+        """Context manager observing the duration of its block."""
+        return self.labels(**labels).time()
+
+    def samples(self) -> Iterable[str]:
+        for key, child in self.children():
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += bucket_count
+                le = 'le="' + _format_value(bound) + '"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {count}"
+
+
+class MetricsRegistry:
+    """Metrics of the process, rendered together for /metrics."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[str]]] = []
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Add a function returning exposition lines computed at scrape time."""
+        self._collectors.append(collector)
+
+    def get(self, name: str) -> _Metric:
+        return self._metrics[name]
+
+    def render(self) -> str:
+        blocks = [metric.render() for metric in self._metrics.values()]
+        for collector in self._collectors:
+            blocks.append("\n".join(collector()))
+        return "\n".join(block for block in blocks if block) + "\n"
+
+    def clear(self) -> None:
+        """Reset every value (useful for testing)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+    metric = Counter(name, documentation, labelnames)
+    REGISTRY.register(metric)
+    return metric
+
+
+def histogram(name: str, documentation: str, labelnames: Iterable[str] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+    metric = Histogram(name, documentation, labelnames, buckets)
+    REGISTRY.register(metric)
+    return metric
+
+
+# ---- Application metrics ----
+
+STAGE_DURATION = histogram(
+    "backoffice_generation_stage_duration_seconds",
+    "Duration of ebook generation stages (cover, pages, text_removal, overlays, assembly, total).",
+    ("stage",),
+)
+PROVIDER_CALL_DURATION = histogram(
+    "backoffice_provider_call_duration_seconds",
+    "Latency of image provider calls.",
+    ("provider", "model", "operation", "outcome"),
+)
+LIMITER_WAIT = histogram(
+    "backoffice_limiter_wait_seconds",
+    "Time spent waiting for a slot in a concurrency limiter.",
+    ("limiter",),
+    buckets=(0.001, *DEFAULT_BUCKETS),
+)
+DB_QUERY_DURATION = histogram(
+    "backoffice_db_query_duration_seconds",
+    "Duration of database repository methods.",
+    ("repository", "method"),
+    buckets=FAST_BUCKETS,
+)
+PDF_ASSEMBLY_DURATION = histogram(
+    "backoffice_pdf_assembly_duration_seconds",
+    "Duration of PDF assembly (HTML rendering to PDF).",
+)
+EXPORT_DURATION = histogram(
+    "backoffice_export_duration_seconds",
+    "Duration of ebook exports, including cache hits.",
+    ("format",),
+)
+BYTES_PRODUCED = counter(
+    "backoffice_bytes_produced_total",
+    "Bytes of images and documents produced.",
+    ("artifact",),
+)
+CACHE_REQUESTS = counter(
+    "backoffice_cache_requests_total",
+    "Cache lookups by result (hit or miss).",
+    ("cache", "result"),
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup."""
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def _cache_hit_ratios() -> Iterable[str]:
+    totals: dict[str, dict[str, float]] = {}
+    for (cache, result), child in CACHE_REQUESTS.children():
+        totals.setdefault(cache, {})[result] = child.value
+    if not totals:
+        return
+    yield "# HELP backoffice_cache_hit_ratio Cache hits / lookups since start."
+    yield "# TYPE backoffice_cache_hit_ratio gauge"
+    for cache, results in sorted(totals.items()):
+        lookups = results.get("hit", 0.0) + results.get("miss", 0.0)
+        ratio = results.get("hit", 0.0) / lookups if lookups else 0.0
+        yield f'backoffice_cache_hit_ratio{{cache="{_escape(cache)}"}} {_format_value(round(ratio, 6))}'
+
+
+REGISTRY.add_collector(_cache_hit_ratios)
+
+
+@asynccontextmanager
+async def limited(semaphore: asyncio.Semaphore, limiter: str) -> AsyncIterator[None]:
+    """Acquire a semaphore, observing the time spent waiting for it."""
+    start = time.perf_counter()
+    async with semaphore:
+        LIMITER_WAIT.observe(time.perf_counter() - start, limiter=limiter)
+        yield
+
+
+def timed_methods(histogram_metric: Histogram, component_label: str, method_label: str) -> Callable[[type], type]:
+    """Class decorator observing the duration of every public coroutine method.
+
+    Labels: component_label=<class name>, method_label=<method name>.
+    """
+
+    def decorate(cls: type) -> type:
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.iscoroutinefunction(method):
+                continue
+            setattr(cls, name, _timed_coroutine(method, histogram_metric, {component_label: cls.__name__, method_label: name}))
+        return cls
+
+    return decorate
+
+
+def _timed_coroutine(method: Callable[..., Any], histogram_metric: Histogram, labels: dict[str, str]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with histogram_metric.time(**labels):
+            return await method(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,254 @@
+"""On-demand profiling of single requests and background jobs (pyinstrument).
+
+Admins listed in ADMIN_EMAILS add ``?profile=1`` (or the header
+``X-Profile: 1``) to a request; ProfilingMiddleware profiles that request
+only and returns the report link in the ``X-Profile-Report`` header.
+Background jobs wrapped with profiled_job() are profiled when scheduled
+from a profiled request, or always when listed in PROFILE_JOBS.
+
+Profiles use pyinstrument in async mode: only the profiled task and the
+tasks it creates are sampled, and time spent awaiting (I/O, other tasks
+hogging the loop, asyncio.to_thread work) shows as ``[await]`` under the
+awaiting call, so slow requests show what they were waiting for.
+
+pyinstrument is an optional dependency (``pip install backoffice[profiling]``).
+Without it, or without admin emails, the middleware is not installed and
+profiled_job() costs a ContextVar lookup.
+
+Reports are written to PROFILES_DIR as <id>.txt (call tree) and
+<id>.speedscope.json (flame graph, open in https://www.speedscope.app).
+"""
+
+import asyncio
+import contextvars
+import functools
+import importlib.util
+import logging
+import os
+import re
+import secrets
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+from urllib.parse import parse_qs
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backoffice.features.auth.infrastructure.admins import get_admin_emails
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+PROFILE_HEADER = "X-Profile-Report"
+PROFILE_ID_PATTERN = re.compile(r"^\d{8}-\d{6}_[0-9a-f]{8}$")
+REPORT_URL = "/api/admin/profiles/{profile_id}"
+
+PYINSTRUMENT_AVAILABLE = importlib.util.find_spec("pyinstrument") is not None
+
+_active_profile: contextvars.ContextVar["Profile | None"] = contextvars.ContextVar("active_profile", default=None)
+# Admin who asked for the profile; inherited by the jobs a profiled request schedules
+_requested_by: contextvars.ContextVar[str | None] = contextvars.ContextVar("profile_requested_by", default=None)
+
+
+class ProfilingConfig:
+    """Who may profile requests, which jobs are always profiled, and where reports go."""
+
+    def __init__(self, admin_emails: Iterable[str] = (), jobs: Iterable[str] = (), profiles_dir: Path | str = "./storage/profiles", interval_ms: float = 1.0):
+        self.admin_emails = frozenset(email.strip().lower() for email in admin_emails if email.strip())
+        self.jobs = frozenset(job.strip() for job in jobs if job.strip())
+        self.profiles_dir = Path(profiles_dir)
+        self.interval = max(interval_ms, 0.1) / 1000
+
+    @classmethod
+    def from_env(cls) -> "ProfilingConfig":
+        return cls(
+            admin_emails=get_admin_emails(),
+            jobs=os.getenv("PROFILE_JOBS", "").split(","),
+            profiles_dir=os.getenv("PROFILES_DIR", "./storage/profiles"),
+            interval_ms=float(os.getenv("PROFILING_INTERVAL_MS", "1")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether requests can be profiled at all."""
+        return bool(self.admin_emails) and PYINSTRUMENT_AVAILABLE
+
+    def is_admin(self, email: str | None) -> bool:
+        return bool(email) and email.lower() in self.admin_emails
+
+    def report_path(self, profile_id: str, kind: str = "txt") -> Path | None:
+        """Path of a stored report ("txt" or "speedscope"), None for an unknown or malformed id."""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self.profiles_dir / (f"{profile_id}.speedscope.json" if kind == "speedscope" else f"{profile_id}.txt")
+        return path if path.is_file() else None
+
+
+_config: ProfilingConfig | None = None
+
+
+def get_profiling_config() -> ProfilingConfig:
+    """Profiling configuration, read from the environment once."""
+    global _config
+    if _config is None:
+        _config = ProfilingConfig.from_env()
+        if (_config.admin_emails or _config.jobs) and not PYINSTRUMENT_AVAILABLE:
+            logger.warning("⚠️ Profiling configured but pyinstrument is not installed (pip install backoffice[profiling]), disabled")
+    return _config
+
+
+class Profile:
+    """One profiled request or job (a pyinstrument session and its reports)."""
+
+    def __init__(self, name: str, interval: float, requested_by: str | None = None):
+        from pyinstrument import Profiler  # Optional dependency, only imported when profiling
+
+        self.id = f"{datetime.now(UTC):%Y%m%d-%H%M%S}_{secrets.token_hex(4)}"
+        self.name = name
+        self.requested_by = requested_by
+        self.interval = interval
+        self.started_at = datetime.now(UTC)
+        self.duration = 0.0
+        self.sample_count = 0
+        self.active = False
+        self.outer_context = contextvars.Context()  # Context the profile was started from
+        # Async mode: samples the current task and the tasks it creates only
+        self._profiler = Profiler(interval=interval, async_mode="enabled")
+
+    def start(self) -> None:
+        self.active = True
+        self._profiler.start()
+
+    def stop(self) -> None:
+        self.active = False
+        session = self._profiler.stop()
+        self.duration = session.duration
+        self.sample_count = session.sample_count
+
+    def save(self, profiles_dir: Path) -> Path:
+        """Write the text summary and the speedscope flame graph, returning the summary path."""
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        profiles_dir.mkdir(parents=True, exist_ok=True)
+        (profiles_dir / f"{self.id}.speedscope.json").write_text(self._profiler.output(renderer=SpeedscopeRenderer()))
+        summary_path = profiles_dir / f"{self.id}.txt"
+        summary_path.write_text(self.summary())
+        return summary_path
+
+    def summary(self) -> str:
+        header = [
+            f"Profile {self.id}: {self.name}",
+            f"Requested by {self.requested_by or '(always-on job profiling)'}, started {self.started_at.isoformat(timespec='seconds')}",
+            f"Wall time {self.duration:.3f}s, {self.sample_count} samples every {self.interval * 1000:g}ms",
+        ]
+        return "\n".join(header) + "\n" + self._profiler.output_text(unicode=True, color=False)
+
+
+# ---- Entry points ----
+
+
+@asynccontextmanager
+async def profile(name: str, requested_by: str | None = None, config: ProfilingConfig | None = None) -> AsyncIterator[Profile]:
+    """Profile the current task (and the tasks it creates) for the block, then save the report.
+
+    Nested calls join the enclosing profile. Requires pyinstrument.
+    """
+    current = _active_profile.get()
+    if current is not None and current.active:
+        yield current
+        return
+
+    config = config if config is not None else get_profiling_config()
+    session = Profile(name, config.interval, requested_by)
+    session.outer_context = contextvars.copy_context()
+    profile_token = _active_profile.set(session)
+    requested_by_token = _requested_by.set(requested_by)
+    session.start()
+    try:
+        yield session
+    finally:
+        session.stop()
+        _active_profile.reset(profile_token)
+        _requested_by.reset(requested_by_token)
+        try:
+            path = await asyncio.to_thread(session.save, config.profiles_dir)
+            logger.info(f"🔬 Profile {session.id} of {name}: {session.duration:.3f}s, {session.sample_count} samples, report {path}")
+        except OSError as e:
+            logger.error(f"❌ Could not save profile {session.id} of {name}: {e}")
+
+
+def profiled_job(name: str, job: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """Wrap a background job so it is profiled when a profiled request scheduled it or PROFILE_JOBS lists it.
+
+    pyinstrument marks the context of a profiled task, and tasks created by
+    that request inherit the mark. A job scheduled by a profiled request
+    therefore runs in its own task, in the context captured before the
+    request profile started, so it can be profiled on its own.
+    """
+
+    @functools.wraps(job)
+    async def run(*args: P.args, **kwargs: P.kwargs) -> T:
+        requested_by = _requested_by.get()
+        if not PYINSTRUMENT_AVAILABLE or (requested_by is None and name not in get_profiling_config().jobs):
+            return await job(*args, **kwargs)
+
+        async def run_profiled() -> T:
+            async with profile(f"job {name}", requested_by):
+                return await job(*args, **kwargs)
+
+        parent = _active_profile.get()
+        if parent is None or parent.active:
+            return await run_profiled()  # Own profile, or joins the running one
+        return await asyncio.create_task(run_profiled(), context=parent.outer_context.copy())
+
+    return run
+
+
+def _profiling_requested(scope: Scope) -> bool:
+    for key, value in scope["headers"]:
+        if key == b"x-profile":
+            return value.strip().lower() in (b"1", b"true")
+    query_string = scope.get("query_string", b"")
+    if b"profile=" not in query_string:
+        return False
+    return parse_qs(query_string.decode("latin-1")).get("profile", [""])[-1].lower() in ("1", "true")
+
+
+class ProfilingMiddleware:
+    """Profile requests flagged with ?profile=1 or X-Profile: 1 by an admin.
+
+    Installed inside AuthMiddleware (request.state.session is set). The
+    X-Profile-Report header links to the report, which is written once the
+    response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp, config: ProfilingConfig | None = None):
+        self.app = app
+        self.config = config
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _profiling_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        config = self.config if self.config is not None else get_profiling_config()
+        session = scope.get("state", {}).get("session") or {}
+        email = session.get("email")
+        if not config.enabled or not config.is_admin(email):
+            logger.warning(f"🚫 Profiling of {scope['path']} requested by non-admin {email or 'anonymous'}, ignored")
+            await self.app(scope, receive, send)
+            return
+
+        async with profile(f"{scope['method']} {scope['path']}", requested_by=email, config=config) as session_profile:
+
+            async def send_with_report_link(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(PROFILE_HEADER, REPORT_URL.format(profile_id=session_profile.id))
+                await send(message)
+
+            await self.app(scope, receive, send_with_report_link)
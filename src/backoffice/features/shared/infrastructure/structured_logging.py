@@ -0,0 +1,215 @@
+"""Non-blocking structured logging.
+
+configure_logging() gives the root logger a single QueueHandler: callers
+(the event loop thread included) only build the record and put it on a
+queue, and a QueueListener thread formats and writes it.
+
+    {"ts": "2026-10-18T09:12:03.412Z", "level": "INFO", "logger": "backoffice.main",
+     "message": "...", "trace_id": "4bf9...", "size_bytes": 48213}
+
+- Extra fields (logger.info(..., extra={"size_bytes": n})) become JSON keys,
+  and the trace id of the current span is added when there is one.
+- Values larger than LOG_MAX_VALUE_CHARS are truncated, bytes are logged
+  as their size only: no multi-megabyte prompts, JSON or base64 images.
+- LOG_SAMPLING keeps a fraction of the records of chatty modules, e.g.
+  "backoffice.features.ebook.shared.domain.services.page_generation=0.1".
+  Warnings and errors are never sampled out.
+
+LOG_FORMAT=text keeps the human-readable format for local development.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from backoffice.features.shared.infrastructure.tracing import current_trace_id
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_MAX_VALUE_CHARS = 2000
+
+# Attributes every LogRecord has: anything else came from extra=
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName", "trace_id"}
+
+# Loggers configured by uvicorn with their own (blocking) handlers
+_SERVER_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+def truncate(value: Any, max_chars: int) -> Any:
+    """Shorten a log value: bytes become their size, long strings keep their head."""
+    if isinstance(value, bytes | bytearray | memoryview):
+        return f"<{len(value)} bytes>"
+    if value is None or isinstance(value, bool | int | float):
+        return value
+    if isinstance(value, Mapping | list | tuple):
+        text = json.dumps(value, default=str)
+        if len(text) <= max_chars:
+            return value  # Kept structured in the JSON output
+    else:
+        text = str(value)
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}… [{len(text) - max_chars} more chars]"
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fraction (the rate) of the records below WARNING for the configured logger prefixes."""
+
+    def __init__(self, rates: Mapping[str, float]):
+        super().__init__()
+        # Longest prefix first, so a module rate overrides its package rate
+        self.rates = sorted(((prefix, max(0.0, min(rate, 1.0))) for prefix, rate in rates.items()), key=lambda item: -len(item[0]))
+        # Deterministic: each record adds the rate, a record is kept whenever the sum reaches 1
+        self._credits: dict[str, float] = {prefix: 1.0 - rate if rate else 0.0 for prefix, rate in self.rates}  # The first record is kept
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: str) -> "SamplingFilter":
+        """Build from "logger.prefix=rate,other.prefix=rate" (rate between 0 and 1)."""
+        rates: dict[str, float] = {}
+        for item in spec.split(","):
+            prefix, _, rate = item.partition("=")
+            if prefix.strip() and rate.strip():
+                rates[prefix.strip()] = float(rate)
+        return cls(rates)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                with self._lock:
+                    credit = self._credits[prefix] + rate
+                    keep = credit >= 1.0 - 1e-9
+                    self._credits[prefix] = credit - 1.0 if keep else credit
+                return keep
+        return True
+
+
+class StructuredQueueHandler(QueueHandler):
+    """Enqueue records already rendered and truncated, with the current trace id.
+
+    prepare() runs on the logging thread, so everything that depends on it
+    (message arguments, exception, trace context) is resolved here; the
+    listener thread only formats and writes.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, max_value_chars: int = DEFAULT_MAX_VALUE_CHARS):
+        super().__init__(log_queue)
+        self.max_value_chars = max_value_chars
+        self._exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared = logging.makeLogRecord(record.__dict__)
+        prepared.msg = truncate(record.getMessage(), self.max_value_chars)
+        prepared.args = None
+        if record.exc_info:
+            prepared.exc_text = self._exception_formatter.formatException(record.exc_info)
+        prepared.exc_info = None
+        if record.stack_info:
+            prepared.stack_info = truncate(record.stack_info, self.max_value_chars)
+        prepared.trace_id = current_trace_id()
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                setattr(prepared, key, truncate(value, self.max_value_chars))
+        return prepared
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "trace_id", None):
+            entry["trace_id"] = record.trace_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+_listener: QueueListener | None = None
+_lock = threading.Lock()
+
+
+def configure_logging(
+    level: str | None = None,
+    log_format: str | None = None,
+    max_value_chars: int | None = None,
+    sampling: str | None = None,
+    handlers: Iterable[logging.Handler] | None = None,
+) -> QueueListener:
+    """Route all logging through a queue to a listener thread (arguments default to the environment).
+
+    Args:
+        level: LOG_LEVEL (INFO)
+        log_format: LOG_FORMAT, "json" (default) or "text"
+        max_value_chars: LOG_MAX_VALUE_CHARS, longest message or extra value kept whole
+        sampling: LOG_SAMPLING, "logger.prefix=rate,..." for high-frequency modules
+        handlers: Output handlers (stderr by default); the formatter is set on them
+
+    Returns:
+        The started listener (stopped at exit, or by the next configure_logging call)
+    """
+    global _listener
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    log_format = (log_format or os.getenv("LOG_FORMAT", "json")).lower()
+    if max_value_chars is None:
+        max_value_chars = int(os.getenv("LOG_MAX_VALUE_CHARS", str(DEFAULT_MAX_VALUE_CHARS)))
+    if sampling is None:
+        sampling = os.getenv("LOG_SAMPLING", "")
+
+    formatter = logging.Formatter(TEXT_FORMAT, datefmt="%Y-%m-%d %H:%M:%S") if log_format == "text" else JsonFormatter()
+    output_handlers = list(handlers) if handlers is not None else [logging.StreamHandler(sys.stderr)]
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue, max_value_chars)
+    if sampling:
+        queue_handler.addFilter(SamplingFilter.parse(sampling))
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(getattr(logging, level))
+        for name in _SERVER_LOGGERS:
+            server_logger = logging.getLogger(name)
+            server_logger.handlers.clear()
+            server_logger.propagate = True
+
+        _listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+        _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,512 @@
+"""Tracing spans for the generation pipeline, written to one JSON file per trace.
+
+The API follows OpenTelemetry's shape (32-hex trace ids, 16-hex span ids,
+parent span ids, attributes, OK/ERROR status, ns timestamps), without an
+SDK or collector:
+
+    with tracer.start_trace("create_ebook", theme="dinosaurs") as span:   # Root (or child if already traced)
+        span.set_attribute("ebook.id", ebook.id)
+        with tracer.span("strategy.cover"):                              # Child, no-op outside a trace
+            ...
+
+    @traced("comfy.queue_prompt")                                        # Sync or async functions
+    def queue_prompt(...): ...
+
+The current span lives in a context variable, so it follows awaits, tasks
+created by asyncio.gather and asyncio.to_thread. Outside a trace, span()
+returns a shared non-recording span: instrumentation on hot paths (listing
+queries, dashboard polls) costs one context variable lookup.
+
+Tracing is off unless TRACING_ENABLED=true. When the root span of a trace
+ends, its spans are handed to the exporter. JsonFileSpanExporter writes them
+from a background thread to TRACE_DIR (ebook_<id>/ when the root has an
+"ebook.id" attribute) in the Chrome trace event format, which Perfetto
+(ui.perfetto.dev), chrome://tracing and speedscope open as a flame graph.
+The same file has the spans in an OTLP-like "spans" list. The oldest files
+are deleted beyond TRACE_MAX_FILES or TRACE_MAX_AGE_DAYS.
+
+Domain events carry the trace id of the span that published them
+(DomainEvent.trace_id), so handlers, progress messages and other workers
+can be correlated with the trace.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import re
+import secrets
+import threading
+import time
+import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_DIR = "./storage/traces"
+DEFAULT_MAX_TRACE_FILES = 500
+DEFAULT_MAX_TRACE_AGE_DAYS = 7.0
+MAX_SPANS_PER_TRACE = 20000
+
+AttributeValue = str | bool | int | float
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+
+class Span:
+    """A timed operation of a trace."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "status", "status_description", "events", "thread_name")
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, attributes: dict[str, AttributeValue] | None = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes: dict[str, AttributeValue] = dict(attributes or {})
+        self.status = "UNSET"
+        self.status_description: str | None = None
+        self.events: list[dict[str, Any]] = []
+        self.thread_name = threading.current_thread().name
+
+    def is_recording(self) -> bool:
+        return self.end_ns is None
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict[str, AttributeValue]) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, attributes: dict[str, AttributeValue] | None = None) -> None:
+        self.events.append({"name": name, "time_ns": time.time_ns(), "attributes": dict(attributes or {})})
+
+    def set_status(self, status: str, description: str | None = None) -> None:
+        """Set the status: "OK" or "ERROR"."""
+        self.status = status
+        self.status_description = description
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.add_event(
+            "exception",
+            {
+                "exception.type": type(exception).__name__,
+                "exception.message": str(exception),
+                "exception.stacktrace": "".join(traceback.format_exception(exception))[-4000:],
+            },
+        )
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.time_ns()) - self.start_ns
+
+    def to_dict(self) -> dict[str, Any]:
+        """OTLP-like JSON representation."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_description or ""},
+            "events": self.events,
+        }
+
+
+class NonRecordingSpan:
+    """Span API that records nothing (returned outside a trace)."""
+
+    __slots__ = ()
+
+    trace_id = None
+    span_id = None
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, AttributeValue]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: dict[str, AttributeValue] | None = None) -> None:
+        pass
+
+    def set_status(self, status: str, description: str | None = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+NON_RECORDING_SPAN = NonRecordingSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def get_current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_trace_id() -> str | None:
+    """Trace id of the current span, or None outside a trace."""
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+class JsonFileSpanExporter:
+    """Writes each finished trace to a JSON file (Chrome trace events + OTLP-like spans).
+
+    export() only queues the spans: a writer thread builds and writes the
+    document, then deletes the oldest files beyond max_files or max_age_days,
+    so the event loop never waits on the disk and TRACE_DIR stays bounded.
+    """
+
+    def __init__(self, trace_dir: str | Path = DEFAULT_TRACE_DIR, max_files: int = DEFAULT_MAX_TRACE_FILES, max_age_days: float = DEFAULT_MAX_TRACE_AGE_DAYS):
+        self.trace_dir = Path(trace_dir)
+        self.max_files = max_files
+        self.max_age_days = max_age_days
+        self._queue: queue.Queue[tuple[list[Span], int] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+
+    def export(self, spans: list[Span], dropped: int = 0) -> None:
+        """Queue a finished trace for writing."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_queued, name="trace-writer", daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)
+        self._queue.put((spans, dropped))
+
+    def flush(self) -> None:
+        """Wait until every queued trace is written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def _write_queued(self) -> None:
+        while True:
+            spans, dropped = self._queue.get()
+            try:
+                path = self.write(spans, dropped)
+                logger.info(f"🧭 Trace {spans[0].trace_id[:8]} written: {path} ({len(spans)} spans)")
+                self.prune()
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to export trace {spans[0].trace_id[:8]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def write(self, spans: list[Span], dropped: int = 0) -> Path:
+        """Write a trace file now (blocking)."""
+        root = next(span for span in spans if span.parent_id is None)
+        started = datetime.fromtimestamp(root.start_ns / 1e9, tz=UTC).strftime("%Y%m%dT%H%M%S")
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", root.name)
+        ebook_id = root.attributes.get("ebook.id")
+        directory = self.trace_dir / (f"ebook_{ebook_id}" if ebook_id is not None else "other")
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{started}_{name}_{root.trace_id[:8]}.json"
+
+        document = {
+            "traceEvents": _chrome_trace_events(spans),
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": root.trace_id, "root": root.name, "ebook_id": ebook_id, "dropped_spans": dropped},
+            "spans": [span.to_dict() for span in spans],
+        }
+        path.write_text(json.dumps(document, default=str))
+        return path
+
+    def prune(self) -> None:
+        """Delete trace files older than max_age_days, then the oldest beyond max_files."""
+        files = []
+        for path in self.trace_dir.glob("*/*.json"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        files.sort(reverse=True)  # Newest first
+        cutoff = time.time() - self.max_age_days * 86400
+        for index, (mtime, path) in enumerate(files):
+            if index >= self.max_files or mtime < cutoff:
+                path.unlink(missing_ok=True)
+
+
+def _chrome_trace_events(spans: list[Span]) -> list[dict[str, Any]]:
+    """Complete ("X") events, laid out on lanes where spans nest under their ancestors.
+
+    Concurrent spans (pages generated in parallel) cannot share a flame graph
+    row, so each span goes on its parent's lane when the innermost span open
+    there is one of its ancestors, else on the first lane where that holds (or
+    which is free), else on a new lane.
+    """
+    ordered = sorted(spans, key=lambda span: (span.start_ns, -(span.end_ns or 0)))
+    origin = ordered[0].start_ns if ordered else 0
+    parents = {span.span_id: span.parent_id for span in spans}
+    lanes: list[list[tuple[int, str]]] = []  # Per lane, (end time, span id) of the open spans (a stack)
+    lane_of: dict[str, int] = {}
+    events: list[dict[str, Any]] = []
+
+    def ancestors(span: Span) -> set[str]:
+        found: set[str] = set()
+        parent_id = span.parent_id
+        while parent_id is not None and parent_id not in found:
+            found.add(parent_id)
+            parent_id = parents.get(parent_id)
+        return found
+
+    def fits(lane: list[tuple[int, str]], span: Span, end: int, span_ancestors: set[str]) -> bool:
+        while lane and lane[-1][0] <= span.start_ns:
+            lane.pop()
+        return not lane or (lane[-1][1] in span_ancestors and lane[-1][0] >= end)
+
+    for span in ordered:
+        end = span.end_ns or span.start_ns
+        span_ancestors = ancestors(span)
+        parent_lane = lane_of.get(span.parent_id or "")
+        candidates = ([parent_lane] if parent_lane is not None else []) + [index for index in range(len(lanes)) if index != parent_lane]
+        lane_index = next((index for index in candidates if fits(lanes[index], span, end, span_ancestors)), None)
+        if lane_index is None:
+            lanes.append([])
+            lane_index = len(lanes) - 1
+        lanes[lane_index].append((end, span.span_id))
+        lane_of[span.span_id] = lane_index
+
+        args: dict[str, Any] = {"span_id": span.span_id, "parent_span_id": span.parent_id, "thread": span.thread_name, **span.attributes}
+        if span.status == "ERROR":
+            args["error"] = span.status_description
+        events.append(
+            {
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start_ns - origin) / 1000,
+                "dur": (end - span.start_ns) / 1000,
+                "pid": 1,
+                "tid": lane_index + 1,
+                "args": args,
+            }
+        )
+    return events
+
+
+class _ActiveTrace:
+    __slots__ = ("spans", "dropped")
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.dropped = 0
+
+
+class Tracer:
+    """Creates spans and exports each trace when its root span ends."""
+
+    def __init__(self, exporter: JsonFileSpanExporter | None = None, enabled: bool = True, max_spans_per_trace: int = MAX_SPANS_PER_TRACE):
+        self.exporter = exporter
+        self.enabled = enabled
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces: dict[str, _ActiveTrace] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def active_trace_count(self) -> int:
+        return len(self._traces)
+
+    @contextmanager
+    def start_trace(self, name: str, **attributes: AttributeValue) -> Iterator[Span | NonRecordingSpan]:
+        """Span starting a new trace, or a child span when a trace is already active."""
+        parent = _current_span.get()
+        if parent is not None:
+            with _SpanScope(self, name, parent.trace_id, parent.span_id, attributes) as span:
+                yield span
+            return
+        if not self.enabled:
+            yield NON_RECORDING_SPAN
+            return
+
+        trace_id = secrets.token_hex(16)
+        with self._lock:
+            self._traces[trace_id] = _ActiveTrace()
+        try:
+            with _SpanScope(self, name, trace_id, None, attributes) as span:
+                yield span
+        finally:
+            self._finish_trace(trace_id)
+
+    def span(self, name: str, **attributes: AttributeValue) -> "_SpanScope | _NoopScope":
+        """Child span of the current span (non-recording outside a trace)."""
+        parent = _current_span.get()
+        if parent is None:
+            return _NOOP_SCOPE
+        return _SpanScope(self, name, parent.trace_id, parent.span_id, attributes)
+
+    def resume(self, trace_id: str | None, name: str, **attributes: AttributeValue) -> "_SpanScope | _NoopScope":
+        """Span of trace_id, if that trace is still active in this process.
+
+        Child of the current span when it belongs to the trace, else of the
+        trace root (the context was lost, e.g. in queued event handlers).
+        """
+        trace = self._traces.get(trace_id) if trace_id else None
+        if trace_id is None or trace is None or not trace.spans:
+            return _NOOP_SCOPE
+        current = _current_span.get()
+        parent_id = current.span_id if current is not None and current.trace_id == trace_id else trace.spans[0].span_id
+        return _SpanScope(self, name, trace_id, parent_id, attributes)
+
+    def _record(self, span: Span) -> bool:
+        trace = self._traces.get(span.trace_id)
+        if trace is None:
+            return False  # Trace already exported (span outliving its root)
+        with self._lock:
+            if len(trace.spans) >= self.max_spans_per_trace:
+                trace.dropped += 1
+                return False
+            trace.spans.append(span)
+        return True
+
+    def _finish_trace(self, trace_id: str) -> None:
+        with self._lock:
+            trace = self._traces.pop(trace_id, None)
+        if trace is None or not trace.spans or self.exporter is None:
+            return
+        self.exporter.export(trace.spans, trace.dropped)
+
+
+class _SpanScope:
+    """Context manager making a new span current for its block (sync or across awaits)."""
+
+    __slots__ = ("_tracer", "_name", "_trace_id", "_parent_id", "_attributes", "_span", "_token")
+
+    def __init__(self, tracer: Tracer, name: str, trace_id: str, parent_id: str | None, attributes: dict[str, AttributeValue]):
+        self._tracer = tracer
+        self._name = name
+        self._trace_id = trace_id
+        self._parent_id = parent_id
+        self._attributes = attributes
+        self._span: Span | None = None
+        self._token = None
+
+    def __enter__(self) -> Span | NonRecordingSpan:
+        span = Span(self._name, self._trace_id, self._parent_id, self._attributes)
+        if not self._tracer._record(span):
+            return NON_RECORDING_SPAN
+        self._span = span
+        self._token = _current_span.set(span)  # type: ignore[assignment]
+        return span
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: object) -> None:
+        span = self._span
+        if span is None:
+            return
+        if exc is not None:
+            span.record_exception(exc)
+            span.set_status("ERROR", f"{type(exc).__name__}: {exc}")
+        elif span.status == "UNSET":
+            span.status = "OK"
+        span.end_ns = time.time_ns()
+        if self._token is not None:
+            _current_span.reset(self._token)
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> NonRecordingSpan:
+        return NON_RECORDING_SPAN
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+_NOOP_SCOPE = _NoopScope()
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer (TRACING_ENABLED, TRACE_DIR, TRACE_MAX_FILES, TRACE_MAX_AGE_DAYS)."""
+    global _tracer
+    if _tracer is None:
+        enabled = os.getenv("TRACING_ENABLED", "false").lower() in ("1", "true", "yes")
+        exporter = JsonFileSpanExporter(
+            os.getenv("TRACE_DIR", DEFAULT_TRACE_DIR),
+            max_files=int(os.getenv("TRACE_MAX_FILES", str(DEFAULT_MAX_TRACE_FILES))),
+            max_age_days=float(os.getenv("TRACE_MAX_AGE_DAYS", str(DEFAULT_MAX_TRACE_AGE_DAYS))),
+        )
+        _tracer = Tracer(exporter=exporter, enabled=enabled)
+    return _tracer
+
+
+def traced(name: str | None = None, **attributes: AttributeValue) -> Callable[[FuncT], FuncT]:
+    """Decorator running a function (sync or async) in a child span of the current trace."""
+
+    def decorate(func: FuncT) -> FuncT:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with get_tracer().span(span_name, **attributes):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with get_tracer().span(span_name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def traced_methods(prefix: str | None = None) -> Callable[[type], type]:
+    """Class decorator tracing every public coroutine method as "<prefix>.<method>"."""
+
+    def decorate(cls: type) -> type:
+        span_prefix = prefix or cls.__name__
+        for method_name, method in list(vars(cls).items()):
+            if method_name.startswith("_") or not inspect.iscoroutinefunction(method):
+                continue
+            setattr(cls, method_name, traced(f"{span_prefix}.{method_name}")(method))
+        return cls
+
+    return decorate
+
+
+def traced_use_case(name: str) -> Callable[[FuncT], FuncT]:
+    """Decorator running an async use case in a trace (a new one, or the caller's).
+
+    The root span gets an "ebook.id" attribute from the ebook_id argument, or
+    from the id of the returned ebook, so the trace is written per book.
+    """
+
+    def decorate(func: FuncT) -> FuncT:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            ebook_id = signature.bind_partial(*args, **kwargs).arguments.get("ebook_id")
+            attributes: dict[str, AttributeValue] = {"ebook.id": ebook_id} if isinstance(ebook_id, int) else {}
+            with get_tracer().start_trace(name, **attributes) as span:
+                result = await func(*args, **kwargs)
+                if not attributes and isinstance(getattr(result, "id", None), int):
+                    span.set_attribute("ebook.id", result.id)
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
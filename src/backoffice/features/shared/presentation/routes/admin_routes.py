@@ -0,0 +1,55 @@
+"""Admin routes for runtime operations (configuration reload, profiling reports).
+
+Every route is restricted to the admin allow-list (ADMIN_EMAILS).
+"""
+
+import logging
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+
+from backoffice.config import reload_app_config
+from backoffice.features.ebook.shared.domain.policies.model_registry import ModelRegistry
+from backoffice.features.shared.infrastructure.profiling import get_profiling_config
+from backoffice.features.shared.presentation.routes.dependencies import AdminEmailDep
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+logger = logging.getLogger(__name__)
+
+
+def reload_configuration() -> dict[str, str]:
+    """Reload the configuration snapshot and the model registry built from it.
+
+    Returns:
+        Config directory and load time of the new snapshot
+
+    Raises:
+        FileNotFoundError, ValueError: If the new config is invalid (current one is kept)
+    """
+    config = reload_app_config()
+    ModelRegistry.reset_instance()
+    return {"config_dir": str(config.config_dir), "loaded_at": config.loaded_at.isoformat()}
+
+
+@router.post("/config/reload")
+async def reload_config(admin_email: AdminEmailDep) -> dict[str, str]:
+    """Atomically swap in a freshly loaded configuration snapshot."""
+    logger.info(f"🔄 Configuration reload requested by {admin_email}")
+    try:
+        result = reload_configuration()
+    except (FileNotFoundError, ValueError) as e:
+        logger.error(f"❌ Configuration reload failed, keeping current snapshot: {e}")
+        raise HTTPException(status_code=422, detail=f"Invalid configuration: {e}") from e
+    return {"status": "reloaded", **result}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile_report(admin_email: AdminEmailDep, profile_id: str, format: Literal["txt", "speedscope"] = "txt") -> FileResponse:
+    """Download a profiling report (text summary, or speedscope JSON flame graph)."""
+    path = get_profiling_config().report_path(profile_id, format)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    if format == "speedscope":
+        return FileResponse(path, media_type="application/json", filename=path.name)
+    return FileResponse(path, media_type="text/plain; charset=utf-8")
@@ -0,0 +1,26 @@
+"""Shared FastAPI dependencies."""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request
+
+from backoffice.config import AppConfig, get_app_config
+from backoffice.features.auth.infrastructure.admins import is_admin
+
+
+async def _app_config_dependency() -> AppConfig:
+    # Async so FastAPI resolves it inline instead of in the threadpool
+    return get_app_config()
+
+
+async def _admin_email_dependency(request: Request) -> str:
+    """Email of the logged-in admin (ADMIN_EMAILS allow-list), 403 for anyone else."""
+    session = getattr(request.state, "session", None) or {}
+    email = session.get("email")
+    if not is_admin(email):
+        raise HTTPException(status_code=403, detail="Restricted to admins")
+    return email
+
+
+AppConfigDep = Annotated[AppConfig, Depends(_app_config_dependency)]
+AdminEmailDep = Annotated[str, Depends(_admin_email_dependency)]
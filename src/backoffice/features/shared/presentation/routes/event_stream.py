@@ -0,0 +1,232 @@
+"""Server-Sent Events streams of live updates, for clients without the websocket protocol.
+
+    GET /api/ebooks/{ebook_id}/events   -> topic "ebook:{ebook_id}"
+
+Messages are the ones published to the websocket hub (same topics, same
+JSON), framed once per publish as ``id``/``event``/``data`` and kept in a
+small ring buffer per topic. A reconnecting client sends the standard
+``Last-Event-ID`` header and gets the events it missed replayed from the
+buffer; when they are no longer buffered (or the id comes from a previous
+process), it receives an ``event: reset`` first so it reloads its state.
+
+Idle subscribers cost a bounded deque and a waiting coroutine: there is no
+per-client polling, and a single task sends keep-alive comments to every
+stream.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from backoffice.features.shared.presentation.routes.websocket_hub import ebook_topic
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Event Stream"])
+
+REPLAY_BUFFER_SIZE = 64
+MAX_BUFFERED_TOPICS = 1024
+SUBSCRIBER_QUEUE_SIZE = 256
+KEEPALIVE_INTERVAL_SECONDS = 15.0
+RECONNECT_DELAY_MS = 3000
+
+
+class EventStreamSubscriber:
+    """One SSE client: a bounded queue of frames and a wake-up event."""
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.dropped = 0  # Frames dropped because the client is too slow
+        self._frames: deque[str] = deque(maxlen=queue_size)
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+    def push(self, frame: str) -> None:
+        """Enqueue a frame (never blocks; drops the oldest when full)."""
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped += 1
+        self._frames.append(frame)
+        self._wakeup.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+
+    async def frames(self) -> AsyncIterator[str]:
+        """Yield queued frames as they arrive, until closed."""
+        while True:
+            while self._frames:
+                yield self._frames.popleft()
+            if self._closed:
+                return
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+
+class TopicStream:
+    """Replay buffer and live subscribers of a topic.
+
+    Event ids are "<epoch>-<seq>": seq increases per topic, and the epoch
+    changes whenever the stream is recreated (new process, evicted topic),
+    so ids from another epoch are never mistaken for buffered events.
+    """
+
+    def __init__(self, epoch: str, replay_size: int):
+        self.epoch = epoch
+        self.buffer: deque[tuple[int, str]] = deque(maxlen=replay_size)
+        self.subscribers: set[EventStreamSubscriber] = set()
+        self._seq = itertools.count(1)
+
+    def append(self, event_type: str, data: str) -> str:
+        seq = next(self._seq)
+        frame = f"id: {self.epoch}-{seq}\nevent: {event_type}\ndata: {data}\n\n"
+        self.buffer.append((seq, frame))
+        return frame
+
+    def missed_since(self, last_event_id: str) -> list[str] | None:
+        """Buffered frames after last_event_id, or None if some were lost."""
+        epoch, _, seq_text = last_event_id.rpartition("-")
+        if epoch != self.epoch or not seq_text.isdigit():
+            return None
+        last_seq = int(seq_text)
+        newest = self.buffer[-1][0] if self.buffer else 0
+        oldest = self.buffer[0][0] if self.buffer else 1
+        if last_seq > newest or last_seq < oldest - 1:
+            return None
+        return [frame for seq, frame in self.buffer if seq > last_seq]
+
+
+class EventStreamHub:
+    """Per-topic SSE fan-out with Last-Event-ID replay."""
+
+    def __init__(
+        self,
+        replay_size: int = REPLAY_BUFFER_SIZE,
+        max_topics: int = MAX_BUFFERED_TOPICS,
+        keepalive_interval: float = KEEPALIVE_INTERVAL_SECONDS,
+    ):
+        self.replay_size = replay_size
+        self.max_topics = max_topics
+        self.keepalive_interval = keepalive_interval
+        self._boot = uuid.uuid4().hex[:8]
+        self._epochs = itertools.count(1)
+        self._topics: OrderedDict[str, TopicStream] = OrderedDict()
+        self._keepalive: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(stream.subscribers) for stream in self._topics.values())
+
+    def _stream(self, topic: str) -> TopicStream:
+        stream = self._topics.get(topic)
+        if stream is None:
+            stream = self._topics[topic] = TopicStream(f"{self._boot}.{next(self._epochs)}", self.replay_size)
+            self._evict()
+        else:
+            self._topics.move_to_end(topic)
+        return stream
+
+    def _evict(self) -> None:
+        """Forget the least recently used topics nobody is listening to."""
+        for topic in list(self._topics):
+            if len(self._topics) <= self.max_topics:
+                return
+            if not self._topics[topic].subscribers:
+                del self._topics[topic]
+
+    def publish(self, topic: str, message: dict[str, Any]) -> int:
+        """Buffer a message and send it to the topic's streams (framed once, non-blocking).
+
+        Returns:
+            Number of streams the message was queued for
+        """
+        stream = self._stream(topic)
+        frame = stream.append(str(message.get("type", "message")), json.dumps(message))
+        for subscriber in stream.subscribers:
+            subscriber.push(frame)
+        return len(stream.subscribers)
+
+    def subscribe(self, topic: str, last_event_id: str | None = None) -> EventStreamSubscriber:
+        """Register a stream, queueing the frames missed since last_event_id."""
+        stream = self._stream(topic)
+        subscriber = EventStreamSubscriber()
+        if last_event_id:
+            missed = stream.missed_since(last_event_id)
+            if missed is None:
+                subscriber.push(f"event: reset\ndata: {json.dumps({'type': 'reset', 'topic': topic})}\n\n")
+                missed = [frame for _, frame in stream.buffer]
+            for frame in missed:
+                subscriber.push(frame)
+        stream.subscribers.add(subscriber)
+        if self._keepalive is None or self._keepalive.done():
+            self._keepalive = asyncio.create_task(self._keepalive_loop(), name="sse-keepalive")
+        return subscriber
+
+    def unsubscribe(self, topic: str, subscriber: EventStreamSubscriber) -> None:
+        stream = self._topics.get(topic)
+        if stream is not None:
+            stream.subscribers.discard(subscriber)
+        subscriber.close()
+
+    async def stream(self, topic: str, last_event_id: str | None = None) -> AsyncIterator[str]:
+        """SSE body of a topic: replayed frames, then live frames until closed."""
+        subscriber = self.subscribe(topic, last_event_id)
+        try:
+            yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+            async for frame in subscriber.frames():
+                yield frame
+        finally:
+            self.unsubscribe(topic, subscriber)
+
+    async def _keepalive_loop(self) -> None:
+        # Comments keep proxies from closing idle streams
+        while self.subscriber_count:
+            await asyncio.sleep(self.keepalive_interval)
+            for stream in list(self._topics.values()):
+                for subscriber in stream.subscribers:
+                    subscriber.push(": keepalive\n\n")
+
+    async def close(self) -> None:
+        """End every stream (application shutdown)."""
+        for stream in self._topics.values():
+            for subscriber in list(stream.subscribers):
+                subscriber.close()
+            stream.subscribers.clear()
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+
+
+_hub: EventStreamHub | None = None
+
+
+def get_event_stream_hub() -> EventStreamHub:
+    """Get the process-wide SSE hub."""
+    global _hub
+    if _hub is None:
+        _hub = EventStreamHub()
+    return _hub
+
+
+def _sse_response(topic: str, last_event_id: str | None) -> StreamingResponse:
+    return StreamingResponse(
+        get_event_stream_hub().stream(topic, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/api/ebooks/{ebook_id}/events")
+async def ebook_events(
+    ebook_id: int,
+    last_event_id: str | None = Header(default=None),
+    last_event_id_query: str | None = Query(default=None, alias="last_event_id"),
+) -> StreamingResponse:
+    """Server-Sent Events stream of an ebook's live updates (generation progress)."""
+    return _sse_response(ebook_topic(ebook_id), last_event_id or last_event_id_query)
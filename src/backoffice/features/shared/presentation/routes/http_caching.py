@@ -0,0 +1,112 @@
+"""HTTP revalidation (ETag / If-None-Match) and byte-range helpers for binary responses.
+
+PDF previews are large: strong content-hash ETags turn repeat previews into
+304 responses, and Range support lets the browser viewer fetch the first
+page of a linearized PDF before the rest of the file.
+"""
+
+import hashlib
+import re
+
+from fastapi import Request
+from fastapi.responses import Response
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def content_etag(content: bytes) -> str:
+    """Strong ETag for response content (quoted SHA-256)."""
+    return f'"{hashlib.sha256(content).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check If-None-Match against an ETag (handles lists and weak validators)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def parse_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single-range Range header.
+
+    Args:
+        range_header: Range header value (e.g. "bytes=0-1023", "bytes=-500")
+        size: Full content size
+
+    Returns:
+        Inclusive (start, end) byte range, or None if absent/unsupported
+        (multi-range requests are answered with the full content)
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    if not range_header:
+        return None
+
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: last N bytes
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or start > end:
+        raise ValueError(f"Range not satisfiable: {range_header} (size {size})")
+    return start, end
+
+
+def cached_binary_response(
+    request: Request,
+    content: bytes,
+    media_type: str,
+    content_disposition: str | None = None,
+    etag: str | None = None,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """Build a revalidatable binary response with Range support.
+
+    Args:
+        request: Incoming request (If-None-Match, Range, If-Range)
+        content: Full response content
+        media_type: Content type
+        content_disposition: Optional Content-Disposition header
+        etag: Precomputed strong ETag (content hash if None)
+        cache_control: Cache-Control header (default: always revalidate)
+
+    Returns:
+        200 with full content, 206 with the requested range, 304 if the
+        client copy is current, or 416 if the range cannot be satisfied
+    """
+    etag = etag or content_etag(content)
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes"}
+    if content_disposition:
+        headers["Content-Disposition"] = content_disposition
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    # If-Range: only honor the range if the client still has this version
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), len(content))
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{len(content)}"})
+
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+            return Response(content=content[start : end + 1], status_code=206, media_type=media_type, headers=headers)
+
+    return Response(content=content, media_type=media_type, headers=headers)
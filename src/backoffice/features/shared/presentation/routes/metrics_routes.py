@@ -0,0 +1,39 @@
+"""Prometheus scrape endpoint (GET /metrics).
+
+Outside the session middleware (like /healthz) so scrapers can authenticate
+with "Authorization: Bearer <METRICS_TOKEN>"; a logged-in session is
+accepted too. Metrics are served anonymously only when ENVIRONMENT is
+explicitly "development" or METRICS_PUBLIC=true; an unset ENVIRONMENT fails closed.
+"""
+
+import hmac
+import os
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+from backoffice.features.auth.infrastructure.session import SESSION_COOKIE_NAME
+from backoffice.features.auth.infrastructure.session_cache import get_session_cache
+from backoffice.features.shared.infrastructure.metrics import REGISTRY
+
+router = APIRouter(tags=["Metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _is_authorized(request: Request, authorization: str | None) -> bool:
+    token = os.getenv("METRICS_TOKEN")
+    if token and hmac.compare_digest(authorization or "", f"Bearer {token}"):
+        return True
+    session_token = request.cookies.get(SESSION_COOKIE_NAME)
+    if session_token and get_session_cache().verify(session_token) is not None:
+        return True
+    return os.getenv("ENVIRONMENT") == "development" or os.getenv("METRICS_PUBLIC", "false").lower() == "true"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request, authorization: str | None = Header(default=None)) -> PlainTextResponse:
+    """Current metric values in the Prometheus text exposition format."""
+    if not _is_authorized(request, authorization):
+        raise HTTPException(status_code=401, detail="Metrics require a bearer token (METRICS_TOKEN) or a session")
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
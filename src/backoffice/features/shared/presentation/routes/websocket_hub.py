@@ -0,0 +1,234 @@
+"""Websocket hub: per-client topic subscriptions over /api/ws/{client_id}.
+
+Clients subscribe explicitly to the topics they display:
+
+    {"action": "subscribe", "ebook_id": 12}      -> topic "ebook:12"
+    {"action": "unsubscribe", "topic": "ebook:12"}
+    {"action": "pong"}                           -> answer to {"type": "ping"}
+
+Publishing a message serializes it once and enqueues it for the subscribers
+of its topic only. Each client has a bounded outbox drained by its own
+writer task, so a slow client drops its oldest messages instead of slowing
+down the others. A single heartbeat task pings every client and drops the
+ones that missed MAX_MISSED_PONGS pings in a row (half-open sockets); failed
+sends and disconnects remove the client from every topic.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import defaultdict, deque
+from typing import Any
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Websocket"])
+
+HEARTBEAT_INTERVAL_SECONDS = 25.0
+MAX_MISSED_PONGS = 3
+CLIENT_OUTBOX_SIZE = 256
+
+
+def ebook_topic(ebook_id: int) -> str:
+    """Topic of the events of an ebook."""
+    return f"ebook:{ebook_id}"
+
+
+class WebSocketClient:
+    """A connected websocket with its subscriptions and outbox."""
+
+    def __init__(self, websocket: WebSocket, client_id: str, outbox_size: int = CLIENT_OUTBOX_SIZE):
+        self.websocket = websocket
+        self.client_id = client_id
+        self.topics: set[str] = set()
+        self.dropped = 0  # Messages dropped because the client is too slow
+        self.missed_pongs = 0  # Pings sent since the client last sent anything
+        self._outbox: deque[str] = deque(maxlen=outbox_size)
+        self._wakeup = asyncio.Event()
+        self._writer: asyncio.Task | None = None
+
+    def send(self, text: str) -> None:
+        """Enqueue a serialized message (never blocks; drops the oldest when full)."""
+        if len(self._outbox) == self._outbox.maxlen:
+            self.dropped += 1
+        self._outbox.append(text)
+        self._wakeup.set()
+
+    def start(self, hub: "WebSocketHub") -> None:
+        self._writer = asyncio.create_task(self._write_loop(hub), name=f"ws-writer-{self.client_id}")
+
+    def stop(self) -> None:
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        self._outbox.clear()
+
+    async def _write_loop(self, hub: "WebSocketHub") -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._outbox:
+                    await self.websocket.send_text(self._outbox.popleft())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"🔌 Websocket {self.client_id} send failed, disconnecting: {e}")
+            hub.disconnect(self)
+
+
+class WebSocketHub:
+    """Topic-based fan-out to connected websocket clients."""
+
+    def __init__(self, heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS, max_missed_pongs: int = MAX_MISSED_PONGS):
+        self.heartbeat_interval = heartbeat_interval
+        self.max_missed_pongs = max_missed_pongs
+        self._clients: set[WebSocketClient] = set()
+        self._topics: dict[str, set[WebSocketClient]] = defaultdict(set)
+        self._heartbeat: asyncio.Task | None = None
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._topics.get(topic, ()))
+
+    async def connect(self, websocket: WebSocket, client_id: str) -> WebSocketClient:
+        """Accept a websocket and register it (no subscriptions yet)."""
+        await websocket.accept()
+        client = WebSocketClient(websocket, client_id)
+        self._clients.add(client)
+        client.start(self)
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop(), name="ws-heartbeat")
+        logger.debug(f"🔌 Websocket {client_id} connected ({len(self._clients)} clients)")
+        return client
+
+    def disconnect(self, client: WebSocketClient) -> None:
+        """Unregister a client from every topic (idempotent)."""
+        if client not in self._clients:
+            return
+        self._clients.discard(client)
+        for topic in client.topics:
+            subscribers = self._topics.get(topic)
+            if subscribers is not None:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self._topics[topic]
+        client.topics.clear()
+        client.stop()
+        logger.debug(f"🔌 Websocket {client.client_id} disconnected ({len(self._clients)} clients)")
+
+    def subscribe(self, client: WebSocketClient, topic: str) -> None:
+        client.topics.add(topic)
+        self._topics[topic].add(client)
+
+    def unsubscribe(self, client: WebSocketClient, topic: str) -> None:
+        client.topics.discard(topic)
+        subscribers = self._topics.get(topic)
+        if subscribers is not None:
+            subscribers.discard(client)
+            if not subscribers:
+                del self._topics[topic]
+
+    def publish(self, topic: str, message: dict[str, Any]) -> int:
+        """Send a message to the subscribers of a topic (serialized once, non-blocking).
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        subscribers = self._topics.get(topic)
+        if not subscribers:
+            return 0
+        text = json.dumps(message)
+        for client in subscribers:
+            client.send(text)
+        return len(subscribers)
+
+    async def serve(self, websocket: WebSocket, client_id: str) -> None:
+        """Run a client connection until it disconnects."""
+        client = await self.connect(websocket, client_id)
+        try:
+            while True:
+                try:
+                    message = await websocket.receive_json()
+                except ValueError:
+                    client.send(json.dumps({"type": "error", "detail": "Invalid JSON message"}))
+                    continue
+                self._handle_message(client, message)
+        except WebSocketDisconnect:
+            pass
+        except RuntimeError as e:
+            # Socket closed by a failed send while waiting for a message
+            logger.debug(f"🔌 Websocket {client_id} closed: {e}")
+        finally:
+            self.disconnect(client)
+
+    def _handle_message(self, client: WebSocketClient, message: Any) -> None:
+        client.missed_pongs = 0  # Any message proves the connection is alive
+        action = message.get("action") if isinstance(message, dict) else None
+        if action == "pong":
+            return
+
+        topic = _topic_from_message(message) if action in ("subscribe", "unsubscribe") else None
+        if topic is None:
+            client.send(json.dumps({"type": "error", "detail": 'Expected {"action": "subscribe"|"unsubscribe", "ebook_id"|"topic": ...}'}))
+            return
+
+        if action == "subscribe":
+            self.subscribe(client, topic)
+        else:
+            self.unsubscribe(client, topic)
+        client.send(json.dumps({"type": f"{action}d", "topic": topic}))
+
+    async def _heartbeat_loop(self) -> None:
+        ping = json.dumps({"type": "ping"})
+        while self._clients:
+            await asyncio.sleep(self.heartbeat_interval)
+            for client in list(self._clients):
+                if client.missed_pongs >= self.max_missed_pongs:
+                    logger.info(f"🔌 Websocket {client.client_id} missed {client.missed_pongs} pings, disconnecting")
+                    self.disconnect(client)
+                    with contextlib.suppress(Exception):
+                        await client.websocket.close()
+                    continue
+                client.missed_pongs += 1
+                client.send(ping)
+
+    async def close(self) -> None:
+        """Disconnect every client (application shutdown)."""
+        for client in list(self._clients):
+            self.disconnect(client)
+            with contextlib.suppress(Exception):
+                await client.websocket.close()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+
+
+def _topic_from_message(message: dict[str, Any]) -> str | None:
+    if isinstance(message.get("ebook_id"), int):
+        return ebook_topic(message["ebook_id"])
+    topic = message.get("topic")
+    if isinstance(topic, str) and topic.startswith("ebook:"):
+        return topic
+    return None
+
+
+_hub: WebSocketHub | None = None
+
+
+def get_websocket_hub() -> WebSocketHub:
+    """Get the process-wide websocket hub."""
+    global _hub
+    if _hub is None:
+        _hub = WebSocketHub()
+    return _hub
+
+
+@router.websocket("/api/ws/{client_id}")
+async def websocket_endpoint(websocket: WebSocket, client_id: str) -> None:
+    """Websocket for live updates: send subscribe messages to receive topics."""
+    await get_websocket_hub().serve(websocket, client_id)
@@ -0,0 +1,73 @@
+"""Worker process for the multi-process event bus harness.
+
+    python event_bus_worker.py <unix:PATH|postgres:DSN> <worker_id> <nb_workers> <nb_events>
+
+Connects an EventBus to the transport, prints "ready", waits for "go" on
+stdin, publishes nb_events progress events, then prints (as one JSON line)
+the (worker_id, status) pairs received from the other workers.
+"""
+
+import asyncio
+import json
+import sys
+
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import (
+    ContentPageRegeneratingStatusEvent,
+)
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+from backoffice.features.shared.infrastructure.events.event_transport import EventTransport
+
+RECEIVE_TIMEOUT_SECONDS = 10.0
+
+
+def build_transport(spec: str) -> EventTransport:
+    kind, _, target = spec.partition(":")
+    if kind == "unix":
+        from backoffice.features.shared.infrastructure.events.unix_socket_event_transport import UnixSocketEventTransport
+
+        return UnixSocketEventTransport(target)
+    if kind == "postgres":
+        from backoffice.features.shared.infrastructure.events.postgres_event_transport import PostgresNotifyEventTransport
+
+        return PostgresNotifyEventTransport(target, channel="backoffice_events_harness")
+    raise ValueError(f"Unknown transport spec {spec!r}")
+
+
+class Collector(EventHandler[ContentPageRegeneratingStatusEvent]):
+    def __init__(self, expected: int):
+        self.received: list[tuple[int, int]] = []
+        self.expected = expected
+        self.done = asyncio.Event()
+
+    async def handle(self, event: ContentPageRegeneratingStatusEvent) -> None:
+        self.received.append((event.page_index, event.status))
+        if len(self.received) >= self.expected:
+            self.done.set()
+
+
+async def run(spec: str, worker_id: int, nb_workers: int, nb_events: int) -> None:
+    bus = EventBus(transport=build_transport(spec))
+    collector = Collector(expected=nb_workers * nb_events)  # Own events are delivered locally
+    bus.distribute(ContentPageRegeneratingStatusEvent)
+    bus.subscribe(ContentPageRegeneratingStatusEvent, collector)
+    await bus.start()
+    print("ready", flush=True)
+
+    await asyncio.to_thread(sys.stdin.readline)
+    for status in range(nb_events):
+        await bus.publish(ContentPageRegeneratingStatusEvent(ebook_id=1, page_index=worker_id, status=status, nb_total_steps=nb_events))
+
+    # Keep serving (possibly as broker host) until every worker is done
+    try:
+        await asyncio.wait_for(collector.done.wait(), timeout=RECEIVE_TIMEOUT_SECONDS)
+    except TimeoutError:
+        pass
+    own = [pair for pair in collector.received if pair[0] == worker_id]
+    print(json.dumps({"received": [pair for pair in collector.received if pair[0] != worker_id], "own": own}), flush=True)
+    await asyncio.to_thread(sys.stdin.readline)
+    await bus.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), int(sys.argv[4])))
@@ -0,0 +1,61 @@
+"""Multi-process harness: EventBus transports between real worker processes."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+WORKER_SCRIPT = Path(__file__).with_name("event_bus_worker.py")
+NB_WORKERS = 3
+NB_EVENTS = 20
+
+
+def run_workers(transport_spec: str, nb_workers: int = NB_WORKERS, nb_events: int = NB_EVENTS) -> list[dict]:
+    """Start the workers, let them all publish at once, and collect what each received."""
+    workers = [
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, str(WORKER_SCRIPT), transport_spec, str(worker_id), str(nb_workers), str(nb_events)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for worker_id in range(nb_workers)
+    ]
+    try:
+        for worker in workers:
+            assert worker.stdout.readline().strip() == "ready"
+        for worker in workers:
+            worker.stdin.write("go\n")
+            worker.stdin.flush()
+        results = [json.loads(worker.stdout.readline()) for worker in workers]
+        for worker in workers:
+            worker.stdin.write("stop\n")
+            worker.stdin.flush()
+        for worker in workers:
+            assert worker.wait(timeout=10) == 0
+        return results
+    finally:
+        for worker in workers:
+            if worker.poll() is None:
+                worker.kill()
+
+
+def assert_full_fan_out(results: list[dict], nb_events: int = NB_EVENTS) -> None:
+    for worker_id, result in enumerate(results):
+        expected = sorted([other, status] for other in range(len(results)) if other != worker_id for status in range(nb_events))
+        assert sorted(result["received"]) == expected  # Every remote event, exactly once
+        assert result["own"] == [[worker_id, status] for status in range(nb_events)]  # Local delivery, no echo
+
+
+def test_unix_socket_transport_fans_out_between_workers(tmp_path):
+    assert_full_fan_out(run_workers(f"unix:{tmp_path / 'events.sock'}"))
+
+
+@pytest.mark.skipif(not os.getenv("EVENT_BUS_TEST_DATABASE_URL"), reason="EVENT_BUS_TEST_DATABASE_URL not set")
+def test_postgres_notify_transport_fans_out_between_workers():
+    assert_full_fan_out(run_workers(f"postgres:{os.environ['EVENT_BUS_TEST_DATABASE_URL']}"))
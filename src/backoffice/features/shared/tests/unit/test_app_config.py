@@ -0,0 +1,122 @@
+"""Tests for the immutable AppConfig snapshot and its atomic reload."""
+
+import dataclasses
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backoffice.config import app_config
+from backoffice.config.app_config import AppConfig, get_app_config, reload_app_config
+from backoffice.config.loader import ConfigLoader
+from backoffice.features.shared.presentation.routes.admin_routes import router as admin_router
+
+PROJECT_CONFIG_DIR = ConfigLoader().config_dir
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Copy of the project YAML configs (without assets) that tests can edit."""
+    target = tmp_path / "config"
+    shutil.copytree(PROJECT_CONFIG_DIR, target, ignore=shutil.ignore_patterns("*.png", "*.ttf", "themes"))
+    return target
+
+
+@pytest.fixture
+def use_config_dir(config_dir, monkeypatch):
+    """Make the process-wide snapshot load from the temporary config directory."""
+    original_load = AppConfig.load.__func__
+    monkeypatch.setattr(AppConfig, "load", classmethod(lambda cls, directory=None: original_load(cls, directory or config_dir)))
+    monkeypatch.setattr(app_config, "_app_config", None)
+    return config_dir
+
+
+def _set_max_pages(config_dir: Path, max_pages) -> None:
+    limits_file = config_dir / "business" / "limits.yaml"
+    limits = yaml.safe_load(limits_file.read_text())
+    limits["ebook"]["pages"]["max"] = max_pages
+    limits_file.write_text(yaml.safe_dump(limits))
+
+
+def test_snapshot_has_typed_sections(config_dir):
+    config = AppConfig.load(config_dir)
+
+    assert config.limits.min_pages == 24
+    assert config.models.for_type("cover").provider in {"openrouter", "gemini", "comfy", "diffusers"}
+    assert config.models.template_key_for_type("coloring_page") in {"comfy", "diffusers", "default"}
+    assert "children" in config.audiences.audiences
+    assert config.kdp.default_paper_type == config.loader.get_default_paper_type()
+    assert config.branding.fonts_directory == config_dir / "branding" / "fonts"
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.limits = None  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        config.branding.identity["brand"] = {}  # type: ignore[index]
+
+
+def test_snapshot_does_not_read_files_after_load(config_dir, monkeypatch):
+    config = AppConfig.load(config_dir)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("config file read after snapshot load")
+
+    monkeypatch.setattr(Path, "open", _fail)
+    monkeypatch.setattr("builtins.open", _fail)
+
+    assert config.loader.get_kdp_dpi() > 0
+    assert config.loader.load_legal_config()
+
+
+def test_snapshot_is_shared_until_reload(use_config_dir):
+    first = get_app_config()
+    assert get_app_config() is first
+
+    _set_max_pages(use_config_dir, 120)
+    assert get_app_config().limits.max_pages == first.limits.max_pages  # No implicit re-read
+
+    reloaded = reload_app_config()
+    assert reloaded is get_app_config()
+    assert reloaded.limits.max_pages == 120
+    assert first.limits.max_pages != 120  # Previous snapshot unchanged
+
+
+def test_invalid_config_keeps_current_snapshot(use_config_dir):
+    current = get_app_config()
+    (use_config_dir / "generation" / "models.yaml").write_text("models:\n  cover:\n    provider: unknown\n")
+
+    with pytest.raises(ValueError):
+        reload_app_config()
+
+    assert get_app_config() is current
+
+
+def test_admin_reload_endpoint(use_config_dir, monkeypatch):
+    monkeypatch.setenv("ADMIN_EMAILS", "Admin@example.com, ops@example.com")
+    app = FastAPI()
+    app.include_router(admin_router)
+
+    @app.middleware("http")
+    async def fake_session(request, call_next):  # Stands in for AuthMiddleware
+        request.state.session = {"email": request.headers.get("x-test-email", "")}
+        return await call_next(request)
+
+    client = TestClient(app, headers={"x-test-email": "admin@example.com"})
+    get_app_config()
+
+    _set_max_pages(use_config_dir, 150)
+    forbidden = client.post("/api/admin/config/reload", headers={"x-test-email": "editor@example.com"})
+    assert forbidden.status_code == 403
+    assert get_app_config().limits.max_pages != 150
+
+    response = client.post("/api/admin/config/reload")
+    assert response.status_code == 200
+    assert response.json()["status"] == "reloaded"
+    assert get_app_config().limits.max_pages == 150
+
+    _set_max_pages(use_config_dir, "not a number")
+    response = client.post("/api/admin/config/reload")
+    assert response.status_code == 422
+    assert get_app_config().limits.max_pages == 150
@@ -0,0 +1,159 @@
+"""Tests for EventBus direct and queued delivery."""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus, OverflowPolicy, QueuedDelivery
+from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+
+
+@dataclass(frozen=True, kw_only=True)
+class ProgressEvent(DomainEvent):
+    page_index: int
+    status: int
+
+
+class RecordingHandler(EventHandler[ProgressEvent]):
+    def __init__(self, gate: asyncio.Event | None = None, delay: float = 0.0):
+        self.events: list[tuple[int, int]] = []
+        self.gate = gate
+        self.delay = delay
+
+    async def handle(self, event: ProgressEvent) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.events.append((event.page_index, event.status))
+
+
+def _event(status: int, page_index: int = 1) -> ProgressEvent:
+    return ProgressEvent(page_index=page_index, status=status)
+
+
+async def test_direct_handlers_are_awaited_without_serializing_publishers():
+    bus = EventBus()
+    handler = RecordingHandler(delay=0.1)
+    bus.subscribe(ProgressEvent, handler)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(*(bus.publish(_event(status)) for status in range(5)))
+
+    assert sorted(handler.events) == [(1, status) for status in range(5)]
+    assert loop.time() - start < 0.3  # Concurrent, not 5 x 0.1s
+
+
+async def test_queued_publish_does_not_wait_for_slow_handler():
+    bus = EventBus()
+    slow = RecordingHandler(delay=0.2)
+    fast = RecordingHandler()
+    bus.subscribe(ProgressEvent, slow, delivery=QueuedDelivery(max_size=10))
+    bus.subscribe(ProgressEvent, fast)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for status in range(3):
+        await bus.publish(_event(status))
+
+    assert loop.time() - start < 0.1
+    assert fast.events == [(1, 0), (1, 1), (1, 2)]
+
+    await bus.drain()
+    assert slow.events == [(1, 0), (1, 1), (1, 2)]
+
+
+async def test_drop_policy_keeps_newest_events():
+    bus = EventBus()
+    gate = asyncio.Event()
+    handler = RecordingHandler(gate=gate)
+    bus.subscribe(ProgressEvent, handler, delivery=QueuedDelivery(max_size=2, overflow=OverflowPolicy.DROP))
+
+    await bus.publish(_event(0))
+    await asyncio.sleep(0)  # Consumer takes event 0 and waits on the gate
+    for status in range(1, 6):
+        await bus.publish(_event(status))
+    gate.set()
+    await bus.drain()
+
+    assert handler.events == [(1, 0), (1, 4), (1, 5)]
+
+
+async def test_coalesce_policy_keeps_latest_state_per_key():
+    bus = EventBus()
+    gate = asyncio.Event()
+    handler = RecordingHandler(gate=gate)
+    delivery = QueuedDelivery(max_size=10, overflow=OverflowPolicy.COALESCE, coalesce_key=lambda e: e.page_index)
+    bus.subscribe(ProgressEvent, handler, delivery=delivery)
+
+    await bus.publish(_event(0, page_index=1))
+    await asyncio.sleep(0)
+    for status in (10, 20, 30):
+        await bus.publish(_event(status, page_index=1))
+        await bus.publish(_event(status, page_index=2))
+    gate.set()
+    await bus.drain()
+
+    assert handler.events == [(1, 0), (1, 30), (2, 30)]
+
+
+async def test_block_policy_applies_backpressure():
+    bus = EventBus()
+    gate = asyncio.Event()
+    handler = RecordingHandler(gate=gate)
+    bus.subscribe(ProgressEvent, handler, delivery=QueuedDelivery(max_size=1, overflow=OverflowPolicy.BLOCK))
+
+    await bus.publish(_event(0))
+    await asyncio.sleep(0)
+    await bus.publish(_event(1))  # Fills the queue
+    blocked = asyncio.create_task(bus.publish(_event(2)))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    gate.set()
+    await asyncio.wait_for(blocked, timeout=1)
+    await bus.drain()
+    assert handler.events == [(1, 0), (1, 1), (1, 2)]
+
+
+@pytest.mark.parametrize("delivery", [None, QueuedDelivery(max_size=10)])
+async def test_subscription_ids_are_stable_across_unsubscribe(delivery):
+    bus = EventBus()
+    handlers = [RecordingHandler() for _ in range(3)]
+    ids = [bus.subscribe(ProgressEvent, handler, delivery=delivery) for handler in handlers]
+
+    assert len(set(ids)) == 3
+    assert [handler.handler_id for handler in handlers] == ids
+
+    assert bus.unsubscribe(ProgressEvent, ids[1]) is True
+    assert bus.unsubscribe(ProgressEvent, ids[1]) is False
+    await bus.publish(_event(1))
+    await bus.drain()
+
+    assert handlers[0].events == [(1, 1)]
+    assert handlers[1].events == []
+    assert handlers[2].events == [(1, 1)]
+    assert bus.unsubscribe(ProgressEvent, ids[2]) is True
+    assert bus.nb_handlers() == 1
+
+
+async def test_handler_can_unsubscribe_itself_from_queue():
+    bus = EventBus()
+
+    class OneShotHandler(RecordingHandler):
+        async def handle(self, event: ProgressEvent) -> None:
+            await super().handle(event)
+            bus.unsubscribe(ProgressEvent, self.handler_id)
+
+    handler = OneShotHandler()
+    bus.subscribe(ProgressEvent, handler, delivery=QueuedDelivery(max_size=10))
+
+    for status in range(3):
+        await bus.publish(_event(status))
+    await asyncio.sleep(0.05)
+
+    assert handler.events == [(1, 0)]
+    assert bus.nb_handlers() == 0
@@ -0,0 +1,122 @@
+"""Tests for the Server-Sent Events hub (replay, reset, fan-out, idle cost)."""
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from backoffice.features.shared.presentation.routes import event_stream
+from backoffice.features.shared.presentation.routes.event_stream import EventStreamHub
+
+
+def _drain(subscriber) -> list[str]:
+    frames = list(subscriber._frames)
+    subscriber._frames.clear()
+    return frames
+
+
+def _ids(frames: list[str]) -> list[str]:
+    return [frame.split("\n", 1)[0].removeprefix("id: ") for frame in frames if frame.startswith("id: ")]
+
+
+def _last_id(frames: list[str]) -> str:
+    return _ids(frames)[-1]
+
+
+async def test_publish_reaches_only_topic_streams():
+    hub = EventStreamHub()
+    first, second, other = hub.subscribe("ebook:1"), hub.subscribe("ebook:1"), hub.subscribe("ebook:2")
+
+    assert hub.publish("ebook:1", {"type": "progress", "status": 10}) == 2
+    frames = _drain(first)
+
+    assert len(frames) == 1
+    assert frames[0].endswith('\nevent: progress\ndata: {"type": "progress", "status": 10}\n\n')
+    assert _drain(second) == frames
+    assert _drain(other) == []
+    await hub.close()
+
+
+async def test_last_event_id_replays_missed_events():
+    hub = EventStreamHub(replay_size=10)
+    for status in range(3):
+        hub.publish("ebook:1", {"type": "progress", "status": status})
+    seen = hub.subscribe("ebook:1", last_event_id=None)
+    assert _drain(seen) == []  # No header: live events only
+
+    replay_all = hub.subscribe("ebook:1", last_event_id=f"{hub._topics['ebook:1'].epoch}-0")
+    all_frames = _drain(replay_all)
+    assert len(all_frames) == 3
+
+    resumed = hub.subscribe("ebook:1", last_event_id=_ids(all_frames)[0])
+    assert _drain(resumed) == all_frames[1:]
+
+    up_to_date = hub.subscribe("ebook:1", last_event_id=_last_id(all_frames))
+    assert _drain(up_to_date) == []
+    await hub.close()
+
+
+async def test_unknown_or_evicted_ids_get_a_reset_before_the_buffer():
+    hub = EventStreamHub(replay_size=2)
+    for status in range(5):
+        hub.publish("ebook:7", {"type": "progress", "status": status})
+
+    too_old = _drain(hub.subscribe("ebook:7", last_event_id=f"{hub._topics['ebook:7'].epoch}-1"))
+    from_previous_process = _drain(hub.subscribe("ebook:7", last_event_id="deadbeef.1-4"))
+
+    for frames in (too_old, from_previous_process):
+        assert frames[0].startswith("event: reset\n")
+        assert [frame.rsplit('status": ', 1)[1][0] for frame in frames[1:]] == ["3", "4"]
+    await hub.close()
+
+
+async def test_idle_subscribers_do_not_spawn_tasks():
+    hub = EventStreamHub(keepalive_interval=0.02)
+    tasks_before = len(asyncio.all_tasks())
+    streams = [hub.stream(f"ebook:{i % 50}") for i in range(2000)]
+    first_frames = await asyncio.gather(*(anext(stream) for stream in streams))
+
+    assert set(first_frames) == {"retry: 3000\n\n"}
+    assert hub.subscriber_count == 2000
+    assert len(asyncio.all_tasks()) - tasks_before == 1  # The shared keep-alive task
+
+    assert await anext(streams[0]) == ": keepalive\n\n"
+    for stream in streams:
+        await stream.aclose()
+    assert hub.subscriber_count == 0
+    await hub.close()
+
+
+async def test_topics_without_subscribers_are_evicted():
+    hub = EventStreamHub(max_topics=2)
+    kept = hub.subscribe("ebook:1")
+    for ebook_id in range(2, 6):
+        hub.publish(f"ebook:{ebook_id}", {"type": "progress"})
+
+    assert list(hub._topics) == ["ebook:1", "ebook:5"]
+    hub.unsubscribe("ebook:1", kept)
+    await hub.close()
+
+
+async def test_sse_route_streams_replay_then_live_events(monkeypatch):
+    hub = EventStreamHub()
+    monkeypatch.setattr(event_stream, "_hub", hub)
+    app = FastAPI()
+    app.include_router(event_stream.router)
+    hub.publish("ebook:7", {"type": "progress", "status": 1})
+    hub.publish("ebook:7", {"type": "progress", "status": 2})
+    first_id = f"{hub._topics['ebook:7'].epoch}-1"
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        request = asyncio.create_task(client.get("/api/ebooks/7/events", headers={"Last-Event-ID": first_id}))
+        while hub.subscriber_count == 0:
+            await asyncio.sleep(0.01)
+        hub.publish("ebook:7", {"type": "progress", "status": 3})
+        await asyncio.sleep(0.01)
+        await hub.close()
+        response = await request
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    data_lines = [line for line in response.text.splitlines() if line.startswith("data: ")]
+    assert data_lines == ['data: {"type": "progress", "status": 2}', 'data: {"type": "progress", "status": 3}']
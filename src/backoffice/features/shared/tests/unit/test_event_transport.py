@@ -0,0 +1,116 @@
+"""Tests for the event wire format and the EventBus transports (single process)."""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import (
+    ContentPageRegeneratingStatusEvent,
+)
+from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus
+from backoffice.features.shared.infrastructure.events.event_codec import EventDecodeError, decode_event, encode_event
+from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+from backoffice.features.shared.infrastructure.events.postgres_event_transport import to_asyncpg_dsn
+from backoffice.features.shared.infrastructure.events.unix_socket_event_transport import UnixSocketEventTransport
+
+
+@dataclass(frozen=True, kw_only=True)
+class LocalOnlyEvent(DomainEvent):
+    ebook_id: int
+
+
+class Recorder(EventHandler[DomainEvent]):
+    def __init__(self):
+        self.events: list[DomainEvent] = []
+
+    async def handle(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+
+def _progress(status: int) -> ContentPageRegeneratingStatusEvent:
+    return ContentPageRegeneratingStatusEvent(ebook_id=4, page_index=2, status=status, state="running", nb_total_steps=30, aggregate_id="4")
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.01)
+
+
+def test_codec_round_trip_is_compact():
+    event = ContentPageRegeneratingStatusEvent(ebook_id=4, page_index=2, status=50, nb_total_steps=30, occurred_at=datetime(2026, 1, 2, 3, 4, 5, 678))
+    message = encode_event(event, "web-1")
+
+    assert " " not in message and "\n" not in message
+    assert "page_index" not in message  # Positional values, no field names
+    assert json.loads(message)[:2] == ["web-1", "ContentPageRegeneratingStatusEvent"]
+    assert decode_event(message) == ("web-1", event)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "not json",
+        '["web-1","NoSuchEvent",[]]',
+        '["web-1","ContentPageRegeneratingStatusEvent",[1,2]]',
+    ],
+)
+def test_codec_rejects_invalid_messages(message):
+    with pytest.raises(EventDecodeError):
+        decode_event(message)
+
+
+def test_sqlalchemy_driver_suffix_is_dropped_for_asyncpg():
+    assert to_asyncpg_dsn("postgresql+asyncpg://u:p@db/app") == "postgresql://u:p@db/app"
+    assert to_asyncpg_dsn("postgresql://u:p@db/app") == "postgresql://u:p@db/app"
+
+
+async def test_only_distributed_event_types_cross_processes(tmp_path):
+    path = str(tmp_path / "events.sock")
+    buses = [EventBus(transport=UnixSocketEventTransport(path)) for _ in range(2)]
+    recorders = [Recorder() for _ in buses]
+    for bus, recorder in zip(buses, recorders, strict=True):
+        bus.distribute(ContentPageRegeneratingStatusEvent)
+        bus.subscribe(ContentPageRegeneratingStatusEvent, recorder)
+        bus.subscribe(LocalOnlyEvent, recorder)
+        await bus.start()
+
+    await buses[0].publish(LocalOnlyEvent(ebook_id=1))
+    await buses[0].publish(_progress(10))
+    await _wait_for(lambda: len(recorders[1].events) == 1)
+
+    assert [type(event) for event in recorders[0].events] == [LocalOnlyEvent, ContentPageRegeneratingStatusEvent]
+    assert recorders[1].events[0].status == 10
+    assert recorders[1].events[0].event_id == recorders[0].events[1].event_id
+
+    for bus in buses:
+        await bus.stop()
+
+
+async def test_workers_elect_a_new_broker_when_the_host_stops(tmp_path):
+    path = str(tmp_path / "events.sock")
+    transports = [UnixSocketEventTransport(path, reconnect_delay=0.02) for _ in range(3)]
+    buses = [EventBus(transport=transport) for transport in transports]
+    recorders = [Recorder() for _ in buses]
+    for bus, recorder in zip(buses, recorders, strict=True):
+        bus.distribute(ContentPageRegeneratingStatusEvent)
+        bus.subscribe(ContentPageRegeneratingStatusEvent, recorder)
+        await bus.start()
+    assert [transport.broker is not None for transport in transports] == [True, False, False]
+
+    await buses[0].stop()
+    await _wait_for(lambda: any(transport.broker is not None and transport.broker.client_count == 2 for transport in transports[1:]))
+
+    await buses[1].publish(_progress(99))
+    await _wait_for(lambda: len(recorders[2].events) == 1)
+    assert recorders[2].events[0].status == 99
+    assert recorders[0].events == []
+
+    for bus in buses[1:]:
+        await bus.stop()
@@ -0,0 +1,67 @@
+"""Unit tests for ETag revalidation and byte-range responses."""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backoffice.features.shared.presentation.routes.http_caching import cached_binary_response, parse_range
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/file")
+    async def file(request: Request):
+        return cached_binary_response(request, CONTENT, "application/pdf", 'inline; filename="file.pdf"')
+
+    return TestClient(app)
+
+
+def test_parse_range():
+    """Single ranges are parsed, unsupported ones ignored, unsatisfiable ones rejected."""
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=0-5000", 1000) == (0, 999)
+    assert parse_range("bytes=0-1,5-6", 1000) is None
+    assert parse_range(None, 1000) is None
+
+    with pytest.raises(ValueError):
+        parse_range("bytes=1000-", 1000)
+
+
+def test_etag_revalidation(client):
+    """Repeat requests with the ETag get a 304 without body."""
+    first = client.get("/file")
+    second = client.get("/file", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert first.content == CONTENT
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_range_request(client):
+    """Range requests return 206 with the requested slice."""
+    response = client.get("/file", headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+
+def test_range_ignored_when_if_range_is_stale(client):
+    """A stale If-Range validator gets the full, current content."""
+    response = client.get("/file", headers={"Range": "bytes=10-19", "If-Range": '"outdated"'})
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_unsatisfiable_range(client):
+    response = client.get("/file", headers={"Range": f"bytes={len(CONTENT)}-"})
+
+    assert response.status_code == 416
@@ -0,0 +1,69 @@
+"""Import-time budget: startup imports must stay cheap.
+
+Each module is imported in a fresh interpreter with `python -X importtime`.
+The test fails when a heavy library leaks into its import graph, when the
+configuration is read at import, or when its cumulative import time grows past
+the budget. Budgets are generous so the test is machine-independent; scale
+them with IMPORT_TIME_BUDGET_FACTOR on slow CI runners.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_LIBRARIES = {"torch", "diffusers", "weasyprint", "googleapiclient", "websocket"}
+
+# module -> (budget in ms, libraries that must not be imported)
+IMPORT_BUDGETS = {
+    "backoffice.features.ebook.shared.domain.constants": (400, HEAVY_LIBRARIES | {"PIL", "fastapi", "sqlalchemy", "pydantic"}),
+    "backoffice.features.ebook.shared.domain.entities.ebook": (400, HEAVY_LIBRARIES | {"PIL", "fastapi", "sqlalchemy", "pydantic"}),
+    "backoffice.features.ebook.shared.infrastructure.factories.repository_factory": (3000, HEAVY_LIBRARIES),
+    "backoffice.features.ebook.shared.infrastructure.providers.provider_factory": (3000, HEAVY_LIBRARIES),
+    "backoffice.features.ebook.creation.presentation.routes": (4000, HEAVY_LIBRARIES),
+    "backoffice.features.ebook.regeneration.presentation.routes": (4000, HEAVY_LIBRARIES),
+}
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+
+def _import_profile(module: str) -> tuple[dict[str, int], bool]:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Cumulative import time in µs by module name, and
+        whether the configuration snapshot was loaded during the import
+    """
+    code = f"import {module}; from backoffice.config import app_config; print(app_config._app_config is not None)"
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and module list
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            cumulative_us[match.group(4)] = int(match.group(2))
+    return cumulative_us, result.stdout.strip() == "True"
+
+
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS))
+def test_import_stays_within_budget(module):
+    budget_ms, forbidden = IMPORT_BUDGETS[module]
+    budget_ms *= float(os.getenv("IMPORT_TIME_BUDGET_FACTOR", "1"))
+
+    cumulative_us, config_loaded = _import_profile(module)
+
+    leaked = sorted(name for name in cumulative_us if name.split(".")[0] in forbidden)
+    assert not leaked, f"{module} imports heavy modules eagerly: {leaked}"
+    assert not config_loaded, f"{module} reads the configuration at import time"
+    assert module in cumulative_us
+    elapsed_ms = cumulative_us[module] / 1000
+    assert elapsed_ms <= budget_ms, f"{module} took {elapsed_ms:.0f}ms to import (budget {budget_ms:.0f}ms)"
@@ -0,0 +1,134 @@
+"""Tests for the in-process metrics registry and the /metrics endpoint."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backoffice.features.auth.infrastructure.session import SESSION_COOKIE_NAME, create_session_token
+from backoffice.features.shared.infrastructure.metrics import (
+    CACHE_REQUESTS,
+    REGISTRY,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    _Metric,
+    limited,
+    record_cache,
+    timed_methods,
+)
+from backoffice.features.shared.presentation.routes import metrics_routes
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    REGISTRY.clear()
+    yield
+    REGISTRY.clear()
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = Histogram("job_seconds", "Job duration.", ("kind",), buckets=(0.1, 1.0))
+    registry.register(histogram)
+
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, kind='a"b')
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP job_seconds Job duration.", "# TYPE job_seconds histogram"]
+    assert 'job_seconds_bucket{kind="a\\"b",le="0.1"} 1' in lines
+    assert 'job_seconds_bucket{kind="a\\"b",le="1"} 3' in lines
+    assert 'job_seconds_bucket{kind="a\\"b",le="+Inf"} 4' in lines
+    assert 'job_seconds_sum{kind="a\\"b"} 4.05' in lines
+    assert 'job_seconds_count{kind="a\\"b"} 4' in lines
+
+
+def test_counter_and_duplicate_registration():
+    registry = MetricsRegistry()
+    counter = Counter("bytes_total", "Bytes.", ("artifact",))
+    registry.register(counter)
+    counter.inc(10, artifact="pdf")
+    counter.inc(5, artifact="pdf")
+
+    assert 'bytes_total{artifact="pdf"} 15' in registry.render()
+    with pytest.raises(ValueError):
+        registry.register(Counter("bytes_total", "Again."))
+
+
+def test_cache_hit_ratio_gauge():
+    record_cache("export_artifact", hit=True)
+    record_cache("export_artifact", hit=True)
+    record_cache("export_artifact", hit=True)
+    record_cache("export_artifact", hit=False)
+
+    output = REGISTRY.render()
+    assert 'backoffice_cache_requests_total{cache="export_artifact",result="hit"} 3' in output
+    assert "# TYPE backoffice_cache_hit_ratio gauge" in output
+    assert 'backoffice_cache_hit_ratio{cache="export_artifact"} 0.75' in output
+
+
+async def test_timed_methods_and_limiter_wait():
+    histogram = Histogram("calls_seconds", "Calls.", ("repository", "method"))
+
+    @timed_methods(histogram, "repository", "method")
+    class Repository:
+        async def get_by_id(self, ebook_id: int) -> int:
+            return ebook_id
+
+        async def _private(self) -> None:
+            return None
+
+        def sync_method(self) -> str:
+            return "untouched"
+
+    repository = Repository()
+    assert await repository.get_by_id(7) == 7
+    await repository._private()
+    assert repository.sync_method() == "untouched"
+    assert [key for key, _ in histogram.children()] == [("Repository", "get_by_id")]
+
+    semaphore = asyncio.Semaphore(1)
+    async with limited(semaphore, "test_limiter"):
+        pass
+    assert 'backoffice_limiter_wait_seconds_count{limiter="test_limiter"} 1' in REGISTRY.render()
+
+
+async def test_metrics_endpoint(monkeypatch):
+    app = FastAPI()
+    app.include_router(metrics_routes.router)
+    CACHE_REQUESTS.inc(cache="session", result="miss")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == metrics_routes.CONTENT_TYPE
+        assert 'backoffice_cache_requests_total{cache="session",result="miss"} 1' in response.text
+
+        # Outside development (or with ENVIRONMENT unset): a bearer token or a session is required
+        monkeypatch.delenv("METRICS_TOKEN", raising=False)
+        monkeypatch.delenv("METRICS_PUBLIC", raising=False)
+        monkeypatch.delenv("ENVIRONMENT")
+        assert (await client.get("/metrics")).status_code == 401
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        assert (await client.get("/metrics")).status_code == 401
+        monkeypatch.setenv("METRICS_PUBLIC", "true")
+        assert (await client.get("/metrics")).status_code == 200
+        monkeypatch.delenv("METRICS_PUBLIC")
+        monkeypatch.setenv("METRICS_TOKEN", "secret")
+        monkeypatch.setenv("SESSION_SECRET_KEY", "test-secret")
+        assert (await client.get("/metrics", headers={"Authorization": "Bearer wrong"})).status_code == 401
+        authorized = await client.get("/metrics", headers={"Authorization": "Bearer secret"})
+        assert authorized.status_code == 200
+        client.cookies.set(SESSION_COOKIE_NAME, create_session_token("editor@example.com"))
+        assert (await client.get("/metrics")).status_code == 200
+
+
+def test_metric_subclasses_must_implement_children_and_samples():
+    class Gauge(_Metric):
+        kind = "gauge"
+
+    with pytest.raises(TypeError):
+        Gauge("queue_depth", "Queued jobs.")
@@ -0,0 +1,136 @@
+"""Tests for the on-demand request and job profiler."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from starlette.types import ASGIApp
+
+from backoffice.features.shared.infrastructure import profiling
+from backoffice.features.shared.infrastructure.profiling import PROFILE_HEADER, ProfilingConfig, ProfilingMiddleware, profile, profiled_job
+from backoffice.features.shared.presentation.routes import admin_routes
+
+ADMIN = "admin@example.com"
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMIN_EMAILS", ADMIN)
+    monkeypatch.setenv("PROFILES_DIR", str(tmp_path))
+    config = ProfilingConfig.from_env()
+    monkeypatch.setattr(profiling, "_config", config)
+    return config
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _render_in_child_task() -> None:
+    _spin(0.05)
+
+
+def _encode_in_worker_thread() -> None:
+    _spin(0.05)
+
+
+def _app(config: ProfilingConfig) -> ASGIApp:
+    app = FastAPI()
+    app.include_router(admin_routes.router)
+
+    @app.get("/api/dashboard/stats")
+    async def stats() -> dict[str, bool]:
+        await asyncio.create_task(_render_in_child_task())
+        await asyncio.to_thread(_encode_in_worker_thread)
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, config=config)
+
+    # Stands in for AuthMiddleware: the session email comes from a test header
+    async def authenticated_app(scope, receive, send):
+        email = dict(scope["headers"]).get(b"x-test-email", b"").decode()
+        scope.setdefault("state", {})["session"] = {"email": email}
+        await app(scope, receive, send)
+
+    return authenticated_app
+
+
+async def test_admin_request_is_profiled_and_report_is_linked(config, tmp_path):
+    app = _app(config)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test", headers={"x-test-email": ADMIN}) as client:
+        assert PROFILE_HEADER not in (await client.get("/api/dashboard/stats")).headers
+        assert list(tmp_path.iterdir()) == []
+
+        response = await client.get("/api/dashboard/stats", params={"profile": "1"})
+        assert response.status_code == 200
+        report_url = response.headers[PROFILE_HEADER]
+
+        summary = await client.get(report_url)
+        assert summary.status_code == 200
+        assert "GET /api/dashboard/stats" in summary.text
+        assert f"Requested by {ADMIN}" in summary.text
+        assert "_render_in_child_task" in summary.text  # Task created by the request
+        assert "to_thread" in summary.text  # Awaited worker thread work
+        assert "[await]" in summary.text
+
+        flame_graph = (await client.get(report_url, params={"format": "speedscope"})).json()
+        frame_names = {frame["name"] for frame in flame_graph["shared"]["frames"]}
+        assert {"stats", "_render_in_child_task", "to_thread"} <= frame_names
+
+        assert (await client.get("/api/admin/profiles/../../etc/passwd")).status_code == 404
+        assert (await client.get("/api/admin/profiles/20260101-000000_00000000")).status_code == 404
+
+
+async def test_non_admin_cannot_profile_or_read_reports(config, tmp_path):
+    app = _app(config)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/dashboard/stats", headers={"x-profile": "1", "x-test-email": "editor@example.com"})
+        assert response.status_code == 200
+        assert PROFILE_HEADER not in response.headers
+        assert list(tmp_path.iterdir()) == []
+
+        async with profile("manual", requested_by=ADMIN, config=config) as session:
+            pass
+        report = await client.get(f"/api/admin/profiles/{session.id}", headers={"x-test-email": "editor@example.com"})
+        assert report.status_code == 403
+
+
+async def test_jobs_are_profiled_when_requested_or_configured(config, tmp_path, monkeypatch):
+    job_ids: list[str | None] = []
+
+    async def rebuild_pdf() -> str:
+        _spin(0.02)
+        session = profiling._active_profile.get()
+        job_ids.append(session.id if session else None)
+        return "rebuilt"
+
+    job = profiled_job("pdf_rebuild", rebuild_pdf)
+
+    assert await job() == "rebuilt"
+    assert job_ids == [None]
+    assert list(tmp_path.iterdir()) == []
+
+    async def debounced(debounce: float) -> str:
+        await asyncio.sleep(debounce)
+        return await job()
+
+    # Scheduled (debounced) by a profiled request: the job runs after it, in a profile of its own
+    async with profile("POST /api/ebooks/1/pages/2", requested_by=ADMIN) as request_profile:
+        scheduled = asyncio.create_task(debounced(0.01))
+    assert await scheduled == "rebuilt"
+    job_profile_id = job_ids[-1]
+    assert job_profile_id not in (None, request_profile.id)
+    assert "job pdf_rebuild" in (tmp_path / f"{job_profile_id}.txt").read_text()
+    assert "rebuild_pdf" in (tmp_path / f"{job_profile_id}.txt").read_text()
+
+    monkeypatch.setattr(profiling, "_config", ProfilingConfig(jobs=["pdf_rebuild"], profiles_dir=tmp_path))
+    await job()
+    assert job_ids[-1] is not None
+
+    document = json.loads((tmp_path / f"{job_profile_id}.speedscope.json").read_text())
+    assert document["$schema"] == "https://www.speedscope.app/file-format-schema.json"
@@ -0,0 +1,92 @@
+"""Tests for the queue-based JSON logging pipeline."""
+
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from backoffice.features.shared.infrastructure import tracing
+from backoffice.features.shared.infrastructure.structured_logging import SamplingFilter, configure_logging, stop_logging
+from backoffice.features.shared.infrastructure.tracing import JsonFileSpanExporter, Tracer
+
+
+class ThreadRecordingHandler(logging.StreamHandler):
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.threads: set[str] = set()
+
+    def emit(self, record):
+        self.threads.add(threading.current_thread().name)
+        super().emit(record)
+
+
+@pytest.fixture
+def output():
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    stream = io.StringIO()
+    handler = ThreadRecordingHandler(stream)
+    yield stream, handler
+    stop_logging()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+def _lines(stream: io.StringIO) -> list[dict]:
+    stop_logging()  # Flushes the queue
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_written_as_json_by_the_listener_thread(output, tmp_path, monkeypatch):
+    stream, handler = output
+    configure_logging(level="INFO", log_format="json", max_value_chars=50, sampling="", handlers=[handler])
+    monkeypatch.setattr(tracing, "_tracer", Tracer(exporter=JsonFileSpanExporter(tmp_path)))
+    logger = logging.getLogger("backoffice.features.test")
+
+    with tracing.get_tracer().start_trace("create_ebook") as root:
+        logger.info("Page %d generated", 3, extra={"image": b"\x89PNG" * 1000, "size_bytes": 4000})
+    logger.info("Structure: %s", {"pages": ["x" * 100]})
+    logger.debug("Not at INFO")
+    try:
+        raise ValueError("bad spine")
+    except ValueError:
+        logger.exception("Export failed")
+
+    page, structure, error = (line for line in _lines(stream) if line["logger"] == logger.name)
+    assert handler.threads and threading.current_thread().name not in handler.threads
+    assert page["level"] == "INFO"
+    assert page["logger"] == "backoffice.features.test"
+    assert page["message"] == "Page 3 generated"
+    assert page["trace_id"] == root.trace_id
+    assert page["image"] == "<4000 bytes>"
+    assert page["size_bytes"] == 4000
+    assert structure["message"].startswith("Structure: {'pages': ['xxx")
+    assert structure["message"].endswith("more chars]")
+    assert "trace_id" not in structure
+    assert "ValueError: bad spine" in error["exception"]
+
+
+def test_text_format_keeps_the_human_readable_layout(output):
+    stream, handler = output
+    configure_logging(level="INFO", log_format="text", max_value_chars=2000, sampling="", handlers=[handler])
+    logging.getLogger("backoffice.main").info("✅ Ready")
+    stop_logging()
+    assert stream.getvalue().rstrip().endswith(" - backoffice.main - INFO - ✅ Ready")
+
+
+def test_sampling_keeps_the_configured_fraction_and_never_drops_warnings():
+    sampling = SamplingFilter.parse("backoffice.pages=0.25, backoffice.pages.comfy=0, backoffice.covers=0.75, other=1")
+
+    def kept(name: str, level: int = logging.INFO, count: int = 8) -> int:
+        return sum(sampling.filter(logging.LogRecord(name, level, "", 0, "msg", (), None)) for _ in range(count))
+
+    assert kept("backoffice.pages") == 2
+    assert kept("backoffice.pages.generation") == 2
+    assert kept("backoffice.pages.comfy") == 0
+    assert kept("backoffice.pages.comfy", level=logging.WARNING) == 8
+    assert kept("backoffice.pagesx") == 8
+    assert kept("other") == 8
+    assert kept("backoffice.covers", count=100) == 75
+    assert kept("backoffice.covers", count=4) == 3
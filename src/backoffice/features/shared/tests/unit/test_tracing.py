@@ -0,0 +1,170 @@
+"""Tests for tracing spans, trace id propagation and the JSON trace exporter."""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+
+import pytest
+
+from backoffice.features.shared.infrastructure import tracing
+from backoffice.features.shared.infrastructure.events.domain_event import DomainEvent
+from backoffice.features.shared.infrastructure.events.event_bus import EventBus, QueuedDelivery
+from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+from backoffice.features.shared.infrastructure.tracing import JsonFileSpanExporter, Tracer, current_trace_id, traced, traced_use_case
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    tracer = Tracer(exporter=JsonFileSpanExporter(tmp_path))
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    return tracer
+
+
+def _read_trace(tracer, tmp_path) -> dict:
+    tracer.exporter.flush()
+    files = list(tmp_path.rglob("*.json"))
+    assert len(files) == 1
+    return json.loads(files[0].read_text())
+
+
+@dataclass(frozen=True, kw_only=True)
+class PageDoneEvent(DomainEvent):
+    page: int
+
+
+class RecordingHandler(EventHandler[PageDoneEvent]):
+    def __init__(self):
+        self.trace_ids: list[str | None] = []
+
+    async def handle(self, event: PageDoneEvent) -> None:
+        with tracing.get_tracer().span("handler.work"):
+            self.trace_ids.append(current_trace_id())
+
+
+async def test_spans_follow_gather_and_threads_and_are_written_per_book(tracer, tmp_path):
+    @traced("page.render")
+    def render(page: int) -> int:
+        return page
+
+    started: list[int] = []
+    both_started = asyncio.Event()
+
+    async def generate(page: int) -> int:
+        with tracer.span("page.generate", page=page):
+            started.append(page)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()  # Both pages in flight at once
+            return await asyncio.to_thread(render, page)
+
+    with tracer.start_trace("create_ebook") as root:
+        assert await asyncio.gather(generate(1), generate(2)) == [1, 2]
+        root.set_attribute("ebook.id", 42)
+
+    assert tracer.active_trace_count == 0
+    tracer.exporter.flush()
+    files = list(tmp_path.glob("ebook_42/*_create_ebook_*.json"))
+    assert len(files) == 1
+    document = json.loads(files[0].read_text())
+
+    spans = {span["spanId"]: span for span in document["spans"]}
+    by_name: dict[str, list[dict]] = {}
+    for span in spans.values():
+        by_name.setdefault(span["name"], []).append(span)
+    (root_span,) = by_name["create_ebook"]
+    assert {span["parentSpanId"] for span in by_name["page.generate"]} == {root_span["spanId"]}
+    for render_span in by_name["page.render"]:
+        assert spans[render_span["parentSpanId"]]["name"] == "page.generate"
+    assert len({span["traceId"] for span in spans.values()}) == 1
+
+    # Concurrent pages are on separate flame graph lanes, each span nested under its ancestors
+    events = document["traceEvents"]
+    generate_lanes = {event["tid"] for event in events if event["name"] == "page.generate"}
+    assert len(generate_lanes) == 2
+    for lane in {event["tid"] for event in events}:
+        lane_events = sorted((event for event in events if event["tid"] == lane), key=lambda event: event["ts"])
+        open_spans: list[dict] = []
+        for event in lane_events:
+            while open_spans and open_spans[-1]["ts"] + open_spans[-1]["dur"] <= event["ts"]:
+                open_spans.pop()
+            if open_spans:
+                assert spans[event["args"]["parent_span_id"]]["name"] in ("create_ebook", "page.generate")
+                assert event["ts"] + event["dur"] <= open_spans[-1]["ts"] + open_spans[-1]["dur"]
+            open_spans.append(event)
+
+
+async def test_spans_outside_a_trace_record_nothing(tracer, tmp_path):
+    with tracer.span("db.get_all") as span:
+        span.set_attribute("ignored", True)
+        assert current_trace_id() is None
+    assert span is tracing.NON_RECORDING_SPAN
+    assert tracer.active_trace_count == 0
+    tracer.exporter.flush()
+    assert list(tmp_path.rglob("*.json")) == []
+
+
+async def test_errors_are_recorded_on_the_span(tracer, tmp_path):
+    with pytest.raises(ValueError):
+        with tracer.start_trace("export_to_kdp", **{"ebook.id": 7}):
+            with tracer.span("assembly.compose"):
+                raise ValueError("bad spine")
+
+    spans = {span["name"]: span for span in _read_trace(tracer, tmp_path)["spans"]}
+    assert spans["assembly.compose"]["status"] == {"code": "ERROR", "message": "ValueError: bad spine"}
+    assert spans["assembly.compose"]["events"][0]["attributes"]["exception.type"] == "ValueError"
+    assert spans["export_to_kdp"]["status"]["code"] == "ERROR"
+
+
+async def test_traced_use_case_names_the_trace_after_the_ebook(tracer, tmp_path):
+    class RegeneratePage:
+        @traced_use_case("regenerate_content_page")
+        async def execute(self, ebook_id: int, page_index: int) -> str:
+            return current_trace_id() or ""
+
+    trace_id = await RegeneratePage().execute(5, page_index=2)
+
+    document = _read_trace(tracer, tmp_path)
+    assert document["otherData"] == {"trace_id": trace_id, "root": "regenerate_content_page", "ebook_id": 5, "dropped_spans": 0}
+    assert list(tmp_path.glob("ebook_5/*.json"))
+
+
+async def test_trace_files_are_written_off_the_event_loop_and_pruned(tmp_path):
+    exporter = JsonFileSpanExporter(tmp_path, max_files=3)
+    tracer = Tracer(exporter=exporter)
+    for ebook_id in range(5):
+        with tracer.start_trace("export_ebook_pdf", **{"ebook.id": ebook_id}):
+            pass
+    exporter.flush()
+
+    assert exporter._writer is not None and exporter._writer.name == "trace-writer"
+    assert len(list(tmp_path.rglob("*.json"))) == 3
+
+    old_trace = next(tmp_path.rglob("*.json"))
+    os.utime(old_trace, (0, 0))
+    exporter.max_age_days = 1
+    exporter.prune()
+    assert not old_trace.exists()
+    assert len(list(tmp_path.rglob("*.json"))) == 2
+
+
+async def test_events_carry_the_trace_id_to_queued_handlers(tracer, tmp_path):
+    bus = EventBus()
+    handler = RecordingHandler()
+    bus.subscribe(PageDoneEvent, handler, delivery=QueuedDelivery(max_size=10))
+
+    assert PageDoneEvent(page=0).trace_id is None
+    await bus.publish(PageDoneEvent(page=0))  # Starts the consumer task outside any trace
+    await bus.drain()
+
+    with tracer.start_trace("create_ebook") as root:
+        event = PageDoneEvent(page=1)
+        assert event.trace_id == root.trace_id
+        await bus.publish(event)
+        await bus.drain()
+    bus.clear()
+
+    assert handler.trace_ids == [None, root.trace_id]
+    spans = {span["name"]: span for span in _read_trace(tracer, tmp_path)["spans"]}
+    assert spans["event.PageDoneEvent"]["attributes"]["handler"] == "RecordingHandler"
+    assert spans["handler.work"]["parentSpanId"] == spans["event.PageDoneEvent"]["spanId"]
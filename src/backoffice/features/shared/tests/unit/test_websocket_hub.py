@@ -0,0 +1,161 @@
+"""Tests for the websocket hub (topic subscriptions, fan-out, heartbeat, cleanup)."""
+
+import asyncio
+import json
+
+from fastapi import FastAPI, WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from backoffice.features.shared.presentation.routes import websocket_hub
+from backoffice.features.shared.presentation.routes.websocket_hub import WebSocketHub, ebook_topic
+
+
+class FakeWebSocket:
+    """Minimal websocket: messages to receive are fed through a queue."""
+
+    def __init__(self, fail_sends: bool = False):
+        self.sent: list[dict] = []
+        self.fail_sends = fail_sends
+        self._incoming: asyncio.Queue = asyncio.Queue()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        if self.fail_sends:
+            raise RuntimeError("connection reset")
+        self.sent.append(json.loads(text))
+
+    async def receive_json(self):
+        message = await self._incoming.get()
+        if message is None:
+            raise WebSocketDisconnect()
+        return message
+
+    async def close(self) -> None:
+        pass
+
+    def feed(self, message) -> None:
+        self._incoming.put_nowait(message)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_messages_reach_only_topic_subscribers():
+    hub = WebSocketHub()
+    editors = [FakeWebSocket() for _ in range(3)]
+    tasks = [asyncio.create_task(hub.serve(ws, f"client-{i}")) for i, ws in enumerate(editors)]
+    editors[0].feed({"action": "subscribe", "ebook_id": 1})
+    editors[1].feed({"action": "subscribe", "ebook_id": 1})
+    editors[2].feed({"action": "subscribe", "ebook_id": 7})
+    await _settle()
+
+    assert hub.publish(ebook_topic(1), {"type": "progress", "status": 50}) == 2
+    assert hub.publish(ebook_topic(2), {"type": "progress", "status": 10}) == 0
+    await _settle()
+
+    assert editors[0].sent == [{"type": "subscribed", "topic": "ebook:1"}, {"type": "progress", "status": 50}]
+    assert editors[1].sent == editors[0].sent
+    assert editors[2].sent == [{"type": "subscribed", "topic": "ebook:7"}]
+
+    editors[0].feed({"action": "unsubscribe", "topic": "ebook:1"})
+    await _settle()
+    hub.publish(ebook_topic(1), {"type": "progress", "status": 100})
+    await _settle()
+    assert editors[0].sent[-1] == {"type": "unsubscribed", "topic": "ebook:1"}
+    assert editors[1].sent[-1] == {"type": "progress", "status": 100}
+
+    for ws in editors:
+        ws.feed(None)
+    await asyncio.gather(*tasks)
+
+
+async def test_invalid_messages_get_an_error_reply():
+    hub = WebSocketHub()
+    ws = FakeWebSocket()
+    task = asyncio.create_task(hub.serve(ws, "client"))
+    ws.feed({"action": "subscribe"})
+    ws.feed(["not", "an", "object"])
+    ws.feed({"action": "subscribe", "job_id": "export-7"})  # No job topics are published
+    ws.feed({"action": "subscribe", "topic": "job:export-7"})
+    ws.feed({"action": "pong"})
+    await _settle()
+
+    assert [message["type"] for message in ws.sent] == ["error", "error", "error", "error"]
+    ws.feed(None)
+    await task
+
+
+async def test_disconnect_and_failed_sends_clean_up_subscriptions():
+    hub = WebSocketHub()
+    gone, broken = FakeWebSocket(), FakeWebSocket(fail_sends=True)
+    gone_task = asyncio.create_task(hub.serve(gone, "gone"))
+    broken_task = asyncio.create_task(hub.serve(broken, "broken"))
+    gone.feed({"action": "subscribe", "ebook_id": 3})
+    broken.feed({"action": "subscribe", "ebook_id": 3})
+    await _settle()
+
+    gone.feed(None)
+    await gone_task
+    await _settle()
+
+    assert hub.client_count == 0  # broken was dropped when its "subscribed" reply failed
+    assert hub.subscriber_count(ebook_topic(3)) == 0
+    assert hub.publish(ebook_topic(3), {"type": "progress"}) == 0
+    broken.feed(None)
+    await broken_task
+
+
+async def test_heartbeat_pings_connected_clients():
+    hub = WebSocketHub(heartbeat_interval=0.02)
+    ws = FakeWebSocket()
+    task = asyncio.create_task(hub.serve(ws, "client"))
+    await asyncio.sleep(0.05)
+
+    assert {"type": "ping"} in ws.sent
+    ws.feed(None)
+    await task
+    await hub.close()
+
+
+async def test_clients_missing_pongs_are_dropped():
+    hub = WebSocketHub(heartbeat_interval=0.01, max_missed_pongs=3)
+    alive, half_open = FakeWebSocket(), FakeWebSocket()
+    tasks = [asyncio.create_task(hub.serve(ws, name)) for ws, name in ((alive, "alive"), (half_open, "half-open"))]
+    alive.feed({"action": "subscribe", "ebook_id": 1})
+    half_open.feed({"action": "subscribe", "ebook_id": 1})
+
+    for _ in range(8):
+        await asyncio.sleep(0.01)
+        alive.feed({"action": "pong"})
+    await _settle()
+
+    assert hub.client_count == 1
+    assert hub.subscriber_count(ebook_topic(1)) == 1
+    assert hub.publish(ebook_topic(1), {"type": "progress"}) == 1
+    for ws in (alive, half_open):
+        ws.feed(None)
+    await asyncio.gather(*tasks)
+    await hub.close()
+
+
+def test_websocket_route_subscribes_and_receives(monkeypatch):
+    hub = WebSocketHub()
+    monkeypatch.setattr(websocket_hub, "_hub", hub)
+    app = FastAPI()
+    app.include_router(websocket_hub.router)
+
+    @app.post("/publish/{ebook_id}")
+    async def publish(ebook_id: int) -> dict[str, int]:
+        return {"clients": hub.publish(ebook_topic(ebook_id), {"type": "progress", "ebook_id": ebook_id})}
+
+    client = TestClient(app)
+    with client.websocket_connect("/api/ws/tab-1") as ws:
+        ws.send_json({"action": "subscribe", "ebook_id": 5})
+        assert ws.receive_json() == {"type": "subscribed", "topic": "ebook:5"}
+
+        assert client.post("/publish/5").json() == {"clients": 1}
+        assert ws.receive_json() == {"type": "progress", "ebook_id": 5}
@@ -1,10 +1,14 @@
 import asyncio
 import logging
 import os
+import signal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
@@ -22,22 +26,84 @@ from backoffice.features.ebook.lifecycle.presentation.routes import (
 )
 from backoffice.features.ebook.listing.presentation.routes import router as ebook_listing_router
 from backoffice.features.ebook.regeneration.domain.events.content_page_regenerating_status_event import ContentPageRegeneratingStatusEvent
+from backoffice.features.ebook.regeneration.infrastructure.progress_channel import get_progress_channel
 from backoffice.features.ebook.regeneration.presentation.routes import (
     router as ebook_regeneration_router,
 )
-from backoffice.features.shared.infrastructure.events import event_bus_singleton
-from backoffice.features.shared.infrastructure.events.event_handler import EventHandler
+from backoffice.features.ebook.shared.infrastructure import warm_up
+from backoffice.features.shared.infrastructure.events.event_bus_singleton import get_event_bus
+from backoffice.features.shared.infrastructure.profiling import ProfilingMiddleware, get_profiling_config
+from backoffice.features.shared.infrastructure.structured_logging import configure_logging
+from backoffice.features.shared.presentation.routes.admin_routes import reload_configuration, router as admin_router
+from backoffice.features.shared.presentation.routes.event_stream import get_event_stream_hub, router as event_stream_router
+from backoffice.features.shared.presentation.routes.metrics_routes import router as metrics_router
 from backoffice.features.shared.presentation.routes.templates import templates
+from backoffice.features.shared.presentation.routes.websocket_hub import ebook_topic, get_websocket_hub, router as websocket_router
 
-# Configure logging level based on environment
-log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=getattr(logging, log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+# JSON logs written by a listener thread (LOG_LEVEL, LOG_FORMAT, LOG_SAMPLING...)
+configure_logging()
+
+logger = logging.getLogger(__name__)
+
+
+async def _forward_progress(event: ContentPageRegeneratingStatusEvent) -> None:
+    """Send coalesced page progress to the websockets and SSE streams of the ebook."""
+    topic = ebook_topic(event.ebook_id)
+    message = {
+        "type": "progress",
+        "status": event.status,
+        "ebook_id": event.ebook_id,
+        "page_index": event.page_index,
+        "current_step": event.current_step,
+        "state": event.state,
+        "trace_id": event.trace_id,
+    }
+    get_websocket_hub().publish(topic, message)
+    get_event_stream_hub().publish(topic, message)
 
-app = FastAPI(title="Backoffice")
+
+def _reload_configuration_on_signal() -> None:
+    """SIGHUP handler: reload the configuration snapshot, keeping the current one on error."""
+    try:
+        reload_configuration()
+    except Exception as e:
+        logger.error(f"❌ Configuration reload (SIGHUP) failed, keeping current snapshot: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Install process-level handlers and warm caches up for the application lifetime."""
+    loop = asyncio.get_running_loop()
+    sighup_installed = False
+    if hasattr(signal, "SIGHUP"):
+        try:
+            loop.add_signal_handler(signal.SIGHUP, _reload_configuration_on_signal)
+            sighup_installed = True
+        except (NotImplementedError, RuntimeError):
+            logger.warning("SIGHUP configuration reload unavailable on this platform")
+
+    event_bus = get_event_bus()
+    await event_bus.start()
+    progress_channel = get_progress_channel()
+    progress_subscription = progress_channel.subscribe(_forward_progress)
+
+    warm_up_task = None
+    if warm_up.is_blocking():
+        await warm_up.run_warm_up()
+    else:
+        warm_up_task = asyncio.create_task(warm_up.run_warm_up())
+    yield
+    if warm_up_task is not None and not warm_up_task.done():
+        warm_up_task.cancel()
+    progress_channel.unsubscribe(progress_subscription)
+    await get_websocket_hub().close()
+    await get_event_stream_hub().close()
+    await event_bus.stop()
+    if sighup_installed:
+        loop.remove_signal_handler(signal.SIGHUP)
+
+
+app = FastAPI(title="Backoffice", lifespan=lifespan)
 
 
 # Configuration CORS basée sur l'environnement
@@ -63,10 +129,13 @@ def get_cors_origins() -> list[str]:
 
 
 # Middleware order matters: first added = last executed
+# 0. ProfilingMiddleware (admin-only ?profile=1) - innermost, needs the session set by AuthMiddleware
 # 1. AuthMiddleware (checks session) - runs first on request
 # 2. SessionMiddleware (required by authlib for OAuth state)
 # 3. CORSMiddleware - runs last on request
 
+if get_profiling_config().enabled:  # Not installed at all unless profiling admins are configured
+    app.add_middleware(ProfilingMiddleware)
 app.add_middleware(AuthMiddleware)
 
 session_secret = os.getenv("SESSION_SECRET_KEY", "dev-secret-key-change-in-production")
@@ -94,45 +163,21 @@ async def dashboard_page(request: Request):
     return templates.TemplateResponse("dashboard.html", {"request": request})
 
 
-@app.websocket("/api/ws/{client_id}")
-async def websocket_endpoint(websocket: WebSocket, client_id: str):
-    loop_condition = True
-
-    class NewStatusHandler(EventHandler[ContentPageRegeneratingStatusEvent]):
-        async def handle(self, event: ContentPageRegeneratingStatusEvent) -> None:
-            await manager.broadcast({"status": event.status, "ebook_id": event.ebook_id, "page_index": event.page_index, "current_step": event.current_step, "state": event.state})
-
-            if event.state == "finished":
-                await websocket.close()
-                manager.disconnect(websocket)
-                if self.handler_id is not None:
-                    event_bus_singleton.get_event_bus().unsubscribe(ContentPageRegeneratingStatusEvent, self.handler_id)
-
-            await asyncio.sleep(0.2)
-
-    event_bus_singleton.get_event_bus().subscribe(ContentPageRegeneratingStatusEvent, NewStatusHandler())
-
-    try:
-        await manager.connect(websocket)
-        print(f"WS Connection established with {client_id}")
-
-        while loop_condition:
-            # if event_bus_singleton.get_event_bus().nb_handlers() == 0:
-            #     break
-
-            await asyncio.sleep(0.1)
-            # data = await websocket.receive_json()
-        #     await websocket.send_json({"message": "test"})
-    except WebSocketDisconnect:
-        manager.disconnect(websocket)
-        print(f"Websocket for {client_id} disconnected.")
-
-
 @app.get("/healthz")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/readyz")
+async def readiness_check() -> JSONResponse:
+    """Ready once the startup warm-up has finished (503 while warming up)."""
+    state = warm_up.get_warm_up_state()
+    return JSONResponse(
+        status_code=200 if state.finished else 503,
+        content={"status": "ready" if state.finished else "warming_up", **state.to_dict()},
+    )
+
+
 # Test reset endpoint pour isolation de données
 @app.post("/__test__/reset")
 async def test_reset_database() -> tuple[dict[str, str], int] | dict[str, str]:
@@ -157,27 +202,6 @@ async def test_reset_database() -> tuple[dict[str, str], int] | dict[str, str]:
         return {"error": str(e)}, 500
 
 
-# Websocket Connection Handler
-# handle connections for websocket in order to update generation or correction status
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: list[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            await connection.send_json(message)
-
-
-manager = ConnectionManager()
-
-
 # Register all feature routes
 app.include_router(auth_router)
 app.include_router(ebook_form_router)
@@ -186,6 +210,10 @@ app.include_router(ebook_creation_router)
 app.include_router(ebook_lifecycle_router)
 app.include_router(ebook_export_router)
 app.include_router(ebook_regeneration_router)
+app.include_router(admin_router)
+app.include_router(websocket_router)
+app.include_router(event_stream_router)
+app.include_router(metrics_router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,33 @@
+"""add_ebook_bytes_sha256_for_pdf_etags
+
+Revision ID: 5f2a9c1d7e3b
+Revises: b34b0200e8da
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f2a9c1d7e3b"
+down_revision: str | None = "b34b0200e8da"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add ebook_bytes_sha256 column (content hash of the stored PDF).
+
+    Used as strong ETag and file store key so PDF downloads never load the
+    ebook_bytes blob just to check freshness. Existing rows are hashed
+    lazily on their first download.
+    """
+    op.add_column("ebooks", sa.Column("ebook_bytes_sha256", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove ebook_bytes_sha256 column (for rollback only)."""
+    op.drop_column("ebooks", "ebook_bytes_sha256")
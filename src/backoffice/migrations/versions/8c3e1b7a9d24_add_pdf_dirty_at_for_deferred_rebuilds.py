@@ -0,0 +1,33 @@
+"""add_pdf_dirty_at_for_deferred_rebuilds
+
+Revision ID: 8c3e1b7a9d24
+Revises: 5f2a9c1d7e3b
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3e1b7a9d24"
+down_revision: str | None = "5f2a9c1d7e3b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add pdf_dirty_at column (time of the latest page change not yet in the stored PDF).
+
+    Page edits set it instead of rebuilding the PDF inline; the debounced
+    rebuild (or the next PDF download) clears it. NULL means the stored PDF
+    is current.
+    """
+    op.add_column("ebooks", sa.Column("pdf_dirty_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove pdf_dirty_at column (for rollback only)."""
+    op.drop_column("ebooks", "pdf_dirty_at")
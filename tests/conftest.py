@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -11,6 +12,9 @@ import pytest
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
+# Tests exercise use cases: don't write a trace file per test run
+os.environ.setdefault("TRACING_ENABLED", "false")
+
 # Guard heavy imports that require cryptography / authlib at import time.
 # These are only needed when integration tests actually run.
 try: